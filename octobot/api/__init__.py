@@ -38,6 +38,8 @@ from octobot.api.backtesting import (
     stop_independent_backtesting,
     join_independent_backtesting_stop,
     get_independent_backtesting_report,
+    create_multi_process_backtesting,
+    run_multi_process_backtesting,
 )
 from octobot.api.strategy_optimizer import (
     create_strategy_optimizer,
@@ -91,6 +93,8 @@ __all__ = [
     "stop_independent_backtesting",
     "join_independent_backtesting_stop",
     "get_independent_backtesting_report",
+    "create_multi_process_backtesting",
+    "run_multi_process_backtesting",
     "create_strategy_optimizer",
     "create_design_strategy_optimizer",
     "find_optimal_configuration",
@@ -15,6 +15,7 @@
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 import octobot.backtesting as backtesting
 import octobot.backtesting.independent_backtesting
+import octobot.backtesting.multi_process_backtesting
 import octobot_backtesting.constants as constants
 
 
@@ -56,6 +57,42 @@ def create_independent_backtesting(
     )
 
 
+def create_multi_process_backtesting(
+    config,
+    tentacles_setup_config,
+    data_files,
+    data_file_path=constants.BACKTESTING_FILE_PATH,
+    join_backtesting_timeout=constants.BACKTESTING_DEFAULT_JOIN_TIMEOUT,
+    run_on_common_part_only=True,
+    start_timestamp=None,
+    end_timestamp=None,
+    enable_logs=False,
+    name=None,
+    enable_storage=True,
+    run_on_all_available_time_frames=False,
+    enforce_total_databases_max_size_after_run=True,
+    max_processes=None,
+) -> backtesting.multi_process_backtesting.MultiProcessBacktesting:
+    return backtesting.multi_process_backtesting.MultiProcessBacktesting(
+        config, tentacles_setup_config, data_files,
+        data_file_path,
+        run_on_common_part_only=run_on_common_part_only,
+        join_backtesting_timeout=join_backtesting_timeout,
+        start_timestamp=start_timestamp,
+        end_timestamp=end_timestamp,
+        enable_logs=enable_logs,
+        name=name,
+        enable_storage=enable_storage,
+        run_on_all_available_time_frames=run_on_all_available_time_frames,
+        enforce_total_databases_max_size_after_run=enforce_total_databases_max_size_after_run,
+        max_processes=max_processes,
+    )
+
+
+async def run_multi_process_backtesting(multi_process_backtesting) -> dict:
+    return await multi_process_backtesting.run()
+
+
 async def initialize_and_run_independent_backtesting(independent_backtesting, log_errors=True) -> None:
     await independent_backtesting.initialize_and_run(log_errors=log_errors)
 
@@ -17,6 +17,7 @@
 from octobot.backtesting import abstract_backtesting_test
 from octobot.backtesting import independent_backtesting
 from octobot.backtesting import octobot_backtesting
+from octobot.backtesting import multi_process_backtesting
 from octobot.backtesting.abstract_backtesting_test import (
     AbstractBacktestingTest,
 )
@@ -26,9 +27,15 @@ from octobot.backtesting.independent_backtesting import (
 from octobot.backtesting.octobot_backtesting import (
     OctoBotBacktesting,
 )
+from octobot.backtesting.multi_process_backtesting import (
+    MultiProcessBacktesting,
+    merge_backtesting_reports,
+)
 
 __all__ = [
     "OctoBotBacktesting",
     "IndependentBacktesting",
+    "MultiProcessBacktesting",
+    "merge_backtesting_reports",
     "AbstractBacktestingTest",
 ]
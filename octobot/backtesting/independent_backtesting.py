@@ -62,6 +62,7 @@ class IndependentBacktesting:
         backtesting_data=None,
         config_by_tentacle=None,
         services_config=None,
+        store_run_metadata=True,
     ):
         self.octobot_origin_config = config
         self.tentacles_setup_config = tentacles_setup_config
@@ -103,6 +104,7 @@ class IndependentBacktesting:
             name=name,
             config_by_tentacle=config_by_tentacle,
             services_config=services_config,
+            store_run_metadata=store_run_metadata,
         )
 
     async def initialize_and_run(self, log_errors=True):
@@ -1,3 +1,5 @@
+import numpy
+
 import octobot_commons.enums
 import octobot_commons.databases as databases
 import octobot_commons.constants
@@ -46,7 +48,11 @@ class MinimalDataImporter(octobot_backtesting.importers.ExchangeDataImporter):
                 continue
             if market_details.time_frame not in self._candles_cache:
                 self._candles_cache[market_details.time_frame] = {}
-            self._candles_cache[market_details.time_frame][market_details.symbol] = market_details.get_formatted_candles()
+            # candles are cached as arrays by PriceIndexes value
+            self._candles_cache[market_details.time_frame][market_details.symbol] = market_details.get_candle_arrays()
+
+    def get_candle_arrays(self, symbol, time_frame: octobot_commons.enums.TimeFrames) -> dict[int, numpy.ndarray]:
+        return self._candles_cache[time_frame.value][symbol]
 
     async def initialize(self) -> None:
         # nothing to do
@@ -85,21 +91,27 @@ class MinimalDataImporter(octobot_backtesting.importers.ExchangeDataImporter):
         return self._select(limit, symbol, time_frame)
 
     def _select_from_timestamp(self, symbol, timestamps, operations, time_frame):
-        parsed_timestamps = [float(timestamp) for timestamp in timestamps]
-        return [
-            candle
-            for candle in self._select(databases.SQLiteDatabase.DEFAULT_SIZE, symbol, time_frame)
-            if _is_valid_from_operations(
-                candle[octobot_commons.enums.PriceIndexes.IND_PRICE_TIME.value], parsed_timestamps, operations
-            )
-        ]
-
-    def _select(self, limit, symbol, time_frame):
-        candles = self._candles_cache[time_frame][symbol]
+        times = self._candles_cache[time_frame][symbol][octobot_commons.enums.PriceIndexes.IND_PRICE_TIME.value]
+        selected = numpy.ones(len(times), dtype=bool)
+        for timestamp, operation in zip(timestamps, operations):
+            selected &= _get_operation_mask(times, float(timestamp), operation)
+        return self._select(databases.SQLiteDatabase.DEFAULT_SIZE, symbol, time_frame, numpy.flatnonzero(selected))
+
+    def _select(self, limit, symbol, time_frame, selected_indexes=None):
+        candle_arrays = self._candles_cache[time_frame][symbol]
+        if selected_indexes is None:
+            selected_indexes = slice(None) if limit == databases.SQLiteDatabase.DEFAULT_SIZE else slice(0, limit)
+        elif limit != databases.SQLiteDatabase.DEFAULT_SIZE:
+            selected_indexes = selected_indexes[:limit]
+        # only create python candles for selected candles
+        candles = numpy.column_stack([
+            candle_arrays[index][selected_indexes]
+            for index in range(len(octobot_commons.enums.PriceIndexes))
+        ]).tolist()
         timeframe_sec = octobot_commons.enums.TimeFramesMinutes[octobot_commons.enums.TimeFrames(time_frame)] * \
             octobot_commons.constants.MINUTE_TO_SECONDS
         currency = octobot_commons.symbols.parse_symbol(symbol).base
-        candles_data = [
+        return [
             [
                 candle[octobot_commons.enums.PriceIndexes.IND_PRICE_TIME.value] + timeframe_sec,
                 self.exchange_name,
@@ -110,9 +122,6 @@ class MinimalDataImporter(octobot_backtesting.importers.ExchangeDataImporter):
             ]
             for candle in candles
         ]
-        if limit != databases.SQLiteDatabase.DEFAULT_SIZE:
-            return candles_data[:limit]
-        return candles_data
 
     @staticmethod
     def _get_sample_market(
@@ -124,21 +133,15 @@ class MinimalDataImporter(octobot_backtesting.importers.ExchangeDataImporter):
         )[-1]
 
 
-def _is_valid_from_operations(input_timestamp, condition_timestamps, operations):
-    for condition_timestamp, operation in zip(condition_timestamps, operations):
-        if operation == octobot_commons.enums.DataBaseOperations.SUP.value:
-            if not input_timestamp > condition_timestamp:
-                return False
-        if operation == octobot_commons.enums.DataBaseOperations.SUP_EQUALS.value:
-            if not input_timestamp >= condition_timestamp:
-                return False
-        if operation == octobot_commons.enums.DataBaseOperations.EQUALS.value:
-            if not input_timestamp == condition_timestamp:
-                return False
-        if operation == octobot_commons.enums.DataBaseOperations.INF_EQUALS.value:
-            if not input_timestamp <= condition_timestamp:
-                return False
-        if operation == octobot_commons.enums.DataBaseOperations.INF.value:
-            if not input_timestamp < condition_timestamp:
-                return False
-    return True
+def _get_operation_mask(times: numpy.ndarray, condition_timestamp: float, operation: str) -> numpy.ndarray:
+    if operation == octobot_commons.enums.DataBaseOperations.SUP.value:
+        return times > condition_timestamp
+    if operation == octobot_commons.enums.DataBaseOperations.SUP_EQUALS.value:
+        return times >= condition_timestamp
+    if operation == octobot_commons.enums.DataBaseOperations.EQUALS.value:
+        return times == condition_timestamp
+    if operation == octobot_commons.enums.DataBaseOperations.INF_EQUALS.value:
+        return times <= condition_timestamp
+    if operation == octobot_commons.enums.DataBaseOperations.INF.value:
+        return times < condition_timestamp
+    return numpy.ones(len(times), dtype=bool)
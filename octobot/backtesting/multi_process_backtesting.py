@@ -0,0 +1,242 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+import concurrent.futures
+import copy
+import logging
+import multiprocessing
+import os.path as path
+
+import octobot_commons.constants as common_constants
+import octobot_commons.enums as commons_enums
+import octobot_commons.logging as commons_logging
+import octobot_commons.databases as databases
+import octobot_commons.multiprocessing_util as multiprocessing_util
+import octobot_commons.optimization_campaign as optimization_campaign
+
+import octobot_backtesting.constants as backtesting_constants
+import octobot_backtesting.enums as backtesting_enums
+import octobot_backtesting.data as backtesting_data
+
+import octobot_trading.api as trading_api
+
+import octobot.backtesting.independent_backtesting as independent_backtesting
+import octobot.storage as storage
+
+
+class MultiProcessBacktesting:
+    """
+    Runs a multi-exchange backtesting as one backtesting process by exchange.
+    Exchanges backtestings share the same backtesting id: each process writes its exchange run databases
+    and run metadata are merged once every process is done.
+    Exchanges are not synchronized with each other: each process runs on its own data files time window
+    unless start_timestamp and end_timestamp are given. Strategies trading across exchanges (like arbitrage)
+    have to use IndependentBacktesting.
+    """
+
+    def __init__(
+        self,
+        config,
+        tentacles_setup_config,
+        backtesting_files,
+        data_file_path=backtesting_constants.BACKTESTING_FILE_PATH,
+        run_on_common_part_only=True,
+        join_backtesting_timeout=backtesting_constants.BACKTESTING_DEFAULT_JOIN_TIMEOUT,
+        start_timestamp=None,
+        end_timestamp=None,
+        enable_logs=False,
+        name=None,
+        enable_storage=True,
+        run_on_all_available_time_frames=False,
+        enforce_total_databases_max_size_after_run=True,
+        max_processes=None,
+    ):
+        self.logger = commons_logging.get_logger(self.__class__.__name__)
+        self.config = config
+        self.tentacles_setup_config = tentacles_setup_config
+        self.backtesting_files = backtesting_files
+        self.data_file_path = data_file_path
+        self.run_on_common_part_only = run_on_common_part_only
+        self.join_backtesting_timeout = join_backtesting_timeout
+        self.start_timestamp = start_timestamp
+        self.end_timestamp = end_timestamp
+        self.enable_logs = enable_logs
+        self.name = name
+        self.enable_storage = enable_storage
+        self.run_on_all_available_time_frames = run_on_all_available_time_frames
+        self.enforce_total_databases_max_size_after_run = enforce_total_databases_max_size_after_run
+        self.max_processes = max_processes or multiprocessing.cpu_count()
+        self.backtesting_id = config.get(common_constants.CONFIG_BACKTESTING_ID)
+        self.backtesting_files_by_exchange = {}
+        self.reports_by_exchange = {}
+        self.run_metadata = None
+
+    async def run(self) -> dict:
+        """
+        Runs every exchange backtesting and stores the merged run metadata
+        :return: the merged backtesting report
+        """
+        self.backtesting_files_by_exchange = await self.get_backtesting_files_by_exchange()
+        await self._generate_backtesting_id_if_missing()
+        config = copy.deepcopy(self.config)
+        config[common_constants.CONFIG_BACKTESTING_ID] = self.backtesting_id
+        processes_count = min(len(self.backtesting_files_by_exchange), self.max_processes)
+        self.logger.info(
+            f"Dispatching backtesting on {list(self.backtesting_files_by_exchange)} "
+            f"into {processes_count} parallel processes."
+        )
+        lock = multiprocessing.RLock()
+        with multiprocessing_util.registered_lock_and_shared_elements(
+                commons_enums.MultiprocessingLocks.DBLock.value, lock, {}
+        ), concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes_count,
+            initializer=multiprocessing_util.register_lock_and_shared_elements,
+            initargs=(commons_enums.MultiprocessingLocks.DBLock.value, lock, {}),
+        ) as pool:
+            results = await asyncio.gather(*(
+                asyncio.get_event_loop().run_in_executor(
+                    pool,
+                    run_backtesting_process,
+                    config,
+                    self.tentacles_setup_config,
+                    backtesting_files,
+                    self._get_backtesting_kwargs(),
+                )
+                for backtesting_files in self.backtesting_files_by_exchange.values()
+            ))
+        self.reports_by_exchange = {
+            exchange: report
+            for exchange, (report, _) in zip(self.backtesting_files_by_exchange, results)
+        }
+        runs_metadata = [run_metadata for _, run_metadata in results if run_metadata is not None]
+        if self.enable_storage and runs_metadata:
+            self.run_metadata = await storage.store_merged_backtesting_run_metadata(
+                runs_metadata,
+                trading_api.get_run_databases_identifier(config, self.tentacles_setup_config)
+            )
+        if self.enforce_total_databases_max_size_after_run:
+            # processes don't enforce it themselves: run databases are complete once every process is done
+            try:
+                await storage.enforce_total_databases_max_size()
+            except Exception as e:
+                self.logger.exception(e, True, f"Error when enforcing max run databases size: {e}")
+        return merge_backtesting_reports(list(self.reports_by_exchange.values()))
+
+    async def get_backtesting_files_by_exchange(self) -> dict:
+        """
+        Data files without exchange (like social data files) are used by every exchange backtesting
+        :return: the backtesting files to use by exchange name
+        """
+        backtesting_files_by_exchange = {}
+        shared_backtesting_files = []
+        for data_file in self.backtesting_files:
+            data_file_path = data_file
+            if not path.isfile(data_file_path):
+                data_file_path = path.join(self.data_file_path, data_file)
+            description = await backtesting_data.get_file_description(data_file_path)
+            if description is None:
+                raise RuntimeError(f"Impossible to start backtesting: missing or invalid data file: {data_file}")
+            exchange_name = description[backtesting_enums.DataFormatKeys.EXCHANGE.value]
+            if exchange_name:
+                backtesting_files_by_exchange.setdefault(exchange_name, []).append(data_file)
+            else:
+                shared_backtesting_files.append(data_file)
+        return {
+            exchange_name: backtesting_files + shared_backtesting_files
+            for exchange_name, backtesting_files in backtesting_files_by_exchange.items()
+        }
+
+    async def _generate_backtesting_id_if_missing(self):
+        if self.backtesting_id is None:
+            run_dbs_identifier = databases.RunDatabasesIdentifier(
+                trading_api.get_activated_trading_mode(self.tentacles_setup_config),
+                optimization_campaign.OptimizationCampaign.get_campaign_name(self.tentacles_setup_config)
+            )
+            self.backtesting_id = await run_dbs_identifier.generate_new_backtesting_id()
+            if self.enable_storage:
+                # initialize to lock the backtesting id
+                run_dbs_identifier.backtesting_id = self.backtesting_id
+                await run_dbs_identifier.initialize()
+
+    def _get_backtesting_kwargs(self) -> dict:
+        return {
+            "data_file_path": self.data_file_path,
+            "run_on_common_part_only": self.run_on_common_part_only,
+            "join_backtesting_timeout": self.join_backtesting_timeout,
+            "start_timestamp": self.start_timestamp,
+            "end_timestamp": self.end_timestamp,
+            "enable_logs": self.enable_logs,
+            "name": self.name,
+            "enable_storage": self.enable_storage,
+            "run_on_all_available_time_frames": self.run_on_all_available_time_frames,
+        }
+
+
+def run_backtesting_process(config, tentacles_setup_config, backtesting_files, backtesting_kwargs) -> tuple:
+    """
+    Backtesting process entry point
+    :return: the backtesting report and its run metadata to be merged with other processes ones
+    """
+    if not backtesting_kwargs["enable_logs"]:
+        logging.basicConfig(level=logging.ERROR)
+    return asyncio.run(_run_backtesting(config, tentacles_setup_config, backtesting_files, backtesting_kwargs))
+
+
+async def _run_backtesting(config, tentacles_setup_config, backtesting_files, backtesting_kwargs) -> tuple:
+    join_backtesting_timeout = backtesting_kwargs.pop("join_backtesting_timeout")
+    backtesting = independent_backtesting.IndependentBacktesting(
+        config,
+        tentacles_setup_config,
+        backtesting_files,
+        join_backtesting_timeout=join_backtesting_timeout,
+        enforce_total_databases_max_size_after_run=False,
+        store_run_metadata=False,
+        **backtesting_kwargs,
+    )
+    try:
+        await backtesting.initialize_and_run(log_errors=False)
+        await backtesting.join_backtesting_updater(join_backtesting_timeout)
+        report = await backtesting.get_dict_formatted_report()
+    finally:
+        await backtesting.stop()
+    return report, backtesting.octobot_backtesting.run_metadata
+
+
+def merge_backtesting_reports(reports) -> dict:
+    """
+    :return: the report of a single backtesting on every exchange of the given reports
+    """
+    SYMBOL_REPORT = "symbol_report"
+    BOT_REPORT = "bot_report"
+    CHART_IDENTIFIERS = "chart_identifiers"
+    ERRORS_COUNT = "errors_count"
+    merged = {
+        SYMBOL_REPORT: [],
+        BOT_REPORT: {},
+        CHART_IDENTIFIERS: [],
+        ERRORS_COUNT: 0
+    }
+    for report in reports:
+        merged[SYMBOL_REPORT] += report[SYMBOL_REPORT]
+        merged[CHART_IDENTIFIERS] += report[CHART_IDENTIFIERS]
+        merged[ERRORS_COUNT] += report[ERRORS_COUNT]
+        for key, value in report[BOT_REPORT].items():
+            if isinstance(value, dict):
+                # values by exchange
+                merged[BOT_REPORT].setdefault(key, {}).update(value)
+            else:
+                merged[BOT_REPORT][key] = value
+    return merged
@@ -68,6 +68,7 @@ class OctoBotBacktesting:
         name=None,
         config_by_tentacle=None,
         services_config=None,
+        store_run_metadata=True,
     ):
         self.logger = commons_logging.get_logger(self.__class__.__name__)
         self.backtesting_config = backtesting_config
@@ -100,6 +101,9 @@ class OctoBotBacktesting:
         self._has_started = False
         self.has_fetched_data = False
         self.services_config = services_config
+        # when False, run metadata is only computed to be stored by the caller
+        self.store_run_metadata = store_run_metadata
+        self.run_metadata = None
 
     async def initialize_and_run(self):
         if not constants.ENABLE_BACKTESTING:
@@ -168,7 +172,6 @@ class OctoBotBacktesting:
                         self.logger.exception(e, True, f"Error when saving exchange historical data: {e}")
                     try:
                         await self._store_metadata(exchange_managers)
-                        self.logger.info(f"Stored backtesting run metadata")
                     except Exception as e:
                         self.logger.exception(e, True, f"Error when saving run metadata: {e}")
                 await backtesting_api.stop_backtesting(self.backtesting)
@@ -280,6 +283,15 @@ class OctoBotBacktesting:
         run_db = commons_databases.RunDatabasesProvider.instance().get_run_db(self.bot_id)
         await run_db.flush()
         user_inputs = await commons_configuration.get_user_inputs(run_db)
+        if not self.store_run_metadata:
+            self.run_metadata = await storage.get_backtesting_run_metadata(
+                exchange_managers,
+                self.start_time,
+                user_inputs,
+                commons_databases.RunDatabasesProvider.instance().get_run_databases_identifier(self.bot_id),
+                self.name
+            )
+            return
         await storage.store_run_metadata(
             self.bot_id,
             exchange_managers,
@@ -293,6 +305,7 @@ class OctoBotBacktesting:
             commons_databases.RunDatabasesProvider.instance().get_run_databases_identifier(self.bot_id),
             self.name
         )
+        self.logger.info(f"Stored backtesting run metadata")
         self.logger.info(f"Backtesting metadata:\n{json.dumps(metadata, indent=4)}")
 
     async def _init_matrix(self):
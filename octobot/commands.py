@@ -152,7 +152,7 @@ async def update_or_repair_tentacles_if_necessary(community_auth, selected_profi
                 # install additional tentacles only when tentacles arch is valid. Install all tentacles otherwise
                 only_additional = tentacles_manager_api.is_tentacles_architecture_valid()
                 await install_or_update_tentacles(config, to_install_urls, only_additional)
-            if tentacles_manager_api.load_tentacles(verbose=True):
+            if _load_tentacles(selected_profile_tentacles_setup_config):
                 logger.debug("OctoBot tentacles are up to date.")
             else:
                 logger.info("OctoBot tentacles are damaged. Reinstalling tentacles ...")
@@ -160,7 +160,7 @@ async def update_or_repair_tentacles_if_necessary(community_auth, selected_profi
                 only_additional = not constants.INSTALL_DEFAULT_TENTACLES
                 await install_or_update_tentacles(config, [], only_additional)
     else:
-        if tentacles_manager_api.load_tentacles(verbose=True):
+        if _load_tentacles(selected_profile_tentacles_setup_config):
             logger.debug("OctoBot tentacles loaded.")
         else:
             logger.error(
@@ -169,6 +169,17 @@ async def update_or_repair_tentacles_if_necessary(community_auth, selected_profi
             )
 
 
+def _load_tentacles(tentacles_setup_config) -> bool:
+    if constants.LAZY_TENTACLES_LOADING:
+        loaded = tentacles_manager_api.load_tentacles(verbose=True, tentacles_setup_config=tentacles_setup_config)
+        logging.get_logger(COMMANDS_LOGGER_NAME).info(
+            f"Lazy tentacles loading: {len(tentacles_manager_api.get_deferred_tentacles())} tentacles will "
+            f"be imported when required"
+        )
+        return loaded
+    return tentacles_manager_api.load_tentacles(verbose=True)
+
+
 async def install_or_update_tentacles(
     config, additional_tentacles_package_urls: typing.Optional[list], only_additional: bool
 ):
@@ -102,6 +102,7 @@ from octobot.community.history_backend import (
     HistoricalBackendClient,
     ClickhouseHistoricalBackendClient,
     IcebergHistoricalBackendClient,
+    ParquetHistoricalBackendClient,
 )
 from octobot.community.community_bot import (
     CommunityBot,
@@ -167,6 +168,7 @@ __all__ = [
     "HistoricalBackendClient",
     "ClickhouseHistoricalBackendClient",
     "IcebergHistoricalBackendClient",
+    "ParquetHistoricalBackendClient",
     "CommunityBot",
     "MissingDeploymentError",
     "MissingProductsSubscriptionError",
@@ -42,6 +42,7 @@ except ImportError:
         gmqtt = GmqttImportMock()
 import json
 import asyncio
+import collections
 import packaging.version as packaging_version
 
 import octobot_commons.enums as commons_enums
@@ -91,7 +92,11 @@ class CommunityMQTTFeed(abstract_feed.AbstractFeed):
         self._reconnect_task = None
         self._connect_task = None
         self._connected_at_least_once = False
-        self._processed_messages = []
+        # processed messages ids, from oldest to newest
+        self._processed_messages: collections.OrderedDict[str, None] = collections.OrderedDict()
+        # each callback consumes its own messages queue to never be delayed by other callbacks
+        self._queue_by_callback: dict[typing.Callable, asyncio.Queue] = {}
+        self._consumer_task_by_callback: dict[typing.Callable, asyncio.Task] = {}
 
         self._default_callbacks_by_subscription_topic = self._build_default_callbacks_by_subscription_topic()
         self._stop_on_cfg_action: typing.Optional[enums.CommunityConfigurationActions] = None
@@ -121,6 +126,7 @@ class CommunityMQTTFeed(abstract_feed.AbstractFeed):
             self._reconnect_task.cancel()
         if self._connect_task is not None and not self._connect_task.done():
             self._connect_task.cancel()
+        self._stop_callbacks_consumers()
         self._reset()
         self.logger.debug("Stopped")
 
@@ -218,27 +224,52 @@ class CommunityMQTTFeed(abstract_feed.AbstractFeed):
             if self._should_process(parsed_message):
                 self.update_last_message_time()
                 for callback in self._get_callbacks(topic):
-                    await callback(parsed_message)
+                    # the parsed message is shared by every callback
+                    self._get_callback_queue(callback).put_nowait(parsed_message)
         except commons_errors.UnsupportedError as err:
             self.logger.error(f"Unsupported message: {err}")
         except Exception as err:
             self.logger.exception(err, True, f"Unexpected error when processing message: {err}")
 
+    def _get_callback_queue(self, callback) -> asyncio.Queue:
+        try:
+            return self._queue_by_callback[callback]
+        except KeyError:
+            queue = self._queue_by_callback[callback] = asyncio.Queue()
+            self._consumer_task_by_callback[callback] = asyncio.create_task(
+                self._consume_callback_queue(callback, queue)
+            )
+            return queue
+
+    async def _consume_callback_queue(self, callback, queue: asyncio.Queue):
+        while True:
+            parsed_message = await queue.get()
+            try:
+                await callback(parsed_message)
+            except Exception as err:
+                self.logger.exception(err, True, f"Unexpected error when processing message: {err}")
+            finally:
+                queue.task_done()
+
+    def _stop_callbacks_consumers(self):
+        for task in self._consumer_task_by_callback.values():
+            # can be the current task when stopping from a callback: it will be cancelled on its next await
+            task.cancel()
+        self._consumer_task_by_callback.clear()
+        self._queue_by_callback.clear()
+
     def _should_process(self, parsed_message):
         try:
-            if parsed_message[commons_enums.CommunityFeedAttrs.ID.value] in self._processed_messages:
-                self.logger.debug(f"Ignored already processed message with id: "
-                                  f"{parsed_message[commons_enums.CommunityFeedAttrs.ID.value]}")
-                return False
+            message_id = parsed_message[commons_enums.CommunityFeedAttrs.ID.value]
         except KeyError:
             # missing commons_enums.CommunityFeedAttrs.ID.value: can't check if message was already processed
             return True
-        self._processed_messages.append(parsed_message[commons_enums.CommunityFeedAttrs.ID.value])
+        if message_id in self._processed_messages:
+            self.logger.debug(f"Ignored already processed message with id: {message_id}")
+            return False
+        self._processed_messages[message_id] = None
         if len(self._processed_messages) > self.MAX_MESSAGE_ID_CACHE_SIZE:
-            self._processed_messages = [
-                message_id
-                for message_id in self._processed_messages[self.MAX_MESSAGE_ID_CACHE_SIZE // 2:]
-            ]
+            self._processed_messages.popitem(last=False)
         return True
 
     async def send(self, message, channel_type, identifier, **kwargs):
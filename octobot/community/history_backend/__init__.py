@@ -34,9 +34,15 @@ from octobot.community.history_backend.iceberg_historical_backend_client import
     IcebergHistoricalBackendClient,
 )
 
+from octobot.community.history_backend import parquet_historical_backend_client
+from octobot.community.history_backend.parquet_historical_backend_client import (
+    ParquetHistoricalBackendClient,
+)
+
 __all__ = [
     "history_backend_client",
     "HistoricalBackendClient",
     "ClickhouseHistoricalBackendClient",
     "IcebergHistoricalBackendClient",
+    "ParquetHistoricalBackendClient",
 ]
@@ -14,7 +14,11 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 import typing
+
+import numpy
+
 import octobot_commons.enums as commons_enums
+import octobot.community.history_backend.util as history_backend_util
 
 
 class HistoricalBackendClient:
@@ -46,6 +50,49 @@ class HistoricalBackendClient:
     ) -> list[list[typing.Union[float, str]]]:
         raise NotImplementedError("fetch_extended_candles_history is not implemented")
 
+    async def fetch_candles_history_arrays(
+        self,
+        exchange: str,
+        symbol: str,
+        time_frame: commons_enums.TimeFrames,
+        first_open_time: float,
+        last_open_time: float
+    ) -> dict[int, numpy.ndarray]:
+        """
+        Columnar version of fetch_candles_history
+        :return: sorted candles as a dict of arrays by PriceIndexes value
+        """
+        # default implementation: override to avoid creating python objects for each candle
+        return history_backend_util.get_candle_arrays_from_ohlcvs(
+            await self.fetch_candles_history(exchange, symbol, time_frame, first_open_time, last_open_time)
+        )
+
+    async def fetch_extended_candles_history_arrays(
+        self,
+        exchange: str,
+        symbols: list[str],
+        time_frames: list[commons_enums.TimeFrames],
+        first_open_time: typing.Optional[float] = None,
+        last_open_time: typing.Optional[float] = None,
+    ) -> dict[str, dict[str, dict[int, numpy.ndarray]]]:
+        """
+        Columnar version of fetch_extended_candles_history
+        :return: sorted candles arrays by time frame value by symbol
+        """
+        # default implementation: override to avoid creating python objects for each candle
+        ohlcvs_by_symbol_and_time_frame = {}
+        for ohlcv in await self.fetch_extended_candles_history(
+            exchange, symbols, time_frames, first_open_time, last_open_time
+        ):
+            ohlcvs_by_symbol_and_time_frame.setdefault(ohlcv[1], {}).setdefault(ohlcv[0], []).append(ohlcv[2:])
+        return {
+            symbol: {
+                time_frame: history_backend_util.get_candle_arrays_from_ohlcvs(ohlcvs)
+                for time_frame, ohlcvs in ohlcvs_by_time_frame.items()
+            }
+            for symbol, ohlcvs_by_time_frame in ohlcvs_by_symbol_and_time_frame.items()
+        }
+
     async def fetch_candles_history_range(
         self,
         exchange: str,
@@ -17,6 +17,7 @@ import contextlib
 
 import octobot.community.history_backend.clickhouse_historical_backend_client as clickhouse_historical_backend_client
 import octobot.community.history_backend.iceberg_historical_backend_client as iceberg_historical_backend_client
+import octobot.community.history_backend.parquet_historical_backend_client as parquet_historical_backend_client
 import octobot.enums
 
 
@@ -45,4 +46,6 @@ def _create_client(
         return iceberg_historical_backend_client.IcebergHistoricalBackendClient(**kwargs)
     if backend_type is octobot.enums.CommunityHistoricalBackendType.Clickhouse:
         return clickhouse_historical_backend_client.ClickhouseHistoricalBackendClient(**kwargs)
+    if backend_type is octobot.enums.CommunityHistoricalBackendType.Parquet:
+        return parquet_historical_backend_client.ParquetHistoricalBackendClient(**kwargs)
     raise NotImplementedError(f"Unsupported historical backend type: {backend_type}")
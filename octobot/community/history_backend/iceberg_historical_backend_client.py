@@ -24,6 +24,8 @@ import json
 import time
 import dataclasses
 
+import numpy
+
 import octobot_commons.logging as commons_logging
 import octobot_commons.os_util as os_util
 
@@ -218,6 +220,34 @@ class IcebergHistoricalBackendClient(historical_backend_client.HistoricalBackend
             True
         )
 
+    async def fetch_candles_history_arrays(
+        self,
+        exchange: str,
+        symbol: str,
+        time_frame: commons_enums.TimeFrames,
+        first_open_time: float,
+        last_open_time: float
+    ) -> dict[int, numpy.ndarray]:
+        return await self._run_in_executor(
+            self._sync_fetch_candles_history_arrays,
+            exchange, symbol, time_frame, None, None, first_open_time, last_open_time,
+            False
+        )
+
+    async def fetch_extended_candles_history_arrays(
+        self,
+        exchange: str,
+        symbols: list[str],
+        time_frames: list[commons_enums.TimeFrames],
+        first_open_time: typing.Optional[float] = None,
+        last_open_time: typing.Optional[float] = None,
+    ) -> dict[str, dict[str, dict[int, numpy.ndarray]]]:
+        return await self._run_in_executor(
+            self._sync_fetch_candles_history_arrays,
+            exchange, None, None, symbols, time_frames, first_open_time, last_open_time,
+            True
+        )
+
     def _get_filter(
         self, element: str, value: typing.Union[None, str, list[str]]
     ) -> typing.Optional[pyiceberg.expressions.BooleanExpression]:
@@ -241,6 +271,45 @@ class IcebergHistoricalBackendClient(historical_backend_client.HistoricalBackend
         last_open_time: typing.Optional[float],
         extended: bool,
     ) -> list[list[typing.Union[float, str]]]:
+        formatted = self._format_ohlcvs(
+            self._scan_candles_history(
+                exchange, symbol, time_frame, symbols, time_frames, first_open_time, last_open_time, extended
+            ),
+            extended
+        )
+        # ensure no duplicates as they can happen due to no unicity constraint
+        return history_backend_util.deduplicate(formatted, [0, 1, 2] if extended else [0])
+
+    def _sync_fetch_candles_history_arrays(
+        self,
+        exchange: str,
+        symbol: typing.Optional[str],
+        time_frame: typing.Optional[commons_enums.TimeFrames],
+        symbols: typing.Optional[list[str]],
+        time_frames: typing.Optional[list[commons_enums.TimeFrames]],
+        first_open_time: typing.Optional[float],
+        last_open_time: typing.Optional[float],
+        extended: bool,
+    ) -> typing.Union[dict[int, numpy.ndarray], dict[str, dict[str, dict[int, numpy.ndarray]]]]:
+        # arrow columns are directly converted into numpy arrays, no python object is created for each candle
+        ohlcvs_table = self._scan_candles_history(
+            exchange, symbol, time_frame, symbols, time_frames, first_open_time, last_open_time, extended
+        )
+        if extended:
+            return history_backend_util.get_candle_arrays_by_symbol_and_time_frame_from_ohlcv_table(ohlcvs_table)
+        return history_backend_util.get_candle_arrays_from_ohlcv_table(ohlcvs_table)
+
+    def _scan_candles_history(
+        self,
+        exchange: str,
+        symbol: typing.Optional[str],
+        time_frame: typing.Optional[commons_enums.TimeFrames],
+        symbols: typing.Optional[list[str]],
+        time_frames: typing.Optional[list[commons_enums.TimeFrames]],
+        first_open_time: typing.Optional[float],
+        last_open_time: typing.Optional[float],
+        extended: bool,
+    ) -> pyarrow.Table:
         table = self._get_or_create_table(TableNames.OHLCV_HISTORY)
         and_filters = [
             pyiceberg.expressions.EqualTo("exchange_internal_name", exchange),
@@ -260,15 +329,11 @@ class IcebergHistoricalBackendClient(historical_backend_client.HistoricalBackend
         selected_fields = ["timestamp", "open", "high", "low", "close", "volume"]
         if extended:
             selected_fields = ["time_frame", "symbol"] + selected_fields
-        result = table.scan(
+        return table.scan(
             row_filter=filter,
             selected_fields=selected_fields,
             case_sensitive=True,
-        )
-
-        formatted = self._format_ohlcvs(result.to_arrow(), extended)
-        # ensure no duplicates as they can happen due to no unicity constraint
-        return history_backend_util.deduplicate(formatted, [0, 1, 2] if extended else [0])
+        ).to_arrow()
 
     async def fetch_candles_history_range(
         self,
@@ -0,0 +1,258 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+import datetime
+import os
+import typing
+
+import numpy
+
+import octobot_commons.enums as commons_enums
+import octobot_commons.logging as commons_logging
+import octobot_commons.os_util as os_util
+
+try:
+    if os_util.is_raspberry_pi_machine():
+        raise ImportError("pyarrow is not available on Raspberry Pi")
+    else:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.parquet
+except ImportError as err:
+    commons_logging.get_logger().info(f"Skipped pyarrow import: {err}")
+    class PyArrowMock():
+        # mock to allow typing hints
+        Table = None
+        Schema = None
+    pyarrow = PyArrowMock()
+
+import octobot.constants as constants
+import octobot.community.history_backend.historical_backend_client as historical_backend_client
+import octobot.community.history_backend.util as history_backend_util
+
+
+_PARQUET_FILE_EXTENSION = ".parquet"
+
+
+class ParquetHistoricalBackendClient(historical_backend_client.HistoricalBackendClient):
+    """
+    Local historical backend storing candles in a directory of Parquet files:
+    <directory>/<exchange>/<time_frame>/<symbol>.parquet
+    Uses the same columns as the Iceberg OHLCV table. Useful to test and to run backtests on local data.
+    """
+
+    def __init__(self, directory: typing.Optional[str] = None, **kwargs):
+        if pyarrow.Table is None:
+            raise ImportError(f"The pyarrow dependency is required to use {self.__class__.__name__}")
+        self.directory: str = directory or constants.PARQUET_HISTORICAL_BACKEND_DIRECTORY
+
+    async def open(self):
+        os.makedirs(self.directory, exist_ok=True)
+
+    async def close(self):
+        # nothing to do
+        pass
+
+    async def fetch_candles_history(
+        self,
+        exchange: str,
+        symbol: str,
+        time_frame: commons_enums.TimeFrames,
+        first_open_time: float,
+        last_open_time: float
+    ) -> list[list[float]]:
+        return history_backend_util.get_ohlcvs_from_candle_arrays(
+            await self.fetch_candles_history_arrays(exchange, symbol, time_frame, first_open_time, last_open_time)
+        )
+
+    async def fetch_extended_candles_history(
+        self,
+        exchange: str,
+        symbols: list[str],
+        time_frames: list[commons_enums.TimeFrames],
+        first_open_time: typing.Optional[float] = None,
+        last_open_time: typing.Optional[float] = None,
+    ) -> list[list[typing.Union[float, str]]]:
+        candle_arrays_by_symbol_and_time_frame = await self.fetch_extended_candles_history_arrays(
+            exchange, symbols, time_frames, first_open_time, last_open_time
+        )
+        return [
+            [time_frame, symbol] + ohlcv
+            for symbol, candle_arrays_by_time_frame in candle_arrays_by_symbol_and_time_frame.items()
+            for time_frame, candle_arrays in candle_arrays_by_time_frame.items()
+            for ohlcv in history_backend_util.get_ohlcvs_from_candle_arrays(candle_arrays)
+        ]
+
+    async def fetch_candles_history_arrays(
+        self,
+        exchange: str,
+        symbol: str,
+        time_frame: commons_enums.TimeFrames,
+        first_open_time: float,
+        last_open_time: float
+    ) -> dict[int, numpy.ndarray]:
+        return await asyncio.to_thread(
+            self._sync_fetch_candles_history_arrays,
+            exchange, symbol, time_frame.value, first_open_time, last_open_time
+        )
+
+    async def fetch_extended_candles_history_arrays(
+        self,
+        exchange: str,
+        symbols: list[str],
+        time_frames: list[commons_enums.TimeFrames],
+        first_open_time: typing.Optional[float] = None,
+        last_open_time: typing.Optional[float] = None,
+    ) -> dict[str, dict[str, dict[int, numpy.ndarray]]]:
+        return await asyncio.to_thread(
+            self._sync_fetch_extended_candles_history_arrays,
+            exchange, symbols, [time_frame.value for time_frame in time_frames], first_open_time, last_open_time
+        )
+
+    def _sync_fetch_extended_candles_history_arrays(
+        self,
+        exchange: str,
+        symbols: list[str],
+        time_frames: list[str],
+        first_open_time: typing.Optional[float],
+        last_open_time: typing.Optional[float],
+    ) -> dict[str, dict[str, dict[int, numpy.ndarray]]]:
+        candle_arrays_by_symbol_and_time_frame = {}
+        for symbol in symbols:
+            for time_frame in time_frames:
+                candle_arrays = self._sync_fetch_candles_history_arrays(
+                    exchange, symbol, time_frame, first_open_time, last_open_time
+                )
+                if len(candle_arrays[commons_enums.PriceIndexes.IND_PRICE_TIME.value]):
+                    candle_arrays_by_symbol_and_time_frame.setdefault(symbol, {})[time_frame] = candle_arrays
+        return candle_arrays_by_symbol_and_time_frame
+
+    def _sync_fetch_candles_history_arrays(
+        self,
+        exchange: str,
+        symbol: str,
+        time_frame: str,
+        first_open_time: typing.Optional[float],
+        last_open_time: typing.Optional[float],
+    ) -> dict[int, numpy.ndarray]:
+        candle_arrays = history_backend_util.get_candle_arrays_from_ohlcv_table(
+            self._read_table(exchange, symbol, time_frame)
+        )
+        times = candle_arrays[commons_enums.PriceIndexes.IND_PRICE_TIME.value]
+        # candles are sorted by time: select the requested time range
+        start_index = numpy.searchsorted(times, first_open_time, side="left") if first_open_time else 0
+        end_index = numpy.searchsorted(times, last_open_time, side="right") if last_open_time else len(times)
+        return {
+            price_index: values[start_index:end_index]
+            for price_index, values in candle_arrays.items()
+        }
+
+    async def fetch_candles_history_range(
+        self,
+        exchange: str,
+        symbol: str,
+        time_frame: commons_enums.TimeFrames
+    ) -> tuple[float, float]:
+        times = (await self.fetch_candles_history_arrays(
+            exchange, symbol, time_frame, 0, 0
+        ))[commons_enums.PriceIndexes.IND_PRICE_TIME.value]
+        if len(times) == 0:
+            return (0, 0)
+        return float(times[0]), float(times[-1])
+
+    async def insert_candles_history(self, rows: list, column_names: list) -> None:
+        await asyncio.to_thread(self._sync_insert_candles_history, rows, column_names)
+
+    def _sync_insert_candles_history(self, rows: list, column_names: list) -> None:
+        if not rows:
+            return
+        inserted_table = pyarrow.table(
+            {
+                column_name: [row[index] for row in rows]
+                for index, column_name in enumerate(column_names)
+            }
+        ).select(self._pyarrow_get_ohlcv_schema().names).cast(self._pyarrow_get_ohlcv_schema())
+        key_columns = ["exchange_internal_name", "symbol", "time_frame"]
+        for key in inserted_table.select(key_columns).group_by(key_columns).aggregate([]).to_pylist():
+            exchange, symbol, time_frame = key["exchange_internal_name"], key["symbol"], key["time_frame"]
+            updated_table = pyarrow.concat_tables([
+                self._read_table(exchange, symbol, time_frame),
+                inserted_table.filter(
+                    (pyarrow.compute.field("exchange_internal_name") == exchange)
+                    & (pyarrow.compute.field("symbol") == symbol)
+                    & (pyarrow.compute.field("time_frame") == time_frame)
+                ),
+            ]).sort_by([("timestamp", "ascending")])
+            file_path = self._get_file_path(exchange, symbol, time_frame)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            pyarrow.parquet.write_table(updated_table, file_path)
+        self._get_logger().info(f"Successfully inserted {len(rows)} rows into {self.directory}")
+
+    async def fetch_all_candles_for_exchange(self, exchange: str) -> list[list[typing.Union[float, str]]]:
+        return await asyncio.to_thread(self._sync_fetch_all_candles_for_exchange, exchange)
+
+    def _sync_fetch_all_candles_for_exchange(self, exchange: str) -> list[list[typing.Union[float, str]]]:
+        exchange_directory = os.path.join(self.directory, exchange)
+        if not os.path.isdir(exchange_directory):
+            return []
+        ohlcvs = []
+        for time_frame in sorted(os.listdir(exchange_directory)):
+            for file_name in sorted(os.listdir(os.path.join(exchange_directory, time_frame))):
+                table = pyarrow.parquet.read_table(os.path.join(exchange_directory, time_frame, file_name))
+                if table.num_rows == 0:
+                    continue
+                symbol = table.column("symbol")[0].as_py()
+                ohlcvs.extend(
+                    [time_frame, symbol] + ohlcv
+                    for ohlcv in history_backend_util.get_ohlcvs_from_candle_arrays(
+                        history_backend_util.get_candle_arrays_from_ohlcv_table(table)
+                    )
+                )
+        return ohlcvs
+
+    def _read_table(self, exchange: str, symbol: str, time_frame: str) -> pyarrow.Table:
+        file_path = self._get_file_path(exchange, symbol, time_frame)
+        if not os.path.isfile(file_path):
+            return self._pyarrow_get_ohlcv_schema().empty_table()
+        return pyarrow.parquet.read_table(file_path)
+
+    def _get_file_path(self, exchange: str, symbol: str, time_frame: str) -> str:
+        # symbols such as BTC/USDT:USDT can't be used as is in file names
+        file_name = symbol.replace("/", "_").replace(":", "-")
+        return os.path.join(self.directory, exchange, time_frame, f"{file_name}{_PARQUET_FILE_EXTENSION}")
+
+    @staticmethod
+    def get_formatted_time(timestamp: float) -> datetime.datetime:
+        return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    def _pyarrow_get_ohlcv_schema() -> pyarrow.Schema:
+        """Schema for OHLCV data, same as IcebergHistoricalBackendClient"""
+        return pyarrow.schema([
+            pyarrow.field("timestamp", pyarrow.timestamp("us"), False),
+            pyarrow.field("exchange_internal_name", pyarrow.string(), False),
+            pyarrow.field("symbol", pyarrow.string(), False),
+            pyarrow.field("time_frame", pyarrow.string(), False),
+            pyarrow.field("open", pyarrow.float64(), False),
+            pyarrow.field("high", pyarrow.float64(), False),
+            pyarrow.field("low", pyarrow.float64(), False),
+            pyarrow.field("close", pyarrow.float64(), False),
+            pyarrow.field("volume", pyarrow.float64(), False),
+        ])
+
+    @classmethod
+    def _get_logger(cls):
+        return commons_logging.get_logger(cls.__name__)
@@ -1,5 +1,9 @@
 import datetime
 
+import numpy
+
+import octobot_commons.enums as commons_enums
+
 
 def get_utc_timestamp_from_datetime(dt: datetime.datetime) -> float:
     """
@@ -18,3 +22,110 @@ def deduplicate(elements, keys: list) -> list:
         for element in elements
     )
     return [x for x, s in elements_and_signature if not (s in seen or seen_add(s))]
+
+
+_PRICE_COLUMNS = {
+    commons_enums.PriceIndexes.IND_PRICE_OPEN.value: "open",
+    commons_enums.PriceIndexes.IND_PRICE_HIGH.value: "high",
+    commons_enums.PriceIndexes.IND_PRICE_LOW.value: "low",
+    commons_enums.PriceIndexes.IND_PRICE_CLOSE.value: "close",
+    commons_enums.PriceIndexes.IND_PRICE_VOL.value: "volume",
+}
+
+
+def get_candle_arrays_from_ohlcv_table(ohlcvs_table) -> dict[int, numpy.ndarray]:
+    """
+    :param ohlcvs_table: pyarrow table containing timestamp, open, high, low, close and volume columns
+    :return: the sorted and deduplicated candles as a dict of arrays by PriceIndexes value
+    """
+    if ohlcvs_table.num_rows == 0:
+        return get_empty_candle_arrays()
+    columns = _get_candle_columns(ohlcvs_table)
+    sorted_indexes = numpy.argsort(columns[commons_enums.PriceIndexes.IND_PRICE_TIME.value], kind="stable")
+    return _select_candles(columns, sorted_indexes)
+
+
+def get_candle_arrays_by_symbol_and_time_frame_from_ohlcv_table(
+    ohlcvs_table
+) -> dict[str, dict[str, dict[int, numpy.ndarray]]]:
+    """
+    :param ohlcvs_table: pyarrow table containing symbol, time_frame, timestamp, open, high, low, close
+    and volume columns
+    :return: the sorted and deduplicated candles arrays by time frame by symbol
+    """
+    if ohlcvs_table.num_rows == 0:
+        return {}
+    columns = _get_candle_columns(ohlcvs_table)
+    symbols, symbol_ids = _dictionary_encode(ohlcvs_table.column("symbol"))
+    time_frames, time_frame_ids = _dictionary_encode(ohlcvs_table.column("time_frame"))
+    group_ids = symbol_ids * len(time_frames) + time_frame_ids
+    # sort by group and then by time, lexsort is stable
+    sorted_indexes = numpy.lexsort((columns[commons_enums.PriceIndexes.IND_PRICE_TIME.value], group_ids))
+    group_starts = numpy.flatnonzero(numpy.diff(group_ids[sorted_indexes])) + 1
+    candle_arrays_by_symbol_and_time_frame = {}
+    for group_indexes in numpy.split(sorted_indexes, group_starts):
+        symbol_id, time_frame_id = divmod(int(group_ids[group_indexes[0]]), len(time_frames))
+        candle_arrays_by_symbol_and_time_frame.setdefault(symbols[symbol_id], {})[time_frames[time_frame_id]] = \
+            _select_candles(columns, group_indexes)
+    return candle_arrays_by_symbol_and_time_frame
+
+
+def get_candle_arrays_from_ohlcvs(ohlcvs: list[list[float]]) -> dict[int, numpy.ndarray]:
+    """
+    :param ohlcvs: candles as lists using PriceIndexes order
+    :return: the given candles as a dict of arrays by PriceIndexes value
+    """
+    if not ohlcvs:
+        return get_empty_candle_arrays()
+    candles = numpy.array(ohlcvs, dtype=numpy.float64)
+    return {
+        price_index.value: candles[:, price_index.value]
+        for price_index in commons_enums.PriceIndexes
+    }
+
+
+def get_ohlcvs_from_candle_arrays(candle_arrays: dict[int, numpy.ndarray]) -> list[list[float]]:
+    """
+    :return: the given candles arrays as lists using PriceIndexes order
+    """
+    return numpy.column_stack([
+        candle_arrays[price_index.value]
+        for price_index in commons_enums.PriceIndexes
+    ]).tolist()
+
+
+def get_empty_candle_arrays() -> dict[int, numpy.ndarray]:
+    return {
+        price_index.value: numpy.array([], dtype=numpy.float64)
+        for price_index in commons_enums.PriceIndexes
+    }
+
+
+def _get_candle_columns(ohlcvs_table) -> dict[int, numpy.ndarray]:
+    columns = {
+        # timestamps are UTC datetimes: convert them into seconds
+        commons_enums.PriceIndexes.IND_PRICE_TIME.value: (
+            ohlcvs_table.column("timestamp").to_numpy().astype("datetime64[us]").astype(numpy.int64)
+            / 1_000_000
+        )
+    }
+    for price_index, column_name in _PRICE_COLUMNS.items():
+        columns[price_index] = ohlcvs_table.column(column_name).to_numpy().astype(numpy.float64, copy=False)
+    return columns
+
+
+def _select_candles(columns: dict[int, numpy.ndarray], sorted_indexes: numpy.ndarray) -> dict[int, numpy.ndarray]:
+    # duplicates can happen as there is no unicity constraint: only keep the first candle of each time
+    sorted_times = columns[commons_enums.PriceIndexes.IND_PRICE_TIME.value][sorted_indexes]
+    is_first_of_time = numpy.ones(len(sorted_indexes), dtype=bool)
+    is_first_of_time[1:] = sorted_times[1:] != sorted_times[:-1]
+    selected_indexes = sorted_indexes[is_first_of_time]
+    return {
+        price_index: column[selected_indexes]
+        for price_index, column in columns.items()
+    }
+
+
+def _dictionary_encode(column) -> tuple[list[str], numpy.ndarray]:
+    encoded = column.combine_chunks().dictionary_encode()
+    return encoded.dictionary.to_pylist(), encoded.indices.to_numpy(zero_copy_only=False).astype(numpy.int64)
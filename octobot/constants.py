@@ -107,6 +107,11 @@ ICEBERG_S3_REGION = os.getenv("ICEBERG_S3_REGION")
 ICEBERG_S3_ENDPOINT = os.getenv("ICEBERG_S3_ENDPOINT")
 CREATE_ICEBERG_DB_IF_MISSING = os_util.parse_boolean_environment_var("CREATE_ICEBERG_DB_IF_MISSING", "false")
 
+PARQUET_HISTORICAL_BACKEND_DIRECTORY = os.getenv(
+    "PARQUET_HISTORICAL_BACKEND_DIRECTORY",
+    os.path.join(octobot_commons.constants.USER_FOLDER, octobot_commons.constants.DATA_FOLDER, "historical_backend")
+)
+
 OCTOBOT_MARKET_MAKING_URL = os.getenv("OCTOBOT_MARKET_MAKING_URL", "https://market-making.octobot.cloud")
 
 # sync server
@@ -151,6 +156,9 @@ USE_FETCHED_BOT_CONFIG = os_util.parse_boolean_environment_var("USE_FETCHED_BOT_
 SHOULD_CHECK_TENTACLES = os_util.parse_boolean_environment_var("SHOULD_CHECK_TENTACLES", "true")
 CAN_INSTALL_TENTACLES = os_util.parse_boolean_environment_var("CAN_INSTALL_TENTACLES", str(not IS_CLOUD_ENV))
 INSTALL_DEFAULT_TENTACLES = os_util.parse_boolean_environment_var("INSTALL_DEFAULT_TENTACLES", "true")
+# when enabled, only import activated evaluators, trading modes and services tentacles at startup,
+# other ones are imported when looked up
+LAZY_TENTACLES_LOADING = os_util.parse_boolean_environment_var("LAZY_TENTACLES_LOADING", "false")
 PH_TRACKING_ID = os.getenv("PH_TRACKING_ID", "phc_QSuFy6zqOXXKT7zAYboYS4nJShfKovpB172aa8X9nXf")
 # Profiles download urls to import at startup if missing, split by ","
 TO_DOWNLOAD_PROFILES = os.getenv("TO_DOWNLOAD_PROFILES", None)
@@ -207,6 +215,9 @@ DEFAULT_TENTACLES_PACKAGE_NAME = "OctoBot-Default-Tentacles"
 # logs
 DEFAULT_LOGS_FOLDER = "logs"
 LOGS_FOLDER = os.getenv("LOGS_FOLDER", DEFAULT_LOGS_FOLDER)
+# write console and file logs from a listener thread instead of the event loop thread
+ENABLE_QUEUED_LOG_HANDLERS = os_util.parse_boolean_environment_var("ENABLE_QUEUED_LOG_HANDLERS", "True")
+QUEUED_LOG_HANDLERS_MAX_SIZE = int(os.getenv("QUEUED_LOG_HANDLERS_MAX_SIZE", "10000"))
 
 # support
 OCTOCHAT_SUPPORT_DESK_REQUEST_LINK=os.getenv("OCTOCHAT_SUPPORT_DESK_REQUEST_LINK", "https://chat.drakkar.software/request?s=sp-48521ba952b06d7eb960b96655d9f1ee#WyJodHRwczovL2NoYXQuZHJha2thci5zb2Z0d2FyZSIsInJlcXVlc3QiLHsidiI6Miwib3duZXJJZCI6Ijg1ZGJlYzQ4ZWY0YmUyZTFlNmVhZTcwYWE3ODc5YTBlIiwicHNldWRvIjoiSGVya2xvcyIsImVkUHViIjoiYTRmZjQ3NDQ4NDY1OTNmMzgyMjcxNWNjYmVhOWM4MWNiMThmYmM1NzNlOWZiYjAyNWJjNDlmYTBhODYwNTFlNyIsImtlbVB1YiI6IjAwNzQ0MjZlN2IzZTMzNDdkNmI5ZWEwMGIwYWFhMzFmM2UyZjRjNDQ5ZjFmODc3Y2JjOTg1YzEyNDExNDlhMTAiLCJrZW1TaWciOiJhYmVmZTgzZTgzYjJjZDk0NGZiMjdjZmQxODQyOTQwZDdlYzEyYTJlNGRjZmZkNGU1NWIwNzk1NWJmMGFiY2FjNGUxNjFiN2VkOTg0MDFjN2U4NmUwNDdkMTc1ZmNjYzJjMTYxY2MyZjE2M2ZiYzJkZGQ5MjFlN2U5YTY5OWIwZCJ9XQ")
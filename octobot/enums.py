@@ -26,6 +26,7 @@ class CommunityFeedType(enum.Enum):
 class CommunityHistoricalBackendType(enum.Enum):
     Clickhouse = "Clickhouse"
     Iceberg = "Iceberg"
+    Parquet = "Parquet"
     DEFAULT = Iceberg
 
 
@@ -53,6 +53,8 @@ def init_logger(logs_folder: str = constants.DEFAULT_LOGS_FOLDER):
     try:
         if not os.path.exists(logs_folder):
             os.makedirs(logs_folder)
+        # stop previous listener threads before replacing handlers
+        common_logging.disable_queued_handlers()
         _load_logger_config(logs_folder)
         init_bot_channel_logger()
     except KeyError:
@@ -74,6 +76,8 @@ def init_logger(logs_folder: str = constants.DEFAULT_LOGS_FOLDER):
             "OctoBot instance."
         )
         os._exit(-1)
+    if constants.ENABLE_QUEUED_LOG_HANDLERS:
+        common_logging.enable_queued_handlers(constants.QUEUED_LOG_HANDLERS_MAX_SIZE)
 
     sys.excepthook = _log_uncaught_exceptions
     return logger
@@ -32,6 +32,7 @@ import octobot_commons.profiles as profiles
 import octobot_commons.errors
 
 import octobot_services.api as service_api
+import octobot_tentacles_manager.api as tentacles_manager_api
 import octobot_trading.api as trading_api
 
 import octobot.logger as logger
@@ -166,6 +167,9 @@ class OctoBot:
         self.automation = automation.Automation(self.bot_id, self.tentacles_setup_config)
         self._init_metadata_run_task = asyncio.create_task(self._store_run_metadata_when_available())
         await self._init_profile_synchronizer()
+        if constants.LAZY_TENTACLES_LOADING:
+            # bot is started: import deferred tentacles for them to be listed with other tentacles
+            tentacles_manager_api.load_deferred_tentacles()
 
     async def _wait_for_run_data_init(self, exchange_managers, timeout):
         for exchange_manager in exchange_managers:
@@ -20,6 +20,9 @@ from octobot.storage.trading_metadata import (
     clear_run_metadata,
     store_run_metadata,
     store_backtesting_run_metadata,
+    get_backtesting_run_metadata,
+    store_merged_backtesting_run_metadata,
+    merge_backtesting_runs_metadata,
 )
 from octobot.storage.db_databases_pruning import (
     enforce_total_databases_max_size
@@ -30,5 +33,8 @@ __all__ = [
     "clear_run_metadata",
     "store_run_metadata",
     "store_backtesting_run_metadata",
+    "get_backtesting_run_metadata",
+    "store_merged_backtesting_run_metadata",
+    "merge_backtesting_runs_metadata",
     "enforce_total_databases_max_size",
 ]
@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import ast
 import math
 import numpy
 
@@ -50,13 +51,105 @@ async def store_run_metadata(bot_id, exchange_managers, start_time, user_inputs=
 
 
 async def store_backtesting_run_metadata(exchange_managers, start_time, user_inputs, run_dbs_identifier, name) -> dict:
-    run_metadata = await _get_trading_metadata(exchange_managers, start_time, user_inputs, run_dbs_identifier, True, name)
+    run_metadata = await get_backtesting_run_metadata(exchange_managers, start_time, user_inputs, run_dbs_identifier, name)
+    await _log_backtesting_run_metadata(run_dbs_identifier, run_metadata)
+    return run_metadata
+
+
+async def get_backtesting_run_metadata(exchange_managers, start_time, user_inputs, run_dbs_identifier, name) -> dict:
+    return await _get_trading_metadata(exchange_managers, start_time, user_inputs, run_dbs_identifier, True, name)
+
+
+async def store_merged_backtesting_run_metadata(runs_metadata, run_dbs_identifier) -> dict:
+    """
+    Stores the metadata of backtestings sharing the same run databases (one backtesting per exchange)
+    as the metadata of a single run, in the run data and backtesting metadata databases
+    """
+    run_metadata = merge_backtesting_runs_metadata(runs_metadata)
+    async with commons_databases.DBWriter.database(
+            run_dbs_identifier.get_run_data_db_identifier(),
+            with_lock=True) as writer:
+        await writer.log(common_enums.DBTables.METADATA.value, run_metadata)
+    await _log_backtesting_run_metadata(run_dbs_identifier, run_metadata)
+    return run_metadata
+
+
+def merge_backtesting_runs_metadata(runs_metadata) -> dict:
+    """
+    :return: the metadata a single backtesting on every exchange of the given runs would have
+    """
+    merged = dict(runs_metadata[0])
+    exchanges_counts = [
+        len(run_metadata[common_enums.DBRows.EXCHANGES.value]) for run_metadata in runs_metadata
+    ]
+    # multi exchanges values are averaged by exchange
+    for key, decimals in (
+        (common_enums.BacktestingMetadata.GAINS.value, 8),
+        (common_enums.BacktestingMetadata.PERCENT_GAINS.value, 3),
+        (common_enums.BacktestingMetadata.WIN_RATE.value, 3),
+        (common_enums.BacktestingMetadata.DRAW_DOWN.value, 3),
+        (common_enums.BacktestingMetadata.COEFFICIENT_OF_DETERMINATION_MAX_BALANCE.value, None),
+        (common_enums.BacktestingMetadata.COEFFICIENT_OF_DETERMINATION_END_BALANCE.value, None),
+    ):
+        value = float(numpy.average(
+            tuple(run_metadata[key] for run_metadata in runs_metadata), weights=exchanges_counts
+        ))
+        merged[key] = value if decimals is None else round(value, decimals)
+    for key in (
+        common_enums.BacktestingMetadata.ENTRIES.value,
+        common_enums.BacktestingMetadata.TRADES.value,
+    ):
+        merged[key] = sum(run_metadata[key] for run_metadata in runs_metadata)
+    for key in (
+        common_enums.BacktestingMetadata.SYMBOLS.value,
+        common_enums.BacktestingMetadata.TIME_FRAMES.value,
+        common_enums.BacktestingMetadata.BACKTESTING_FILES.value,
+    ):
+        merged[key] = list(set(
+            value for run_metadata in runs_metadata for value in run_metadata[key]
+        ))
+    for key in (
+        common_enums.BacktestingMetadata.MARKETS_PROFITABILITY.value,
+        common_enums.DBRows.FUTURE_CONTRACTS.value,
+    ):
+        merged[key] = {
+            name: value for run_metadata in runs_metadata for name, value in run_metadata[key].items()
+        }
+    for key in (
+        common_enums.BacktestingMetadata.START_PORTFOLIO.value,
+        common_enums.BacktestingMetadata.END_PORTFOLIO.value,
+    ):
+        portfolio = {}
+        for run_metadata in runs_metadata:
+            _add_portfolio(portfolio, ast.literal_eval(run_metadata[key]))
+        merged[key] = str(portfolio)
+    win_rate = merged[common_enums.BacktestingMetadata.WIN_RATE.value]
+    entries = merged[common_enums.BacktestingMetadata.ENTRIES.value]
+    merged[common_enums.BacktestingMetadata.WINS.value] = 0 if math.isnan(win_rate) else round(win_rate * entries / 100)
+    merged[common_enums.BacktestingMetadata.LOSES.value] = \
+        entries - merged[common_enums.BacktestingMetadata.WINS.value]
+    merged[common_enums.DBRows.EXCHANGES.value] = [
+        exchange for run_metadata in runs_metadata for exchange in run_metadata[common_enums.DBRows.EXCHANGES.value]
+    ]
+    merged[common_enums.BacktestingMetadata.LEVERAGE.value] = max(
+        run_metadata[common_enums.BacktestingMetadata.LEVERAGE.value] for run_metadata in runs_metadata
+    )
+    for key, merge_func in (
+        (common_enums.BacktestingMetadata.TIMESTAMP.value, min),
+        (common_enums.BacktestingMetadata.DURATION.value, max),
+        (common_enums.DBRows.START_TIME.value, min),
+        (common_enums.DBRows.END_TIME.value, max),
+    ):
+        merged[key] = merge_func(run_metadata[key] for run_metadata in runs_metadata)
+    return merged
+
+
+async def _log_backtesting_run_metadata(run_dbs_identifier, run_metadata):
     # use local database as a lock is required
     async with commons_databases.DBWriter.database(
             run_dbs_identifier.get_backtesting_metadata_identifier(),
             with_lock=True) as writer:
         await writer.log(common_enums.DBTables.METADATA.value, run_metadata)
-    return run_metadata
 
 
 async def _get_trading_metadata(exchange_managers, run_start_time, user_inputs, run_dbs_identifier, is_backtesting, name) \
@@ -240,17 +333,21 @@ def _get_portfolio(exchange_managers):
 
         for exchange_portfolio, portfolio in zip((exchange_origin_portfolio, exchange_end_portfolio),
                                                  (origin_portfolio, end_portfolio)):
-            for currency, value_dict in exchange_portfolio.items():
-                try:
-                    pf_value = portfolio[currency]
-                except KeyError:
-                    pf_value = {}
-                    portfolio[currency] = pf_value
-                for key, value in value_dict.items():
-                    pf_value[key] = pf_value.get(key, 0) + value
+            _add_portfolio(portfolio, exchange_portfolio)
     return origin_portfolio, end_portfolio
 
 
+def _add_portfolio(portfolio, exchange_portfolio):
+    for currency, value_dict in exchange_portfolio.items():
+        try:
+            pf_value = portfolio[currency]
+        except KeyError:
+            pf_value = {}
+            portfolio[currency] = pf_value
+        for key, value in value_dict.items():
+            pf_value[key] = pf_value.get(key, 0) + value
+
+
 def _get_future_contracts_by_exchange(exchange_managers):
     return {
         trading_api.get_exchange_name(exchange_manager): {
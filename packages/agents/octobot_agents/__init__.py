@@ -50,6 +50,7 @@ from octobot_agents import storage
 from octobot_agents.storage import (
     AbstractMemoryStorage,
     JSONMemoryStorage,
+    IndexedMemoryStorage,
     create_memory_storage,
     get_memory_tools,
     execute_memory_tool,
@@ -136,6 +137,7 @@ __all__ = [
     "AbstractLiveAgentsTeamChannelProducer",
     "AbstractMemoryStorage",
     "JSONMemoryStorage",
+    "IndexedMemoryStorage",
     "MemoryAgentMixin",
     "create_memory_storage",
     "get_memory_tools",
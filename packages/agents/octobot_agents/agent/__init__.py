@@ -49,6 +49,7 @@ from octobot_agents import storage
 from octobot_agents.storage import (
     AbstractMemoryStorage,
     JSONMemoryStorage,
+    IndexedMemoryStorage,
     create_memory_storage,
 )
 
@@ -66,6 +67,7 @@ __all__ = [
     "AbstractAIAgentChannelProducer",
     "AbstractMemoryStorage",
     "JSONMemoryStorage",
+    "IndexedMemoryStorage",
     "MemoryAgentMixin",
     "create_memory_storage",
     # Deep Agent
@@ -113,6 +113,7 @@ class AbstractAIAgentChannelProducer(agent_channels.AbstractAgentChannelProducer
 
     # Memory configuration
     ENABLE_MEMORY: bool = False
+    MEMORY_STORAGE_TYPE: enums.MemoryStorageType = enums.MemoryStorageType.JSON
     MEMORY_SEARCH_LIMIT: int = 5
     MEMORY_STORAGE_ENABLED: bool = True
     MEMORY_AGENT_ID_KEY: str = constants.MEMORY_AGENT_ID_KEY
@@ -151,7 +152,7 @@ class AbstractAIAgentChannelProducer(agent_channels.AbstractAgentChannelProducer
         # Initialize memory storage if memory is enabled
         memory_enabled = enable_memory if enable_memory is not None else self.ENABLE_MEMORY
         self.memory_manager: storage.AbstractMemoryStorage = storage.create_memory_storage(
-            enums.MemoryStorageType.JSON,
+            self.MEMORY_STORAGE_TYPE,
             agent_name=self.__class__.__name__,
             agent_version=self.AGENT_VERSION,
             enabled=memory_enabled,
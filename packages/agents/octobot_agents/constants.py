@@ -52,6 +52,15 @@ MEMORY_CONTENT_MAX_LENGTH = 500
 # Storage constants
 MEMORY_FOLDER_NAME = "agents"
 MEMORY_FILE_EXTENSION = ".json"
+INDEXED_MEMORY_FILE_EXTENSION = ".jsonl"
+
+# Indexed memory constants
+MEMORY_INDEX_DIMENSIONS = 2048
+MEMORY_INDEX_MIN_TOKEN_LENGTH = 2
+MEMORY_INDEX_SIMILARITY_WEIGHT = 0.8
+# journal is compacted when it holds more than ratio * memories records
+MEMORY_JOURNAL_COMPACTION_RATIO = 3
+MEMORY_JOURNAL_MIN_COMPACTION_RECORDS = 50
 
 # Analysis constants
 DEFAULT_ANALYSIS_DIR = "analysis/"
@@ -18,6 +18,7 @@ import enum
 
 class MemoryStorageType(enum.Enum):
     JSON = "json"
+    INDEXED = "indexed"
 
 
 class StepType(enum.Enum):
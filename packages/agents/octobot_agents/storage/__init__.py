@@ -18,6 +18,8 @@ from octobot_agents.storage import memory, history
 from octobot_agents.storage.memory import (
     AbstractMemoryStorage,
     JSONMemoryStorage,
+    MemoryIndex,
+    IndexedMemoryStorage,
     create_memory_storage,
     get_memory_tools,
     execute_memory_tool,
@@ -31,6 +33,8 @@ from octobot_agents.storage.history import (
 __all__ = [
     "AbstractMemoryStorage",
     "JSONMemoryStorage",
+    "MemoryIndex",
+    "IndexedMemoryStorage",
     "create_memory_storage",
     "get_memory_tools",
     "execute_memory_tool",
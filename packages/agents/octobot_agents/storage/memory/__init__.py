@@ -22,6 +22,14 @@ from octobot_agents.storage.memory import json_memory_storage
 from octobot_agents.storage.memory.json_memory_storage import (
     JSONMemoryStorage
 )
+from octobot_agents.storage.memory import memory_index
+from octobot_agents.storage.memory.memory_index import (
+    MemoryIndex
+)
+from octobot_agents.storage.memory import indexed_memory_storage
+from octobot_agents.storage.memory.indexed_memory_storage import (
+    IndexedMemoryStorage
+)
 from octobot_agents.storage.memory import factory
 from octobot_agents.storage.memory.factory import (
     create_memory_storage,
@@ -35,6 +43,8 @@ from octobot_agents.storage.memory.tools import (
 __all__ = [
     "AbstractMemoryStorage",
     "JSONMemoryStorage",
+    "MemoryIndex",
+    "IndexedMemoryStorage",
     "create_memory_storage",
     "get_memory_tools",
     "execute_memory_tool",
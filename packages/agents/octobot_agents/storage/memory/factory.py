@@ -16,6 +16,7 @@
 import octobot_agents.storage.memory.abstract_memory_storage as abstract_memory_storage
 import octobot_agents.enums as enums
 import octobot_agents.storage.memory.json_memory_storage as json_memory_storage
+import octobot_agents.storage.memory.indexed_memory_storage as indexed_memory_storage
 import octobot_agents.constants as constants
 import octobot_agents.errors as errors
 
@@ -59,5 +60,15 @@ def create_memory_storage(
             agent_id_key=agent_id_key,
             max_memories=max_memories,
         )
+    elif storage_type == enums.MemoryStorageType.INDEXED:
+        return indexed_memory_storage.IndexedMemoryStorage(
+            agent_name=agent_name,
+            agent_version=agent_version,
+            enabled=enabled,
+            search_limit=search_limit,
+            storage_enabled=storage_enabled,
+            agent_id_key=agent_id_key,
+            max_memories=max_memories,
+        )
     else:
         raise errors.UnsupportedStorageTypeError(f"Unsupported memory storage type: {storage_type}")
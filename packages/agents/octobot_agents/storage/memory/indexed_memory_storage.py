@@ -0,0 +1,235 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import heapq
+import json
+import os
+import typing
+
+import octobot_agents.storage.memory.json_memory_storage as json_memory_storage
+import octobot_agents.storage.memory.memory_index as memory_index
+import octobot_agents.constants as constants
+
+ADD_OPERATION = "add"
+UPDATE_OPERATION = "update"
+REMOVE_OPERATION = "remove"
+
+
+class IndexedMemoryStorage(json_memory_storage.JSONMemoryStorage):
+    """
+    Memory storage for AI agents backed by a keyword index and an append-only journal.
+
+    Each agent has its own journal at `user/data/agents/memories/<agent_name>.jsonl`:
+    every change is appended as one JSON line instead of rewriting all memories.
+    The journal is compacted once it holds too many outdated records.
+    Memories from an existing JSON memory file are imported on first load.
+    search_memories returns the memories the most similar to the query according
+    to a MemoryIndex, completed by the highest priority memories when not enough
+    memories match the query.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._index: memory_index.MemoryIndex = memory_index.MemoryIndex()
+        self._memories_by_id: typing.Dict[str, dict] = {}
+        self._pending_records: typing.List[dict] = []
+        self._journal_records_count: int = 0
+        super().__init__(*args, **kwargs)
+
+    def _get_memory_file_path(self) -> str:
+        legacy_path_root, _ = os.path.splitext(self._get_legacy_memory_file_path())
+        return f"{legacy_path_root}{constants.INDEXED_MEMORY_FILE_EXTENSION}"
+
+    def _get_legacy_memory_file_path(self) -> str:
+        return super()._get_memory_file_path()
+
+    def _load_memories(self) -> None:
+        self._memories = []
+        self._memories_by_id = {}
+        self._index.clear()
+        self._pending_records = []
+        self._journal_records_count = 0
+        if self._memory_file_path and os.path.exists(self._memory_file_path):
+            self._load_journal()
+        elif os.path.exists(legacy_path := self._get_legacy_memory_file_path()):
+            self._import_legacy_memories(legacy_path)
+
+    def _load_journal(self) -> None:
+        memories_by_id = {}
+        try:
+            with open(self._memory_file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        # an interrupted append can only corrupt the last record
+                        self.logger.warning(f"Ignored invalid memory journal record: {e}")
+                        continue
+                    self._journal_records_count += 1
+                    if "op" not in record:
+                        stored_version = record.get("agent_version")
+                        if stored_version and stored_version != self.agent_version:
+                            self.logger.warning(
+                                f"Memory file version mismatch for {self.agent_name}: "
+                                f"stored={stored_version}, current={self.agent_version}"
+                            )
+                    elif record["op"] == REMOVE_OPERATION:
+                        memories_by_id.pop(record.get("id"), None)
+                    else:
+                        memory = record.get("memory", {})
+                        memories_by_id[memory.get("id")] = memory
+        except IOError as e:
+            self.logger.warning(f"Error loading memories from {self._memory_file_path}: {e}")
+            memories_by_id = {}
+        for memory in memories_by_id.values():
+            self._add_memory(memory)
+        # loading is not a change
+        self._pending_records = []
+        self.logger.debug(f"Loaded {len(self._memories)} memories from {self._memory_file_path}")
+
+    def _import_legacy_memories(self, legacy_path: str) -> None:
+        try:
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            self.logger.warning(f"Error loading memories from {legacy_path}: {e}")
+            return
+        for memory in data.get("memories", []):
+            self._add_memory(memory)
+        self._compact_journal()
+        self.logger.info(f"Imported {len(self._memories)} memories from {legacy_path}")
+
+    @staticmethod
+    def _get_indexed_text(memory: dict) -> str:
+        return " ".join((
+            memory.get("title", ""),
+            memory.get("context", ""),
+            memory.get("content", ""),
+            memory.get("category", ""),
+            " ".join(memory.get("tags", [])),
+        ))
+
+    def _add_memory(self, memory: dict) -> None:
+        super()._add_memory(memory)
+        self._memories_by_id[memory.get("id")] = memory
+        self._index.add(memory.get("id"), self._get_indexed_text(memory))
+        self._pending_records.append({"op": ADD_OPERATION, "memory": memory})
+
+    def _remove_memory(self, memory: dict) -> None:
+        super()._remove_memory(memory)
+        self._memories_by_id.pop(memory.get("id"), None)
+        self._index.remove(memory.get("id"))
+        self._pending_records.append({"op": REMOVE_OPERATION, "id": memory.get("id")})
+
+    def _on_memory_updated(self, memory: dict) -> None:
+        # scores and metadata updates don't change indexed texts
+        self._pending_records.append({"op": UPDATE_OPERATION, "memory": memory})
+
+    def _find_memory(self, memory_id: str) -> typing.Optional[dict]:
+        return self._memories_by_id.get(memory_id)
+
+    def _should_compact_journal(self) -> bool:
+        return (
+            self._journal_records_count > constants.MEMORY_JOURNAL_MIN_COMPACTION_RECORDS
+            and self._journal_records_count > len(self._memories) * constants.MEMORY_JOURNAL_COMPACTION_RATIO
+        )
+
+    def _save_memories(self) -> None:
+        if not self._memory_file_path or not self._pending_records:
+            return
+        if self._journal_records_count == 0:
+            self._compact_journal()
+            return
+        try:
+            with open(self._memory_file_path, 'a', encoding='utf-8') as f:
+                self._lock_file(f, self._memory_file_path)
+                f.write("".join(self._serialize_record(record) for record in self._pending_records))
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal_records_count += len(self._pending_records)
+            self.logger.debug(f"Appended {len(self._pending_records)} memory records to {self._memory_file_path}")
+            self._pending_records = []
+        except (IOError, OSError) as e:
+            self.logger.warning(f"Error saving memories to {self._memory_file_path}: {e}")
+            return
+        if self._should_compact_journal():
+            self._compact_journal()
+
+    def _compact_journal(self) -> None:
+        if not self._memory_file_path:
+            return
+        records = [{"agent_version": self.agent_version}] + [
+            {"op": ADD_OPERATION, "memory": memory}
+            for memory in self._memories
+        ]
+        try:
+            # Use atomic write: write to temp file, then rename
+            temp_path = f"{self._memory_file_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                self._lock_file(f, temp_path)
+                f.write("".join(self._serialize_record(record) for record in records))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self._memory_file_path)
+            self._journal_records_count = len(records)
+            self._pending_records = []
+            self.logger.debug(f"Compacted {len(self._memories)} memories into {self._memory_file_path}")
+        except (IOError, OSError) as e:
+            self.logger.warning(f"Error saving memories to {self._memory_file_path}: {e}")
+
+    @staticmethod
+    def _serialize_record(record: dict) -> str:
+        return f"{json.dumps(record, ensure_ascii=False, default=str)}\n"
+
+    async def search_memories(
+        self,
+        query: str,
+        input_data: typing.Any,
+        limit: typing.Optional[int] = None,
+    ) -> typing.List[dict]:
+        if not self.is_enabled():
+            return []
+
+        try:
+            limit = limit or self.search_limit
+            scored_memories = [
+                (
+                    similarity * constants.MEMORY_INDEX_SIMILARITY_WEIGHT
+                    + self._get_search_priority(self._memories_by_id[memory_id])
+                    * (1 - constants.MEMORY_INDEX_SIMILARITY_WEIGHT),
+                    self._memories_by_id[memory_id]
+                )
+                for memory_id, similarity in self._index.search(query or "", limit)
+            ]
+            selected_memories = [
+                memory
+                for _, memory in sorted(scored_memories, key=lambda scored: scored[0], reverse=True)
+            ]
+            if len(selected_memories) < limit:
+                # complete with the highest priority memories
+                selected_ids = set(memory.get("id") for memory in selected_memories)
+                selected_memories += heapq.nlargest(
+                    limit - len(selected_memories),
+                    (memory for memory in self._memories if memory.get("id") not in selected_ids),
+                    key=self._get_search_priority,
+                )
+            results = [self._format_search_result(mem) for mem in selected_memories]
+            if results:
+                self.logger.debug(f"Retrieved {len(results)} memory summaries")
+            return results
+        except Exception as e:
+            self.logger.warning(f"Error searching memories: {e}")
+            return []
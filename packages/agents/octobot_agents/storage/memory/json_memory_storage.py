@@ -118,6 +118,19 @@ class JSONMemoryStorage(abstract_memory_storage.AbstractMemoryStorage):
             self.logger.warning(f"Error loading memories from {self._memory_file_path}: {e}")
             self._memories = []
     
+    def _lock_file(self, f: typing.IO, path: str) -> None:
+        # Acquire exclusive lock if available
+        if HAS_FILE_LOCKING:
+            try:
+                if HAS_FCNTL:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                else:
+                    # Windows
+                    file_size = os.path.getsize(path) if os.path.exists(path) else 0
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, file_size)
+            except (IOError, OSError) as e:
+                self.logger.warning(f"Could not acquire file lock: {e}")
+    
     def _save_memories(self) -> None:
         if not self._memory_file_path:
             return
@@ -127,18 +140,7 @@ class JSONMemoryStorage(abstract_memory_storage.AbstractMemoryStorage):
             temp_path = f"{self._memory_file_path}.tmp"
             
             with open(temp_path, 'w', encoding='utf-8') as f:
-                # Acquire exclusive lock if available
-                if HAS_FILE_LOCKING:
-                    try:
-                        if HAS_FCNTL:
-                            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                        else:
-                            # Windows
-                            file_size = os.path.getsize(temp_path) if os.path.exists(temp_path) else 0
-                            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, file_size)
-                    except (IOError, OSError) as e:
-                        self.logger.warning(f"Could not acquire file lock: {e}")
-                
+                self._lock_file(f, temp_path)
                 data = {
                     "agent_version": self.agent_version,
                     "memories": self._memories,
@@ -183,28 +185,12 @@ class JSONMemoryStorage(abstract_memory_storage.AbstractMemoryStorage):
             # Sort by importance_score and confidence_score (highest first)
             sorted_memories = sorted(
                 self._memories,
-                key=lambda m: (
-                    m.get("importance_score", 0.5) * 0.6 +
-                    m.get("confidence_score", 0.5) * 0.4
-                ),
+                key=self._get_search_priority,
                 reverse=True
             )
             
             # Return summaries (limit applied by LLM tool)
-            results = []
-            for mem in sorted_memories[:limit]:
-                results.append({
-                    "memory": mem.get("content", ""),
-                    "metadata": {
-                        "id": mem.get("id"),
-                        "title": mem.get("title", ""),
-                        "context": mem.get("context", ""),
-                        "category": mem.get("category", constants.DEFAULT_CATEGORY),
-                        "tags": mem.get("tags", []),
-                        "importance_score": mem.get("importance_score", constants.DEFAULT_IMPORTANCE_SCORE),
-                        "confidence_score": mem.get("confidence_score", constants.DEFAULT_CONFIDENCE_SCORE),
-                    }
-                })
+            results = [self._format_search_result(mem) for mem in sorted_memories[:limit]]
             
             if results:
                 self.logger.debug(f"Retrieved {len(results)} memory summaries")
@@ -213,6 +199,24 @@ class JSONMemoryStorage(abstract_memory_storage.AbstractMemoryStorage):
             self.logger.warning(f"Error searching memories: {e}")
             return []
     
+    @staticmethod
+    def _get_search_priority(mem: dict) -> float:
+        return mem.get("importance_score", 0.5) * 0.6 + mem.get("confidence_score", 0.5) * 0.4
+    
+    def _format_search_result(self, mem: dict) -> dict:
+        return {
+            "memory": mem.get("content", ""),
+            "metadata": {
+                "id": mem.get("id"),
+                "title": mem.get("title", ""),
+                "context": mem.get("context", ""),
+                "category": mem.get("category", constants.DEFAULT_CATEGORY),
+                "tags": mem.get("tags", []),
+                "importance_score": mem.get("importance_score", constants.DEFAULT_IMPORTANCE_SCORE),
+                "confidence_score": mem.get("confidence_score", constants.DEFAULT_CONFIDENCE_SCORE),
+            }
+        }
+    
     def _truncate_content(
         self,
         title: str,
@@ -375,7 +379,7 @@ class JSONMemoryStorage(abstract_memory_storage.AbstractMemoryStorage):
                 },
             }
             
-            self._memories.append(memory)
+            self._add_memory(memory)
             
             # Prune if needed
             if len(self._memories) > self.max_memories:
@@ -473,41 +477,54 @@ class JSONMemoryStorage(abstract_memory_storage.AbstractMemoryStorage):
                 to_remove.append(mem)
         
         for mem in to_remove:
-            self._memories.remove(mem)
+            self._remove_memory(mem)
         
         if to_remove:
             self.logger.info(f"Pruned {len(to_remove)} memories (kept {len(self._memories)})")
     
-    def update_memory_importance(self, memory_id: str, score: float) -> None:
+    def _add_memory(self, memory: dict) -> None:
+        self._memories.append(memory)
+    
+    def _remove_memory(self, memory: dict) -> None:
+        self._memories.remove(memory)
+    
+    def _on_memory_updated(self, memory: dict) -> None:
+        # memories are saved as a whole: nothing to track
+        pass
+    
+    def _find_memory(self, memory_id: str) -> typing.Optional[dict]:
         for mem in self._memories:
             if mem.get("id") == memory_id:
-                mem["importance_score"] = max(0.0, min(1.0, score))
-                self._save_memories()
-                return
+                return mem
+        return None
+    
+    def update_memory_importance(self, memory_id: str, score: float) -> None:
+        if (mem := self._find_memory(memory_id)) is not None:
+            mem["importance_score"] = max(0.0, min(1.0, score))
+            self._on_memory_updated(mem)
+            self._save_memories()
+            return
         self.logger.warning(f"Memory {memory_id} not found for importance update")
     
     def update_memory_confidence(self, memory_id: str, score: float) -> None:
-        for mem in self._memories:
-            if mem.get("id") == memory_id:
-                mem["confidence_score"] = max(0.0, min(1.0, score))
-                self._save_memories()
-                return
+        if (mem := self._find_memory(memory_id)) is not None:
+            mem["confidence_score"] = max(0.0, min(1.0, score))
+            self._on_memory_updated(mem)
+            self._save_memories()
+            return
         self.logger.warning(f"Memory {memory_id} not found for confidence update")
     
     def increment_memory_use(self, memory_id: str) -> None:
-        for mem in self._memories:
-            if mem.get("id") == memory_id:
-                metadata = mem.setdefault("metadata", {})
-                metadata["use_count"] = metadata.get("use_count", 0) + 1
-                self._save_memories()
-                return
+        if (mem := self._find_memory(memory_id)) is not None:
+            metadata = mem.setdefault("metadata", {})
+            metadata["use_count"] = metadata.get("use_count", 0) + 1
+            self._on_memory_updated(mem)
+            self._save_memories()
+            return
         self.logger.warning(f"Memory {memory_id} not found for use count increment")
     
     def get_memory_by_id(self, memory_id: str) -> typing.Optional[dict]:
-        for mem in self._memories:
-            if mem.get("id") == memory_id:
-                return mem
-        return None
+        return self._find_memory(memory_id)
     
     def get_all_memories(self) -> typing.List[dict]:
         return self._memories.copy()
@@ -0,0 +1,163 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import collections
+import math
+import re
+import typing
+import zlib
+
+import numpy
+
+import octobot_agents.constants as constants
+
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> typing.List[str]:
+    return [
+        token
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if len(token) >= constants.MEMORY_INDEX_MIN_TOKEN_LENGTH
+    ]
+
+
+class MemoryIndex:
+    """
+    Local keyword index over memory texts.
+
+    Each memory is stored as a L2-normalized hashed term frequency vector in a
+    compact float32 matrix. Queries only score the rows sharing at least one term
+    with the query (found through an inverted index) and rank them by cosine
+    similarity weighted by the inverse document frequency of the query terms.
+    """
+
+    def __init__(self, dimensions: int = constants.MEMORY_INDEX_DIMENSIONS):
+        self.dimensions: int = dimensions
+        self._vectors: numpy.ndarray = numpy.zeros((0, dimensions), dtype=numpy.float32)
+        self._ids: typing.List[str] = []
+        self._row_by_id: typing.Dict[str, int] = {}
+        self._rows_by_bucket: typing.Dict[int, typing.Set[int]] = collections.defaultdict(set)
+        self._buckets_by_row: typing.List[typing.Tuple[int, ...]] = []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._row_by_id
+
+    def _bucket(self, token: str) -> int:
+        return zlib.crc32(token.encode()) % self.dimensions
+
+    def _term_frequencies(self, text: str) -> typing.Dict[int, float]:
+        counts = collections.Counter(self._bucket(token) for token in tokenize(text))
+        # sublinear term frequency: avoid letting repeated words dominate a memory
+        return {bucket: 1 + math.log(count) for bucket, count in counts.items()}
+
+    def _ensure_capacity(self, size: int) -> None:
+        if size <= self._vectors.shape[0]:
+            return
+        capacity = max(size, 2 * self._vectors.shape[0], 16)
+        vectors = numpy.zeros((capacity, self.dimensions), dtype=numpy.float32)
+        vectors[:len(self._ids)] = self._vectors[:len(self._ids)]
+        self._vectors = vectors
+
+    def add(self, memory_id: str, text: str) -> None:
+        if memory_id in self._row_by_id:
+            self.remove(memory_id)
+        frequencies = self._term_frequencies(text)
+        row = len(self._ids)
+        self._ensure_capacity(row + 1)
+        vector = self._vectors[row]
+        vector[:] = 0
+        if frequencies:
+            buckets = numpy.fromiter(frequencies.keys(), dtype=numpy.int64, count=len(frequencies))
+            vector[buckets] = numpy.fromiter(frequencies.values(), dtype=numpy.float32, count=len(frequencies))
+            vector /= numpy.linalg.norm(vector)
+        self._ids.append(memory_id)
+        self._row_by_id[memory_id] = row
+        self._buckets_by_row.append(tuple(frequencies))
+        for bucket in frequencies:
+            self._rows_by_bucket[bucket].add(row)
+
+    def remove(self, memory_id: str) -> None:
+        row = self._row_by_id.pop(memory_id, None)
+        if row is None:
+            return
+        for bucket in self._buckets_by_row[row]:
+            self._drop_posting(bucket, row)
+        last_row = len(self._ids) - 1
+        if row != last_row:
+            # move the last row into the freed slot to keep the matrix compact
+            last_id = self._ids[last_row]
+            self._vectors[row] = self._vectors[last_row]
+            self._ids[row] = last_id
+            self._row_by_id[last_id] = row
+            self._buckets_by_row[row] = self._buckets_by_row[last_row]
+            for bucket in self._buckets_by_row[row]:
+                self._drop_posting(bucket, last_row)
+                self._rows_by_bucket[bucket].add(row)
+        self._ids.pop()
+        self._buckets_by_row.pop()
+
+    def _drop_posting(self, bucket: int, row: int) -> None:
+        rows = self._rows_by_bucket[bucket]
+        rows.discard(row)
+        if not rows:
+            del self._rows_by_bucket[bucket]
+
+    def clear(self) -> None:
+        self._vectors = numpy.zeros((0, self.dimensions), dtype=numpy.float32)
+        self._ids = []
+        self._row_by_id = {}
+        self._rows_by_bucket = collections.defaultdict(set)
+        self._buckets_by_row = []
+
+    def search(self, query: str, limit: int) -> typing.List[typing.Tuple[str, float]]:
+        """
+        Find the memories most similar to the query.
+
+        Args:
+            query: Search query.
+            limit: Maximum number of results.
+
+        Returns:
+            List of (memory_id, similarity) sorted by decreasing similarity. Only
+            memories sharing at least one term with the query are returned.
+        """
+        if limit <= 0 or not self._ids:
+            return []
+        frequencies = self._term_frequencies(query)
+        candidate_rows = set()
+        query_weights = {}
+        for bucket, frequency in frequencies.items():
+            if rows := self._rows_by_bucket.get(bucket):
+                candidate_rows.update(rows)
+                query_weights[bucket] = frequency * math.log(1 + len(self._ids) / len(rows))
+        if not candidate_rows:
+            return []
+        buckets = numpy.fromiter(query_weights.keys(), dtype=numpy.int64, count=len(query_weights))
+        weights = numpy.fromiter(query_weights.values(), dtype=numpy.float32, count=len(query_weights))
+        weights /= numpy.linalg.norm(weights)
+        rows = numpy.fromiter(candidate_rows, dtype=numpy.int64, count=len(candidate_rows))
+        # only the query buckets contribute to the dot product
+        scores = self._vectors[rows[:, None], buckets] @ weights
+        if len(rows) > limit:
+            top = numpy.argpartition(scores, -limit)[-limit:]
+        else:
+            top = numpy.arange(len(rows))
+        top = top[numpy.argsort(scores[top])[::-1]]
+        return [(self._ids[rows[index]], float(scores[index])) for index in top]
@@ -0,0 +1,105 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import json
+import mock
+import pytest
+
+import octobot_commons.constants as commons_constants
+import octobot_agents.constants as agent_constants
+import octobot_agents.enums as agent_enums
+import octobot_agents.storage.memory as memory
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def user_folder(tmp_path):
+    with mock.patch.object(commons_constants, "USER_FOLDER", str(tmp_path)):
+        yield tmp_path
+
+
+def _create_storage(**kwargs):
+    return memory.create_memory_storage(
+        agent_enums.MemoryStorageType.INDEXED, agent_name="TestAgent", agent_version="1.0.0", **kwargs
+    )
+
+
+async def _store(storage, title, content, importance_score=agent_constants.DEFAULT_IMPORTANCE_SCORE):
+    await storage.store_execution_memory(
+        {}, None, user_message=content, metadata={"title": title, "importance_score": importance_score}
+    )
+    return storage.get_all_memories()[-1]["id"]
+
+
+async def test_memory_index_search():
+    index = memory.MemoryIndex(dimensions=256)
+    index.add("1", "bitcoin breakout above resistance")
+    index.add("2", "ethereum funding rate turned negative")
+    index.add("3", "bitcoin volume spike on breakout")
+    assert [memory_id for memory_id, _ in index.search("bitcoin breakout", 5)] == ["1", "3"]
+    assert [memory_id for memory_id, _ in index.search("bitcoin breakout", 1)] == ["1"]
+    assert index.search("solana", 5) == []
+    index.remove("1")
+    assert "1" not in index
+    assert len(index) == 2
+    assert [memory_id for memory_id, _ in index.search("bitcoin breakout", 5)] == ["3"]
+    assert [memory_id for memory_id, _ in index.search("funding", 5)] == ["2"]
+
+
+async def test_search_memories_by_relevance(user_folder):
+    storage = _create_storage()
+    assert isinstance(storage, memory.IndexedMemoryStorage)
+    await _store(storage, "Funding", "Negative funding rates preceded ETH squeezes", importance_score=0.9)
+    btc_id = await _store(storage, "BTC breakouts", "BTC breakouts on low volume often fail")
+    await _store(storage, "Risk", "Reduce position sizes during high volatility", importance_score=0.8)
+
+    results = await storage.search_memories("volume breakout", {}, limit=1)
+    assert [result["metadata"]["id"] for result in results] == [btc_id]
+    # completed by the highest priority memories
+    results = await storage.search_memories("volume breakout", {}, limit=3)
+    assert [result["metadata"]["title"] for result in results] == ["BTC breakouts", "Funding", "Risk"]
+
+
+async def test_journal_persistence_and_compaction(user_folder):
+    storage = _create_storage(max_memories=2)
+    first_id = await _store(storage, "first", "first memory", importance_score=0.1)
+    second_id = await _store(storage, "second", "second memory")
+    third_id = await _store(storage, "third", "third memory")
+    storage.increment_memory_use(third_id)
+    with open(storage._memory_file_path) as f:
+        # header + 3 additions + 1 removal + 1 update: nothing was rewritten
+        assert len(f.readlines()) == 6
+
+    reloaded = _create_storage(max_memories=2)
+    assert [mem["id"] for mem in reloaded.get_all_memories()] == [second_id, third_id]
+    assert reloaded.get_memory_by_id(first_id) is None
+    assert reloaded.get_memory_by_id(third_id)["metadata"]["use_count"] == 1
+
+    with mock.patch.object(agent_constants, "MEMORY_JOURNAL_MIN_COMPACTION_RECORDS", 0):
+        reloaded.increment_memory_use(second_id)
+    with open(reloaded._memory_file_path) as f:
+        assert len(f.readlines()) == 3
+
+
+async def test_legacy_json_memories_import(user_folder):
+    json_storage = memory.create_memory_storage(
+        agent_enums.MemoryStorageType.JSON, agent_name="TestAgent", agent_version="1.0.0"
+    )
+    memory_id = await _store(json_storage, "legacy", "legacy memory content")
+    storage = _create_storage()
+    assert storage.get_memory_by_id(memory_id)["title"] == "legacy"
+    with open(storage._memory_file_path) as f:
+        assert [json.loads(line).get("op") for line in f] == [None, "add"]
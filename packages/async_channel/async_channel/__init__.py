@@ -31,11 +31,18 @@ from async_channel.producer import Producer
 
 from async_channel import consumer
 from async_channel.consumer import (
+    ConsumerQueue,
     Consumer,
     InternalConsumer,
     SupervisedConsumer,
 )
 
+from async_channel import metrics
+from async_channel.metrics import (
+    ConsumerMetrics,
+    DurationHistogram,
+)
+
 PROJECT_NAME = "async-channel"
 VERSION = "2.2.2"  # major.minor.revision
 
@@ -44,9 +51,12 @@ __all__ = [
     "DEFAULT_QUEUE_SIZE",
     "ChannelConsumerPriorityLevels",
     "Producer",
+    "ConsumerQueue",
     "Consumer",
     "InternalConsumer",
     "SupervisedConsumer",
+    "ConsumerMetrics",
+    "DurationHistogram",
     "PROJECT_NAME",
     "VERSION",
 ]
@@ -17,10 +17,13 @@
 """
 Defines the channel core class : Channel
 """
+import functools
 import typing
 
 import async_channel.util.logging_util as logging
 import async_channel.enums
+import async_channel.consumer
+import async_channel.metrics
 import async_channel.channels.channel_instances as channel_instances
 
 if typing.TYPE_CHECKING:
@@ -79,6 +82,12 @@ class Channel:
         # Used to synchronize producers and consumer
         self.is_synchronized: bool = False
 
+        # Called with the consumer each time data is added to a consumer queue
+        # Used to know which consumers have data to process when the channel is synchronized
+        self.consumer_queue_listener: typing.Optional[
+            typing.Callable[["async_channel.consumer.Consumer"], None]
+        ] = None
+
     @classmethod
     def get_name(cls) -> str:
         """
@@ -145,6 +154,31 @@ class Channel:
         """
         consumer_filters[self.INSTANCE_KEY] = consumer
         self.consumers.append(consumer_filters)
+        self._listen_consumer_queue(consumer)
+        if async_channel.metrics.is_enabled() and consumer.metrics is None:
+            consumer.set_metrics(async_channel.metrics.ConsumerMetrics())
+
+    def set_consumer_queue_listener(
+        self,
+        listener: typing.Optional[
+            typing.Callable[["async_channel.consumer.Consumer"], None]
+        ],
+    ) -> None:
+        """
+        Set the listener called with the consumer each time data is added to one of this channel's consumers queue
+        :param listener: the listener to call, None to stop listening
+        """
+        self.consumer_queue_listener = listener
+        for consumer in self.consumers:
+            self._listen_consumer_queue(consumer[self.INSTANCE_KEY])
+
+    def _listen_consumer_queue(self, consumer: "async_channel.consumer.Consumer") -> None:
+        if isinstance(consumer.queue, async_channel.consumer.ConsumerQueue):
+            consumer.queue.listener = (
+                None
+                if self.consumer_queue_listener is None
+                else functools.partial(self.consumer_queue_listener, consumer)
+            )
 
     def get_consumer_from_filters(
         self, consumer_filters: dict
@@ -16,6 +16,25 @@
 """
 Define async_channel global constants
 """
+import os
+
 CHANNEL_WILDCARD = "*"
 
 DEFAULT_QUEUE_SIZE = 0  # unlimited
+
+# Consumers metrics are disabled by default as measuring every queued element has a cost
+ENABLE_METRICS = os.getenv("ASYNC_CHANNEL_METRICS", "false").lower() == "true"
+# Upper bounds, in seconds, of the latency and callback duration histograms buckets
+METRICS_DURATION_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1,
+    5,
+    10,
+)
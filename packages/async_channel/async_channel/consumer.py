@@ -17,11 +17,68 @@
 Define async_channel Consumer class
 """
 import asyncio
+import collections
+import time
 import typing
 
 import async_channel.util.logging_util as logging
 import async_channel.enums
 
+if typing.TYPE_CHECKING:
+    import async_channel.metrics
+
+
+class ConsumerQueue(asyncio.Queue):
+    """
+    An asyncio.Queue calling its listener each time an element is added
+    Used by synchronized channels to know which consumers have data to process
+    Also measures the queue depth and the time spent by elements in the queue when metrics are set
+    """
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize=maxsize)
+        self.listener: typing.Optional[typing.Callable[[], None]] = None
+        self.metrics: typing.Optional["async_channel.metrics.ConsumerMetrics"] = None
+        # time at which each queued element has been added, None when unknown
+        self._put_times: collections.deque = collections.deque()
+
+    def set_metrics(
+        self, metrics: typing.Optional["async_channel.metrics.ConsumerMetrics"]
+    ) -> None:
+        """
+        Set the metrics to update, None to stop measuring
+        :param metrics: the metrics to update
+        """
+        self.metrics = metrics
+        # elements queued before metrics were set have no known put time
+        self._put_times = collections.deque(
+            [None] * self.qsize() if metrics is not None else ()
+        )
+
+    def _put(self, item: typing.Any) -> None:
+        super()._put(item)
+        if self.metrics is not None:
+            self._put_times.append(time.perf_counter())
+            self.metrics.on_put(self.qsize())
+
+    def _get(self) -> typing.Any:
+        item = super()._get()
+        if self.metrics is not None and self._put_times:
+            put_time = self._put_times.popleft()
+            if put_time is not None:
+                self.metrics.on_get(time.perf_counter() - put_time)
+        return item
+
+    def put_nowait(self, item: typing.Any) -> None:
+        """
+        Add the item to the queue and call the listener
+        put() is also calling put_nowait()
+        :param item: the item to add
+        """
+        super().put_nowait(item)
+        if self.listener is not None:
+            self.listener()
+
 
 class Consumer:
     """
@@ -40,7 +97,7 @@ class Consumer:
         self.logger = logging.get_logger(self.__class__.__name__)
 
         # Consumer data queue. It contains producer's work (received through Producer.send()).
-        self.queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self.queue: asyncio.Queue = ConsumerQueue(maxsize=size)
 
         # Method to be called when performing task is done
         self.callback: typing.Callable = callback
@@ -60,13 +117,16 @@ class Consumer:
         # The lowest level has the highest priority
         self.priority_level: int = priority_level
 
+        # Set when consumer metrics are enabled
+        self.metrics: typing.Optional["async_channel.metrics.ConsumerMetrics"] = None
+
     async def consume(self) -> None:
         """
         Should be overwritten with a self.queue.get() in a while loop
         """
         while not self.should_stop:
             try:
-                await self.perform(await self.queue.get())
+                await self.measured_perform(await self.queue.get())
             except asyncio.CancelledError:
                 self.logger.debug("Cancelled task")
             except Exception as consume_exception:  # pylint: disable=broad-except
@@ -85,6 +145,35 @@ class Consumer:
         """
         await self.callback(**kwargs)
 
+    async def measured_perform(self, kwargs) -> None:
+        """
+        Call perform and measure its duration and errors when metrics are set
+        :param kwargs: queue get content
+        """
+        if (metrics := self.metrics) is None:
+            await self.perform(kwargs)
+            return
+        is_error = False
+        start_time = time.perf_counter()
+        try:
+            await self.perform(kwargs)
+        except Exception:
+            is_error = True
+            raise
+        finally:
+            metrics.on_perform(time.perf_counter() - start_time, is_error)
+
+    def set_metrics(
+        self, metrics: typing.Optional["async_channel.metrics.ConsumerMetrics"]
+    ) -> None:
+        """
+        Set the metrics to update, None to stop measuring
+        :param metrics: the metrics to update
+        """
+        self.metrics = metrics
+        if isinstance(self.queue, ConsumerQueue):
+            self.queue.set_metrics(metrics)
+
     async def consume_ends(self) -> None:
         """
         Should be overwritten to handle consumption ends
@@ -0,0 +1,358 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define async_channel consumers metrics: enqueue to callback latency, callback duration,
+queue depth and callback errors, per channel and consumer
+"""
+import bisect
+import typing
+
+import async_channel.constants
+import async_channel.channels.channel_instances as channel_instances
+
+if typing.TYPE_CHECKING:
+    import async_channel.channels.channel
+    import async_channel.consumer
+
+_METRICS_PREFIX = "async_channel"
+INFINITE_BUCKET = "+Inf"
+
+
+class DurationHistogram:
+    """
+    Counts durations (in seconds) by bucket upper bound
+    """
+
+    def __init__(
+        self, buckets: tuple = async_channel.constants.METRICS_DURATION_BUCKETS
+    ):
+        self.buckets: tuple = buckets
+        # last count is for durations above the last bucket upper bound
+        self.bucket_counts: list[int] = [0] * (len(buckets) + 1)
+        self.count: int = 0
+        self.sum: float = 0
+        self.max: float = 0
+
+    def observe(self, duration: float) -> None:
+        """
+        Add a duration to the histogram
+        :param duration: the duration in seconds
+        """
+        self.bucket_counts[bisect.bisect_left(self.buckets, duration)] += 1
+        self.count += 1
+        self.sum += duration
+        if duration > self.max:
+            self.max = duration
+
+    def merge(self, other: "DurationHistogram") -> None:
+        """
+        Add the other histogram durations to this histogram
+        :param other: the histogram to merge, using the same buckets
+        """
+        self.bucket_counts = [
+            count + other_count
+            for count, other_count in zip(self.bucket_counts, other.bucket_counts)
+        ]
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def get_cumulative_buckets(self) -> list[tuple[str, int]]:
+        """
+        :return: the (upper bound, count of durations lower or equal to this bound) list
+        """
+        cumulative_buckets = []
+        cumulative_count = 0
+        for bound, count in zip(
+            (*(str(bucket) for bucket in self.buckets), INFINITE_BUCKET),
+            self.bucket_counts,
+        ):
+            cumulative_count += count
+            cumulative_buckets.append((bound, cumulative_count))
+        return cumulative_buckets
+
+    def to_dict(self) -> dict:
+        """
+        :return: the histogram as a dict
+        """
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else 0,
+            "buckets": dict(self.get_cumulative_buckets()),
+        }
+
+
+class ConsumerMetrics:
+    """
+    Metrics of a consumer, updated by its queue and when calling its perform method
+    """
+
+    def __init__(self):
+        # time between a producer adding an element to the queue and the consumer getting it
+        self.enqueue_to_callback_latency: DurationHistogram = DurationHistogram()
+        self.callback_duration: DurationHistogram = DurationHistogram()
+        self.queue_depth_high_water_mark: int = 0
+        self.enqueued_count: int = 0
+        self.errors_count: int = 0
+
+    def on_put(self, queue_depth: int) -> None:
+        """
+        Called when an element is added to the consumer queue
+        :param queue_depth: the queue size including the added element
+        """
+        self.enqueued_count += 1
+        if queue_depth > self.queue_depth_high_water_mark:
+            self.queue_depth_high_water_mark = queue_depth
+
+    def on_get(self, latency: float) -> None:
+        """
+        Called when the consumer gets an element from its queue
+        :param latency: the time spent by the element in the queue
+        """
+        self.enqueue_to_callback_latency.observe(latency)
+
+    def on_perform(self, duration: float, is_error: bool) -> None:
+        """
+        Called when the consumer perform method is done
+        :param duration: the perform call duration
+        :param is_error: True if perform raised
+        """
+        self.callback_duration.observe(duration)
+        if is_error:
+            self.errors_count += 1
+
+    def merge(self, other: "ConsumerMetrics") -> None:
+        """
+        Add the other consumer metrics to this one
+        :param other: the metrics to merge
+        """
+        self.enqueue_to_callback_latency.merge(other.enqueue_to_callback_latency)
+        self.callback_duration.merge(other.callback_duration)
+        self.queue_depth_high_water_mark = max(
+            self.queue_depth_high_water_mark, other.queue_depth_high_water_mark
+        )
+        self.enqueued_count += other.enqueued_count
+        self.errors_count += other.errors_count
+
+
+class _MetricsState:
+    enabled: bool = async_channel.constants.ENABLE_METRICS
+
+
+def is_enabled() -> bool:
+    """
+    :return: True if new consumers are measured
+    """
+    return _MetricsState.enabled
+
+
+def enable(enabled: bool = True) -> None:
+    """
+    Start or stop measuring consumers, including the existing ones.
+    Stopping also clears the existing consumers metrics
+    :param enabled: True to measure consumers
+    """
+    _MetricsState.enabled = enabled
+    for _, chan in _get_channels():
+        for consumer in chan.get_consumers():
+            if not enabled:
+                consumer.set_metrics(None)
+            elif consumer.metrics is None:
+                consumer.set_metrics(ConsumerMetrics())
+
+
+def reset() -> None:
+    """
+    Clear the existing consumers metrics
+    """
+    if _MetricsState.enabled:
+        for _, chan in _get_channels():
+            for consumer in chan.get_consumers():
+                consumer.set_metrics(ConsumerMetrics())
+
+
+def get_consumer_label(consumer: "async_channel.consumer.Consumer") -> str:
+    """
+    :param consumer: the consumer to identify
+    :return: the consumer class and callback name
+    """
+    callback_name = (
+        getattr(consumer.callback, "__qualname__", None)
+        or consumer.callback.__class__.__name__
+    )
+    return f"{consumer.__class__.__name__}:{callback_name}"
+
+
+def get_metrics() -> list[dict]:
+    """
+    Consumers of a channel using the same class and callback are aggregated
+    :return: the consumers metrics, by channel and consumer
+    """
+    metrics = []
+    for (chan_id, chan_name, consumer_label), (
+        consumers_count,
+        queue_depth,
+        consumer_metrics,
+    ) in _get_aggregated_metrics().items():
+        metrics.append(
+            {
+                "channel": chan_name,
+                "channel_id": chan_id,
+                "consumer": consumer_label,
+                "consumers_count": consumers_count,
+                "queue_depth": queue_depth,
+                "queue_depth_high_water_mark": consumer_metrics.queue_depth_high_water_mark,
+                "enqueued_count": consumer_metrics.enqueued_count,
+                "errors_count": consumer_metrics.errors_count,
+                "enqueue_to_callback_latency": consumer_metrics.enqueue_to_callback_latency.to_dict(),
+                "callback_duration": consumer_metrics.callback_duration.to_dict(),
+            }
+        )
+    return metrics
+
+
+def get_prometheus_metrics() -> str:
+    """
+    :return: the consumers metrics in the Prometheus text exposition format
+    """
+    aggregated_metrics = _get_aggregated_metrics()
+    lines = []
+    for name, help_text, get_value in (
+        (
+            "queue_depth",
+            "Current count of elements waiting in consumers queues",
+            lambda queue_depth, _: queue_depth,
+        ),
+        (
+            "queue_depth_high_water_mark",
+            "Highest count of elements waiting in a consumer queue",
+            lambda _, metrics: metrics.queue_depth_high_water_mark,
+        ),
+    ):
+        _add_metric_header(lines, name, help_text, "gauge")
+        for labels, (_, queue_depth, consumer_metrics) in aggregated_metrics.items():
+            lines.append(
+                f"{_METRICS_PREFIX}_{name}{_format_labels(labels)} {get_value(queue_depth, consumer_metrics)}"
+            )
+    for name, help_text, get_value in (
+        (
+            "enqueued_total",
+            "Count of elements added to consumers queues",
+            lambda metrics: metrics.enqueued_count,
+        ),
+        (
+            "callback_errors_total",
+            "Count of consumers callbacks errors",
+            lambda metrics: metrics.errors_count,
+        ),
+    ):
+        _add_metric_header(lines, name, help_text, "counter")
+        for labels, (_, _, consumer_metrics) in aggregated_metrics.items():
+            lines.append(
+                f"{_METRICS_PREFIX}_{name}{_format_labels(labels)} {get_value(consumer_metrics)}"
+            )
+    for name, help_text, get_histogram in (
+        (
+            "enqueue_to_callback_latency_seconds",
+            "Time spent by elements in consumers queues",
+            lambda metrics: metrics.enqueue_to_callback_latency,
+        ),
+        (
+            "callback_duration_seconds",
+            "Duration of consumers callbacks",
+            lambda metrics: metrics.callback_duration,
+        ),
+    ):
+        _add_metric_header(lines, name, help_text, "histogram")
+        for labels, (_, _, consumer_metrics) in aggregated_metrics.items():
+            _add_histogram(lines, name, labels, get_histogram(consumer_metrics))
+    return "\n".join(lines) + "\n"
+
+
+def _get_channels() -> typing.Iterator[
+    tuple[typing.Optional[str], "async_channel.channels.channel.Channel"]
+]:
+    """
+    :return: the (channel id, channel) of every channel, including channels registered by id
+    """
+    for key, chan in list(
+        channel_instances.ChannelInstances.instance().channels.items()
+    ):
+        if isinstance(chan, dict):
+            for id_chan in list(chan.values()):
+                yield str(key), id_chan
+        else:
+            yield None, chan
+
+
+def _get_aggregated_metrics() -> dict[
+    tuple[typing.Optional[str], str, str], tuple[int, int, ConsumerMetrics]
+]:
+    """
+    :return: the (consumers count, queue depth, metrics) of measured consumers
+    by (channel id, channel name, consumer label)
+    """
+    aggregated_metrics = {}
+    for chan_id, chan in _get_channels():
+        for consumer in chan.get_consumers():
+            if consumer.metrics is None:
+                continue
+            key = (chan_id, chan.get_name(), get_consumer_label(consumer))
+            consumers_count, queue_depth, consumer_metrics = aggregated_metrics.get(
+                key, (0, 0, ConsumerMetrics())
+            )
+            consumer_metrics.merge(consumer.metrics)
+            aggregated_metrics[key] = (
+                consumers_count + 1,
+                queue_depth + consumer.queue.qsize(),
+                consumer_metrics,
+            )
+    return aggregated_metrics
+
+
+def _add_metric_header(lines: list, name: str, help_text: str, metric_type: str):
+    lines.append(f"# HELP {_METRICS_PREFIX}_{name} {help_text}")
+    lines.append(f"# TYPE {_METRICS_PREFIX}_{name} {metric_type}")
+
+
+def _add_histogram(
+    lines: list, name: str, labels: tuple, histogram: DurationHistogram
+) -> None:
+    for bound, count in histogram.get_cumulative_buckets():
+        lines.append(
+            f"{_METRICS_PREFIX}_{name}_bucket{_format_labels(labels, le=bound)} {count}"
+        )
+    lines.append(f"{_METRICS_PREFIX}_{name}_sum{_format_labels(labels)} {histogram.sum}")
+    lines.append(
+        f"{_METRICS_PREFIX}_{name}_count{_format_labels(labels)} {histogram.count}"
+    )
+
+
+def _format_labels(labels: tuple, le: typing.Optional[str] = None) -> str:
+    chan_id, chan_name, consumer_label = labels
+    formatted_labels = [f'channel="{_escape_label_value(chan_name)}"']
+    if chan_id is not None:
+        formatted_labels.append(f'channel_id="{_escape_label_value(chan_id)}"')
+    formatted_labels.append(f'consumer="{_escape_label_value(consumer_label)}"')
+    if le is not None:
+        formatted_labels.append(f'le="{le}"')
+    return "{" + ",".join(formatted_labels) + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
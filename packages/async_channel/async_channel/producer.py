@@ -135,7 +135,7 @@ class Producer:
         """
         for consumer in self.channel.get_prioritized_consumers(priority_level):
             while not consumer.queue.empty():
-                await consumer.perform(await consumer.queue.get())
+                await consumer.measured_perform(await consumer.queue.get())
             if join_consumers:
                 await consumer.join(timeout)
 
@@ -0,0 +1,23 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Producer to consumers throughput benchmarks, using pytest-benchmark.
+Not collected by default, run them from the Async-Channel folder:
+pytest tests/benchmarks/benchmark_*.py --benchmark-storage=tests/benchmarks/.benchmarks
+
+Save a baseline with --benchmark-save=<name> and detect regressions against it with
+--benchmark-compare=<name> --benchmark-compare-fail=mean:10%
+"""
@@ -0,0 +1,81 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import pytest
+
+import async_channel.channels as channels
+import async_channel.consumer as channel_consumer
+import async_channel.util as util
+import tests
+
+MESSAGES_COUNTS = (100, 1000, 10000)
+CONSUMERS_COUNTS = (1, 10)
+
+
+class BenchmarkChannel(channels.Channel):
+    PRODUCER_CLASS = tests.EmptyTestProducer
+    CONSUMER_CLASS = channel_consumer.SupervisedConsumer
+
+
+async def _callback(**kwargs):
+    pass
+
+
+@pytest.fixture
+def benchmark_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+async def _init_channel(consumers_count, is_synchronized):
+    channels.del_chan(BenchmarkChannel.get_name())
+    channel = await util.create_channel_instance(BenchmarkChannel, channels.set_chan, is_synchronized=is_synchronized)
+    producer = tests.EmptyTestProducer(channel)
+    await producer.run()
+    for _ in range(consumers_count):
+        await channel.new_consumer(_callback)
+    return producer
+
+
+async def _send_and_wait_for_processing(producer, messages_count):
+    for index in range(messages_count):
+        await producer.send({"index": index})
+    await producer.wait_for_processing()
+
+
+async def _send_and_perform_consumers_queue(producer, messages_count):
+    for index in range(messages_count):
+        await producer.send({"index": index})
+        # as done by backtesting producers
+        await producer.synchronized_perform_consumers_queue(BenchmarkChannel.DEFAULT_PRIORITY_LEVEL, True, 1)
+
+
+@pytest.mark.parametrize("consumers_count", CONSUMERS_COUNTS)
+@pytest.mark.parametrize("messages_count", MESSAGES_COUNTS)
+def test_producer_to_consumers_throughput(benchmark, benchmark_loop, messages_count, consumers_count):
+    producer = benchmark_loop.run_until_complete(_init_channel(consumers_count, False))
+    benchmark(lambda: benchmark_loop.run_until_complete(_send_and_wait_for_processing(producer, messages_count)))
+    benchmark_loop.run_until_complete(producer.channel.stop())
+
+
+@pytest.mark.parametrize("consumers_count", CONSUMERS_COUNTS)
+@pytest.mark.parametrize("messages_count", MESSAGES_COUNTS)
+def test_synchronized_producer_to_consumers_throughput(benchmark, benchmark_loop, messages_count, consumers_count):
+    producer = benchmark_loop.run_until_complete(_init_channel(consumers_count, True))
+    benchmark(lambda: benchmark_loop.run_until_complete(_send_and_perform_consumers_queue(producer, messages_count)))
+    benchmark_loop.run_until_complete(producer.channel.stop())
@@ -0,0 +1,176 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+import async_channel.channels as channels
+import async_channel.consumer as channel_consumer
+import async_channel.metrics as metrics
+import async_channel.util as util
+import tests
+
+
+class MetricsTestChannel(channels.Channel):
+    PRODUCER_CLASS = tests.EmptyTestProducer
+    CONSUMER_CLASS = channel_consumer.SupervisedConsumer
+
+
+async def _callback(value):
+    if value < 0:
+        raise ValueError(value)
+
+
+@pytest_asyncio.fixture
+async def metrics_channel():
+    channels.del_chan(tests.TEST_CHANNEL)
+    channel = await util.create_channel_instance(
+        MetricsTestChannel, channels.set_chan, channel_name=tests.TEST_CHANNEL
+    )
+    producer = tests.EmptyTestProducer(channel)
+    await producer.run()
+    try:
+        yield channel
+    finally:
+        metrics.enable(False)
+        await channel.stop()
+        channels.del_chan(tests.TEST_CHANNEL)
+
+
+def test_duration_histogram():
+    histogram = metrics.DurationHistogram(buckets=(0.1, 1))
+    for duration in (0.05, 0.1, 0.5, 2):
+        histogram.observe(duration)
+    assert histogram.get_cumulative_buckets() == [("0.1", 2), ("1", 3), ("+Inf", 4)]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(2.65)
+    assert histogram.max == 2
+    other_histogram = metrics.DurationHistogram(buckets=(0.1, 1))
+    other_histogram.observe(3)
+    histogram.merge(other_histogram)
+    assert histogram.get_cumulative_buckets() == [("0.1", 2), ("1", 3), ("+Inf", 5)]
+    assert histogram.max == 3
+    assert histogram.to_dict()["buckets"] == {"0.1": 2, "1": 3, "+Inf": 5}
+
+
+@pytest.mark.asyncio
+async def test_disabled_metrics(metrics_channel):
+    consumer = await metrics_channel.new_consumer(_callback)
+    assert consumer.metrics is None
+    await metrics_channel.get_internal_producer().send({"value": 1})
+    await metrics_channel.get_internal_producer().wait_for_processing()
+    assert metrics.get_metrics() == []
+
+
+@pytest.mark.asyncio
+async def test_consumer_metrics(metrics_channel):
+    metrics.enable()
+    consumer = await metrics_channel.new_consumer(_callback)
+    other_consumer = await metrics_channel.new_consumer(_callback)
+    producer = metrics_channel.get_internal_producer()
+    for value in (1, 2, -1, 3):
+        await producer.send({"value": value})
+    # elements are queued until consumers tasks run
+    assert consumer.queue.qsize() == 4
+    await producer.wait_for_processing()
+
+    assert consumer.metrics is not other_consumer.metrics
+    assert consumer.metrics.queue_depth_high_water_mark == 4
+    assert consumer.metrics.enqueued_count == 4
+    assert consumer.metrics.enqueue_to_callback_latency.count == 4
+    assert consumer.metrics.callback_duration.count == 4
+    assert consumer.metrics.errors_count == 1
+
+    # consumers of the same class and callback are aggregated
+    consumers_metrics = metrics.get_metrics()
+    assert len(consumers_metrics) == 1
+    channel_metrics = consumers_metrics[0]
+    assert channel_metrics["channel"] == "MetricsTest"
+    assert channel_metrics["channel_id"] is None
+    assert channel_metrics["consumer"] == "SupervisedConsumer:_callback"
+    assert channel_metrics["consumers_count"] == 2
+    assert channel_metrics["queue_depth"] == 0
+    assert channel_metrics["queue_depth_high_water_mark"] == 4
+    assert channel_metrics["enqueued_count"] == 8
+    assert channel_metrics["errors_count"] == 2
+    assert channel_metrics["enqueue_to_callback_latency"]["count"] == 8
+    assert channel_metrics["enqueue_to_callback_latency"]["buckets"]["+Inf"] == 8
+    assert channel_metrics["callback_duration"]["count"] == 8
+
+    metrics.reset()
+    assert metrics.get_metrics()[0]["enqueued_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_synchronized_consumer_metrics(metrics_channel):
+    metrics_channel.is_synchronized = True
+    metrics.enable()
+    consumer = await metrics_channel.new_consumer(_callback)
+    producer = metrics_channel.get_internal_producer()
+    await producer.send({"value": 1})
+    await producer.send({"value": -1})
+    with pytest.raises(ValueError):
+        await producer.synchronized_perform_consumers_queue(
+            metrics_channel.DEFAULT_PRIORITY_LEVEL, True, 1
+        )
+    await producer.synchronized_perform_consumers_queue(
+        metrics_channel.DEFAULT_PRIORITY_LEVEL, True, 1
+    )
+    assert consumer.metrics.queue_depth_high_water_mark == 2
+    assert consumer.metrics.enqueue_to_callback_latency.count == 2
+    assert consumer.metrics.callback_duration.count == 2
+    assert consumer.metrics.errors_count == 1
+
+
+@pytest.mark.asyncio
+async def test_enable_with_existing_consumers(metrics_channel):
+    consumer = await metrics_channel.new_consumer(_callback)
+    producer = metrics_channel.get_internal_producer()
+    await producer.send({"value": 1})
+    metrics.enable()
+    assert consumer.metrics is not None
+    await producer.send({"value": 2})
+    await producer.wait_for_processing()
+    # the put time of the element queued before enabling metrics is unknown
+    assert consumer.metrics.enqueued_count == 1
+    assert consumer.metrics.enqueue_to_callback_latency.count == 1
+    assert consumer.metrics.callback_duration.count == 2
+
+    metrics.enable(False)
+    assert consumer.metrics is None
+    assert consumer.queue.metrics is None
+    assert metrics.get_metrics() == []
+
+
+@pytest.mark.asyncio
+async def test_get_prometheus_metrics(metrics_channel):
+    metrics.enable()
+    await metrics_channel.new_consumer(_callback)
+    producer = metrics_channel.get_internal_producer()
+    await producer.send({"value": -1})
+    await producer.wait_for_processing()
+    labels = 'channel="MetricsTest",consumer="SupervisedConsumer:_callback"'
+    prometheus_metrics = metrics.get_prometheus_metrics()
+    assert "# TYPE async_channel_queue_depth gauge\n" in prometheus_metrics
+    assert f"async_channel_queue_depth{{{labels}}} 0\n" in prometheus_metrics
+    assert f"async_channel_queue_depth_high_water_mark{{{labels}}} 1\n" in prometheus_metrics
+    assert f"async_channel_enqueued_total{{{labels}}} 1\n" in prometheus_metrics
+    assert f"async_channel_callback_errors_total{{{labels}}} 1\n" in prometheus_metrics
+    assert "# TYPE async_channel_enqueue_to_callback_latency_seconds histogram\n" in prometheus_metrics
+    assert f'async_channel_enqueue_to_callback_latency_seconds_bucket{{{labels},le="+Inf"}} 1\n' \
+        in prometheus_metrics
+    assert f"async_channel_callback_duration_seconds_count{{{labels}}} 1\n" in prometheus_metrics
@@ -271,3 +271,28 @@ async def test_producer_synchronized_perform_consumers_queue_with_multiple_consu
         assert producer.is_consumers_queue_empty(1)
         assert producer.is_consumers_queue_empty(2)
         assert producer.is_consumers_queue_empty(3)
+
+
+@pytest.mark.asyncio
+async def test_consumer_queue_listener(synchronized_channel):
+    async def callback():
+        pass
+
+    first_consumer = await synchronized_channel.new_consumer(callback)
+    listener = mock.Mock()
+    synchronized_channel.set_consumer_queue_listener(listener)
+    second_consumer = await synchronized_channel.new_consumer(callback, priority_level=2)
+
+    producer = SynchronizedProducerTest(channels.get_chan(TEST_SYNCHRONIZED_CHANNEL))
+    await producer.run()
+
+    await producer.send({})
+    assert listener.call_args_list == [mock.call(first_consumer), mock.call(second_consumer)]
+    listener.reset_mock()
+    await producer.synchronized_perform_consumers_queue(2, True, 1)
+    listener.assert_not_called()
+
+    synchronized_channel.set_consumer_queue_listener(None)
+    await producer.send({})
+    listener.assert_not_called()
+    assert not producer.is_consumers_queue_empty(1)
@@ -24,7 +24,12 @@ def exchange_historical_data_collector_factory(exchange_name,
                                                time_frames=None,
                                                start_timestamp=None,
                                                end_timestamp=None,
-                                               config=None):
+                                               config=None,
+                                               data_file=None):
+    """
+    :param data_file: when set, add the collected data to this existing data file: an interrupted collection
+    is resumed and a completed collection is extended up to end_timestamp (or now)
+    """
     return _exchange_collector_factory(collectors.AbstractExchangeHistoryCollector,
                                        exchange_name,
                                        exchange_type,
@@ -33,7 +38,8 @@ def exchange_historical_data_collector_factory(exchange_name,
                                        time_frames,
                                        start_timestamp,
                                        end_timestamp,
-                                       config)
+                                       config,
+                                       data_file=data_file)
 
 
 def exchange_bot_snapshot_data_collector_factory(exchange_name,
@@ -58,12 +64,15 @@ def exchange_bot_snapshot_data_collector_factory(exchange_name,
 
 
 def _exchange_collector_factory(collector_parent_class, exchange_name, exchange_type, tentacles_setup_config, symbols,
-                                time_frames, start_timestamp, end_timestamp, config):
+                                time_frames, start_timestamp, end_timestamp, config, data_file=None):
     collector_class = tentacles_management.get_single_deepest_child_class(collector_parent_class)
+    # only give data_file when set to support collectors that can't extend data files
+    kwargs = {"data_file": data_file} if data_file else {}
     collector_instance = collector_class(config or {}, exchange_name, exchange_type,
                                          tentacles_setup_config, symbols, time_frames,
                                          use_all_available_timeframes=time_frames is None,
-                                         start_timestamp=start_timestamp, end_timestamp=end_timestamp)
+                                         start_timestamp=start_timestamp, end_timestamp=end_timestamp,
+                                         **kwargs)
     return collector_instance
 
 
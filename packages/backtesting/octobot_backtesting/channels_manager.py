@@ -15,6 +15,8 @@
 #  License along with this library.
 import asyncio
 import copy
+import functools
+import heapq
 
 import async_channel.channels as channels
 import async_channel.enums as channel_enums
@@ -39,6 +41,7 @@ class ChannelsManager:
         self.iteration_task = None
         self.should_stop = False
         self.producers_by_priority_levels = {}
+        self.ready_producers_by_priority_levels = {}
 
     async def initialize(self) -> None:
         """
@@ -57,6 +60,8 @@ class ChannelsManager:
                 priority_level.value: self.producers
                 for priority_level in channel_enums.ChannelConsumerPriorityLevels
             }
+            self._listen_consumers_queues()
+            self._update_ready_producers()
 
             # Initialize all producers by calling producer.start()
             for producer in list_util.flatten_list(self._get_trading_producers() + self._get_evaluator_producers()):
@@ -78,11 +83,41 @@ class ChannelsManager:
             for priority_level in channel_enums.ChannelConsumerPriorityLevels
             if _check_producers_has_priority_consumers(self.producers, priority_level.value)
         }
+        self._update_ready_producers()
+
+    def _listen_consumers_queues(self):
+        producers_by_channel = {}
+        for producer in self.initial_producers:
+            if producer.channel is not None:
+                producers_by_channel.setdefault(producer.channel, []).append(producer)
+        for channel, producers in producers_by_channel.items():
+            channel.set_consumer_queue_listener(functools.partial(self._on_consumer_queue_update, producers))
+
+    def _stop_listening_consumers_queues(self):
+        for producer in self.initial_producers:
+            if producer.channel is not None:
+                producer.channel.set_consumer_queue_listener(None)
+
+    def _on_consumer_queue_update(self, producers, consumer):
+        for priority_level, ready_producers in self.ready_producers_by_priority_levels.items():
+            if consumer.priority_level <= priority_level:
+                for producer in producers:
+                    ready_producers.add(producer)
+
+    def _update_ready_producers(self):
+        self.ready_producers_by_priority_levels = {
+            priority_level: _ReadyProducers(producers)
+            for priority_level, producers in self.producers_by_priority_levels.items()
+        }
+        for priority_level, ready_producers in self.ready_producers_by_priority_levels.items():
+            for producer in ready_producers.producers:
+                if not _check_producers_consumers_emptiness([producer], priority_level):
+                    ready_producers.add(producer)
 
     async def handle_new_iteration(self, current_timestamp) -> None:
         for level_key, producers in self.producers_by_priority_levels.items():
             try:
-                if _check_producers_consumers_emptiness(producers, level_key):
+                if not self.ready_producers_by_priority_levels[level_key]:
                     # avoid creating tasks when not necessary
                     continue
                 self.iteration_task = self.refresh_priority_level(producers, level_key, True)
@@ -97,19 +132,21 @@ class ChannelsManager:
                                   f"{current_timestamp}.")
 
     async def refresh_priority_level(self, producers, priority_level: int, join_consumers: bool) -> None:
-        while not self.should_stop:
-            for producer in producers:
+        # only visit producers which consumers received data, in the same order as producers
+        ready_producers = self.ready_producers_by_priority_levels[priority_level]
+        while not self.should_stop and ready_producers:
+            for producer in ready_producers.pop_iteration_producers():
                 await producer.synchronized_perform_consumers_queue(priority_level, join_consumers, self.refresh_timeout)
-            if _check_producers_consumers_emptiness(self.producers, priority_level):
-                break
 
     def stop(self):
         self.should_stop = True
 
     def flush(self):
+        self._stop_listening_consumers_queues()
         self.producers = []
         self.initial_producers = []
         self.producers_by_priority_levels = {}
+        self.ready_producers_by_priority_levels = {}
         self.iteration_task = None
 
     def _get_trading_producers(self):
@@ -128,6 +165,50 @@ class ChannelsManager:
         ]
 
 
+class _ReadyProducers:
+    """
+    Producers of a priority level which consumers might have data to process, sorted by producers order
+    """
+
+    def __init__(self, producers):
+        self.producers = producers
+        self._index_by_producer = {producer: index for index, producer in enumerate(producers)}
+        self._pending_indexes = set()
+        self._ready_indexes = []
+        self._next_iteration_indexes = []
+        self._current_index = -1
+
+    def add(self, producer):
+        index = self._index_by_producer.get(producer)
+        if index is None or index in self._pending_indexes:
+            return
+        self._pending_indexes.add(index)
+        if index > self._current_index:
+            heapq.heappush(self._ready_indexes, index)
+        else:
+            # already visited during the current iteration over producers: visit it during the next one
+            self._next_iteration_indexes.append(index)
+
+    def pop_iteration_producers(self):
+        """
+        Iterates over ready producers in producers order, including the ones added during the iteration after the
+        current producer. Producers added before the current producer are returned by the next iteration.
+        """
+        try:
+            while self._ready_indexes:
+                self._current_index = heapq.heappop(self._ready_indexes)
+                self._pending_indexes.discard(self._current_index)
+                yield self.producers[self._current_index]
+        finally:
+            self._current_index = -1
+            for index in self._next_iteration_indexes:
+                heapq.heappush(self._ready_indexes, index)
+            self._next_iteration_indexes = []
+
+    def __bool__(self):
+        return bool(self._pending_indexes)
+
+
 def _get_channel_producers(channel):
     if channel.producers:
         return channel.producers
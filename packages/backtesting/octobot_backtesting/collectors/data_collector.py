@@ -83,10 +83,11 @@ class DataCollector:
 
     def create_database(self) -> None:
         if not self.database:
-            self.database = databases.SQLiteDatabase(self.temp_file_path)
+            self.database = databases.SQLiteDatabase(self.temp_file_path, write_ahead_log=True)
 
     def finalize_database(self):
-        os.rename(self.temp_file_path, self.file_path)
+        # replace the previous version of the data file when extending it
+        os.replace(self.temp_file_path, self.file_path)
 
     def create_aiohttp_session(self) -> None:
         if not self.aiohttp_session:
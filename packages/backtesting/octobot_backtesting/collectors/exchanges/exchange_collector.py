@@ -16,13 +16,17 @@
 import json
 import logging
 import abc 
-
+import os
+import shutil
 import time
 
 import octobot_commons.constants as commons_constants
+import octobot_commons.enums as commons_enums
+import octobot_commons.symbols as commons_symbols
 import octobot_backtesting.collectors.data_collector as data_collector
 import octobot_backtesting.constants as constants
 import octobot_backtesting.enums as enums
+import octobot_backtesting.errors as errors
 import octobot_backtesting.importers as importers
 
 try:
@@ -37,7 +41,8 @@ class ExchangeDataCollector(data_collector.DataCollector):
 
     def __init__(self, config, exchange_name, exchange_type,
                  tentacles_setup_config, symbols, time_frames, use_all_available_timeframes=False,
-                 data_format=enums.DataFormats.REGULAR_COLLECTOR_DATA, start_timestamp=None, end_timestamp=None):
+                 data_format=enums.DataFormats.REGULAR_COLLECTOR_DATA, start_timestamp=None, end_timestamp=None,
+                 data_file=None):
         super().__init__(config, data_format=data_format)
         self.exchange_name = exchange_name
         self.exchange_type = exchange_type
@@ -51,6 +56,11 @@ class ExchangeDataCollector(data_collector.DataCollector):
         self.total_steps = 0
         self.current_step_percent = 0
         self.exchange_id = None
+        # when set, collected data is added to this existing (or interrupted) data file
+        self.data_file = data_file
+        self.has_existing_data = False
+        if self.data_file:
+            self.file_name = self.data_file
         self.set_file_path()
 
     def register_exchange_id(self, exchange_id):
@@ -70,8 +80,11 @@ class ExchangeDataCollector(data_collector.DataCollector):
         raise NotImplementedError("_load_all_available_timeframes is not implemented")
 
     async def initialize(self):
+        self._prepare_existing_data_file()
         self.create_database()
         await self.database.initialize()
+        if self.data_file:
+            await self._load_existing_description()
 
         # set config from params
         self.config[commons_constants.CONFIG_TIME_FRAME] = self.time_frames
@@ -86,7 +99,50 @@ class ExchangeDataCollector(data_collector.DataCollector):
             self._load_all_available_timeframes()
         self.config[commons_constants.CONFIG_TIME_FRAME] = self.time_frames
 
+    def _prepare_existing_data_file(self):
+        if not self.data_file:
+            return
+        if os.path.isfile(self.temp_file_path):
+            self.logger.info(f"Resuming interrupted {self.data_file} data collection")
+        elif os.path.isfile(self.file_path):
+            # work on a copy to keep the existing data file intact until the new collection succeeds
+            shutil.copyfile(self.file_path, self.temp_file_path)
+            self.logger.info(f"Extending {self.data_file} data file")
+        else:
+            raise errors.DataCollectorError(f"{self.data_file} data file not found")
+
+    async def _load_existing_description(self):
+        if not await self.database.check_table_exists(enums.DataTables.DESCRIPTION):
+            # interrupted before creating the description: collect from scratch
+            return
+        description = (await self.database.select(enums.DataTables.DESCRIPTION, size=1))[0]
+        if description[1] != constants.CURRENT_VERSION:
+            raise errors.DataCollectorError(
+                f"Impossible to add data to {self.data_file}: unsupported data file version ({description[1]}), "
+                f"convert it first"
+            )
+        exchange_name, symbols, time_frames, start_timestamp = description[3:7]
+        if exchange_name != self.exchange_name:
+            raise errors.DataCollectorError(
+                f"Impossible to add {self.exchange_name} data to {self.data_file}: "
+                f"this file contains {exchange_name} data"
+            )
+        self.symbols = [commons_symbols.parse_symbol(symbol) for symbol in json.loads(symbols)]
+        self.time_frames = [commons_enums.TimeFrames(time_frame) for time_frame in json.loads(time_frames)]
+        self.use_all_available_timeframes = False
+        self.start_timestamp = int(start_timestamp) * 1000 if int(start_timestamp) else None
+        self.has_existing_data = True
+
     async def _create_description(self):
+        if self.has_existing_data:
+            await self.database.update(enums.DataTables.DESCRIPTION,
+                                       {
+                                           "timestamp": time.time(),
+                                           "end_timestamp": int(self.end_timestamp/1000) if self.end_timestamp
+                                           else int(time.time()) if self.start_timestamp else 0
+                                       },
+                                       exchange=self.exchange_name)
+            return
         await self.database.insert(enums.DataTables.DESCRIPTION,
                                    timestamp=time.time(),
                                    version=constants.CURRENT_VERSION,
@@ -162,3 +218,17 @@ class ExchangeDataCollector(data_collector.DataCollector):
         if time_frame:
             kwargs["time_frame"] = time_frame.value
         await self.database.delete(table, **kwargs)
+
+    async def get_last_saved_timestamp(self, table, exchange, symbol, time_frame=None):
+        """
+        :return: the highest saved timestamp of the given table data or None when there is no saved data
+        """
+        if not await self.database.check_table_exists(table):
+            return None
+        kwargs = {
+            "exchange_name": exchange,
+            "symbol": symbol,
+        }
+        if time_frame:
+            kwargs["time_frame"] = time_frame.value
+        return (await self.database.select_max(table, [self.database.TIMESTAMP_COLUMN], **kwargs))[0][0]
@@ -0,0 +1,125 @@
+#  Drakkar-Software OctoBot-Backtesting
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+import pytest_asyncio
+
+import async_channel.channels as channels
+import async_channel.consumer as channel_consumer
+import async_channel.producer as channel_producer
+import async_channel.util as channel_util
+
+import octobot_backtesting.channels_manager as channels_manager
+
+
+class SynchronizedProducer(channel_producer.Producer):
+    async def pause(self):
+        pass
+
+    async def resume(self):
+        pass
+
+
+class TimeTestChannel(channels.Channel):
+    PRODUCER_CLASS = SynchronizedProducer
+    CONSUMER_CLASS = channel_consumer.Consumer
+
+
+class DataTestChannel(channels.Channel):
+    PRODUCER_CLASS = SynchronizedProducer
+    CONSUMER_CLASS = channel_consumer.Consumer
+
+
+class IdleTestChannel(channels.Channel):
+    PRODUCER_CLASS = SynchronizedProducer
+    CONSUMER_CLASS = channel_consumer.Consumer
+
+
+@pytest_asyncio.fixture
+async def synchronized_channels():
+    created_channels = [
+        await channel_util.create_channel_instance(channel_class, channels.set_chan, is_synchronized=True)
+        for channel_class in (TimeTestChannel, DataTestChannel, IdleTestChannel)
+    ]
+    yield created_channels
+    for channel in created_channels:
+        channels.del_chan(channel.get_name())
+
+
+def test_ready_producers_order():
+    producers = ["p0", "p1", "p2", "p3"]
+    ready_producers = channels_manager._ReadyProducers(producers)
+    assert not ready_producers
+    ready_producers.add("p2")
+    ready_producers.add("p0")
+    ready_producers.add("p0")
+    ready_producers.add("unknown")
+    assert ready_producers
+    visited = []
+    for producer in ready_producers.pop_iteration_producers():
+        visited.append(producer)
+        if producer == "p0":
+            # after the current producer: visited in this iteration
+            ready_producers.add("p1")
+        if producer == "p2":
+            # before or is the current producer: visited in the next iteration
+            ready_producers.add("p0")
+            ready_producers.add("p2")
+    assert visited == ["p0", "p1", "p2"]
+    assert ready_producers
+    assert list(ready_producers.pop_iteration_producers()) == ["p0", "p2"]
+    assert not ready_producers
+
+
+@pytest.mark.asyncio
+async def test_handle_new_iteration_only_visits_ready_producers(synchronized_channels):
+    time_channel, data_channel, idle_channel = synchronized_channels
+    received_data = []
+
+    async def time_callback(timestamp):
+        await data_channel.get_internal_producer().send({"value": timestamp * 2})
+
+    async def data_callback(value):
+        received_data.append(value)
+
+    async def idle_callback():
+        pass
+
+    await time_channel.new_consumer(time_callback)
+    await data_channel.new_consumer(data_callback)
+    await idle_channel.new_consumer(idle_callback)
+    manager = channels_manager.ChannelsManager([], None, time_channel.get_name())
+    with mock.patch.object(
+        manager, "_get_trading_producers",
+        mock.Mock(return_value=[[data_channel.get_internal_producer()], [idle_channel.get_internal_producer()]])
+    ), mock.patch.object(manager, "_get_evaluator_producers", mock.Mock(return_value=[])):
+        await manager.initialize()
+    manager.clear_empty_channels_producers()
+    manager.update_producers_by_priority_levels()
+    idle_producer = idle_channel.get_internal_producer()
+    try:
+        with mock.patch.object(
+            idle_producer, "synchronized_perform_consumers_queue", mock.AsyncMock()
+        ) as idle_perform_mock:
+            for timestamp in (1, 2):
+                await time_channel.get_internal_producer().send({"timestamp": timestamp})
+                await manager.handle_new_iteration(timestamp)
+            assert received_data == [2, 4]
+            idle_perform_mock.assert_not_called()
+            assert not any(manager.ready_producers_by_priority_levels.values())
+    finally:
+        manager.flush()
+    assert time_channel.consumer_queue_listener is None
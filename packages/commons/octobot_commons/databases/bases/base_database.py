@@ -57,6 +57,13 @@ class BaseDatabase:
         """
         return self._database.get_db_path()
 
+    def get_uuid(self, document) -> int:
+        """
+        :param document: a document selected from this database
+        :return: the uuid of the document
+        """
+        return self._database.get_uuid(document)
+
     async def search(self, dict_query: dict = None):
         """
         :param dict_query: initialization dict for the query
@@ -102,10 +102,15 @@ class DBWriter(base_database.BaseDatabase):
         """
         return await self._database.update_many(table_name, update_values)
 
-    async def delete(self, table_name: str, dict_query: dict):
+    async def delete(self, table_name: str, dict_query: dict, uuid=None):
         """
         Deletes selected values at once, doesn't use cache
+        :param table_name: table to delete data from
+        :param dict_query: select query
+        :param uuid: uuid to select data (enable faster operations)
         """
+        if uuid is not None:
+            return await self._database.delete(table_name, None, uuid=uuid)
         query = None
         if dict_query:
             if isinstance(dict_query, dict):
@@ -148,9 +153,10 @@ class DBWriter(base_database.BaseDatabase):
         :param table_name: name of the table
         :param rows: rows to insert
         :param cache: When True, rows will be registered in cache
+        :return: the uuids of the inserted rows
         """
         await self.delete_all(table_name)
-        await self.log_many(table_name, rows, cache=cache)
+        return await self.log_many(table_name, rows, cache=cache)
 
     async def flush(self):
         """
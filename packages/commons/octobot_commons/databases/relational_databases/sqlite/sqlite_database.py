@@ -14,6 +14,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import asyncio
 import contextlib
 import sqlite3
 
@@ -44,8 +45,21 @@ class SQLiteDatabase:
     DEFAULT_WHERE_OPERATION = "="
     DEFAULT_SIZE = -1
     CACHE_SIZE = 50
-
-    def __init__(self, file_name):
+    # columns to index together with timestamp when present in a new table
+    INDEXED_COLUMNS = ["symbol", "time_frame"]
+    # connection settings favoring read-heavy usages such as backtesting
+    CONNECTION_PRAGMAS = {
+        "temp_store": "MEMORY",
+        "cache_size": -64000,  # 64MB
+        "mmap_size": 268435456,  # 256MB
+    }
+    WRITE_AHEAD_LOG_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+    }
+    DEFAULT_JOURNAL_MODE = "DELETE"
+
+    def __init__(self, file_name, write_ahead_log=False):
         self.file_name = file_name
         self.logger = logging.get_logger(self.__class__.__name__)
 
@@ -53,6 +67,11 @@ class SQLiteDatabase:
         self.cache = {}
 
         self.connection = None
+        # use write-ahead logging while this database is open, the default journal mode is restored on stop
+        self.write_ahead_log = write_ahead_log
+        # changes of other tasks wait for the current transaction to complete
+        self._transaction_lock = asyncio.Lock()
+        self._transaction_task = None
 
         # should never be used directly, use async with self.aio_cursor() as cursor: instead
         self._cursor_pool = None
@@ -61,10 +80,36 @@ class SQLiteDatabase:
         try:
             self.connection = await aiosqlite.connect(self.file_name)
             self._cursor_pool = cursor_pool.CursorPool(self.connection)
+            await self.__set_pragmas(self.CONNECTION_PRAGMAS)
+            if self.write_ahead_log:
+                await self.__set_pragmas(self.WRITE_AHEAD_LOG_PRAGMAS)
             await self.__init_tables_list()
         except (sqlite3.OperationalError, sqlite3.DatabaseError) as err:
             raise errors.DatabaseNotFoundError(f"{err} (file: {self.file_name})")
 
+    @contextlib.asynccontextmanager
+    async def transaction(self):
+        """
+        Use this as a context manager to commit every change made within it at once.
+        Changes are rolled back when an error is raised within it.
+        :return: None
+        """
+        if self._transaction_task is asyncio.current_task():
+            # nested transaction: changes are committed by the outer one
+            yield
+            return
+        async with self._transaction_lock:
+            self._transaction_task = asyncio.current_task()
+            try:
+                yield
+            except BaseException:
+                await self.__rollback()
+                raise
+            else:
+                await self.connection.commit()
+            finally:
+                self._transaction_task = None
+
     async def create_index(self, table, columns):
         await self.__execute_index_creation(
             table, "_".join(columns), ", ".join(columns)
@@ -80,10 +125,33 @@ class SQLiteDatabase:
         async with self._cursor_pool.idle_cursor() as cursor:
             yield cursor.cursor
 
+    async def __set_pragmas(self, pragmas):
+        async with self.aio_cursor() as cursor:
+            for key, value in pragmas.items():
+                await cursor.execute(f"PRAGMA {key}={value}")
+
+    @contextlib.asynccontextmanager
+    async def __changes(self, commit=True):
+        if self._transaction_task is asyncio.current_task():
+            # changes are committed when leaving the transaction
+            yield
+            return
+        async with self._transaction_lock:
+            yield
+            if commit:
+                # Save (commit) the changes
+                await self.connection.commit()
+
+    async def __rollback(self):
+        if self.connection is not None:
+            await self.connection.rollback()
+            # tables created within the transaction are also rolled back
+            await self.__init_tables_list()
+
     async def __execute_index_creation(self, table, name, columns):
         async with self.aio_cursor() as cursor:
             await cursor.execute(
-                f"CREATE INDEX index_{table.value}_{name} ON {table.value} ({columns})"
+                f"CREATE INDEX IF NOT EXISTS index_{table.value}_{name} ON {table.value} ({columns})"
             )
 
     async def insert(self, table, timestamp, **kwargs):
@@ -91,60 +159,58 @@ class SQLiteDatabase:
             await self.__create_table(table, **kwargs)
 
         # Insert a row of data
-        inserting_values = [f"'{value}'" for value in kwargs.values()]
-        await self.__execute_insert(
-            table, self.__insert_values(timestamp, ", ".join(inserting_values))
+        await self.__execute_insert_many(
+            table,
+            len(kwargs) + 1,
+            [(timestamp, *(str(value) for value in kwargs.values()))],
         )
 
     async def insert_all(self, table, timestamp, **kwargs):
-        # TODO refactor with : cursor.executemany("INSERT INTO my_table VALUES (?,?)", values)
         if table.value not in self.tables:
             await self.__create_table(table, **kwargs)
 
-        insert_values = []
-
-        for index, values in enumerate(timestamp):
-            # Insert a row of data
-            inserting_values = [
-                f"'{value if not isinstance(value, list) else value[index]}'"
-                for value in kwargs.values()
-            ]
-            insert_values.append(
-                self.__insert_values(values, ", ".join(inserting_values))
+        # Insert every row using a single parameterized statement and commit
+        rows = [
+            (
+                row_timestamp,
+                *(
+                    str(value if not isinstance(value, list) else value[index])
+                    for value in kwargs.values()
+                ),
             )
-
-        await self.__execute_insert(table, ", ".join(insert_values))
+            for index, row_timestamp in enumerate(timestamp)
+        ]
+        await self.__execute_insert_many(table, len(kwargs) + 1, rows)
 
     async def update(self, table, updated_value_by_column, **kwargs):
         # Update a row of data
-        updating_values = [
-            f"{key} = '{value}'" for key, value in updated_value_by_column.items()
-        ]
+        where_clauses, where_parameters = self.__where_clauses_from_kwargs(**kwargs)
         await self.__execute_update(
             table,
-            ", ".join(updating_values),
-            self.__where_clauses_from_kwargs(**kwargs),
+            ", ".join(f"{key} = ?" for key in updated_value_by_column),
+            where_clauses,
+            [str(value) for value in updated_value_by_column.values()]
+            + where_parameters,
         )
 
-    def __insert_values(self, timestamp, inserting_values) -> str:
-        return f"({timestamp}, {inserting_values})"
-
-    async def __execute_insert(self, table, insert_items) -> None:
-        async with self.aio_cursor() as cursor:
-            await cursor.execute(f"INSERT INTO {table.value} VALUES {insert_items}")
-
-        # Save (commit) the changes
-        await self.connection.commit()
+    async def __execute_insert_many(self, table, columns_count, rows) -> None:
+        if not rows:
+            return
+        async with self.__changes(), self.aio_cursor() as cursor:
+            await cursor.executemany(
+                f"INSERT INTO {table.value} VALUES ({', '.join('?' * columns_count)})",
+                rows,
+            )
 
-    async def __execute_update(self, table, update_items, where_clauses) -> None:
-        async with self.aio_cursor() as cursor:
+    async def __execute_update(
+        self, table, update_items, where_clauses, parameters
+    ) -> None:
+        async with self.__changes(), self.aio_cursor() as cursor:
             await cursor.execute(
-                f"UPDATE {table.value} SET {update_items} WHERE {where_clauses}"
+                f"UPDATE {table.value} SET {update_items} WHERE {where_clauses}",
+                parameters,
             )
 
-        # Save (commit) the changes
-        await self.connection.commit()
-
     async def select(
         self,
         table,
@@ -153,41 +219,49 @@ class SQLiteDatabase:
         sort=DEFAULT_SORT,
         **kwargs,
     ):
+        where_clauses, parameters = self.__where_clauses_from_kwargs(**kwargs)
         return await self.__execute_select(
             table=table,
-            where_clauses=self.__where_clauses_from_kwargs(**kwargs),
+            where_clauses=where_clauses,
+            parameters=parameters,
             additional_clauses=self.__select_order_by(order_by, sort),
             size=size,
         )
 
     async def select_count(self, table, selected_items=None, **kwargs):
+        where_clauses, parameters = self.__where_clauses_from_kwargs(**kwargs)
         return await self.__execute_select(
             table=table,
             select_items=f"{self.__count(selected_items)}",
-            where_clauses=self.__where_clauses_from_kwargs(**kwargs),
+            where_clauses=where_clauses,
+            parameters=parameters,
         )
 
     async def select_max(
         self, table, max_columns, selected_items=None, group_by=None, **kwargs
     ):
+        where_clauses, parameters = self.__where_clauses_from_kwargs(**kwargs)
         return await self.__execute_select(
             table=table,
             select_items=f"{self.__max(max_columns)}"
             f"{', ' if selected_items else ''}"
             f"{self.__selected_columns(selected_items)}",
-            where_clauses=self.__where_clauses_from_kwargs(**kwargs),
+            where_clauses=where_clauses,
+            parameters=parameters,
             group_by=self.__select_group_by(group_by) if group_by else "",
         )
 
     async def select_min(
         self, table, min_columns, selected_items=None, group_by=None, **kwargs
     ):
+        where_clauses, parameters = self.__where_clauses_from_kwargs(**kwargs)
         return await self.__execute_select(
             table=table,
             select_items=f"{self.__min(min_columns)}"
             f"{', ' if selected_items else ''}"
             f"{self.__selected_columns(selected_items)}",
-            where_clauses=self.__where_clauses_from_kwargs(**kwargs),
+            where_clauses=where_clauses,
+            parameters=parameters,
             group_by=self.__select_group_by(group_by) if group_by else "",
         )
 
@@ -201,13 +275,16 @@ class SQLiteDatabase:
         sort=DEFAULT_SORT,
         **kwargs,
     ):
-        timestamps_where_clauses = self.__where_clauses_from_operations(
+        (
+            timestamps_where_clauses,
+            timestamps_parameters,
+        ) = self.__where_clauses_from_operations(
             keys=[self.TIMESTAMP_COLUMN] * len(timestamps),
             values=timestamps,
             operations=operations,
             should_quote_value=False,
         )
-        where_clause = self.__where_clauses_from_kwargs(**kwargs)
+        where_clause, parameters = self.__where_clauses_from_kwargs(**kwargs)
         final_where_close = (
             f"{where_clause} AND "
             if where_clause and timestamps_where_clauses
@@ -217,6 +294,7 @@ class SQLiteDatabase:
         return await self.__execute_select(
             table=table,
             where_clauses=final_where_close,
+            parameters=parameters + timestamps_parameters,
             additional_clauses=self.__select_order_by(order_by, sort),
             size=size,
         )
@@ -224,10 +302,12 @@ class SQLiteDatabase:
     async def delete(self, table, **kwargs):
         return await self.__execute_delete(
             table,
-            self.__where_clauses_from_kwargs(**kwargs),
+            *self.__where_clauses_from_kwargs(**kwargs),
         )
 
-    def __where_clauses_from_kwargs(self, should_quote_value=True, **kwargs) -> str:
+    def __where_clauses_from_kwargs(
+        self, should_quote_value=True, **kwargs
+    ) -> (str, list):
         return self.__where_clauses_from_operations(
             list(kwargs.keys()),
             list(kwargs.values()),
@@ -236,28 +316,28 @@ class SQLiteDatabase:
         )
 
     def __where_clauses_from_operation(
-        self, key, value, operation=DEFAULT_WHERE_OPERATION, should_quote_value=True
-    ):
-        return (
-            f"{key} {operation if operation is not None else self.DEFAULT_WHERE_OPERATION} "
-            f"{self.__quote_value(value) if should_quote_value else value}"
-        )
+        self, key, operation=DEFAULT_WHERE_OPERATION
+    ) -> str:
+        return f"{key} {operation if operation is not None else self.DEFAULT_WHERE_OPERATION} ?"
 
     def __where_clauses_from_operations(
         self, keys, values, operations, should_quote_value=True
-    ):
-        return " AND ".join(
-            [
+    ) -> (str, list):
+        """
+        :return: the where clauses and their parameters, quoted values are compared as text
+        """
+        clauses = []
+        parameters = []
+        for i, key in enumerate(keys):
+            if values[i] is None:
+                continue
+            clauses.append(
                 self.__where_clauses_from_operation(
-                    keys[i],
-                    values[i],
-                    operations[i] if len(operations) > i else None,
-                    should_quote_value=should_quote_value,
+                    key, operations[i] if len(operations) > i else None
                 )
-                for i in range(len(keys))
-                if values[i] is not None
-            ]
-        )
+            )
+            parameters.append(str(values[i]) if should_quote_value else values[i])
+        return " AND ".join(clauses), parameters
 
     def __select_order_by(self, order_by, sort):
         return (
@@ -269,9 +349,6 @@ class SQLiteDatabase:
     def __select_group_by(self, group_by):
         return f"GROUP BY {group_by}"
 
-    def __quote_value(self, value):
-        return f"'{value}'"
-
     def __max(self, columns):
         return f"MAX({self.__selected_columns(columns)})"
 
@@ -289,6 +366,7 @@ class SQLiteDatabase:
         table,
         select_items="*",
         where_clauses="",
+        parameters=None,
         additional_clauses="",
         group_by="",
         size=DEFAULT_SIZE,
@@ -299,7 +377,8 @@ class SQLiteDatabase:
                 await cursor.execute(
                     f"SELECT {select_items} FROM {table.value} "
                     f"{'WHERE' if where_clauses else ''} {where_clauses} "
-                    f"{additional_clauses} {limit_clause} {group_by}"
+                    f"{additional_clauses} {limit_clause} {group_by}",
+                    parameters or [],
                 )
                 return await cursor.fetchall()
         except sqlite3.OperationalError as err:
@@ -308,15 +387,18 @@ class SQLiteDatabase:
             self.logger.error(f"An error occurred when executing select : {err}")
         return []
 
-    async def __execute_delete(self, table, where_clauses):
-        async with self.aio_cursor() as cursor:
-            await cursor.execute(f"DELETE FROM {table.value} WHERE {where_clauses} ")
+    async def __execute_delete(self, table, where_clauses, parameters):
+        async with self.__changes(commit=False), self.aio_cursor() as cursor:
+            await cursor.execute(
+                f"DELETE FROM {table.value} WHERE {where_clauses} ", parameters
+            )
             # nothing to return, will raise on error
 
     async def check_table_exists(self, table) -> bool:
         async with self.aio_cursor() as cursor:
             await cursor.execute(
-                f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table.value}'"
+                "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
+                (table.value,),
             )
             return await cursor.fetchall() != []
 
@@ -346,11 +428,26 @@ class SQLiteDatabase:
                         [self.TIMESTAMP_COLUMN] + [columns[u] for u in range(0, i)],
                     )
 
+                # covering index for selects filtering on these columns within a time range
+                if indexed_columns := [
+                    column for column in self.INDEXED_COLUMNS if column in columns
+                ]:
+                    await self.create_index(
+                        table, indexed_columns + [self.TIMESTAMP_COLUMN]
+                    )
+
         except sqlite3.OperationalError:
             self.logger.error(f"{table} already exists")
         finally:
             self.tables.append(table.value)
 
+    async def __restore_default_journal_mode(self):
+        try:
+            # checkpoint write-ahead log changes: the database file is self-contained when closed
+            await self.__set_pragmas({"journal_mode": self.DEFAULT_JOURNAL_MODE})
+        except sqlite3.OperationalError as err:
+            self.logger.warning(f"Failed to restore {self.file_name} journal mode: {err}")
+
     async def __init_tables_list(self):
         async with self.aio_cursor() as cursor:
             await cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
@@ -359,6 +456,8 @@ class SQLiteDatabase:
     async def stop(self):
         try:
             if self._cursor_pool is not None:
+                if self.write_ahead_log and self.connection is not None:
+                    await self.__restore_default_journal_mode()
                 await self._cursor_pool.close()
         finally:
             if self.connection is not None:
@@ -368,8 +467,8 @@ class SQLiteDatabase:
 
 
 @contextlib.asynccontextmanager
-async def new_sqlite_database(file_path):
-    local_database = SQLiteDatabase(file_path)
+async def new_sqlite_database(file_path, write_ahead_log=False):
+    local_database = SQLiteDatabase(file_path, write_ahead_log=write_ahead_log)
     try:
         await local_database.initialize()
         yield local_database
@@ -27,6 +27,7 @@ from octobot_commons.logging.logging_util import (
     reset_backtesting_errors,
     set_error_publication_enabled,
     get_private_minimized_message_if_necessary,
+    PrivateMinimizedMessage,
     get_private_placeholder_if_necessary,
     BACKTESTING_NEW_ERRORS_COUNT,
     LOG_DATABASE,
@@ -45,6 +46,11 @@ from octobot_commons.logging.context_based_file_handler import (
     add_context_based_file_handler,
     ContextBasedFileHandler,
 )
+from octobot_commons.logging.queued_handler import (
+    enable_queued_handlers,
+    disable_queued_handlers,
+    QueuedHandler,
+)
 from octobot_commons.logging.fastapi_unhandled_exception_handlers import (
     register_unhandled_exception_handler,
 )
@@ -62,6 +68,7 @@ __all__ = [
     "reset_backtesting_errors",
     "set_error_publication_enabled",
     "get_private_minimized_message_if_necessary",
+    "PrivateMinimizedMessage",
     "get_private_placeholder_if_necessary",
     "BACKTESTING_NEW_ERRORS_COUNT",
     "LOG_DATABASE",
@@ -77,5 +84,8 @@ __all__ = [
     "set_enable_web_interface_logs",
     "add_context_based_file_handler",
     "ContextBasedFileHandler",
+    "enable_queued_handlers",
+    "disable_queued_handlers",
+    "QueuedHandler",
     "register_unhandled_exception_handler",
 ]
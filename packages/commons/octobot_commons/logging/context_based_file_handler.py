@@ -72,6 +72,8 @@ class ContextBasedFileHandler(logging.Handler):
         file_handler.setLevel(self.level)
         root_logger = logging.getLogger()
         for handler in root_logger.handlers:
+            # queued handlers are writing logs using the wrapped handler formatter
+            handler = getattr(handler, "handler", handler)
             if isinstance(handler, logging.FileHandler) and handler.formatter:
                 # reuse the user configured formatter
                 file_handler.setFormatter(handler.formatter)
@@ -126,6 +126,21 @@ def get_private_minimized_message_if_necessary(message: typing.Any) -> typing.An
     )
 
 
+class PrivateMinimizedMessage:
+    """
+    Lazy get_private_minimized_message_if_necessary to use as a %-style log arg:
+    the message is only converted and minimized when the log is formatted
+    """
+
+    __slots__ = ("message",)
+
+    def __init__(self, message: typing.Any):
+        self.message = message
+
+    def __str__(self) -> str:
+        return str(get_private_minimized_message_if_necessary(self.message))
+
+
 def get_private_placeholder_if_necessary(message: typing.Any) -> str:
     """
     :param message: the message replace with a placeholder
@@ -202,29 +217,35 @@ class BotLogger:
     def debug(self, message: str, *args, **kwargs) -> None:
         """
         Called for a debug log
-        :param message: the log message
+        :param message: the log message, formatted with args using the %-style only when the log is emitted
         """
+        if not self._is_enabled_for(logging.DEBUG):
+            return
         message = self._process_log_callback(message)
         self.logger.debug(message, *args, **kwargs)
-        self._publish_log_if_necessary(message, logging.DEBUG)
+        self._publish_log_if_necessary(message, logging.DEBUG, args)
 
     def info(self, message: str, *args, **kwargs) -> None:
         """
         Called for an info log
-        :param message: the log message
+        :param message: the log message, formatted with args using the %-style only when the log is emitted
         """
+        if not self._is_enabled_for(logging.INFO):
+            return
         message = self._process_log_callback(message)
         self.logger.info(message, *args, **kwargs)
-        self._publish_log_if_necessary(message, logging.INFO)
+        self._publish_log_if_necessary(message, logging.INFO, args)
 
     def warning(self, message: str, *args, **kwargs) -> None:
         """
         Called for a warning log
-        :param message: the log message
+        :param message: the log message, formatted with args using the %-style only when the log is emitted
         """
+        if not self._is_enabled_for(logging.WARNING):
+            return
         message = self._process_log_callback(message)
         self.logger.warning(message, *args, **kwargs)
-        self._publish_log_if_necessary(message, logging.WARNING)
+        self._publish_log_if_necessary(message, logging.WARNING, args)
 
     def error(self, message: str, *args, skip_post_callback=False, **kwargs) -> None:
         """
@@ -234,7 +255,7 @@ class BotLogger:
         """
         message = self._process_log_callback(message)
         self.logger.error(message, *args, **kwargs)
-        self._publish_log_if_necessary(message, logging.ERROR)
+        self._publish_log_if_necessary(message, logging.ERROR, args)
         self._post_callback_if_necessary(None, message, skip_post_callback)
 
     def exception(
@@ -282,20 +303,24 @@ class BotLogger:
     def critical(self, message: str, *args, **kwargs) -> None:
         """
         Called for a critical log
-        :param message: the log message
+        :param message: the log message, formatted with args using the %-style only when the log is emitted
         """
+        if not self._is_enabled_for(logging.CRITICAL):
+            return
         message = self._process_log_callback(message)
         self.logger.critical(message, *args, **kwargs)
-        self._publish_log_if_necessary(message, logging.CRITICAL)
+        self._publish_log_if_necessary(message, logging.CRITICAL, args)
 
     def fatal(self, message: str, *args, **kwargs) -> None:
         """
         Called for a fatal log
-        :param message: the log message
+        :param message: the log message, formatted with args using the %-style only when the log is emitted
         """
+        if not self._is_enabled_for(logging.FATAL):
+            return
         message = self._process_log_callback(message)
         self.logger.fatal(message, *args, **kwargs)
-        self._publish_log_if_necessary(message, logging.FATAL)
+        self._publish_log_if_necessary(message, logging.FATAL, args)
 
     def disable(self, disabled):
         """
@@ -309,18 +334,22 @@ class BotLogger:
             return message
         return _LOG_CALLBACK(message)
 
-    def _publish_log_if_necessary(self, message, level) -> None:
+    def _is_enabled_for(self, level) -> bool:
+        """
+        :param level: the log level
+        :return: True when a log of this level would be either emitted or published
+        """
+        return self.logger.isEnabledFor(level) or _should_publish_log(level)
+
+    def _publish_log_if_necessary(self, message, level, args=None) -> None:
         """
         Publish the log message if necessary
         :param message: the log message
         :param level: the log level
+        :param args: the log message %-style formatting args
         """
-        if (
-            ENABLE_WEB_INTERFACE_LOGS
-            and STORED_LOG_MIN_LEVEL <= level
-            and get_global_logger_level() <= level
-        ):
-            self._web_interface_publish_log(message, level)
+        if _should_publish_log(level):
+            self._web_interface_publish_log(_format_message(message, args), level)
             if not ERROR_PUBLICATION_ENABLED and logging.ERROR <= level:
                 global SHOULD_PUBLISH_LOGS_WHEN_RE_ENABLED
                 SHOULD_PUBLISH_LOGS_WHEN_RE_ENABLED = True
@@ -353,6 +382,23 @@ class BotLogger:
             _ERROR_CALLBACK(exception, error_message)
 
 
+def _should_publish_log(level) -> bool:
+    return (
+        ENABLE_WEB_INTERFACE_LOGS
+        and STORED_LOG_MIN_LEVEL <= level
+        and get_global_logger_level() <= level
+    )
+
+
+def _format_message(message, args) -> str:
+    if not args:
+        return message
+    try:
+        return message % args
+    except (TypeError, ValueError):
+        return f"{message} {args}"
+
+
 def register_log_callback(callback: typing.Union[None, typing.Callable[[str], str]]):
     """
     :param callback: the callback to be called upon any log of any level
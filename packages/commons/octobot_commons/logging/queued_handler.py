@@ -0,0 +1,110 @@
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import atexit
+import logging
+import logging.handlers
+import queue
+
+DEFAULT_QUEUED_HANDLER_MAX_SIZE = 10000
+
+
+def enable_queued_handlers(
+    max_queue_size: int = DEFAULT_QUEUED_HANDLER_MAX_SIZE,
+    handler_types: tuple = (logging.StreamHandler,),
+) -> list:
+    """
+    Replace the root logger handlers of the given types by QueuedHandlers writing logs from a listener thread.
+    Handlers relying on the logging thread context (such as the ContextBasedFileHandler) should not be queued.
+    :param max_queue_size: the maximum number of logs waiting to be written by each handler
+    :param handler_types: the types of the handlers to queue
+    :return: the created QueuedHandlers
+    """
+    root_logger = logging.getLogger()
+    queued_handlers = []
+    for index, handler in enumerate(root_logger.handlers):
+        if isinstance(handler, handler_types) and not isinstance(handler, QueuedHandler):
+            queued_handler = QueuedHandler(handler, max_queue_size)
+            queued_handler.start()
+            root_logger.handlers[index] = queued_handler
+            queued_handlers.append(queued_handler)
+    return queued_handlers
+
+
+def disable_queued_handlers() -> None:
+    """
+    Write the remaining queued logs and restore the root logger handlers replaced by QueuedHandlers
+    """
+    root_logger = logging.getLogger()
+    for index, handler in enumerate(root_logger.handlers):
+        if isinstance(handler, QueuedHandler):
+            handler.stop()
+            root_logger.handlers[index] = handler.handler
+
+
+class QueuedHandler(logging.handlers.QueueHandler):
+    """
+    Handler pushing logs to a bounded queue from which they are written by the wrapped
+    handler in a listener thread. Logs are dropped and counted when the queue is full.
+    """
+
+    def __init__(self, handler: logging.Handler, max_queue_size: int = DEFAULT_QUEUED_HANDLER_MAX_SIZE):
+        super().__init__(queue.Queue(max_queue_size))
+        self.handler = handler
+        self.dropped_logs_count = 0
+        self._unreported_dropped_logs_count = 0
+        self._is_started = False
+        # levels are checked when logs are queued: this handler level is the wrapped handler level
+        self._listener = logging.handlers.QueueListener(self.queue, handler)
+        super().setLevel(handler.level)
+
+    def start(self):
+        """
+        Start writing queued logs
+        """
+        self._listener.start()
+        self._is_started = True
+        atexit.register(self.stop)
+
+    def stop(self):
+        """
+        Write the remaining queued logs and stop the listener thread
+        """
+        atexit.unregister(self.stop)
+        if self._is_started:
+            self._listener.stop()
+            self._is_started = False
+
+    def setLevel(self, level):  # pylint: disable=C0103
+        super().setLevel(level)
+        self.handler.setLevel(level)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self._unreported_dropped_logs_count:
+                self.queue.put_nowait(self._get_dropped_logs_record(record))
+                self._unreported_dropped_logs_count = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_logs_count += 1
+            self._unreported_dropped_logs_count += 1
+
+    def _get_dropped_logs_record(self, record: logging.LogRecord) -> logging.LogRecord:
+        return logging.LogRecord(
+            self.__class__.__name__, logging.WARNING, record.pathname, record.lineno,
+            f"{self._unreported_dropped_logs_count} logs dropped: {self.handler.__class__.__name__} "
+            f"queue is full (total dropped: {self.dropped_logs_count})",
+            None, None
+        )
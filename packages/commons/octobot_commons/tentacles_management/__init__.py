@@ -19,6 +19,7 @@ from octobot_commons.tentacles_management import class_inspector
 
 from octobot_commons.tentacles_management.abstract_tentacle import AbstractTentacle
 from octobot_commons.tentacles_management.class_inspector import (
+    set_missing_class_importer,
     default_parent_inspection,
     default_parents_inspection,
     evaluator_parent_inspection,
@@ -33,6 +34,7 @@ from octobot_commons.tentacles_management.class_inspector import (
 
 __all__ = [
     "AbstractTentacle",
+    "set_missing_class_importer",
     "default_parent_inspection",
     "default_parents_inspection",
     "evaluator_parent_inspection",
@@ -14,9 +14,22 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import inspect
+import typing
 
 import octobot_commons.logging as logging_util
 
+# called with the name of a class that is not found, returns True when it imported this class
+_MISSING_CLASS_IMPORTER: typing.Optional[typing.Callable[[str], bool]] = None
+
+
+def set_missing_class_importer(importer: typing.Optional[typing.Callable[[str], bool]]):
+    """
+    Set the function to call when a looked up class is not found, for example when its module is lazy loaded
+    :param importer: the function importing the given class name when available, returning True if it did
+    """
+    global _MISSING_CLASS_IMPORTER
+    _MISSING_CLASS_IMPORTER = importer
+
 
 def default_parent_inspection(element, parent):
     """
@@ -82,12 +95,19 @@ def get_deep_class_from_parent_subclasses(class_string, parent):
     :param parent: the expected parent
     :return: the class if found else None
     """
+    found = _get_deep_class_from_parent_subclasses(class_string, parent)
+    if found is None and _import_missing_class(class_string):
+        return _get_deep_class_from_parent_subclasses(class_string, parent)
+    return found
+
+
+def _get_deep_class_from_parent_subclasses(class_string, parent):
     found = get_class_from_parent_subclasses(class_string, parent)
     if found is not None:
         return found
 
     for parent_class in parent.__subclasses__():
-        found = get_deep_class_from_parent_subclasses(class_string, parent_class)
+        found = _get_deep_class_from_parent_subclasses(class_string, parent_class)
         if found is not None:
             return found
     return None
@@ -109,6 +129,17 @@ def get_class_from_string(
     :param error_when_not_found: if errors should be raised
     :return: the class if found else None
     """
+    found = _get_class_from_module(class_string, parent, module, parent_inspection)
+    if found is None and _import_missing_class(class_string):
+        found = _get_class_from_module(class_string, parent, module, parent_inspection)
+    if found is not None:
+        return found
+    if error_when_not_found:
+        raise ModuleNotFoundError(f"Cant find {class_string} module")
+    return None  # no class found
+
+
+def _get_class_from_module(class_string, parent, module, parent_inspection):
     if tentacle_class_by_name := {
         m[0]: m[1]
         for m in inspect.getmembers(module)
@@ -117,9 +148,11 @@ def get_class_from_string(
         and parent_inspection(m[1], parent)
     }:
         return tentacle_class_by_name[class_string]
-    if error_when_not_found:
-        raise ModuleNotFoundError(f"Cant find {class_string} module")
-    return None  # no class found
+    return None
+
+
+def _import_missing_class(class_string) -> bool:
+    return _MISSING_CLASS_IMPORTER is not None and _MISSING_CLASS_IMPORTER(class_string)
 
 
 def is_abstract_using_inspection_and_class_naming(clazz):
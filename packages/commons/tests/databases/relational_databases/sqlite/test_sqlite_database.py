@@ -239,6 +239,13 @@ async def test_insert_all():
                                              date=["01", "05"])
         assert await temp_empty_database.select(OHLCV) == [(2, 'abc', '10', '05'), (1, 'xyz', '1', '01')]
         assert await temp_empty_database.select(OHLCV, date="05") == [(2, 'abc', '10', '05')]
+        # values are not inlined in the query
+        await temp_empty_database.insert_all(OHLCV,
+                                             symbol="x'yz",
+                                             timestamp=[3, 4],
+                                             price=[1.5, 2],
+                                             date=["06", "07"])
+        assert await temp_empty_database.select(OHLCV, size=2) == [(4, "x'yz", '2', '07'), (3, "x'yz", '1.5', '06')]
 
 
 async def test_delete():
@@ -286,3 +293,82 @@ async def _check_select_result(database, timestamp, time_frame="1h", expected_ex
             pass
         else:
             raise
+
+
+async def test_transaction():
+    async with get_temp_empty_database() as temp_empty_database:
+        with mock.patch.object(temp_empty_database.connection, "commit", mock.AsyncMock()) as commit_mock:
+            async with temp_empty_database.transaction():
+                await temp_empty_database.insert(OHLCV, 1, symbol="xyz", price="1", date="01")
+                await temp_empty_database.insert_all(OHLCV, timestamp=[2, 3], symbol="xyz", price=["2", "3"],
+                                                     date=["02", "03"])
+                await temp_empty_database.update(OHLCV, {"price": "'4'"}, timestamp=3)
+                commit_mock.assert_not_called()
+            commit_mock.assert_awaited_once()
+        # values are not inlined in queries
+        assert await temp_empty_database.select(OHLCV, price="'4'") == [(3, 'xyz', "'4'", '03')]
+        assert await temp_empty_database.select_count(OHLCV, ["*"], symbol="xyz") == [(3,)]
+
+
+async def test_transaction_rollback():
+    async with get_temp_empty_database() as temp_empty_database:
+        await temp_empty_database.insert(OHLCV, 1, symbol="xyz", price="1", date="01")
+        with pytest.raises(ZeroDivisionError):
+            async with temp_empty_database.transaction():
+                await temp_empty_database.insert(OHLCV, 2, symbol="xyz", price="2", date="02")
+                await temp_empty_database.insert(KLINE, 2, symbol="xyz", price="2", date="02")
+                1 / 0
+        # changes made within the failed transaction are not saved
+        assert await temp_empty_database.select(OHLCV) == [(1, 'xyz', '1', '01')]
+        assert not await temp_empty_database.check_table_exists(KLINE)
+        assert KLINE.value not in temp_empty_database.tables
+
+
+async def test_concurrent_transaction():
+    async with get_temp_empty_database() as temp_empty_database:
+        await temp_empty_database.insert(OHLCV, 1, symbol="xyz", price="1", date="01")
+        in_transaction = asyncio.Event()
+        release_transaction = asyncio.Event()
+
+        async def _failing_transaction():
+            async with temp_empty_database.transaction():
+                await temp_empty_database.insert(OHLCV, 2, symbol="xyz", price="2", date="02")
+                in_transaction.set()
+                await release_transaction.wait()
+                raise ZeroDivisionError
+
+        transaction_task = asyncio.create_task(_failing_transaction())
+        await in_transaction.wait()
+        # waits for the transaction to complete: is not rolled back with it
+        insert_task = asyncio.create_task(
+            temp_empty_database.insert(OHLCV, 3, symbol="xyz", price="3", date="03")
+        )
+        await asyncio_tools.wait_asyncio_next_cycle()
+        assert not insert_task.done()
+        release_transaction.set()
+        with pytest.raises(ZeroDivisionError):
+            await transaction_task
+        await insert_task
+        assert await temp_empty_database.select(OHLCV) == [(3, 'xyz', '3', '03'), (1, 'xyz', '1', '01')]
+
+
+async def test_write_ahead_log():
+    database_name = "temp_wal_database"
+    try:
+        async with databases.new_sqlite_database(database_name, write_ahead_log=True) as database:
+            await database.insert(OHLCV, 1, symbol="xyz", time_frame="1h", price="1")
+            assert os.path.isfile(f"{database_name}-wal")
+            async with database.aio_cursor() as cursor:
+                await cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+                assert "index_ohlcv_symbol_time_frame_timestamp" in [row[0] for row in await cursor.fetchall()]
+        await asyncio_tools.wait_asyncio_next_cycle()
+        # journal mode is restored when closing the database
+        assert not os.path.isfile(f"{database_name}-wal")
+        async with databases.new_sqlite_database(database_name) as database:
+            assert await database.select(OHLCV) == [(1, 'xyz', '1h', '1')]
+            async with database.aio_cursor() as cursor:
+                await cursor.execute("PRAGMA journal_mode")
+                assert await cursor.fetchall() == [("delete",)]
+        await asyncio_tools.wait_asyncio_next_cycle()
+    finally:
+        os.remove(database_name)
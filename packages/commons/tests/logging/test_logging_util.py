@@ -113,6 +113,19 @@ def test_get_private_minimized_message_when_disallowed_coerces_non_string():
     assert logging_util.get_private_minimized_message_if_necessary(numeric_token) == expected
 
 
+@mock.patch("octobot_commons.logging.logging_util.constants.ALLOW_PRIVATE_DATA_LOGS", False)
+def test_private_minimized_message_is_lazy():
+    private_message = mock.Mock(__str__=mock.Mock(return_value="abcdefghijklmnop"))
+    lazy_message = logging_util.PrivateMinimizedMessage(private_message)
+    private_message.__str__.assert_not_called()
+    assert str(lazy_message) == logging_util.get_private_minimized_message_if_necessary("abcdefghijklmnop")
+    private_message.__str__.assert_called_once()
+    with mock.patch.object(logging_util.PrivateMinimizedMessage, "__str__", mock.Mock()) as str_mock:
+        with logging.temporary_log_level(logging_util.logging.INFO):
+            logging.get_logger("test").debug("lazy message: %s", lazy_message)
+        str_mock.assert_not_called()
+
+
 @mock.patch("octobot_commons.logging.logging_util.constants.ALLOW_PRIVATE_DATA_LOGS", True)
 def test_get_private_placeholder_when_allowed_returns_message():
     assert logging_util.get_private_placeholder_if_necessary("sensitive-value") == "sensitive-value"
@@ -130,3 +143,33 @@ def test_get_private_placeholder_when_disallowed_returns_placeholder_constant():
         logging_util.get_private_placeholder_if_necessary("any-content")
         == commons_constants.PRIVATE_MESSAGE_PLACEHOLDER
     )
+
+
+def test_disabled_level_skips_log_processing():
+    logger = logging.get_logger("test_disabled_level_skips_log_processing")
+    log_callback = mock.Mock(side_effect=lambda message: message)
+    logging.register_log_callback(log_callback)
+    try:
+        with logging.temporary_log_level(logging_util.logging.INFO), \
+                mock.patch.object(logger.logger, "debug", mock.Mock()) as debug_mock, \
+                mock.patch.object(logger, "_publish_log_if_necessary", mock.Mock()) as _publish_log_if_necessary_mock:
+            logger.debug("%s", mock.Mock(__str__=mock.Mock(side_effect=AssertionError)))
+            log_callback.assert_not_called()
+            debug_mock.assert_not_called()
+            _publish_log_if_necessary_mock.assert_not_called()
+        with logging.temporary_log_level(logging_util.logging.DEBUG), \
+                mock.patch.object(logger.logger, "debug", mock.Mock()) as debug_mock:
+            logger.debug("value: %s", 1)
+            log_callback.assert_called_once_with("value: %s")
+            debug_mock.assert_called_once_with("value: %s", 1)
+    finally:
+        logging.register_log_callback(None)
+
+
+def test_published_logs_are_formatted(logger):
+    with mock.patch.object(logger, "_web_interface_publish_log", mock.Mock()) as _web_interface_publish_log_mock:
+        logger.warning("%s order %s", "buy", 1)
+        _web_interface_publish_log_mock.assert_called_once_with("buy order 1", logging_util.logging.WARNING)
+        _web_interface_publish_log_mock.reset_mock()
+        logger.warning("100% filled")
+        _web_interface_publish_log_mock.assert_called_once_with("100% filled", logging_util.logging.WARNING)
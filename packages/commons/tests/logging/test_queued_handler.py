@@ -0,0 +1,81 @@
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import io
+import logging
+import threading
+
+import pytest
+
+import octobot_commons.logging as commons_logging
+
+
+@pytest.fixture
+def stream_handler():
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    root_logger = logging.getLogger()
+    root_logger.addHandler(handler)
+    try:
+        yield handler
+    finally:
+        commons_logging.disable_queued_handlers()
+        root_logger.removeHandler(handler)
+
+
+def test_enable_and_disable_queued_handlers(stream_handler):
+    root_logger = logging.getLogger()
+    queued_handlers = commons_logging.enable_queued_handlers()
+    handler = next(handler for handler in queued_handlers if handler.handler is stream_handler)
+    assert handler in root_logger.handlers
+    assert stream_handler not in root_logger.handlers
+    # already queued handlers are not queued again
+    assert commons_logging.enable_queued_handlers() == []
+
+    handler.setLevel(logging.INFO)
+    assert stream_handler.level == logging.INFO
+    logger = commons_logging.get_logger("test_enable_and_disable_queued_handlers")
+    logger.logger.setLevel(logging.DEBUG)
+    logger.debug("debug %s", 1)
+    logger.info("info %s", 1)
+    commons_logging.disable_queued_handlers()
+    assert stream_handler in root_logger.handlers
+    assert handler not in root_logger.handlers
+    assert stream_handler.stream.getvalue() == "INFO info 1\n"
+
+
+def test_full_queue_drops_logs(stream_handler):
+    handler = commons_logging.QueuedHandler(stream_handler, max_queue_size=2)
+    logger = logging.getLogger("test_full_queue_drops_logs")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        for index in range(5):
+            logger.warning("log %s", index)
+        assert handler.dropped_logs_count == 3
+        handler.start()
+        handler.stop()
+        # queue is empty: dropped logs are reported
+        logger.warning("log 5")
+        assert handler.dropped_logs_count == 3
+        handler.start()
+        handler.stop()
+    finally:
+        logger.removeHandler(handler)
+    assert stream_handler.stream.getvalue() == (
+        "WARNING log 0\nWARNING log 1\n"
+        "WARNING 3 logs dropped: StreamHandler queue is full (total dropped: 3)\nWARNING log 5\n"
+    )
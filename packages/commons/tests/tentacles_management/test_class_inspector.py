@@ -13,10 +13,12 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import types
 
 from octobot_commons.tentacles_management.class_inspector import default_parent_inspection, default_parents_inspection, \
-    get_class_from_parent_subclasses, get_deep_class_from_parent_subclasses, \
-    is_abstract_using_inspection_and_class_naming, get_all_classes_from_parent, get_single_deepest_child_class
+    get_class_from_parent_subclasses, get_deep_class_from_parent_subclasses, get_class_from_string, \
+    is_abstract_using_inspection_and_class_naming, get_all_classes_from_parent, get_single_deepest_child_class, \
+    set_missing_class_importer
 
 
 class AbstractParent:
@@ -63,6 +65,34 @@ def test_get_deep_class_from_parent_subclasses():
     assert get_deep_class_from_parent_subclasses("BasicChild", ChildOfChild) is None
 
 
+def test_get_class_with_missing_class_importer():
+    class LazyParent:
+        pass
+
+    class OtherLazyParent(LazyParent):
+        pass
+
+    module = types.ModuleType("lazy_module")
+    imported_classes = {}
+
+    def _importer(class_name):
+        if class_name != "LazyChild":
+            return False
+        imported_classes[class_name] = module.LazyChild = type("LazyChild", (OtherLazyParent,), {})
+        return True
+
+    assert get_class_from_string("LazyChild", OtherLazyParent, module) is None
+    set_missing_class_importer(_importer)
+    try:
+        # missing classes are imported on lookup
+        assert get_class_from_string("LazyChild", OtherLazyParent, module) is imported_classes["LazyChild"]
+        assert get_deep_class_from_parent_subclasses("LazyChild", LazyParent) is imported_classes["LazyChild"]
+        assert get_class_from_string("UnknownChild", OtherLazyParent, module) is None
+        assert get_deep_class_from_parent_subclasses("UnknownChild", LazyParent) is None
+    finally:
+        set_missing_class_importer(None)
+
+
 def test_is_abstract_using_inspection_and_class_naming():
     assert is_abstract_using_inspection_and_class_naming(AbstractParent)
     assert not is_abstract_using_inspection_and_class_naming(Parent)
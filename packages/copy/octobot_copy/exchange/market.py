@@ -1,3 +1,4 @@
+import asyncio
 import decimal
 import typing
 
@@ -29,6 +30,14 @@ class MarketInterface:
             timeout=trading_constants.ORDER_DATA_FETCHING_TIMEOUT,
         )
 
+    async def get_up_to_date_prices(self, symbols: typing.Iterable[str]) -> dict[str, decimal.Decimal]:
+        """
+        Fetches the up-to-date price of each symbol concurrently
+        """
+        symbols = list(symbols)
+        prices = await asyncio.gather(*(self.get_up_to_date_price(symbol) for symbol in symbols))
+        return dict(zip(symbols, prices))
+
     def get_potentially_outdated_price(self, symbol: str) -> (decimal.Decimal, bool):
         return trading_personal_data.get_potentially_outdated_price(
             self._exchange_manager,
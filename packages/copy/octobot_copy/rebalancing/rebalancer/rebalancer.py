@@ -170,6 +170,8 @@ class AbstractRebalancer:
             coins_to_buy=coins_to_buy,
         )
         for symbol, values in amount_by_symbol.items():
+            # buy orders are created one after the other: created orders can be filled right away, which
+            # requires the portfolio lock held by the calling task
             orders.extend(
                 await self._buy_coin(
                     symbol,
@@ -303,17 +305,21 @@ class AbstractRebalancer:
             if coins_to_buy is not None
             else list(self._rebalance_actions_planner.targeted_coins)
         )
+        symbol_by_coin = {}
         for coin in coins:
             if not symbol_util.is_symbol(coin):
                 if coin == ref_market:
                     # nothing to do for reference market, keep as is
                     continue
-                symbol = symbol_util.merge_currencies(coin, ref_market)
+                symbol_by_coin[coin] = symbol_util.merge_currencies(coin, ref_market)
             else:
-                symbol = coin
-
-            up_to_date_price = await self._exchange_interface.market.get_up_to_date_price(symbol)
-            price = coins_prices.get(symbol, up_to_date_price)
+                symbol_by_coin[coin] = coin
+        # fetch every price at once to compute the whole order plan from prices of the same time
+        up_to_date_prices = await self._exchange_interface.market.get_up_to_date_prices(
+            symbol_by_coin.values()
+        )
+        for coin, symbol in symbol_by_coin.items():
+            price = coins_prices.get(symbol, up_to_date_prices[symbol])
             ratio = self._rebalance_actions_planner.get_target_ratio(coin)
             if ratio == trading_constants.ZERO:
                 # coin is not to handle
@@ -15,6 +15,8 @@
 #  License along with this library.
 import typing
 
+import octobot_commons.os_util as os_util
+
 MatrixValueType = typing.NewType('MatrixValueType', typing.Union[str, int, float])
 
 START_EVAL_PERTINENCE = 1
@@ -38,3 +40,8 @@ RESET_EVALUATION = "reset_evaluation"
 EVALUATOR_CHANNEL_DATA_ACTION = "action"
 EVALUATOR_CHANNEL_DATA_EXCHANGE_ID = "exchange_id"
 EVALUATOR_CHANNEL_DATA_TIME_FRAMES = "time_frames"
+
+# when True, strategy optimizer backtesting runs replay TA evaluations from previous runs on the same data
+REPLAY_CACHED_EVALUATIONS_IN_OPTIMIZER = os_util.parse_boolean_environment_var(
+    "REPLAY_CACHED_EVALUATIONS_IN_OPTIMIZER", "True"
+)
@@ -22,6 +22,7 @@ import octobot_commons.tree as commons_tree
 
 import octobot_evaluators.constants as constants
 import octobot_evaluators.evaluators as evaluator
+import octobot_evaluators.util as util
 
 
 class TAEvaluator(evaluator.AbstractEvaluator):
@@ -37,6 +38,17 @@ class TAEvaluator(evaluator.AbstractEvaluator):
 
         self._price_init_timeout = self.DEFAULT_LIVE_PRICE_INIT_TIMEOUT
 
+        # set when evaluations can be replayed from previous backtesting runs
+        self.evaluations_replay_cache = None
+
+    @classmethod
+    def can_replay_cached_evaluations(cls) -> bool:
+        """
+        Override to return False when evaluations depend on more than this evaluator candles, code and configuration
+        :return: True when evaluations from a previous optimizer run on the same data can be replayed
+        """
+        return not cls.use_cache()
+
     async def start(self, bot_id: str) -> bool:
         """
         Default TA start: to be overwritten
@@ -61,10 +73,13 @@ class TAEvaluator(evaluator.AbstractEvaluator):
                     time_frame=self.time_frame.value if self.time_frame else time_frame_filter,
                     priority_level=self.priority_level,
             )
-            if exchange_api.get_is_backtesting(
-                    exchange_api.get_exchange_manager_from_exchange_name_and_id(self.exchange_name, exchange_id)
-            ):
+            exchange_manager = exchange_api.get_exchange_manager_from_exchange_name_and_id(
+                self.exchange_name, exchange_id
+            )
+            if exchange_api.get_is_backtesting(exchange_manager):
                 self.use_backtesting_init_timeout()
+                if self._should_replay_cached_evaluations(exchange_manager):
+                    self._init_evaluations_replay_cache(exchange_manager)
             return True
         except ImportError as e:
             self.logger.error(f"Can't connect to OHLCV trading channel {e}")
@@ -73,6 +88,30 @@ class TAEvaluator(evaluator.AbstractEvaluator):
     def use_backtesting_init_timeout(self):
         self._price_init_timeout = 0
 
+    def _should_replay_cached_evaluations(self, exchange_manager) -> bool:
+        return constants.REPLAY_CACHED_EVALUATIONS_IN_OPTIMIZER \
+            and self.can_replay_cached_evaluations() \
+            and exchange_manager.config.get(common_constants.CONFIG_OPTIMIZER_ID) is not None
+
+    def _init_evaluations_replay_cache(self, exchange_manager):
+        import octobot_trading.api as exchange_api
+        start_timestamp, end_timestamp = exchange_api.get_exchange_backtesting_time_window(exchange_manager)
+        self.evaluations_replay_cache = util.EvaluationsReplayCache(
+            self,
+            util.get_data_identifier(
+                exchange_api.get_backtesting_data_files(exchange_manager), start_timestamp, end_timestamp
+            ),
+            end_timestamp
+        )
+
+    async def stop(self) -> None:
+        await super().stop()
+        if self.evaluations_replay_cache is not None:
+            try:
+                await self.evaluations_replay_cache.flush()
+            except Exception as err:
+                self.logger.exception(err, True, f"Error when saving evaluations to replay: {err}")
+
     async def reset_evaluation(self, cryptocurrency, symbol, time_frame):
         self.eval_note = common_constants.START_PENDING_EVAL_NOTE
         await self.evaluation_completed(cryptocurrency, symbol, time_frame, eval_time=0, notify=False)
@@ -96,7 +135,58 @@ class TAEvaluator(evaluator.AbstractEvaluator):
                 ),
                 self._price_init_timeout
             )
-        await self.ohlcv_callback(exchange, exchange_id, cryptocurrency, symbol, time_frame, candle, False)
+        if self.evaluations_replay_cache is None:
+            await self.ohlcv_callback(exchange, exchange_id, cryptocurrency, symbol, time_frame, candle, False)
+            return
+        candle_time = candle[common_enums.PriceIndexes.IND_PRICE_TIME.value]
+        evaluations = await self.evaluations_replay_cache.get_evaluations(symbol, time_frame, candle_time)
+        if evaluations is None:
+            with self.evaluations_replay_cache.recording(symbol, time_frame, candle_time):
+                await self.ohlcv_callback(exchange, exchange_id, cryptocurrency, symbol, time_frame, candle, False)
+        else:
+            for evaluation in evaluations:
+                await self._replay_evaluation(**evaluation)
+
+    async def _replay_evaluation(self, eval_note=None, **kwargs):
+        self.eval_note = eval_note
+        await super().evaluation_completed(eval_note=eval_note, **kwargs)
+
+    async def evaluation_completed(self,
+                                   cryptocurrency=None,
+                                   symbol=None,
+                                   time_frame=None,
+                                   eval_note=None,
+                                   eval_time=0,
+                                   eval_note_description=None,
+                                   eval_note_metadata=None,
+                                   notify=True,
+                                   origin_consumer=None,
+                                   cache_client=None,
+                                   cache_if_available=True) -> None:
+        if self.evaluations_replay_cache is not None:
+            self.evaluations_replay_cache.record(
+                cryptocurrency=cryptocurrency,
+                symbol=symbol,
+                time_frame=time_frame,
+                eval_note=self.eval_note if eval_note is None else eval_note,
+                eval_time=eval_time,
+                eval_note_description=eval_note_description,
+                eval_note_metadata=eval_note_metadata,
+                notify=notify,
+            )
+        await super().evaluation_completed(
+            cryptocurrency=cryptocurrency,
+            symbol=symbol,
+            time_frame=time_frame,
+            eval_note=eval_note,
+            eval_time=eval_time,
+            eval_note_description=eval_note_description,
+            eval_note_metadata=eval_note_metadata,
+            notify=notify,
+            origin_consumer=origin_consumer,
+            cache_client=cache_client,
+            cache_if_available=cache_if_available,
+        )
 
     async def evaluators_callback(self,
                                   matrix_id,
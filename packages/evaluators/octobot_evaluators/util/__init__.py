@@ -23,6 +23,11 @@ from octobot_evaluators.util.evaluation_util import (
     local_cache_client,
     get_required_candles_count,
 )
+from octobot_evaluators.util import evaluations_replay_cache
+from octobot_evaluators.util.evaluations_replay_cache import (
+    EvaluationsReplayCache,
+    get_data_identifier,
+)
 
 __all__ = [
     "get_eval_time",
@@ -30,5 +35,7 @@ __all__ = [
     "local_trading_context",
     "local_cache_client",
     "get_required_candles_count",
+    "EvaluationsReplayCache",
+    "get_data_identifier",
 ]
 
@@ -0,0 +1,131 @@
+#  Drakkar-Software OctoBot-Evaluators
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import contextlib
+import hashlib
+import json
+import os
+import typing
+
+import octobot_commons.constants as constants
+import octobot_commons.enums as enums
+import octobot_commons.logging as logging
+
+import octobot_evaluators.util.evaluation_util as evaluation_util
+
+
+class EvaluationsReplayCache:
+    """
+    Stores the evaluations sent by an evaluator after each candle in its cache database to replay them in later
+    backtesting runs using the same data files and time window.
+    The cache database path identifies the evaluator code and configuration.
+    """
+    VALUE_KEY = "replayed_evaluations"
+
+    def __init__(self, evaluator, data_identifier: str, end_timestamp: float):
+        self.evaluator = evaluator
+        self.value_key: str = f"{self.VALUE_KEY}{constants.CACHE_RELATED_DATA_SEPARATOR}{data_identifier}"
+        self.end_timestamp: float = end_timestamp
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self._cache_clients: dict = {}
+        self._recorded_evaluations: dict = {}
+        self._replayed_symbols_time_frames: set = set()
+        self._current_evaluations: typing.Optional[list] = None
+
+    async def get_evaluations(self, symbol: str, time_frame: str, timestamp: float) -> typing.Optional[list]:
+        """
+        :return: the evaluations sent at the given candle timestamp or None when they are not cached
+        """
+        if (symbol, time_frame) in self._recorded_evaluations:
+            # already recording this run evaluations: cache can't be complete
+            return None
+        evaluations, missing = await self._get_cache_client(symbol, time_frame).get_cached_value(
+            value_key=self.value_key, cache_key=timestamp
+        )
+        if missing:
+            return None
+        self._replayed_symbols_time_frames.add((symbol, time_frame))
+        return evaluations
+
+    @contextlib.contextmanager
+    def recording(self, symbol: str, time_frame: str, timestamp: float):
+        """
+        Records the evaluations sent during this context as the evaluations of the given candle
+        """
+        self._current_evaluations = []
+        try:
+            yield
+            if self._current_evaluations is not None and (symbol, time_frame) not in self._replayed_symbols_time_frames:
+                self._recorded_evaluations.setdefault((symbol, time_frame), {})[timestamp] = self._current_evaluations
+        finally:
+            self._current_evaluations = None
+
+    def record(self, **evaluation):
+        """
+        Records an evaluation when in a recording context
+        """
+        if self._current_evaluations is None:
+            return
+        try:
+            json.dumps(evaluation)
+            self._current_evaluations.append(evaluation)
+        except (TypeError, ValueError):
+            # this candle evaluations can't be stored
+            self._current_evaluations = None
+
+    async def flush(self):
+        """
+        Writes the recorded evaluations into the cache when they cover the whole backtesting time window
+        """
+        for (symbol, time_frame), evaluations_by_timestamp in self._recorded_evaluations.items():
+            time_frame_seconds = enums.TimeFramesMinutes[enums.TimeFrames(time_frame)] * constants.MINUTE_TO_SECONDS
+            # the last candle opens at most 2 time frames before the end of the backtesting
+            if max(evaluations_by_timestamp) + 2 * time_frame_seconds < self.end_timestamp:
+                self.logger.debug(f"Skipped incomplete {self.evaluator.get_name()} {symbol} {time_frame} evaluations")
+                continue
+            cache_client = self._cache_clients[(symbol, time_frame)]
+            await cache_client.set_cached_values(
+                list(evaluations_by_timestamp.values()), self.value_key, list(evaluations_by_timestamp)
+            )
+            await cache_client.get_cache().flush()
+        self._recorded_evaluations = {}
+
+    def _get_cache_client(self, symbol, time_frame):
+        try:
+            return self._cache_clients[(symbol, time_frame)]
+        except KeyError:
+            cache_client = evaluation_util.local_cache_client(self.evaluator, symbol, time_frame)
+            self._cache_clients[(symbol, time_frame)] = cache_client
+            return cache_client
+
+
+def get_data_identifier(data_files: list, start_timestamp: float, end_timestamp: float) -> str:
+    """
+    :return: an identifier of the data evaluated in a backtesting run, it changes when data files are updated
+    """
+    return hashlib.sha256(
+        f"{sorted(_get_data_file_identifier(data_file) for data_file in data_files)}"
+        f"{start_timestamp}{end_timestamp}".encode()
+    ).hexdigest()[:constants.CACHE_HASH_SIZE]
+
+
+def _get_data_file_identifier(data_file: str) -> str:
+    file_name = os.path.basename(data_file)
+    try:
+        file_stat = os.stat(data_file)
+    except OSError:
+        return file_name
+    # data files can be extended in place when resuming their collection
+    return f"{file_name}:{file_stat.st_size}:{file_stat.st_mtime_ns}"
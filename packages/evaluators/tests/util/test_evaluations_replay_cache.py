@@ -0,0 +1,155 @@
+#  Drakkar-Software OctoBot-Evaluators
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import os
+import tempfile
+import pytest
+
+import octobot_evaluators.evaluators as evaluators
+import octobot_evaluators.util as util
+import octobot_evaluators.util.evaluations_replay_cache as evaluations_replay_cache
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+HOUR = 3600
+START = 1699999200
+SYMBOL = "BTC/USDT"
+TIME_FRAME = "1h"
+
+
+class CacheClient:
+    def __init__(self):
+        self.values_by_key = {}
+        self.cache = mock.Mock(flush=mock.AsyncMock())
+
+    async def get_cached_value(self, value_key, cache_key):
+        try:
+            return self.values_by_key[value_key][cache_key], False
+        except KeyError:
+            return None, True
+
+    async def set_cached_values(self, values, value_key, cache_keys):
+        self.values_by_key.setdefault(value_key, {}).update(dict(zip(cache_keys, values)))
+
+    def get_cache(self):
+        return self.cache
+
+
+@pytest.fixture
+def cache_client():
+    client = CacheClient()
+    with mock.patch.object(evaluations_replay_cache.evaluation_util, "local_cache_client",
+                           mock.Mock(return_value=client)):
+        yield client
+
+
+def _evaluator(end_timestamp):
+    evaluator = evaluators.TAEvaluator(mock.Mock())
+
+    async def ohlcv_callback(exchange, exchange_id, cryptocurrency, symbol, time_frame, candle, _):
+        evaluator.eval_note = candle[1]
+        await evaluator.evaluation_completed(cryptocurrency, symbol, time_frame, eval_time=candle[0] + HOUR)
+
+    evaluator.ohlcv_callback = ohlcv_callback
+    evaluator.evaluations_replay_cache = util.EvaluationsReplayCache(evaluator, "data", end_timestamp)
+    return evaluator
+
+
+async def _run(evaluator, hours):
+    for hour in hours:
+        await evaluator.evaluator_ohlcv_callback(
+            "binance", "id", "Bitcoin", SYMBOL, TIME_FRAME, [START + hour * HOUR, hour]
+        )
+
+
+async def test_record_and_replay_evaluations(cache_client):
+    recording_evaluator = _evaluator(START + 3 * HOUR)
+    with mock.patch.object(evaluators.AbstractEvaluator, "evaluation_completed", mock.AsyncMock()) \
+            as evaluation_completed_mock:
+        await _run(recording_evaluator, range(4))
+        assert evaluation_completed_mock.call_count == 4
+        await recording_evaluator.stop()
+    cache_client.cache.flush.assert_awaited_once()
+    assert cache_client.values_by_key[recording_evaluator.evaluations_replay_cache.value_key] == {
+        START + hour * HOUR: [{
+            "cryptocurrency": "Bitcoin", "symbol": SYMBOL, "time_frame": TIME_FRAME, "eval_note": hour,
+            "eval_time": START + (hour + 1) * HOUR, "eval_note_description": None, "eval_note_metadata": None,
+            "notify": True,
+        }]
+        for hour in range(4)
+    }
+
+    replaying_evaluator = _evaluator(START + 3 * HOUR)
+    with mock.patch.object(evaluators.AbstractEvaluator, "evaluation_completed", mock.AsyncMock()) \
+            as evaluation_completed_mock, \
+            mock.patch.object(replaying_evaluator, "ohlcv_callback", mock.AsyncMock()) as ohlcv_callback_mock:
+        await _run(replaying_evaluator, range(4))
+        ohlcv_callback_mock.assert_not_called()
+        assert [call.kwargs["eval_note"] for call in evaluation_completed_mock.call_args_list] == list(range(4))
+        assert replaying_evaluator.eval_note == 3
+        await replaying_evaluator.stop()
+    # nothing to save
+    cache_client.cache.flush.assert_awaited_once()
+
+    # another data identifier: evaluations are not replayed
+    other_data_evaluator = _evaluator(START + 3 * HOUR)
+    other_data_evaluator.evaluations_replay_cache.value_key = "other"
+    with mock.patch.object(evaluators.AbstractEvaluator, "evaluation_completed", mock.AsyncMock()), \
+            mock.patch.object(other_data_evaluator, "ohlcv_callback", mock.AsyncMock()) as ohlcv_callback_mock:
+        await _run(other_data_evaluator, range(1))
+        ohlcv_callback_mock.assert_awaited_once()
+
+
+async def test_incomplete_evaluations_are_not_saved(cache_client):
+    evaluator = _evaluator(START + 10 * HOUR)
+    with mock.patch.object(evaluators.AbstractEvaluator, "evaluation_completed", mock.AsyncMock()):
+        await _run(evaluator, range(4))
+        await evaluator.stop()
+    assert cache_client.values_by_key == {}
+    cache_client.cache.flush.assert_not_called()
+
+
+async def test_not_serializable_evaluations_are_not_saved(cache_client):
+    replay_cache = util.EvaluationsReplayCache(mock.Mock(), "data", START)
+    with replay_cache.recording(SYMBOL, TIME_FRAME, START):
+        replay_cache.record(eval_note=1)
+    with replay_cache.recording(SYMBOL, TIME_FRAME, START + HOUR):
+        replay_cache.record(eval_note=1)
+        replay_cache.record(eval_note_metadata={"value": object()})
+    # outside of recording context
+    replay_cache.record(eval_note=2)
+    assert replay_cache._recorded_evaluations == {(SYMBOL, TIME_FRAME): {START: [{"eval_note": 1}]}}
+
+
+async def test_get_data_identifier():
+    identifier = util.get_data_identifier(["a/data_1.data", "b/data_2.data"], START, START + HOUR)
+    assert identifier == util.get_data_identifier(["data_2.data", "data_1.data"], START, START + HOUR)
+    assert identifier != util.get_data_identifier(["data_2.data", "data_1.data"], START + 1, START + HOUR)
+
+
+async def test_get_data_identifier_with_updated_data_file():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_file = os.path.join(temp_dir, "data_1.data")
+        with open(data_file, "w") as file:
+            file.write("candles")
+        identifier = util.get_data_identifier([data_file], START, START + HOUR)
+        assert identifier == util.get_data_identifier([data_file], START, START + HOUR)
+        assert identifier != util.get_data_identifier(["data_1.data"], START, START + HOUR)
+        # data file is extended in place
+        with open(data_file, "a") as file:
+            file.write("new candles")
+        assert identifier != util.get_data_identifier([data_file], START, START + HOUR)
@@ -123,6 +123,11 @@ ENV_GPT_MODEL = "GPT_MODEL"
 ENV_LLM_CUSTOM_BASE_URL = "LLM_CUSTOM_BASE_URL"
 ENV_LLM_MODEL = "LLM_MODEL"
 ENV_GPT_DAILY_TOKENS_LIMIT = "GPT_DAILY_TOKEN_LIMIT"
+# seconds during which identical LLM requests reuse their stored response, 0 to disable
+ENV_LLM_RESPONSE_CACHE_TTL = "LLM_RESPONSE_CACHE_TTL"
+ENV_LLM_RESPONSE_CACHE_MAX_ENTRIES = "LLM_RESPONSE_CACHE_MAX_ENTRIES"
+DEFAULT_LLM_RESPONSE_CACHE_MAX_ENTRIES = 10000
+LLM_RESPONSE_CACHE_FILE = "llm_responses_cache.json"
 
 # LangChain
 CONFIG_LANGCHAIN = "langchain"
@@ -257,32 +257,34 @@ class ExchangeBotSnapshotWithHistoryCollector(collector.AbstractExchangeBotSnaps
                            database_candles, current_bot_candles):
         to_add_candles = []
         symbol_id = str(symbol)
-        for up_to_date_candle in current_bot_candles:
-            current_candle_time = up_to_date_candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value]
-            equivalent_db_candle, candle_timestamp = self.find_candle(database_candles, current_candle_time)
-            if equivalent_db_candle is None:
-                to_add_candles.append(up_to_date_candle)
-            elif equivalent_db_candle != up_to_date_candle:
-                updated_value_by_column = {
-                    "candle": json.dumps(up_to_date_candle)
-                }
-                await self.database.update(backtesting_enums.ExchangeDataTables.OHLCV,
-                                           updated_value_by_column=updated_value_by_column,
-                                           exchange_name=exchange,
-                                           cryptocurrency=
-                                           self.exchange_manager.exchange.get_pair_cryptocurrency(symbol_id),
-                                           symbol=symbol.symbol_str,
-                                           time_frame=time_frame.value,
-                                           timestamp=str(candle_timestamp))
-        if to_add_candles:
-            await self.save_ohlcv(
-                exchange=exchange,
-                cryptocurrency=self.exchange_manager.exchange.get_pair_cryptocurrency(symbol_id),
-                symbol=symbol, time_frame=time_frame, candle=to_add_candles,
-                timestamp=[candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] + time_frame_sec
-                           for candle in to_add_candles],
-                multiple=True
-            )
+        # commit every updated and added candle at once
+        async with self.database.transaction():
+            for up_to_date_candle in current_bot_candles:
+                current_candle_time = up_to_date_candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value]
+                equivalent_db_candle, candle_timestamp = self.find_candle(database_candles, current_candle_time)
+                if equivalent_db_candle is None:
+                    to_add_candles.append(up_to_date_candle)
+                elif equivalent_db_candle != up_to_date_candle:
+                    updated_value_by_column = {
+                        "candle": json.dumps(up_to_date_candle)
+                    }
+                    await self.database.update(backtesting_enums.ExchangeDataTables.OHLCV,
+                                               updated_value_by_column=updated_value_by_column,
+                                               exchange_name=exchange,
+                                               cryptocurrency=
+                                               self.exchange_manager.exchange.get_pair_cryptocurrency(symbol_id),
+                                               symbol=symbol.symbol_str,
+                                               time_frame=time_frame.value,
+                                               timestamp=str(candle_timestamp))
+            if to_add_candles:
+                await self.save_ohlcv(
+                    exchange=exchange,
+                    cryptocurrency=self.exchange_manager.exchange.get_pair_cryptocurrency(symbol_id),
+                    symbol=symbol, time_frame=time_frame, candle=to_add_candles,
+                    timestamp=[candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] + time_frame_sec
+                               for candle in to_add_candles],
+                    multiple=True
+                )
 
     async def _check_ohlcv_integrity(self, database_candles):
         # ensure no timestamp is here twice
@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import asyncio
 import logging
 import os
 import time
@@ -35,15 +36,18 @@ except ImportError:
 
 class ExchangeHistoryDataCollector(collector.AbstractExchangeHistoryCollector):
     IMPORTER = generic_exchange_importer.GenericExchangeDataImporter
+    # symbol and time frame histories collected at the same time, requests are throttled by the exchange rate limit
+    MAX_CONCURRENT_JOBS = 5
 
     def __init__(self, config, exchange_name, exchange_type, tentacles_setup_config, symbols, time_frames,
                  use_all_available_timeframes=False,
                  data_format=backtesting_enums.DataFormats.REGULAR_COLLECTOR_DATA,
                  start_timestamp=None,
-                 end_timestamp=None):
+                 end_timestamp=None,
+                 data_file=None):
         super().__init__(config, exchange_name, exchange_type, tentacles_setup_config, symbols, time_frames,
                          use_all_available_timeframes, data_format=data_format,
-                         start_timestamp=start_timestamp, end_timestamp=end_timestamp)
+                         start_timestamp=start_timestamp, end_timestamp=end_timestamp, data_file=data_file)
         self.exchange = None
         self.exchange_manager = None
 
@@ -73,24 +77,22 @@ class ExchangeHistoryDataCollector(collector.AbstractExchangeHistoryCollector):
             self.in_progress = True
 
             self.logger.info(f"Start collecting history on {self.exchange_name}")
-            for symbol_index, symbol in enumerate(self.symbols):
-                self.logger.info(f"Collecting history for {symbol}...")
-                await self.get_ticker_history(self.exchange_name, symbol)
-                await self.get_order_book_history(self.exchange_name, symbol)
-                await self.get_recent_trades_history(self.exchange_name, symbol)
-
-                for time_frame_index, time_frame in enumerate(self.time_frames):
-                    self.current_step_index = (symbol_index * len(self.time_frames)) + time_frame_index + 1
-                    self.logger.info(
-                        f"[{time_frame_index}/{len(self.time_frames)}] Collecting {symbol} history on {time_frame}...")
-                    await self.get_ohlcv_history(self.exchange_name, symbol, time_frame)
-                    await self.get_kline_history(self.exchange_name, symbol, time_frame)
+            await self._run_jobs(self._collect_symbol_history(symbol) for symbol in self.symbols)
+            await self._run_jobs(
+                self._collect_time_frame_history(symbol, time_frame)
+                for symbol in self.symbols
+                for time_frame in self.time_frames
+            )
         except Exception as err:
             await self.database.stop()
             should_stop_database = False
-            # Do not keep errored data file
             if os.path.isfile(self.temp_file_path):
-                os.remove(self.temp_file_path)
+                if (self.current_step_index or self.data_file) and not self.should_stop:
+                    # keep collected data to resume the collection from this file
+                    self.logger.warning(f"Keeping {self.temp_file_path} to resume this collection later")
+                else:
+                    # Do not keep errored data file
+                    os.remove(self.temp_file_path)
             if not self.should_stop:
                 self.logger.exception(err, True, f"Error when collecting {self.exchange_name} history for "
                                                  f"{', '.join([str(symbol) for symbol in self.symbols])}: {err}")
@@ -98,6 +100,37 @@ class ExchangeHistoryDataCollector(collector.AbstractExchangeHistoryCollector):
         finally:
             await self.stop(should_stop_database=should_stop_database)
 
+    async def _run_jobs(self, jobs):
+        # workers share the jobs iterator: jobs coroutines are only created when a worker is available
+        jobs_iterator = iter(jobs)
+
+        async def _worker():
+            for job in jobs_iterator:
+                await job
+
+        workers = [asyncio.create_task(_worker()) for _ in range(self.MAX_CONCURRENT_JOBS)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # stop pending jobs on error
+            for worker in workers:
+                if not worker.done():
+                    worker.cancel()
+
+    async def _collect_symbol_history(self, symbol):
+        self.logger.info(f"Collecting history for {symbol}...")
+        await self.get_ticker_history(self.exchange_name, symbol)
+        await self.get_order_book_history(self.exchange_name, symbol)
+        await self.get_recent_trades_history(self.exchange_name, symbol)
+
+    async def _collect_time_frame_history(self, symbol, time_frame):
+        self.logger.info(f"Collecting {symbol} history on {time_frame}...")
+        await self.get_ohlcv_history(self.exchange_name, symbol, time_frame)
+        await self.get_kline_history(self.exchange_name, symbol, time_frame)
+        # each completed job is a checkpoint: its data is saved
+        self.current_step_index += 1
+        self.logger.info(f"[{self.current_step_index}/{self.total_steps}] Collected {symbol} history on {time_frame}")
+
     def _load_all_available_timeframes(self):
         allowed_timeframes = set(tf.value for tf in commons_enums.TimeFrames)
         self.time_frames = [commons_enums.TimeFrames(time_frame)
@@ -131,14 +164,19 @@ class ExchangeHistoryDataCollector(collector.AbstractExchangeHistoryCollector):
         time_frame_sec = commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
         symbol_id = str(symbol)
         cryptocurrency = self.exchange_manager.exchange.get_pair_cryptocurrency(symbol_id)
-        if self.start_timestamp is not None:
-            start_time = self.start_timestamp
+        resume_time = await self._get_ohlcv_resume_time(exchange, symbol, time_frame, time_frame_sec)
+        should_replace_resume_candle = resume_time is not None
+        if self.start_timestamp is not None or resume_time is not None:
             end_time = self.end_timestamp or time.time() * 1000
-            first_candle_timestamp = await self.get_first_candle_timestamp(
-                self.start_timestamp, symbol, time_frame
-            ) * 1000
-            if self.start_timestamp < first_candle_timestamp:
-                start_time = first_candle_timestamp
+            if resume_time is None:
+                start_time = self.start_timestamp
+                first_candle_timestamp = await self.get_first_candle_timestamp(
+                    self.start_timestamp, symbol, time_frame
+                ) * 1000
+                if self.start_timestamp < first_candle_timestamp:
+                    start_time = first_candle_timestamp
+            else:
+                start_time = resume_time
             async for hist_candles in trading_api.get_historical_ohlcv(self.exchange_manager, symbol_id, time_frame,
                                                                        start_time, end_time):
                 if hist_candles:
@@ -146,13 +184,21 @@ class ExchangeHistoryDataCollector(collector.AbstractExchangeHistoryCollector):
                         (hist_candles[-1][commons_enums.PriceIndexes.IND_PRICE_TIME.value] - start_time / 1000) / \
                         ((end_time - start_time) / 1000) * 100
                     self.logger.info(f"[{self.current_step_percent}%] historical data fetched for {symbol} {time_frame}")
-                    await self.save_ohlcv(
-                        exchange=exchange,
-                        cryptocurrency=cryptocurrency,
-                        symbol=symbol.symbol_str, time_frame=time_frame, candle=hist_candles,
-                        timestamp=[candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] + time_frame_sec
-                                   for candle in hist_candles],
-                        multiple=True)
+                    # replace the resume candle and save fetched candles at once
+                    async with self.database.transaction():
+                        if should_replace_resume_candle:
+                            # the last saved candle might have been saved before being closed: replace it
+                            should_replace_resume_candle = False
+                            await self._delete_fetched_resume_candle(
+                                exchange, symbol, time_frame, time_frame_sec, resume_time, hist_candles
+                            )
+                        await self.save_ohlcv(
+                            exchange=exchange,
+                            cryptocurrency=cryptocurrency,
+                            symbol=symbol.symbol_str, time_frame=time_frame, candle=hist_candles,
+                            timestamp=[candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] + time_frame_sec
+                                       for candle in hist_candles],
+                            multiple=True)
         else:
             try:
                 candles = await self.exchange.get_symbol_prices(symbol_id, time_frame)
@@ -167,6 +213,26 @@ class ExchangeHistoryDataCollector(collector.AbstractExchangeHistoryCollector):
                 self.logger.exception(err, False)
                 self.logger.warning(f"Ignored {symbol} {time_frame} candles on {exchange} ({err})")
 
+    async def _get_ohlcv_resume_time(self, exchange, symbol, time_frame, time_frame_sec):
+        """
+        :return: the millisecond open time of the last saved candle of this symbol and time frame or None
+        when there is no saved candle
+        """
+        last_saved_timestamp = await self.get_last_saved_timestamp(
+            backtesting_enums.ExchangeDataTables.OHLCV, exchange, symbol.symbol_str, time_frame
+        )
+        if last_saved_timestamp is None:
+            return None
+        # saved timestamps are candles close time
+        return (last_saved_timestamp - time_frame_sec) * 1000
+
+    async def _delete_fetched_resume_candle(self, exchange, symbol, time_frame, time_frame_sec, resume_time, candles):
+        if candles[0][commons_enums.PriceIndexes.IND_PRICE_TIME.value] * 1000 == resume_time:
+            await self.database.delete(backtesting_enums.ExchangeDataTables.OHLCV,
+                                       exchange_name=exchange, symbol=symbol.symbol_str,
+                                       time_frame=time_frame.value,
+                                       timestamp=int(resume_time / 1000) + time_frame_sec)
+
     async def get_kline_history(self, exchange, symbol, time_frame):
         pass
 
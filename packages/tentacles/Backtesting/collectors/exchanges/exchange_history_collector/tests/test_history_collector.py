@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import mock
 import pytest
 import os
 import contextlib
@@ -25,6 +26,7 @@ import octobot_commons.enums as commons_enums
 import octobot_commons.constants as commons_constants
 import octobot_backtesting.enums as enums
 import octobot_backtesting.errors as errors
+import octobot_trading.api as trading_api
 import octobot_trading.enums as trading_enums
 import tests.test_utils.config as test_utils_config
 import tentacles.Backtesting.collectors.exchanges as collector_exchanges
@@ -35,17 +37,20 @@ pytestmark = pytest.mark.asyncio
 
 BINANCEUS = "binanceus"
 BINANCEUS_MAX_CANDLES_COUNT = 500
+HOUR = 3600
+START = 1699999200
 
 
 @contextlib.asynccontextmanager
 async def data_collector(exchange_name, tentacles_setup_config, symbols, time_frames, use_all_available_timeframes,
-                         start_timestamp=None, end_timestamp=None):
+                         start_timestamp=None, end_timestamp=None, data_file=None):
     collector_instance = collector_exchanges.ExchangeHistoryDataCollector(
         {}, exchange_name, trading_enums.ExchangeTypes.SPOT, tentacles_setup_config,
         [commons_symbols.parse_symbol(symbol) for symbol in symbols], time_frames,
         use_all_available_timeframes=use_all_available_timeframes,
         start_timestamp=start_timestamp,
-        end_timestamp=end_timestamp
+        end_timestamp=end_timestamp,
+        data_file=data_file
     )
     try:
         await collector_instance.initialize()
@@ -239,3 +244,109 @@ async def test_stop_collect():
         assert collector.exchange_manager is None
         assert not os.path.isfile(collector.temp_file_path)
         assert not os.path.isfile(collector.file_path)
+
+
+def _candles(first_hour, last_hour, close_offset=0):
+    return [
+        [START + hour * HOUR, hour, hour, hour, hour + close_offset, 10]
+        for hour in range(first_hour, last_hour + 1)
+    ]
+
+
+async def _save_candles(collector, symbol, time_frame, candles):
+    await collector.save_ohlcv(
+        exchange=collector.exchange_name, cryptocurrency=symbol.base, symbol=symbol.symbol_str,
+        time_frame=time_frame, candle=candles, timestamp=[candle[0] + HOUR for candle in candles], multiple=True
+    )
+
+
+async def test_run_jobs():
+    tentacles_setup_config = test_utils_config.load_test_tentacles_config()
+    async with data_collector(BINANCEUS, tentacles_setup_config, ["ETH/BTC"], None, True) as collector:
+        running_jobs = []
+        max_running_jobs = []
+
+        async def job():
+            running_jobs.append(None)
+            max_running_jobs.append(len(running_jobs))
+            await asyncio.sleep(0.01)
+            running_jobs.pop()
+
+        with mock.patch.object(collector, "MAX_CONCURRENT_JOBS", 2):
+            await collector._run_jobs(job() for _ in range(5))
+        assert len(max_running_jobs) == 5
+        assert max(max_running_jobs) == 2
+
+        async def failing_job():
+            raise ZeroDivisionError
+
+        with mock.patch.object(collector, "MAX_CONCURRENT_JOBS", 1), pytest.raises(ZeroDivisionError):
+            await collector._run_jobs(job() if index else failing_job() for index in range(5))
+        # pending jobs are cancelled
+        assert len(max_running_jobs) < 10
+        await collector.database.stop()
+
+
+async def test_resume_and_extend_data_file():
+    tentacles_setup_config = test_utils_config.load_test_tentacles_config()
+    symbol = commons_symbols.parse_symbol("ETH/BTC")
+    time_frame = commons_enums.TimeFrames.ONE_HOUR
+    async with data_collector(BINANCEUS, tentacles_setup_config, [str(symbol)], [time_frame], False,
+                              START * 1000, (START + 2 * HOUR) * 1000) as collector:
+        await collector._create_description()
+        await _save_candles(collector, symbol, time_frame, _candles(0, 2))
+        await collector.database.stop()
+        collector.finalize_database()
+
+        async with data_collector(BINANCEUS, tentacles_setup_config, [], None, True,
+                                  data_file=collector.file_name) as extending_collector:
+            # existing data file is kept until the collection succeeds
+            assert os.path.isfile(extending_collector.file_path)
+            assert os.path.isfile(extending_collector.temp_file_path)
+            assert extending_collector.symbols == [symbol]
+            assert extending_collector.time_frames == [time_frame]
+            assert extending_collector.use_all_available_timeframes is False
+            assert extending_collector.start_timestamp == START * 1000
+            extending_collector.exchange_manager = mock.Mock(
+                exchange=mock.Mock(get_pair_cryptocurrency=mock.Mock(return_value=symbol.base))
+            )
+            fetched_start_times = []
+
+            async def get_historical_ohlcv(exchange_manager, symbol_id, fetched_time_frame, start_time, end_time):
+                fetched_start_times.append(start_time)
+                # last saved candle was not closed when saved
+                yield _candles(2, 4, close_offset=1)
+
+            with mock.patch.object(trading_api, "get_historical_ohlcv", get_historical_ohlcv):
+                await extending_collector.get_ohlcv_history(BINANCEUS, symbol, time_frame)
+            # resumed from the last saved candle
+            assert fetched_start_times == [(START + 2 * HOUR) * 1000]
+            await extending_collector._create_description()
+            await extending_collector.database.stop()
+            extending_collector.finalize_database()
+            assert not os.path.isfile(extending_collector.temp_file_path)
+            async with collector_database(extending_collector) as database:
+                ohlcv = await database.select(enums.ExchangeDataTables.OHLCV, order_by="timestamp", sort=commons_enums.DataBaseOrderBy.ASC.value)
+                assert [json.loads(candle[-1]) for candle in ohlcv] == _candles(0, 1) + _candles(2, 4, close_offset=1)
+                descriptions = await database.select(enums.DataTables.DESCRIPTION)
+                assert len(descriptions) == 1
+                assert int(descriptions[0][6]) == START
+                assert int(descriptions[0][7]) > START
+
+
+async def test_data_file_from_another_exchange():
+    tentacles_setup_config = test_utils_config.load_test_tentacles_config()
+    async with data_collector(BINANCEUS, tentacles_setup_config, ["ETH/BTC"], [commons_enums.TimeFrames.ONE_HOUR],
+                              False) as collector:
+        await collector._create_description()
+        await collector.database.stop()
+        collector.finalize_database()
+        other_collector = collector_exchanges.ExchangeHistoryDataCollector(
+            {}, "binance", trading_enums.ExchangeTypes.SPOT, tentacles_setup_config, [], None,
+            use_all_available_timeframes=True, data_file=collector.file_name
+        )
+        try:
+            with pytest.raises(errors.DataCollectorError):
+                await other_collector.initialize()
+        finally:
+            await other_collector.database.stop()
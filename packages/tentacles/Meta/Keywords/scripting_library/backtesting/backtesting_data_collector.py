@@ -112,22 +112,6 @@ def get_backtesting_start_time(
     return time.time() - profile_data.backtesting_context.start_time_delta
 
 
-def iter_fetched_ohlcvs(ohlcvs: list[list[typing.Union[float, str]]]):
-    ohlcvs_by_symbol = {}
-    for ohlcv in ohlcvs:
-        time_frame = ohlcv[0]
-        symbol = ohlcv[1]
-        candles = ohlcv[2:]
-        if symbol not in ohlcvs_by_symbol:
-            ohlcvs_by_symbol[symbol] = {}
-        if time_frame not in ohlcvs_by_symbol[symbol]:
-            ohlcvs_by_symbol[symbol][time_frame] = []
-        ohlcvs_by_symbol[symbol][time_frame].append(candles)
-    for symbol, time_frames in ohlcvs_by_symbol.items():
-        for time_frame, ohlcvs in time_frames.items():
-            yield symbol, time_frame, ohlcvs
-
-
 async def populate_backtesting_exchange_data_from_historical_client(
     exchange_data: exchange_data_import.ExchangeData,
     profile_data: commons_profiles.ProfileData,
@@ -249,45 +233,36 @@ async def update_backtesting_symbols_data(
     # can adapt backtesting start and end time on custom strategies that require symbol prices at all time
     allow_any_backtesting_start_and_end_time = is_custom_strategy and requires_traded_symbol_prices_at_all_time
 
-    all_ohlcvs = await historical_client.fetch_extended_candles_history(
+    # fetch candles as arrays: avoids creating python objects for each candle
+    candle_arrays_by_symbol_and_time_frame = await historical_client.fetch_extended_candles_history_arrays(
         exchange_name, symbols, time_frames, start_time, end_time
     )
 
-    for symbol, str_time_frame, ohlcvs in iter_fetched_ohlcvs(all_ohlcvs):
-        time_frame = common_enums.TimeFrames(str_time_frame)
-        # do not take current incomplete candle into account
-        last_open_time = end_time - common_enums.TimeFramesMinutes[time_frame] * common_constants.MINUTE_TO_SECONDS
-        # When symbol in is first_traded_symbols, it should be available from the start
-        # EXCEPT for custom strategies that might require trading pairs that don't exist for long enough
-        # (when compatible with trading mode).
-        # Otherwise, when it is available doesn't really matter.
-        # If it's not available from the start, adapt start time to start as early as possible,
-        # latest being first_traded_symbols_time.
-        required_from_the_start = symbol in first_traded_symbols and (
-            requires_traded_symbol_prices_at_all_time or not is_custom_strategy
-        )
-        required_till_the_end = symbol in last_traded_symbols
-        updated_start_time = ensure_ohlcv_validity(
-            ohlcvs, exchange_name, symbol, time_frame, start_time, last_open_time,
-            required_from_the_start, required_till_the_end, first_traded_symbols_time,
-            allow_any_backtesting_start_and_end_time
-        )
-        if updated_start_time is not None:
-            updated_start_times.append(updated_start_time)
-        exchange_data.markets.append(exchange_data_import.MarketDetails(
-            symbol=symbol,
-            time_frame=time_frame.value,
-            close=[ohlcv[common_enums.PriceIndexes.IND_PRICE_CLOSE.value] for ohlcv in ohlcvs],
-            open=[ohlcv[common_enums.PriceIndexes.IND_PRICE_OPEN.value] for ohlcv in ohlcvs]
-            if not close_price_only else [],
-            high=[ohlcv[common_enums.PriceIndexes.IND_PRICE_HIGH.value] for ohlcv in ohlcvs]
-            if not close_price_only else [],
-            low=[ohlcv[common_enums.PriceIndexes.IND_PRICE_LOW.value] for ohlcv in ohlcvs]
-            if not close_price_only else [],
-            volume=[ohlcv[common_enums.PriceIndexes.IND_PRICE_VOL.value] for ohlcv in ohlcvs]
-            if not close_price_only else [],
-            time=[ohlcv[common_enums.PriceIndexes.IND_PRICE_TIME.value] for ohlcv in ohlcvs],
-        ))
+    for symbol, candle_arrays_by_time_frame in candle_arrays_by_symbol_and_time_frame.items():
+        for str_time_frame, candle_arrays in candle_arrays_by_time_frame.items():
+            time_frame = common_enums.TimeFrames(str_time_frame)
+            # do not take current incomplete candle into account
+            last_open_time = end_time - common_enums.TimeFramesMinutes[time_frame] * common_constants.MINUTE_TO_SECONDS
+            # When symbol in is first_traded_symbols, it should be available from the start
+            # EXCEPT for custom strategies that might require trading pairs that don't exist for long enough
+            # (when compatible with trading mode).
+            # Otherwise, when it is available doesn't really matter.
+            # If it's not available from the start, adapt start time to start as early as possible,
+            # latest being first_traded_symbols_time.
+            required_from_the_start = symbol in first_traded_symbols and (
+                requires_traded_symbol_prices_at_all_time or not is_custom_strategy
+            )
+            required_till_the_end = symbol in last_traded_symbols
+            updated_start_time = ensure_candle_arrays_validity(
+                candle_arrays, exchange_name, symbol, time_frame, start_time, last_open_time,
+                required_from_the_start, required_till_the_end, first_traded_symbols_time,
+                allow_any_backtesting_start_and_end_time
+            )
+            if updated_start_time is not None:
+                updated_start_times.append(updated_start_time)
+            exchange_data.markets.append(exchange_data_import.MarketDetails.from_candle_arrays(
+                symbol, time_frame.value, candle_arrays, close_price_only=close_price_only
+            ))
     updated_start_time = _ensure_start_time(
         exchange_data, start_time, updated_start_times
     )
@@ -309,18 +284,17 @@ def _ensure_start_time(
     return updated_start_time
 
 
-def ensure_ohlcv_validity(
-    ohlcvs: list, exchange: str, symbol: str, time_frame: common_enums.TimeFrames,
+def ensure_candle_arrays_validity(
+    candle_arrays: dict, exchange: str, symbol: str, time_frame: common_enums.TimeFrames,
     start_time: float, last_open_time: float, required_from_the_start: bool, required_till_the_end: bool,
     first_traded_symbols_time: float, allow_any_backtesting_start_and_end_time: bool
 ) -> typing.Optional[float]:
-    if not ohlcvs:
+    times = candle_arrays[common_enums.PriceIndexes.IND_PRICE_TIME.value]
+    if len(times) == 0:
         raise errors.InvalidBacktestingDataError(f"No {symbol} {time_frame.value} {exchange} OHLCV data")
     # ensure history is going approximately to start_time
-    first_candle_time = ohlcvs[0][common_enums.PriceIndexes.IND_PRICE_TIME.value]
-    last_candle_time = ohlcvs[-1][common_enums.PriceIndexes.IND_PRICE_TIME.value]
     return ensure_compatible_candle_time(
-        exchange, symbol, time_frame, start_time, last_open_time, first_candle_time, last_candle_time,
+        exchange, symbol, time_frame, start_time, last_open_time, float(times[0]), float(times[-1]),
         False, required_from_the_start, required_till_the_end, first_traded_symbols_time,
         allow_any_backtesting_start_and_end_time
     )
@@ -140,7 +140,7 @@ async def _init_backtest_data(
     await _init_importers(exchange_data, backtest_data)
     importer = next(iter(backtest_data.importers_by_data_file.values()))
     start_time, end_time = await importer.get_data_timestamp_interval()
-    await _init_preloaded_candle_managers(exchange_data, backtest_data, start_time, end_time)
+    await _init_preloaded_candle_managers(exchange_data, backtest_data, importer, start_time, end_time)
     return backtest_data
 
 
@@ -158,6 +158,7 @@ async def _init_importers(
 async def _init_preloaded_candle_managers(
     exchange_data: exchange_data_import.ExchangeData,
     backtest_data: octobot_backtesting.backtest_data.BacktestData,
+    importer: minimal_data_importer.MinimalDataImporter,
     start_time,
     end_time
 ):
@@ -169,6 +170,10 @@ async def _init_preloaded_candle_managers(
                 exchange_details.name, market_details.symbol, common_enums.TimeFrames(market_details.time_frame),
                 start_time, end_time
             )
-            backtest_data.preloaded_candle_managers[key] = await octobot_trading.api.create_preloaded_candles_manager(
-                market_details.get_formatted_candles()
-            )
+            # share the importer candle arrays: no need to convert candles again
+            backtest_data.preloaded_candle_managers[key] = \
+                await octobot_trading.api.create_preloaded_candles_manager_from_arrays(
+                    importer.get_candle_arrays(
+                        market_details.symbol, common_enums.TimeFrames(market_details.time_frame)
+                    )
+                )
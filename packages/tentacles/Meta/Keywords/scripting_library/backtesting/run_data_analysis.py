@@ -14,6 +14,9 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import json
+import os
+
+import numpy
 import sortedcontainers
 
 import octobot_trading.enums as trading_enums
@@ -32,6 +35,30 @@ import octobot_commons.time_frame_manager as time_frame_manager
 import octobot_commons.logging
 
 
+RUN_ANALYSIS_FILE_NAME = "run_analysis.npz"
+RUN_ANALYSIS_VERSION = 1
+RUN_ANALYSIS_VALUES_KEY = "values"
+RUN_ANALYSIS_VERSION_KEY = "version"
+RUN_ANALYSIS_SERIES_SEPARATOR = ":"
+PORTFOLIO_VALUE_SERIES = "portfolio_value"
+DRAWDOWN_SERIES = "drawdown"
+PNL_SERIES = "pnl"
+WINS_AND_LOSSES_SERIES = "wins_and_losses"
+WIN_RATES_SERIES = "win_rates"
+BEST_CASE_GROWTH_SERIES = "best_case_growth"
+START_PORTFOLIO_VALUE = "start_portfolio_value"
+END_PORTFOLIO_VALUE = "end_portfolio_value"
+PAID_FEES = "paid_fees"
+MAX_DRAWDOWN = "max_drawdown"
+WIN_RATE = "win_rate"
+PNL_TRANSACTION_TYPES = (
+    trading_enums.TransactionType.TRADING_FEE.value,
+    trading_enums.TransactionType.FUNDING_FEE.value,
+    trading_enums.TransactionType.REALISED_PNL.value,
+    trading_enums.TransactionType.CLOSE_REALISED_PNL.value,
+)
+
+
 def get_logger():
     return octobot_commons.logging.get_logger("BacktestingRunData")
 
@@ -72,6 +99,10 @@ async def get_transactions(meta_database, transaction_type=None, transaction_typ
 async def get_starting_portfolio(meta_database) -> dict:
     portfolio = (await meta_database.get_run_db().all(commons_enums.DBTables.METADATA.value))[0][
         commons_enums.BacktestingMetadata.START_PORTFOLIO.value]
+    return _parse_portfolio(portfolio)
+
+
+def _parse_portfolio(portfolio: str) -> dict:
     return json.loads(portfolio.replace("'", '"'))
 
 
@@ -223,11 +254,14 @@ def _evaluate_portfolio(portfolio, price_data, use_start_value):
     return value
 
 
-async def get_portfolio_values(meta_database, exchange=None, historical_values=None):
+async def get_portfolio_values(meta_database, exchange=None, historical_values=None, run_analysis=None):
+    if run_analysis is not None:
+        values = run_analysis[RUN_ANALYSIS_VALUES_KEY]
+        return values[START_PORTFOLIO_VALUE], values[END_PORTFOLIO_VALUE]
     price_data, trades_data, moving_portfolio_data, trading_type, metadata, _ = \
         historical_values or await load_historical_values(meta_database, exchange, with_portfolio=False, with_trades=False)
-    starting_portfolio = json.loads(metadata[commons_enums.BacktestingMetadata.START_PORTFOLIO.value].replace("'", '"'))
-    ending_portfolio = json.loads(metadata[commons_enums.BacktestingMetadata.END_PORTFOLIO.value].replace("'", '"'))
+    starting_portfolio = _parse_portfolio(metadata[commons_enums.BacktestingMetadata.START_PORTFOLIO.value])
+    ending_portfolio = _parse_portfolio(metadata[commons_enums.BacktestingMetadata.END_PORTFOLIO.value])
     return _evaluate_portfolio(
         starting_portfolio,
         price_data,
@@ -240,10 +274,31 @@ async def get_portfolio_values(meta_database, exchange=None, historical_values=N
 
 
 async def plot_historical_portfolio_value(
-    meta_database, plotted_element, exchange=None, own_yaxis=False, historical_values=None
+    meta_database, plotted_element, exchange=None, own_yaxis=False, historical_values=None, run_analysis=None
 ):
-    price_data, trades_data, moving_portfolio_data, trading_type, metadata, _ = \
-        historical_values or await load_historical_values(meta_database, exchange)
+    if run_analysis is None:
+        price_data, trades_data, moving_portfolio_data, trading_type, metadata, _ = \
+            historical_values or await load_historical_values(meta_database, exchange)
+        funding_fees_history_by_pair = await _get_grouped_funding_fees(meta_database,
+                                                                       commons_enums.DBRows.SYMBOL.value)
+        x_data, y_data = _get_historical_portfolio_value(
+            price_data, trades_data, moving_portfolio_data, trading_type, metadata, funding_fees_history_by_pair
+        )
+    else:
+        x_data, y_data = get_run_analysis_series(run_analysis, PORTFOLIO_VALUE_SERIES)
+    plotted_element.plot(
+        mode="scatter",
+        x=x_data,
+        y=y_data,
+        title="Portfolio value",
+        own_yaxis=own_yaxis
+    )
+
+
+def _get_historical_portfolio_value(price_data, trades_data, moving_portfolio_data, trading_type, metadata,
+                                    funding_fees_history_by_pair):
+    # the moving portfolio is updated with each trade: keep the given one as is
+    moving_portfolio_data = dict(moving_portfolio_data)
     price_data_by_time = {}
     for symbol, candles in price_data.items():
         price_data_by_time[symbol] = {
@@ -255,8 +310,6 @@ async def plot_historical_portfolio_value(
         pass
     for pair in trades_data:
         trades_data[pair] = sorted(trades_data[pair], key=lambda tr: tr[commons_enums.PlotAttributes.X.value])
-    funding_fees_history_by_pair = await _get_grouped_funding_fees(meta_database,
-                                                                   commons_enums.DBRows.SYMBOL.value)
     value_data = sortedcontainers.SortedDict()
     pairs = list(trades_data)
     if pairs:
@@ -348,13 +401,7 @@ async def plot_historical_portfolio_value(
                 if ref_market not in handled_currencies:
                     value_data[candle_time] = value_data[candle_time] + moving_portfolio_data[ref_market]
                     handled_currencies.append(ref_market)
-    plotted_element.plot(
-        mode="scatter",
-        x=list(value_data.keys()),
-        y=list(value_data.values()),
-        title="Portfolio value",
-        own_yaxis=own_yaxis
-    )
+    return list(value_data.keys()), list(value_data.values())
 
 
 def _read_pnl_from_trades(x_data, pnl_data, cumulative_pnl_data, trades_history, x_as_trade_count):
@@ -438,28 +485,17 @@ def _read_pnl_from_transactions(x_data, pnl_data, cumulative_pnl_data, trading_t
             x_data.append(transaction[commons_enums.PlotAttributes.X.value])
 
 
-async def _get_historical_pnl(meta_database, plotted_element, include_cumulative, include_unitary,
-                              exchange=None, x_as_trade_count=True, own_yaxis=False, historical_values=None):
+def _get_pnl_series(price_data, trades_data, trading_transactions_history, x_as_trade_count):
     # PNL:
     # 1. open position: consider position opening fee from PNL
     # 2. close position: consider closed amount + closing fee into PNL
     # what is a trade ?
     #   futures: when position going to 0 (from long/short) => trade is closed
     #   spot: when position lowered => trade is closed
-    price_data, trades_data, _, _, _, _ = historical_values or await load_historical_values(meta_database, exchange)
-    if not (price_data and next(iter(price_data.values()))):
-        return
     x_data = [0 if x_as_trade_count
               else next(iter(price_data.values()))[0][commons_enums.PriceIndexes.IND_PRICE_TIME.value]]
     pnl_data = [0]
     cumulative_pnl_data = [0]
-    trading_transactions_history = await get_transactions(
-        meta_database,
-        transaction_types=(trading_enums.TransactionType.TRADING_FEE.value,
-                           trading_enums.TransactionType.FUNDING_FEE.value,
-                           trading_enums.TransactionType.REALISED_PNL.value,
-                           trading_enums.TransactionType.CLOSE_REALISED_PNL.value)
-    )
     if trading_transactions_history:
         # can rely on pnl history
         _read_pnl_from_transactions(x_data, pnl_data, cumulative_pnl_data,
@@ -476,6 +512,33 @@ async def _get_historical_pnl(meta_database, plotted_element, include_cumulative
             x_data.append(last_time_value)
             pnl_data.append(0)
             cumulative_pnl_data.append(cumulative_pnl_data[-1])
+    return x_data, pnl_data, cumulative_pnl_data
+
+
+def _has_price_data(price_data):
+    return bool(price_data and next(iter(price_data.values())))
+
+
+async def _get_historical_pnl(meta_database, plotted_element, include_cumulative, include_unitary,
+                              exchange=None, x_as_trade_count=True, own_yaxis=False, historical_values=None,
+                              run_analysis=None):
+    if run_analysis is None:
+        price_data, trades_data, _, _, _, _ = \
+            historical_values or await load_historical_values(meta_database, exchange)
+        if not _has_price_data(price_data):
+            return
+        trading_transactions_history = await get_transactions(
+            meta_database,
+            transaction_types=PNL_TRANSACTION_TYPES
+        )
+        x_data, pnl_data, cumulative_pnl_data = _get_pnl_series(
+            price_data, trades_data, trading_transactions_history, x_as_trade_count
+        )
+    else:
+        pnl_series = get_run_analysis_series(run_analysis, _get_x_axis_series_name(PNL_SERIES, x_as_trade_count))
+        if pnl_series is None:
+            return
+        x_data, pnl_data, cumulative_pnl_data = pnl_series
 
     if include_unitary:
         plotted_element.plot(
@@ -532,10 +595,10 @@ async def total_paid_fees(meta_database, all_trades):
 
 async def plot_historical_pnl_value(meta_database, plotted_element, exchange=None, x_as_trade_count=True,
                                     own_yaxis=False, include_cumulative=True, include_unitary=True,
-                                    historical_values=None):
+                                    historical_values=None, run_analysis=None):
     return await _get_historical_pnl(meta_database, plotted_element, include_cumulative, include_unitary,
                                      exchange=exchange, x_as_trade_count=x_as_trade_count, own_yaxis=own_yaxis,
-                                     historical_values=historical_values)
+                                     historical_values=historical_values, run_analysis=run_analysis)
 
 
 def _plot_table_data(data, plotted_element, data_name, additional_key_to_label, additional_columns,
@@ -797,29 +860,38 @@ def _get_wins_and_losses_from_trades(x_data, wins_and_losses_data, trades_histor
     pass
 
 
-async def plot_historical_wins_and_losses(meta_database, plotted_element, exchange=None, x_as_trade_count=False,
-                                          own_yaxis=True, historical_values=None):
-    price_data, trades_data, _, _, _, _ = historical_values or await load_historical_values(meta_database, exchange)
-    if not (price_data and next(iter(price_data.values()))):
-        return
-    x_data = []
-    wins_and_losses_data = []
-    trading_transactions_history = await get_transactions(
-        meta_database,
-        transaction_types=(trading_enums.TransactionType.TRADING_FEE.value,
-                           trading_enums.TransactionType.FUNDING_FEE.value,
-                           trading_enums.TransactionType.REALISED_PNL.value,
-                           trading_enums.TransactionType.CLOSE_REALISED_PNL.value)
-    )
-    if trading_transactions_history:
-        # can rely on pnl history
-        _get_wins_and_losses_from_transactions(x_data, wins_and_losses_data,
-                                               trading_transactions_history, x_as_trade_count)
-    else:
+def _get_wins_and_losses_series(trading_transactions_history, x_as_trade_count):
+    if not trading_transactions_history:
         # recreate pnl history from trades
-        return  # todo not implemented yet
+        return None  # todo not implemented yet
         # _read_pnl_from_trades(x_data, pnl_data, cumulative_pnl_data, trades_data, x_as_trade_count)
+    x_data = []
+    wins_and_losses_data = []
+    # can rely on pnl history
+    _get_wins_and_losses_from_transactions(x_data, wins_and_losses_data,
+                                           trading_transactions_history, x_as_trade_count)
+    return x_data, wins_and_losses_data
+
 
+async def plot_historical_wins_and_losses(meta_database, plotted_element, exchange=None, x_as_trade_count=False,
+                                          own_yaxis=True, historical_values=None, run_analysis=None):
+    if run_analysis is None:
+        price_data, trades_data, _, _, _, _ = \
+            historical_values or await load_historical_values(meta_database, exchange)
+        if not _has_price_data(price_data):
+            return
+        trading_transactions_history = await get_transactions(
+            meta_database,
+            transaction_types=PNL_TRANSACTION_TYPES
+        )
+        wins_and_losses_series = _get_wins_and_losses_series(trading_transactions_history, x_as_trade_count)
+    else:
+        wins_and_losses_series = get_run_analysis_series(
+            run_analysis, _get_x_axis_series_name(WINS_AND_LOSSES_SERIES, x_as_trade_count)
+        )
+    if wins_and_losses_series is None:
+        return
+    x_data, wins_and_losses_data = wins_and_losses_series
     plotted_element.plot(
         mode="scatter",
         x=x_data,
@@ -855,29 +927,39 @@ def _get_win_rates_from_trades(x_data, win_rates_data, trades_history, x_as_trad
     pass
 
 
-async def plot_historical_win_rates(meta_database, plotted_element, exchange=None,
-                                    x_as_trade_count=False, own_yaxis=True, historical_values=None):
-    price_data, trades_data, _, _, _, _ = historical_values or await load_historical_values(meta_database, exchange)
-    if not (price_data and next(iter(price_data.values()))):
-        return
-    x_data = []
-    win_rates_data = []
-    trading_transactions_history = await get_transactions(
-        meta_database,
-        transaction_types=(trading_enums.TransactionType.TRADING_FEE.value,
-                           trading_enums.TransactionType.FUNDING_FEE.value,
-                           trading_enums.TransactionType.REALISED_PNL.value,
-                           trading_enums.TransactionType.CLOSE_REALISED_PNL.value)
-    )
-    if trading_transactions_history:
-        # can rely on pnl history
-        _get_win_rates_from_transactions(x_data, win_rates_data,
-                                         trading_transactions_history, x_as_trade_count)
-    else:
+def _get_win_rates_series(trading_transactions_history, x_as_trade_count):
+    if not trading_transactions_history:
         # recreate pnl history from trades
-        return  # todo not implemented yet
+        return None  # todo not implemented yet
         # _get_win_rates_from_trades(x_data, pnl_data, cumulative_pnl_data, trades_data, x_as_trade_count)
+    x_data = []
+    win_rates_data = []
+    # can rely on pnl history
+    _get_win_rates_from_transactions(x_data, win_rates_data,
+                                     trading_transactions_history, x_as_trade_count)
+    return x_data, win_rates_data
+
 
+async def plot_historical_win_rates(meta_database, plotted_element, exchange=None,
+                                    x_as_trade_count=False, own_yaxis=True, historical_values=None,
+                                    run_analysis=None):
+    if run_analysis is None:
+        price_data, trades_data, _, _, _, _ = \
+            historical_values or await load_historical_values(meta_database, exchange)
+        if not _has_price_data(price_data):
+            return
+        trading_transactions_history = await get_transactions(
+            meta_database,
+            transaction_types=PNL_TRANSACTION_TYPES
+        )
+        win_rates_series = _get_win_rates_series(trading_transactions_history, x_as_trade_count)
+    else:
+        win_rates_series = get_run_analysis_series(
+            run_analysis, _get_x_axis_series_name(WIN_RATES_SERIES, x_as_trade_count)
+        )
+    if win_rates_series is None:
+        return
+    x_data, win_rates_data = win_rates_series
     plotted_element.plot(
         mode="scatter",
         x=x_data,
@@ -902,25 +984,35 @@ async def _get_best_case_growth_from_transactions(trading_transactions_history,
     return [], []
 
 
-async def plot_best_case_growth(meta_database, plotted_element, exchange=None,
-                                x_as_trade_count=False, own_yaxis=False, historical_values=None):
-    price_data, trades_data, _, _, _, _ = historical_values or await load_historical_values(meta_database, exchange)
-    if not (price_data and next(iter(price_data.values()))):
-        return
-    x_data = []
-    best_case_data = []
-    trading_transactions_history = await get_transactions(
-        meta_database,
-        transaction_types=(trading_enums.TransactionType.TRADING_FEE.value,
-                           trading_enums.TransactionType.FUNDING_FEE.value,
-                           trading_enums.TransactionType.REALISED_PNL.value,
-                           trading_enums.TransactionType.CLOSE_REALISED_PNL.value)
-    )
+async def _get_best_case_growth_series(trading_transactions_history, x_as_trade_count, meta_database):
     if trading_transactions_history:
         # can rely on pnl history
-        x_data, best_case_data = await _get_best_case_growth_from_transactions(trading_transactions_history,
-                                                                               x_as_trade_count, meta_database)
+        return await _get_best_case_growth_from_transactions(trading_transactions_history,
+                                                             x_as_trade_count, meta_database)
+    return [], []
+
 
+async def plot_best_case_growth(meta_database, plotted_element, exchange=None,
+                                x_as_trade_count=False, own_yaxis=False, historical_values=None, run_analysis=None):
+    if run_analysis is None:
+        price_data, trades_data, _, _, _, _ = \
+            historical_values or await load_historical_values(meta_database, exchange)
+        if not _has_price_data(price_data):
+            return
+        trading_transactions_history = await get_transactions(
+            meta_database,
+            transaction_types=PNL_TRANSACTION_TYPES
+        )
+        x_data, best_case_data = await _get_best_case_growth_series(
+            trading_transactions_history, x_as_trade_count, meta_database
+        )
+    else:
+        best_case_series = get_run_analysis_series(
+            run_analysis, _get_x_axis_series_name(BEST_CASE_GROWTH_SERIES, x_as_trade_count)
+        )
+        if best_case_series is None:
+            return
+        x_data, best_case_data = best_case_series
     plotted_element.plot(
         mode="scatter",
         x=x_data,
@@ -929,3 +1021,163 @@ async def plot_best_case_growth(meta_database, plotted_element, exchange=None,
         title="best case growth",
         own_yaxis=own_yaxis,
         line_shape="hv")
+
+
+async def plot_historical_drawdown(meta_database, plotted_element, exchange=None, own_yaxis=True,
+                                   historical_values=None, run_analysis=None):
+    if run_analysis is None:
+        run_analysis = await compute_run_analysis(meta_database, exchange=exchange,
+                                                  historical_values=historical_values)
+    x_data, drawdown_data = get_run_analysis_series(run_analysis, DRAWDOWN_SERIES)
+    plotted_element.plot(
+        mode="scatter",
+        x=x_data,
+        y=drawdown_data,
+        title="Drawdown %",
+        own_yaxis=own_yaxis
+    )
+
+
+async def get_run_analysis(meta_database, exchange=None, historical_values=None) -> dict:
+    """
+    :return: the run analysis stored alongside the backtesting run databases.
+    It is computed and stored when missing or created by a previous analysis version.
+    """
+    file_path = _get_run_analysis_file_path(meta_database, exchange)
+    if file_path is not None and os.path.isfile(file_path):
+        try:
+            run_analysis = _load_run_analysis(file_path)
+            if run_analysis is not None:
+                return run_analysis
+        except (OSError, ValueError, KeyError) as err:
+            get_logger().warning(f"Ignored invalid run analysis file {file_path}: {err}")
+    run_analysis = await compute_run_analysis(meta_database, exchange=exchange, historical_values=historical_values)
+    if file_path is not None:
+        try:
+            _save_run_analysis(run_analysis, file_path)
+        except OSError as err:
+            get_logger().warning(f"Failed to save run analysis into {file_path}: {err}")
+    return run_analysis
+
+
+async def compute_run_analysis(meta_database, exchange=None, historical_values=None) -> dict:
+    """
+    Computes the series and values of a run displayed in backtesting reports
+    :return: numpy arrays tuples by series name and the run values dict under RUN_ANALYSIS_VALUES_KEY
+    """
+    price_data, trades_data, moving_portfolio_data, trading_type, metadata, run_global_metadata = \
+        historical_values or await load_historical_values(meta_database, exchange)
+    start_portfolio_value, end_portfolio_value = 0, 0
+    if metadata:
+        start_portfolio_value, end_portfolio_value = await get_portfolio_values(
+            meta_database,
+            historical_values=(price_data, trades_data, moving_portfolio_data, trading_type, metadata,
+                               run_global_metadata)
+        )
+    funding_fees_history_by_pair = await _get_grouped_funding_fees(meta_database, commons_enums.DBRows.SYMBOL.value)
+    portfolio_x_data, portfolio_value_data = _get_historical_portfolio_value(
+        price_data, trades_data, moving_portfolio_data, trading_type, metadata, funding_fees_history_by_pair
+    )
+    portfolio_values = numpy.array(portfolio_value_data, dtype=float)
+    drawdown_data = _get_drawdown(portfolio_values)
+    run_analysis = {
+        PORTFOLIO_VALUE_SERIES: _to_series(portfolio_x_data, portfolio_values),
+        DRAWDOWN_SERIES: _to_series(portfolio_x_data, drawdown_data),
+    }
+    win_rate = 0
+    if _has_price_data(price_data):
+        trading_transactions_history = await get_transactions(
+            meta_database,
+            transaction_types=PNL_TRANSACTION_TYPES
+        )
+        for x_as_trade_count in (True, False):
+            run_analysis[_get_x_axis_series_name(PNL_SERIES, x_as_trade_count)] = _to_series(
+                *_get_pnl_series(price_data, trades_data, trading_transactions_history, x_as_trade_count)
+            )
+            run_analysis[_get_x_axis_series_name(BEST_CASE_GROWTH_SERIES, x_as_trade_count)] = _to_series(
+                *await _get_best_case_growth_series(trading_transactions_history, x_as_trade_count, meta_database)
+            )
+            if trading_transactions_history:
+                run_analysis[_get_x_axis_series_name(WINS_AND_LOSSES_SERIES, x_as_trade_count)] = _to_series(
+                    *_get_wins_and_losses_series(trading_transactions_history, x_as_trade_count)
+                )
+                win_rates_series = _get_win_rates_series(trading_transactions_history, x_as_trade_count)
+                run_analysis[_get_x_axis_series_name(WIN_RATES_SERIES, x_as_trade_count)] = _to_series(
+                    *win_rates_series
+                )
+                win_rate = win_rates_series[1][-1] if win_rates_series[1] else win_rate
+    run_analysis[RUN_ANALYSIS_VALUES_KEY] = {
+        START_PORTFOLIO_VALUE: float(start_portfolio_value),
+        END_PORTFOLIO_VALUE: float(end_portfolio_value),
+        PAID_FEES: float(await total_paid_fees(
+            meta_database, [trade for trades in trades_data.values() for trade in trades]
+        )),
+        MAX_DRAWDOWN: float(drawdown_data.max()) if drawdown_data.size else 0,
+        WIN_RATE: float(win_rate),
+    }
+    return run_analysis
+
+
+def get_run_analysis_series(run_analysis, series_name):
+    """
+    :return: the lists of the given run analysis series or None when the series is not available
+    """
+    try:
+        return tuple(values.tolist() for values in run_analysis[series_name])
+    except KeyError:
+        return None
+
+
+def _get_x_axis_series_name(series_name, x_as_trade_count):
+    return f"{series_name}{RUN_ANALYSIS_SERIES_SEPARATOR}{'trade_count' if x_as_trade_count else 'time'}"
+
+
+def _to_series(*values):
+    return tuple(numpy.array(series_values, dtype=float) for series_values in values)
+
+
+def _get_drawdown(values):
+    # drawdown in % from the highest previous value
+    peaks = numpy.maximum.accumulate(values) if values.size else values
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        return numpy.where(peaks > 0, (peaks - values) / peaks * 100, 0)
+
+
+def _get_run_analysis_file_path(meta_database, exchange):
+    run_dbs_identifier = meta_database.run_dbs_identifier
+    if not (run_dbs_identifier.is_backtesting() and run_dbs_identifier.database_adaptor.is_file_system_based()):
+        return None
+    folder = run_dbs_identifier.get_exchange_based_identifier(exchange) if exchange \
+        else run_dbs_identifier.get_backtesting_run_folder()
+    return os.path.join(folder, RUN_ANALYSIS_FILE_NAME)
+
+
+def _save_run_analysis(run_analysis, file_path):
+    arrays = {
+        f"{series_name}{RUN_ANALYSIS_SERIES_SEPARATOR}{index}": values
+        for series_name, series in run_analysis.items()
+        if series_name != RUN_ANALYSIS_VALUES_KEY
+        for index, values in enumerate(series)
+    }
+    arrays[RUN_ANALYSIS_VALUES_KEY] = numpy.array(json.dumps(run_analysis[RUN_ANALYSIS_VALUES_KEY]))
+    arrays[RUN_ANALYSIS_VERSION_KEY] = numpy.array(RUN_ANALYSIS_VERSION)
+    with open(file_path, "wb") as run_analysis_file:
+        numpy.savez(run_analysis_file, **arrays)
+
+
+def _load_run_analysis(file_path):
+    with numpy.load(file_path) as stored_run_analysis:
+        if int(stored_run_analysis[RUN_ANALYSIS_VERSION_KEY]) != RUN_ANALYSIS_VERSION:
+            return None
+        values_by_index_by_series = {}
+        for key in stored_run_analysis.files:
+            if key in (RUN_ANALYSIS_VALUES_KEY, RUN_ANALYSIS_VERSION_KEY):
+                continue
+            series_name, index = key.rsplit(RUN_ANALYSIS_SERIES_SEPARATOR, 1)
+            values_by_index_by_series.setdefault(series_name, {})[int(index)] = stored_run_analysis[key]
+        run_analysis = {
+            series_name: tuple(values_by_index[index] for index in sorted(values_by_index))
+            for series_name, values_by_index in values_by_index_by_series.items()
+        }
+        run_analysis[RUN_ANALYSIS_VALUES_KEY] = json.loads(str(stored_run_analysis[RUN_ANALYSIS_VALUES_KEY]))
+    return run_analysis
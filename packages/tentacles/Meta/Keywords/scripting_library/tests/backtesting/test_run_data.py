@@ -83,6 +83,62 @@ async def test_total_paid_fees(default_trades_data):
         get_transactions_mock.assert_called_once()
 
 
+async def test_get_run_analysis(default_price_data, default_trades_data, default_portfolio_data,
+                                default_portfolio_historical_value, default_funding_fees_data,
+                                default_spot_metadata, tmp_path):
+    metadata = {
+        **default_spot_metadata,
+        commons_enums.BacktestingMetadata.START_PORTFOLIO.value: "{'USDT': {'total': 1000}}",
+        commons_enums.BacktestingMetadata.END_PORTFOLIO.value: "{'USDT': {'total': 1008}}",
+    }
+    meta_database = mock.Mock(run_dbs_identifier=mock.Mock(
+        is_backtesting=mock.Mock(return_value=True),
+        get_exchange_based_identifier=mock.Mock(return_value=str(tmp_path)),
+    ))
+    with mock.patch.object(run_data_analysis, "load_historical_values",
+                           mock.AsyncMock(return_value=(default_price_data, default_trades_data,
+                                                        default_portfolio_data, "spot", metadata, metadata))) \
+            as load_historical_values_mock, \
+         mock.patch.object(run_data_analysis, "get_transactions",
+                           mock.AsyncMock(return_value=default_funding_fees_data)):
+        run_analysis = await run_data_analysis.get_run_analysis(meta_database, exchange="exchange")
+        load_historical_values_mock.assert_called_once_with(meta_database, "exchange")
+        # moving portfolio is not updated
+        assert default_portfolio_data == {'BTC': 0.0, 'USDT': 1000.0}
+        assert (tmp_path / run_data_analysis.RUN_ANALYSIS_FILE_NAME).is_file()
+
+        # stored analysis is used
+        stored_run_analysis = await run_data_analysis.get_run_analysis(meta_database, exchange="exchange")
+        load_historical_values_mock.assert_called_once()
+
+    assert run_analysis[run_data_analysis.RUN_ANALYSIS_VALUES_KEY] == \
+        stored_run_analysis[run_data_analysis.RUN_ANALYSIS_VALUES_KEY]
+    values = stored_run_analysis[run_data_analysis.RUN_ANALYSIS_VALUES_KEY]
+    assert values[run_data_analysis.START_PORTFOLIO_VALUE] == 1000
+    assert values[run_data_analysis.END_PORTFOLIO_VALUE] == 1008
+    max_value = max(default_portfolio_historical_value)
+    assert round(values[run_data_analysis.MAX_DRAWDOWN], 10) == \
+        round((max_value - min(default_portfolio_historical_value[
+            default_portfolio_historical_value.index(max_value):
+        ])) / max_value * 100, 10)
+    assert sorted(stored_run_analysis) == sorted(run_analysis)
+    for series_name in (run_data_analysis.PORTFOLIO_VALUE_SERIES, run_data_analysis.DRAWDOWN_SERIES,
+                        run_data_analysis._get_x_axis_series_name(run_data_analysis.PNL_SERIES, True)):
+        assert run_data_analysis.get_run_analysis_series(stored_run_analysis, series_name) == \
+            run_data_analysis.get_run_analysis_series(run_analysis, series_name)
+
+    plotted_element = mock.Mock()
+    await run_data_analysis.plot_historical_portfolio_value(meta_database, plotted_element, own_yaxis=True,
+                                                            run_analysis=stored_run_analysis)
+    plotted_element.plot.assert_called_once_with(
+        mode="scatter",
+        x=[candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] for candle in default_price_data["BTC/USDT"]],
+        y=default_portfolio_historical_value,
+        title="Portfolio value",
+        own_yaxis=True
+    )
+
+
 async def _test_historical_portfolio_values(price_data, trades_data, portfolio_data, funding_fees_data,
                                             expected_time_data, expected_value_data, exchange_type,
                                             spot_metadata):
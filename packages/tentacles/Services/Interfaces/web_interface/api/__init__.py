@@ -26,6 +26,7 @@ import tentacles.Services.Interfaces.web_interface.api.bots
 import tentacles.Services.Interfaces.web_interface.api.webhook
 import tentacles.Services.Interfaces.web_interface.api.tentacles_packages
 import tentacles.Services.Interfaces.web_interface.api.dsl
+import tentacles.Services.Interfaces.web_interface.api.channels_metrics
 
 from tentacles.Services.Interfaces.web_interface.api.webhook import (
     has_webhook,
@@ -55,6 +56,7 @@ def register(distribution: octobot.enums.OctoBotDistribution):
     tentacles.Services.Interfaces.web_interface.api.trading.register(blueprint)
     tentacles.Services.Interfaces.web_interface.api.user_commands.register(blueprint)
     tentacles.Services.Interfaces.web_interface.api.dsl.register(blueprint)
+    tentacles.Services.Interfaces.web_interface.api.channels_metrics.register(blueprint)
     return blueprint
 
 
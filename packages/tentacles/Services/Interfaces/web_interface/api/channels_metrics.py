@@ -0,0 +1,57 @@
+#  Drakkar-Software OctoBot-Interfaces
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import flask
+
+import async_channel.metrics as channel_metrics
+import octobot_services.interfaces.util as interfaces_util
+import tentacles.Services.Interfaces.web_interface.login as login
+import tentacles.Services.Interfaces.web_interface.util as util
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+async def _update_channels_metrics(enabled, reset):
+    channel_metrics.enable(enabled)
+    if reset:
+        channel_metrics.reset()
+
+
+def register(blueprint):
+    @blueprint.route("/channels_metrics", methods=['GET', 'POST'])
+    @login.login_required_when_activated
+    def channels_metrics():
+        if flask.request.method == "POST":
+            # consumers metrics are updated from the bot loop: replace them from this loop
+            request_data = flask.request.get_json()
+            interfaces_util.run_in_bot_main_loop(
+                _update_channels_metrics(
+                    request_data.get("enabled", channel_metrics.is_enabled()),
+                    request_data.get("reset", False)
+                )
+            )
+        return flask.jsonify({
+            "enabled": channel_metrics.is_enabled(),
+            "metrics": channel_metrics.get_metrics(),
+        })
+
+
+    @blueprint.route("/channels_metrics/prometheus", methods=['GET'])
+    @login.login_required_when_activated
+    def prometheus_channels_metrics():
+        return util.get_rest_reply(
+            channel_metrics.get_prometheus_metrics(),
+            content_type=PROMETHEUS_CONTENT_TYPE
+        )
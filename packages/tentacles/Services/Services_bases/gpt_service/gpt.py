@@ -37,6 +37,7 @@ import octobot_services.errors as errors
 import octobot_services.enums as enums
 import octobot_services.interfaces.util as interfaces_util
 
+import octobot_commons.constants as commons_constants
 import octobot_commons.enums as commons_enums
 import octobot_commons.logging as commons_logging
 import octobot_commons.time_frame_manager as time_frame_manager
@@ -49,6 +50,7 @@ import octobot.community as community
 
 from tentacles.Services.Services_bases.gpt_service import provider_adapters
 from tentacles.Services.Services_bases.gpt_service import rpm_limiter as rpm_limiter_module
+from tentacles.Services.Services_bases.gpt_service import response_cache as response_cache_module
 
 
 NO_SYSTEM_PROMPT_MODELS = [
@@ -191,6 +193,17 @@ class LLMService(services.AbstractAIService):
         self.ai_provider = enums.AIProvider.OPENAI
         self._tool_call_json_output: bool = True
         self._rpm_limiter: typing.Optional[rpm_limiter_module.RPMLimiter] = None
+        self._response_cache: response_cache_module.LLMResponseCache = response_cache_module.LLMResponseCache(
+            float(os.getenv(services_constants.ENV_LLM_RESPONSE_CACHE_TTL, 0)),
+            int(os.getenv(
+                services_constants.ENV_LLM_RESPONSE_CACHE_MAX_ENTRIES,
+                services_constants.DEFAULT_LLM_RESPONSE_CACHE_MAX_ENTRIES
+            )),
+            file_path=os.path.join(
+                commons_constants.USER_FOLDER, commons_constants.DATA_FOLDER,
+                services_constants.LLM_RESPONSE_CACHE_FILE
+            ),
+        )
 
         if self._env_secret_key is None and self._env_base_url is None:
             result = provider_adapters.auto_configure(self.DEFAULT_MODEL, bool(env_model))
@@ -919,7 +932,6 @@ class LLMService(services.AbstractAIService):
         
         return message_content
 
-    @services.AbstractAIService.retry_llm_completion()
     async def get_completion(
         self,
         messages,
@@ -970,7 +982,55 @@ class LLMService(services.AbstractAIService):
                   - "tool_calls": list of tool call dicts with id, type, function keys
             dict: {"content": str, "reasoning": str} when show_reasoning=True and reasoning available
             None: On error
+
+        When LLM_RESPONSE_CACHE_TTL is set, identical requests share the same in-flight provider call and
+        reuse the stored response of the previous identical request. Without it, only identical requests
+        with a 0 temperature share the same in-flight provider call.
         """
+        model = model or self.model
+        return await self._response_cache.get_or_fetch(
+            self._response_cache.get_key(
+                model,
+                messages,
+                tools,
+                {
+                    "max_tokens": max_tokens,
+                    "n": n,
+                    "stop": stop,
+                    "temperature": temperature,
+                    "json_output": json_output,
+                    "response_schema": response_schema,
+                    "reasoning_effort": reasoning_effort,
+                    "show_reasoning": show_reasoning,
+                    "tool_choice": tool_choice,
+                    "use_octobot_mcp": use_octobot_mcp,
+                },
+            ),
+            lambda: self._get_provider_completion(
+                messages, model, max_tokens, n, stop, temperature, json_output, response_schema,
+                reasoning_effort, show_reasoning, tools, tool_choice, use_octobot_mcp,
+            ),
+            # sampled completions of identical requests are expected to differ
+            coalesce=temperature == 0,
+        )
+
+    @services.AbstractAIService.retry_llm_completion()
+    async def _get_provider_completion(
+        self,
+        messages,
+        model,
+        max_tokens,
+        n,
+        stop,
+        temperature,
+        json_output,
+        response_schema,
+        reasoning_effort: typing.Optional[str],
+        show_reasoning: typing.Optional[bool],
+        tools: typing.Optional[list],
+        tool_choice: typing.Optional[typing.Union[str, dict]],
+        use_octobot_mcp: typing.Optional[bool],
+    ) -> typing.Union[str, dict, None]:
         self._ensure_rate_limit()
         try:
             model = model or self.model
@@ -1743,6 +1803,7 @@ class LLMService(services.AbstractAIService):
         return not self.config
 
     async def stop(self):
+        self._response_cache.save()
         # Clean up cached OpenAI client
         if self._client is not None:
             try:
@@ -0,0 +1,191 @@
+#  Drakkar-Software OctoBot-Tentacles
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import collections
+import copy
+import hashlib
+import json
+import os
+import time
+import typing
+
+import octobot_commons.json_util as json_util
+import octobot_commons.logging as commons_logging
+
+_logger = commons_logging.get_logger("LLMResponseCache")
+SAVE_EVERY_NEW_ENTRIES = 20
+_TIMESTAMP_INDEX = 0
+_RESPONSE_INDEX = 1
+
+
+class _CancelledInFlightRequestError(Exception):
+    """
+    Raised to the identical requests waiting for an in-flight request that has been cancelled
+    """
+
+
+class LLMResponseCache:
+    """
+    Content-addressed cache of LLM responses. Async-safe.
+    Identical concurrent requests share the same in-flight provider call.
+    When ttl is 0, responses are not stored and in-flight calls are only shared when requested.
+    """
+
+    def __init__(self, ttl: float, max_entries: int, file_path: typing.Optional[str] = None):
+        if ttl < 0:
+            raise ValueError(f"ttl must be >= 0, got {ttl}")
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be > 0, got {max_entries}")
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._file_path = file_path
+        # (timestamp, response) by key, from least to most recently used
+        self._entries: collections.OrderedDict[str, tuple[float, typing.Any]] = collections.OrderedDict()
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._loaded = False
+        self._unsaved_entries = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    @staticmethod
+    def get_key(model: str, messages: list, tools: typing.Optional[list], params: dict) -> str:
+        """
+        :return: the key of the request, identical for requests only differing by messages surrounding whitespaces
+        """
+        content = json.dumps(
+            {
+                "model": model,
+                "messages": [_normalized_message(message) for message in messages],
+                "tools": tools,
+                "params": params,
+            },
+            sort_keys=True,
+            default=_to_serializable,
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    async def get_or_fetch(
+        self, key: str, fetch: typing.Callable[[], typing.Awaitable], coalesce: bool = False
+    ) -> typing.Any:
+        """
+        :param coalesce: when True, identical requests share the same in-flight provider call even when
+        responses are not stored. Should only be used for deterministic requests.
+        :return: a copy of the cached response of key when fresh, of the response of the identical in-flight
+        request or the response of fetch() otherwise. None responses are not cached.
+        """
+        if not (self.enabled or coalesce):
+            return await fetch()
+        if self.enabled:
+            self._ensure_loaded()
+            try:
+                return copy.deepcopy(self._get_fresh_response(key))
+            except KeyError:
+                pass
+        while (in_flight := self._in_flight.get(key)) is not None:
+            try:
+                return copy.deepcopy(await asyncio.shield(in_flight))
+            except _CancelledInFlightRequestError:
+                # the in-flight request has been cancelled: the first waiting request fetches instead
+                pass
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await fetch()
+        except asyncio.CancelledError:
+            # don't cancel waiting identical requests: they will retry
+            future.set_exception(_CancelledInFlightRequestError())
+            future.exception()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            # the exception is forwarded to the waiting identical requests, if any
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            if response is not None and self.enabled:
+                self._store(key, copy.deepcopy(response))
+            return response
+        finally:
+            self._in_flight.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._unsaved_entries = 0
+
+    def save(self) -> None:
+        """
+        Writes the stored responses to the cache file, if any
+        """
+        if self._file_path is None or not self._unsaved_entries:
+            return
+        try:
+            if directory := os.path.dirname(self._file_path):
+                os.makedirs(directory, exist_ok=True)
+            json_util.safe_dump(
+                {key: list(entry) for key, entry in self._entries.items()},
+                self._file_path
+            )
+            self._unsaved_entries = 0
+        except Exception as err:
+            _logger.exception(err, True, f"Error when saving LLM responses cache: {err}")
+
+    def _get_fresh_response(self, key: str) -> typing.Any:
+        timestamp, response = self._entries[key]
+        if time.time() - timestamp > self._ttl:
+            self._entries.pop(key)
+            raise KeyError(key)
+        self._entries.move_to_end(key)
+        return response
+
+    def _store(self, key: str, response: typing.Any) -> None:
+        self._entries[key] = (time.time(), response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        self._unsaved_entries += 1
+        if self._unsaved_entries >= SAVE_EVERY_NEW_ENTRIES:
+            self.save()
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self._file_path is None or not os.path.isfile(self._file_path):
+            return
+        content = json_util.read_file(self._file_path, raise_errors=False, on_error_value={})
+        min_timestamp = time.time() - self._ttl
+        # oldest entries first to keep the least recently used order
+        for key, entry in sorted(content.items(), key=lambda item: item[1][_TIMESTAMP_INDEX]):
+            if entry[_TIMESTAMP_INDEX] >= min_timestamp:
+                self._entries[key] = (entry[_TIMESTAMP_INDEX], entry[_RESPONSE_INDEX])
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+def _normalized_message(message: typing.Any) -> typing.Any:
+    if isinstance(message, dict) and isinstance(message.get("content"), str):
+        return {**message, "content": message["content"].strip()}
+    return message
+
+
+def _to_serializable(value: typing.Any) -> typing.Any:
+    # pydantic models are identified by their json schema
+    if hasattr(value, "model_json_schema"):
+        return value.model_json_schema()
+    return str(value)
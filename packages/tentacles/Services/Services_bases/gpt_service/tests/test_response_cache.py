@@ -0,0 +1,238 @@
+#  Drakkar-Software OctoBot-Tentacles
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import os
+
+import pytest
+
+try:
+    import tentacles.Services.Services_bases.gpt_service.response_cache as response_cache
+except ImportError:
+    import response_cache
+
+
+class _FakeProvider:
+    """Answers prompts after an optional delay, counting calls."""
+    def __init__(self, delay: float = 0, error: Exception = None):
+        self.delay = delay
+        self.error = error
+        self.calls: list[str] = []
+
+    async def complete(self, prompt: str):
+        self.calls.append(prompt)
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return f"answer to {prompt}"
+
+
+class _FakeClock:
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_clock(monkeypatch) -> _FakeClock:
+    clock = _FakeClock()
+    monkeypatch.setattr(response_cache.time, "time", clock.time)
+    return clock
+
+
+def _key(prompt: str, **params) -> str:
+    return response_cache.LLMResponseCache.get_key("model", [{"role": "user", "content": prompt}], None, params)
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        response_cache.LLMResponseCache(-1, 10)
+    with pytest.raises(ValueError):
+        response_cache.LLMResponseCache(10, 0)
+
+
+def test_get_key():
+    assert _key("hello") == _key(" hello\n")
+    assert _key("hello") != _key("hello there")
+    assert _key("hello", temperature=0.5) == _key("hello", temperature=0.5)
+    assert _key("hello", temperature=0.5) != _key("hello", temperature=0)
+    assert response_cache.LLMResponseCache.get_key("model", [], None, {}) != \
+        response_cache.LLMResponseCache.get_key("other_model", [], None, {})
+    assert response_cache.LLMResponseCache.get_key("model", [], None, {}) != \
+        response_cache.LLMResponseCache.get_key("model", [], [{"type": "function"}], {})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_call():
+    provider = _FakeProvider(delay=0.01)
+    cache = response_cache.LLMResponseCache(0, 10)
+    responses = await asyncio.gather(
+        cache.get_or_fetch(_key("a"), lambda: provider.complete("a"), coalesce=True),
+        cache.get_or_fetch(_key("a"), lambda: provider.complete("a"), coalesce=True),
+        cache.get_or_fetch(_key("b"), lambda: provider.complete("b"), coalesce=True),
+    )
+    assert responses == ["answer to a", "answer to a", "answer to b"]
+    assert provider.calls == ["a", "b"]
+    # disabled cache: responses are not stored
+    assert await cache.get_or_fetch(_key("a"), lambda: provider.complete("a"), coalesce=True) == "answer to a"
+    assert provider.calls == ["a", "b", "a"]
+
+    # disabled cache without coalesce: identical requests are not shared
+    await asyncio.gather(
+        cache.get_or_fetch(_key("a"), lambda: provider.complete("a")),
+        cache.get_or_fetch(_key("a"), lambda: provider.complete("a")),
+    )
+    assert provider.calls == ["a", "b", "a", "a", "a"]
+
+    # enabled cache: identical requests are shared
+    cache = response_cache.LLMResponseCache(60, 10)
+    await asyncio.gather(
+        cache.get_or_fetch(_key("c"), lambda: provider.complete("c")),
+        cache.get_or_fetch(_key("c"), lambda: provider.complete("c")),
+    )
+    assert provider.calls == ["a", "b", "a", "a", "a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_in_flight_request():
+    provider = _FakeProvider(delay=0.01)
+    cache = response_cache.LLMResponseCache(60, 10)
+    leader = asyncio.create_task(cache.get_or_fetch(_key("a"), lambda: provider.complete("a")))
+    await asyncio.sleep(0)
+    followers = [
+        asyncio.create_task(cache.get_or_fetch(_key("a"), lambda: provider.complete("a")))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    leader.cancel()
+    # waiting requests are not cancelled: the first one fetches the response for the other one
+    assert await asyncio.gather(*followers) == ["answer to a", "answer to a"]
+    assert leader.cancelled()
+    assert provider.calls == ["a", "a"]
+
+
+@pytest.mark.asyncio
+async def test_responses_are_copies():
+    async def _fetch():
+        await asyncio.sleep(0.01)
+        return {"content": "answer"}
+
+    cache = response_cache.LLMResponseCache(60, 10)
+    responses = await asyncio.gather(
+        cache.get_or_fetch(_key("a"), _fetch),
+        cache.get_or_fetch(_key("a"), _fetch),
+    )
+    assert responses == [{"content": "answer"}, {"content": "answer"}]
+    assert responses[0] is not responses[1]
+    responses[0]["content"] = "updated"
+    responses[1]["content"] = "updated"
+    assert await cache.get_or_fetch(_key("a"), _fetch) == {"content": "answer"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_error():
+    provider = _FakeProvider(delay=0.01, error=ValueError("provider error"))
+    cache = response_cache.LLMResponseCache(60, 10)
+    responses = await asyncio.gather(
+        cache.get_or_fetch(_key("a"), lambda: provider.complete("a")),
+        cache.get_or_fetch(_key("a"), lambda: provider.complete("a")),
+        return_exceptions=True
+    )
+    assert [str(response) for response in responses] == ["provider error", "provider error"]
+    assert provider.calls == ["a"]
+    # errors are not cached
+    provider.error = None
+    assert await cache.get_or_fetch(_key("a"), lambda: provider.complete("a")) == "answer to a"
+    assert provider.calls == ["a", "a"]
+
+
+@pytest.mark.asyncio
+async def test_ttl(fake_clock):
+    provider = _FakeProvider()
+    cache = response_cache.LLMResponseCache(60, 10)
+    assert await cache.get_or_fetch(_key("a"), lambda: provider.complete("a")) == "answer to a"
+    fake_clock.now += 60
+    assert await cache.get_or_fetch(_key("a"), lambda: provider.complete("a")) == "answer to a"
+    assert provider.calls == ["a"]
+    fake_clock.now += 1
+    assert await cache.get_or_fetch(_key("a"), lambda: provider.complete("a")) == "answer to a"
+    assert provider.calls == ["a", "a"]
+
+
+@pytest.mark.asyncio
+async def test_none_responses_are_not_cached():
+    calls = []
+
+    async def _fetch():
+        calls.append(1)
+        return None
+
+    cache = response_cache.LLMResponseCache(60, 10)
+    assert await cache.get_or_fetch(_key("a"), _fetch) is None
+    assert await cache.get_or_fetch(_key("a"), _fetch) is None
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_max_entries_evicts_least_recently_used():
+    provider = _FakeProvider()
+    cache = response_cache.LLMResponseCache(60, 2)
+    for prompt in ("a", "b", "a", "c"):
+        await cache.get_or_fetch(_key(prompt), lambda: provider.complete(prompt))
+    # "b" is the least recently used when adding "c"
+    assert provider.calls == ["a", "b", "c"]
+    await cache.get_or_fetch(_key("b"), lambda: provider.complete("b"))
+    await cache.get_or_fetch(_key("c"), lambda: provider.complete("c"))
+    assert provider.calls == ["a", "b", "c", "b"]
+
+
+@pytest.mark.asyncio
+async def test_save_and_load(tmp_path, fake_clock):
+    file_path = os.path.join(tmp_path, "data", "cache.json")
+    provider = _FakeProvider()
+    cache = response_cache.LLMResponseCache(60, 10, file_path=file_path)
+    await cache.get_or_fetch(_key("a"), lambda: provider.complete("a"))
+    fake_clock.now += 30
+    await cache.get_or_fetch(_key("b"), lambda: provider.complete("b"))
+    assert not os.path.isfile(file_path)
+    cache.save()
+    assert os.path.isfile(file_path)
+
+    # previous responses are reused from another cache
+    other_cache = response_cache.LLMResponseCache(60, 10, file_path=file_path)
+    assert await other_cache.get_or_fetch(_key("a"), lambda: provider.complete("a")) == "answer to a"
+    assert await other_cache.get_or_fetch(_key("b"), lambda: provider.complete("b")) == "answer to b"
+    assert provider.calls == ["a", "b"]
+
+    # expired responses are not loaded
+    fake_clock.now += 31
+    other_cache = response_cache.LLMResponseCache(60, 10, file_path=file_path)
+    assert await other_cache.get_or_fetch(_key("a"), lambda: provider.complete("a")) == "answer to a"
+    assert await other_cache.get_or_fetch(_key("b"), lambda: provider.complete("b")) == "answer to b"
+    assert provider.calls == ["a", "b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_save_every_new_entries(tmp_path):
+    file_path = os.path.join(tmp_path, "cache.json")
+    provider = _FakeProvider()
+    cache = response_cache.LLMResponseCache(60, 100, file_path=file_path)
+    for index in range(response_cache.SAVE_EVERY_NEW_ENTRIES - 1):
+        await cache.get_or_fetch(_key(str(index)), lambda: provider.complete(str(index)))
+    assert not os.path.isfile(file_path)
+    await cache.get_or_fetch(_key("last"), lambda: provider.complete("last"))
+    assert os.path.isfile(file_path)
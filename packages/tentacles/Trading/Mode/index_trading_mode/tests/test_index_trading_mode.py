@@ -3061,7 +3061,7 @@ async def test_get_buy_symbols_and_amounts(trading_tools):
                 {}, decimal.Decimal(0.01),
                 coins_to_buy=["BTC", "ETH"],
             )
-        assert get_up_to_date_price_mock.call_count == 1
+        assert get_up_to_date_price_mock.call_count == 2  # all prices are fetched before checking amounts
 
     # with ref market in coins config
     mode.trading_config = {
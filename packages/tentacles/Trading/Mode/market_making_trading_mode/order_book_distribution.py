@@ -19,6 +19,8 @@ import decimal
 import typing
 import random
 
+import numpy
+
 import octobot_commons.logging as commons_logging
 import octobot_trading.constants as trading_constants
 import octobot_trading.enums as trading_enums
@@ -33,6 +35,7 @@ TARGET_CUMULATED_VOLUME_PERCENT: decimal.Decimal = decimal.Decimal(3)
 DAILY_TRADING_VOLUME_PERCENT: decimal.Decimal = decimal.Decimal(2)
 MAX_HANDLED_BIDS_ORDERS = 5
 MAX_HANDLED_ASKS_ORDERS = 5
+VECTORIZED_MIN_ORDERS_COUNT = 20
 
 INCREASING = "increasing_towards_current_price"
 DECREASING = "decreasing_towards_current_price"
@@ -40,6 +43,8 @@ RANDOM = "random"
 
 # allow up to 10 decimals to avoid floating point precision issues due to percent ratios
 _MAX_PRECISION = decimal.Decimal("1.0000000000")
+_MAX_DIGITS = 10
+MOVING_WINDOW_PRICE_RATIO = decimal.Decimal("1.5")
 
 @dataclasses.dataclass
 class InferredOrderData:
@@ -91,11 +96,15 @@ class OrderBookDistribution:
         asks_count: int,
         min_spread: decimal.Decimal,
         max_spread: decimal.Decimal,
+        vectorized: bool = True,
     ):
         self.min_spread: decimal.Decimal = min_spread
         self.max_spread: decimal.Decimal = max_spread
         self.bids_count: int = bids_count
         self.asks_count: int = asks_count
+        # when True, compute prices, volumes and shape distances of all orders at once using float arrays
+        # and only convert final values into decimal.Decimal when handling at least VECTORIZED_MIN_ORDERS_COUNT orders
+        self.vectorized: bool = vectorized
 
         self.bids: list[BookOrderData] = []
         self.asks: list[BookOrderData] = []
@@ -270,6 +279,10 @@ class OrderBookDistribution:
             closer_to_further_real_orders, available_funds, reference_price,daily_volume, side, trigger_source
         ):
             return 1
+        if self._should_vectorize(max(len(closer_to_further_real_orders), ideal_orders_count)):
+            return self._get_vectorized_sided_orders_distance_from_ideal(
+                closer_to_further_real_orders, ideal_orders_count, side, trigger_source
+            )
         min_amount, max_amount = (
             min(closer_to_further_real_orders[0].amount, closer_to_further_real_orders[-1].amount),
             max(closer_to_further_real_orders[0].amount, closer_to_further_real_orders[-1].amount)
@@ -305,6 +318,39 @@ class OrderBookDistribution:
             distances += [decimal.Decimal(1)] * (len(real_amounts) - len(ideal_amounts))
         return (sum(distances) / len(distances)) if distances else 0
 
+    def _get_vectorized_sided_orders_distance_from_ideal(
+        self,
+        closer_to_further_real_orders: list[BookOrderData],
+        ideal_orders_count: int,
+        side: trading_enums.TradeOrderSide,
+        trigger_source: str,
+    ) -> float:
+        real_amounts = numpy.array([float(o.amount) for o in closer_to_further_real_orders], dtype=numpy.float64)
+        min_amount, max_amount = (
+            min(real_amounts[0], real_amounts[-1]), max(real_amounts[0], real_amounts[-1])
+        )
+        ideal_prices = self._get_order_prices_array(0, 100, ideal_orders_count)
+        raw_ideal_amounts = self._get_order_volumes_array(side, 100, ideal_prices)
+        min_ideal_amount, max_ideal_amount = raw_ideal_amounts.min(), raw_ideal_amounts.max()
+        if max_amount == 0 or max_ideal_amount == 0:
+            # impossible to compute distance
+            self.get_logger().info(
+                f"Incompatible total amounts on {side.name} side: {max_amount=}, {max_ideal_amount=}, refresh required "
+                f"[trigger source: {trigger_source}]"
+            )
+            return 1
+        # align amounts between 0 and 100 to be able to compare
+        real_amounts = (real_amounts - min_amount) * 100 / max_amount
+        ideal_amounts = (raw_ideal_amounts - min_ideal_amount) * 100 / max_ideal_amount
+        distances = numpy.zeros(max(len(real_amounts), len(ideal_amounts)), dtype=numpy.float64)
+        compared_count = min(len(real_amounts), len(ideal_amounts))
+        distances[:compared_count] = numpy.abs(
+            ideal_amounts[:compared_count] - real_amounts[:compared_count]
+        ) / 100
+        # missing prices are 0 distance, real orders that should not be open are 1 distance
+        distances[len(ideal_amounts):] = 1
+        return float(distances.mean()) if len(distances) else 0
+
     def _should_use_artificial_funds(
         self, ideal_total_volume: decimal.Decimal, total_volume: decimal.Decimal,
         side: trading_enums.TradeOrderSide, tolerated_bellow_depth_ratio=DEFAULT_TOLERATED_BELLOW_DEPTH_RATIO
@@ -380,6 +426,11 @@ class OrderBookDistribution:
             side, reference_price, daily_base_volume, daily_quote_volume, available_base, available_quote, []
         )
 
+        if self._should_vectorize(orders_count):
+            return self._get_vectorized_target_orders(
+                side, reference_price, start_price, end_price, orders_count, reference_volume, available_funds,
+                symbol_market
+            )
         # order prices are sorted from the inside out of the order book (closest to the price first)
         order_prices = self._get_order_prices(start_price, end_price, orders_count)
 
@@ -407,6 +458,38 @@ class OrderBookDistribution:
             for price, volume in zip(order_prices, order_volumes)
         ]
 
+    def _get_vectorized_target_orders(
+        self, side: trading_enums.TradeOrderSide, reference_price: decimal.Decimal,
+        start_price: decimal.Decimal, end_price: decimal.Decimal, orders_count: int,
+        reference_volume: decimal.Decimal, available_funds: typing.Optional[decimal.Decimal],
+        symbol_market: dict
+    ) -> list[BookOrderData]:
+        # order prices are sorted from the inside out of the order book (closest to the price first)
+        order_prices = self._get_order_prices_array(float(start_price), float(end_price), orders_count)
+        total_volume = self._get_total_volume_to_use(
+            side, reference_price, reference_volume, _to_decimals(order_prices), available_funds, False
+        )
+        # order volumes are sorted from the inside out of the order book (closest to the price first)
+        order_volumes = self._get_order_volumes_array(side, float(total_volume), order_prices)
+        if side is trading_enums.TradeOrderSide.BUY:
+            # convert quote volume into base
+            order_volumes = numpy.divide(
+                order_volumes, order_prices, out=order_volumes, where=order_prices != 0
+            )
+        # only create decimal.Decimal values for the final orders
+        return [
+            BookOrderData(
+                trading_personal_data.decimal_adapt_price(symbol_market, price),
+                trading_personal_data.decimal_adapt_quantity(symbol_market, volume),
+                side,
+            )
+            for price, volume in zip(_to_decimals(order_prices), _to_decimals(order_volumes))
+        ]
+
+    def _should_vectorize(self, orders_count: int) -> bool:
+        # numpy arrays are slower than decimal.Decimal lists for a few orders
+        return self.vectorized and orders_count >= VECTORIZED_MIN_ORDERS_COUNT
+
     def can_create_at_least_one_order(self, sides: list[trading_enums.TradeOrderSide], symbol_market: dict) -> bool:
         for side in sides:
             orders = self.bids if side == trading_enums.TradeOrderSide.BUY else self.asks
@@ -489,6 +572,13 @@ class OrderBookDistribution:
             for i in range(orders_count)
         ]
 
+    def _get_order_prices_array(
+        self, start_price: float, end_price: float, orders_count: int
+    ) -> numpy.ndarray:
+        if orders_count < 2:
+            raise ValueError("Orders count must be greater than 2")
+        return numpy.linspace(start_price, end_price, orders_count, dtype=numpy.float64)
+
     def _infer_sided_order_data_after_swaps(
         self,
         existing_orders: list[BookOrderData],
@@ -513,57 +603,118 @@ class OrderBookDistribution:
         )
         ideal_prices = self._get_order_prices(ideal_start_price, ideal_end_price, orders_count)
         ideal_amount_percents = self._get_order_volumes(side, trading_constants.ONE_HUNDRED, ideal_prices)
+        if self._should_vectorize(orders_count):
+            existing_order_indexes = self._get_vectorized_existing_order_indexes(
+                ideal_prices, reference_price, closer_to_further_orders, side
+            )
+        else:
+            existing_order_indexes = self._get_existing_order_indexes(
+                ideal_prices, reference_price, closer_to_further_orders
+            )
         adapted_orders_data = []
+        for ideal_price, ideal_amount_percent, existing_order_index in zip(
+            ideal_prices, ideal_amount_percents, existing_order_indexes
+        ):
+            inferred_order_data = InferredOrderData(
+                ideal_price, ideal_amount_percent, None, None, None, ideal_price
+            )
+            if existing_order_index is not None:
+                # price and amount are found: keep them
+                current_order = closer_to_further_orders[existing_order_index]
+                inferred_order_data.current_price = current_order.price
+                inferred_order_data.final_price = current_order.price
+                inferred_order_data.current_origin_amount = current_order.amount
+                inferred_order_data.final_amount = current_order.amount
+            # otherwise price is missing: it will have to be added
+            adapted_orders_data.append(inferred_order_data)
+
+        self._adapt_inferred_order_amounts(
+            adapted_orders_data, existing_orders, outdated_orders,
+            available_funds, reference_price, reference_volume, side
+        )
+
+        return [
+            BookOrderData(order.final_price, order.final_amount, side)
+            for order in adapted_orders_data
+        ]
+
+    def _get_existing_order_indexes(
+        self,
+        ideal_prices: list[decimal.Decimal],
+        reference_price: decimal.Decimal,
+        closer_to_further_orders: list[BookOrderData],
+    ) -> list[typing.Optional[int]]:
+        """
+        :return: the index of the existing order to keep for each ideal price, None when missing
+        """
+        existing_order_indexes = []
         existing_order_index = 0
-        moving_window_price_ratio = decimal.Decimal("1.5")
         for i in range(0, len(ideal_prices)):
             ideal_price = ideal_prices[i]
-            inferred_order_data = InferredOrderData(
-                ideal_price, ideal_amount_percents[i], None, None, None, ideal_price
-            )
             previous_ideal_price = ideal_prices[i - 1] if i > 0 else reference_price
             next_ideal_price = ideal_prices[i + 1] if i < len(ideal_prices) - 1 else None
             window_min = ideal_price - (
                 abs(ideal_price - previous_ideal_price) / (
-                    moving_window_price_ratio if i > 0 else decimal.Decimal(1)
+                    MOVING_WINDOW_PRICE_RATIO if i > 0 else decimal.Decimal(1)
                 )
             )
             window_max = ideal_price + (
-                (abs(next_ideal_price - ideal_price) / moving_window_price_ratio)
+                (abs(next_ideal_price - ideal_price) / MOVING_WINDOW_PRICE_RATIO)
                 if next_ideal_price is not None
                 # fallback to previous price increment
                 else abs(ideal_price - previous_ideal_price)
             )
             # for each ideal price, check if an equivalent exists in current prices
+            found_order_index = None
             candidate_existing_order_index = existing_order_index
-            found_order = False
-            while not found_order and len(closer_to_further_orders) > candidate_existing_order_index:
-                current_order = closer_to_further_orders[candidate_existing_order_index]
-                if window_min <= current_order.price <= window_max:
-                    # price and amount are found: keep them
-                    inferred_order_data.current_price = current_order.price
-                    inferred_order_data.final_price = current_order.price
-                    inferred_order_data.current_origin_amount = current_order.amount
-                    inferred_order_data.final_amount = current_order.amount
-                    found_order = True
-                candidate_existing_order_index += 1
-                if found_order:
+            while found_order_index is None and len(closer_to_further_orders) > candidate_existing_order_index:
+                if window_min <= closer_to_further_orders[candidate_existing_order_index].price <= window_max:
+                    found_order_index = candidate_existing_order_index
                     # skip existing order from checked orders
-                    existing_order_index = candidate_existing_order_index
-                else:
-                    # price is missing: it will have to be added
-                    pass
-            adapted_orders_data.append(inferred_order_data)
-
-        self._adapt_inferred_order_amounts(
-            adapted_orders_data, existing_orders, outdated_orders,
-            available_funds, reference_price, reference_volume, side
-        )
+                    existing_order_index = candidate_existing_order_index + 1
+                candidate_existing_order_index += 1
+            existing_order_indexes.append(found_order_index)
+        return existing_order_indexes
 
-        return [
-            BookOrderData(order.final_price, order.final_amount, side)
-            for order in adapted_orders_data
-        ]
+    def _get_vectorized_existing_order_indexes(
+        self,
+        ideal_prices: list[decimal.Decimal],
+        reference_price: decimal.Decimal,
+        closer_to_further_orders: list[BookOrderData],
+        side: trading_enums.TradeOrderSide
+    ) -> list[typing.Optional[int]]:
+        """
+        float array equivalent of _get_existing_order_indexes
+        """
+        prices = numpy.array(ideal_prices, dtype=numpy.float64)
+        previous_prices = numpy.concatenate(([float(reference_price)], prices[:-1]))
+        previous_price_distances = numpy.abs(prices - previous_prices)
+        window_mins = prices - previous_price_distances
+        window_mins[1:] = prices[1:] - previous_price_distances[1:] / float(MOVING_WINDOW_PRICE_RATIO)
+        window_maxes = numpy.empty_like(prices)
+        window_maxes[:-1] = prices[:-1] + numpy.abs(prices[1:] - prices[:-1]) / float(MOVING_WINDOW_PRICE_RATIO)
+        # fallback to previous price increment
+        window_maxes[-1] = prices[-1] + previous_price_distances[-1]
+        existing_prices = numpy.array([order.price for order in closer_to_further_orders], dtype=numpy.float64)
+        if side is trading_enums.TradeOrderSide.BUY:
+            # closer to further buy orders have decreasing prices: use negative prices to sort them
+            existing_prices = -existing_prices
+            window_mins, window_maxes = -window_maxes, -window_mins
+        # existing orders in each window are existing_prices[first_indexes[i]:end_indexes[i]]
+        first_indexes = numpy.searchsorted(existing_prices, window_mins, side="left").tolist()
+        end_indexes = numpy.searchsorted(existing_prices, window_maxes, side="right").tolist()
+        existing_order_indexes = []
+        existing_order_index = 0
+        for first_index, end_index in zip(first_indexes, end_indexes):
+            # use the first order of the window that has not been checked yet
+            candidate_index = max(first_index, existing_order_index)
+            if candidate_index < end_index:
+                existing_order_indexes.append(candidate_index)
+                # skip existing order from checked orders
+                existing_order_index = candidate_index + 1
+            else:
+                existing_order_indexes.append(None)
+        return existing_order_indexes
 
     def _adapt_inferred_order_amounts(
         self,
@@ -711,6 +862,29 @@ class OrderBookDistribution:
             raise NotImplementedError(f"{direction} not implemented")
         return order_volumes
 
+    def _get_order_volumes_array(
+        self, side: trading_enums.TradeOrderSide, total_volume: float, order_prices: numpy.ndarray,
+        multiplier: float = 1, direction: typing.Union[DECREASING, INCREASING, RANDOM] = DECREASING
+    ) -> numpy.ndarray:
+        """
+        float array equivalent of _get_order_volumes
+        """
+        orders_count = len(order_prices)
+        if orders_count < 2:
+            raise ValueError("Orders count must be greater than 2")
+        multiplier = float(multiplier)
+        if direction in (INCREASING, DECREASING):
+            average_order_size = total_volume / orders_count
+            increment = average_order_size * (multiplier - 1) / orders_count
+            total_increments = orders_count * (orders_count - 1) / 2
+            base_vol = (total_volume - (total_increments * increment)) / orders_count
+            # same order as _get_order_volumes: orders are smaller when closer to the reference price
+            return base_vol + increment * numpy.arange(orders_count, dtype=numpy.float64)
+        if direction == RANDOM:
+            multipliers = numpy.random.uniform(1 - multiplier, 1 + multiplier, orders_count)
+            return total_volume * multipliers / multipliers.sum()
+        raise NotImplementedError(f"{direction} not implemented")
+
     def _get_total_volume_to_use(
         self, side: trading_enums.TradeOrderSide, reference_price: decimal.Decimal,
         reference_volume: decimal.Decimal, order_prices: list[decimal.Decimal],
@@ -732,9 +906,12 @@ class OrderBookDistribution:
             for order in orders
             if abs(trading_constants.ONE_HUNDRED - (
                 order.price * trading_constants.ONE_HUNDRED / reference_price
-            )) <= TARGET_CUMULATED_VOLUME_PERCENT
+            )) <= self._get_target_cumulated_volume_percent()
         ]
 
+    def _get_target_cumulated_volume_percent(self) -> decimal.Decimal:
+        return TARGET_CUMULATED_VOLUME_PERCENT
+
     def _get_ideal_total_volume_to_use(
         self, side: trading_enums.TradeOrderSide, reference_price: decimal.Decimal,
         reference_volume: decimal.Decimal, order_prices: list[decimal.Decimal],
@@ -749,10 +926,17 @@ class OrderBookDistribution:
         if until_depth_threshold_only:
             self.get_logger().info(f"{target_before_threshold_volume=} {daily_trading_volume_percent=}")
             return target_before_threshold_volume
-        counted_orders = len(self._get_market_depth_order_amounts([
-            BookOrderData(price, trading_constants.ZERO, side)
-            for price in order_prices
-        ], reference_price))
+        if self._should_vectorize(len(order_prices)):
+            prices = numpy.array(order_prices, dtype=numpy.float64)
+            counted_orders = int(numpy.count_nonzero(
+                numpy.abs(100 - (prices * 100 / float(reference_price)))
+                <= float(self._get_target_cumulated_volume_percent())
+            ))
+        else:
+            counted_orders = len(self._get_market_depth_order_amounts([
+                BookOrderData(price, trading_constants.ZERO, side)
+                for price in order_prices
+            ], reference_price))
         # goal: the first (closes to reference price) counted_orders orders have a volume of target_volume
 
         # use a percent-based volume profile to figure out the total required volume
@@ -791,6 +975,11 @@ def _quantize_decimal(value: decimal.Decimal) -> decimal.Decimal:
     )
 
 
+def _to_decimals(values: numpy.ndarray) -> list[decimal.Decimal]:
+    # keep up to 10 decimals to avoid floating point precision issues
+    return [decimal.Decimal(str(value)) for value in numpy.round(values, _MAX_DIGITS).tolist()]
+
+
 def get_sorted_sided_orders(orders: list[BookOrderData], closer_to_further: bool) -> list[BookOrderData]:
     if orders:
         side = orders[0].side
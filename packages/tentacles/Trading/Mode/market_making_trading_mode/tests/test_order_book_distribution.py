@@ -14,6 +14,8 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import decimal
+import mock
+import numpy
 import pytest
 
 import octobot_trading.enums as trading_enums
@@ -210,6 +212,43 @@ def test_infer_full_order_data_after_swaps(distribution):
     assert round(updated_orders[5].price, 1) == round(sorted_ideal_asks[0].price, 1)
 
 
+def test_vectorized_infer_full_order_data_after_swaps(distribution):
+    with mock.patch.object(order_book_distribution, "VECTORIZED_MIN_ORDERS_COUNT", 2):
+        test_infer_full_order_data_after_swaps(distribution)
+
+
+def test_get_vectorized_existing_order_indexes(distribution):
+    reference_price = decimal.Decimal("100")
+    for side, direction in ((trading_enums.TradeOrderSide.BUY, -1), (trading_enums.TradeOrderSide.SELL, 1)):
+        ideal_prices = distribution._get_order_prices(
+            reference_price + direction * decimal.Decimal("1"), reference_price + direction * decimal.Decimal("10"),
+            10
+        )
+        for existing_prices in (
+            # no existing order
+            [],
+            # ideal orders
+            ideal_prices,
+            # missing and moved orders
+            [ideal_prices[0], ideal_prices[2] + decimal.Decimal("0.3"), ideal_prices[3] - decimal.Decimal("0.6"),
+             ideal_prices[5] + decimal.Decimal("0.6"), ideal_prices[9]],
+            # orders out of ideal windows or in the same window
+            [reference_price + direction * decimal.Decimal("0.01"), ideal_prices[1], ideal_prices[1],
+             ideal_prices[1] + decimal.Decimal("0.01"), reference_price + direction * decimal.Decimal("30")],
+        ):
+            closer_to_further_orders = order_book_distribution.get_sorted_sided_orders(
+                [order_book_distribution.BookOrderData(price, decimal.Decimal("1"), side) for price in existing_prices],
+                True
+            )
+            expected_indexes = distribution._get_existing_order_indexes(
+                ideal_prices, reference_price, closer_to_further_orders
+            )
+            assert distribution._get_vectorized_existing_order_indexes(
+                ideal_prices, reference_price, closer_to_further_orders, side
+            ) == expected_indexes
+            assert len(expected_indexes) == len(ideal_prices)
+
+
 def test_validate_config(distribution):
     distribution.validate_config()  # does not raise
 
@@ -357,3 +396,77 @@ def test_get_order_volumes_random(distribution):
     for vol in volumes:
         assert min_expected <= vol <= max_expected, \
             f"Volume {vol} should be between {min_expected} and {max_expected}"
+
+
+def test_vectorized_and_decimal_distributions_are_equal():
+    with mock.patch.object(order_book_distribution, "VECTORIZED_MIN_ORDERS_COUNT", 2):
+        _test_vectorized_and_decimal_distributions_are_equal()
+
+
+def _test_vectorized_and_decimal_distributions_are_equal():
+    price = decimal.Decimal("50000.12")
+    daily_base_volume = decimal.Decimal("10.1111111111111111111111111")
+    daily_quote_volume = decimal.Decimal("450000.22222222222222222222222")
+    for available_base, available_quote in ((None, None), (decimal.Decimal("0.0945"), decimal.Decimal("199.01"))):
+        vectorized_distribution = order_book_distribution.OrderBookDistribution(
+            BIDS_COUNT, ASKS_COUNT, MIN_SPREAD, MAX_SPREAD, vectorized=True
+        ).compute_distribution(
+            price, daily_base_volume, daily_quote_volume, SYMBOL_MARKET,
+            available_base=available_base, available_quote=available_quote
+        )
+        decimal_distribution = order_book_distribution.OrderBookDistribution(
+            BIDS_COUNT, ASKS_COUNT, MIN_SPREAD, MAX_SPREAD, vectorized=False
+        ).compute_distribution(
+            price, daily_base_volume, daily_quote_volume, SYMBOL_MARKET,
+            available_base=available_base, available_quote=available_quote
+        )
+        assert vectorized_distribution.bids == decimal_distribution.bids
+        assert vectorized_distribution.asks == decimal_distribution.asks
+
+        orders = decimal_distribution.bids + decimal_distribution.asks
+        # remove an order to get a distance
+        orders.pop(2)
+        available_quote = available_quote or decimal_distribution.get_ideal_total_volume(
+            trading_enums.TradeOrderSide.BUY, price, daily_base_volume, daily_quote_volume,
+        )
+        available_base = available_base or decimal_distribution.get_ideal_total_volume(
+            trading_enums.TradeOrderSide.SELL, price, daily_base_volume, daily_quote_volume,
+        )
+        assert vectorized_distribution.get_shape_distance_from(
+            orders, available_base, available_quote, price, daily_base_volume, daily_quote_volume, "test"
+        ) == pytest.approx(decimal_distribution.get_shape_distance_from(
+            orders, available_base, available_quote, price, daily_base_volume, daily_quote_volume, "test"
+        ))
+
+
+def test_get_order_volumes_array(distribution):
+    order_prices = [
+        decimal.Decimal("50000"),
+        decimal.Decimal("49900"),
+        decimal.Decimal("49800"),
+        decimal.Decimal("49700"),
+        decimal.Decimal("49600"),
+    ]
+    for multiplier in (decimal.Decimal("1"), decimal.Decimal("1.5"), decimal.Decimal("2")):
+        for direction in (order_book_distribution.DECREASING, order_book_distribution.INCREASING):
+            volumes = distribution._get_order_volumes_array(
+                trading_enums.TradeOrderSide.BUY, 100, numpy.array([float(p) for p in order_prices]),
+                multiplier=float(multiplier), direction=direction
+            )
+            assert volumes.tolist() == pytest.approx([
+                float(v) for v in distribution._get_order_volumes(
+                    trading_enums.TradeOrderSide.BUY, decimal.Decimal("100"), order_prices,
+                    multiplier=multiplier, direction=direction
+                )
+            ])
+    numpy.random.seed(42)
+    volumes = distribution._get_order_volumes_array(
+        trading_enums.TradeOrderSide.BUY, 150, numpy.array([float(p) for p in order_prices]),
+        multiplier=0.3, direction=order_book_distribution.RANDOM
+    )
+    assert volumes.sum() == pytest.approx(150)
+    assert all(30 * 0.7 <= volume <= 30 * 1.3 for volume in volumes)
+    with pytest.raises(ValueError):
+        distribution._get_order_volumes_array(
+            trading_enums.TradeOrderSide.BUY, 150, numpy.array([50000.0]),
+        )
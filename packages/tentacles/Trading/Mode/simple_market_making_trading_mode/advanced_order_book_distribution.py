@@ -17,6 +17,8 @@ import decimal
 import enum
 import typing
 
+import numpy
+
 import octobot_trading.constants as trading_constants
 import octobot_trading.enums as trading_enums
 import tentacles.Trading.Mode.market_making_trading_mode.order_book_distribution as order_book_distribution
@@ -76,8 +78,9 @@ class AdvancedOrderBookDistribution(order_book_distribution.OrderBookDistributio
         min_quote_budget: typing.Optional[decimal.Decimal] = None,
         tolerated_bellow_depth_ratio: decimal.Decimal = DEFAULT_TOLERATED_BELLOW_DEPTH_RATIO,
         tolerated_above_depth_ratio: decimal.Decimal = DEFAULT_TOLERATED_ABOVE_DEPTH_RATIO,
+        vectorized: bool = True,
     ):
-        super().__init__(bids_count, asks_count, min_spread, max_spread)
+        super().__init__(bids_count, asks_count, min_spread, max_spread, vectorized=vectorized)
         self.target_cumulated_volume_percent: decimal.Decimal = target_cumulated_volume_percent
         self.daily_trading_volume_percent: decimal.Decimal = daily_trading_volume_percent
         self.price_distribution: OrdersDistribution = price_distribution
@@ -136,6 +139,14 @@ class AdvancedOrderBookDistribution(order_book_distribution.OrderBookDistributio
             raise NotImplementedError(f"{self.price_distribution} not implemented")
         return order_prices
 
+    def _get_order_prices_array(
+        self, start_price: float, end_price: float, orders_count: int
+    ) -> numpy.ndarray:
+        if self.price_distribution is not OrdersDistribution.LINEAR:
+            raise NotImplementedError(f"{self.price_distribution} not implemented")
+        # orders evenly distributed between lowest and highest price
+        return super()._get_order_prices_array(start_price, end_price, orders_count)
+
     def _get_order_volumes(
         self, side: trading_enums.TradeOrderSide, total_volume: decimal.Decimal, order_prices: list[decimal.Decimal],
         multiplier=decimal.Decimal(1), direction=order_book_distribution.DECREASING
@@ -145,6 +156,15 @@ class AdvancedOrderBookDistribution(order_book_distribution.OrderBookDistributio
             side, total_volume, order_prices, multiplier=strategy[MULTIPLIER], direction=strategy[side]
         )
 
+    def _get_order_volumes_array(
+        self, side: trading_enums.TradeOrderSide, total_volume: float, order_prices: numpy.ndarray,
+        multiplier: float = 1, direction=order_book_distribution.DECREASING
+    ) -> numpy.ndarray:
+        strategy = FundsDistributionStrategyModeMultipliersDetails[self.funds_distribution]
+        return super()._get_order_volumes_array(
+            side, total_volume, order_prices, multiplier=float(strategy[MULTIPLIER]), direction=strategy[side]
+        )
+
     def _are_total_order_volumes_compatible_with_config(
         self,
         closer_to_further_real_orders: list[order_book_distribution.BookOrderData],
@@ -192,16 +212,8 @@ class AdvancedOrderBookDistribution(order_book_distribution.OrderBookDistributio
             self.max_quote_budget if side is trading_enums.TradeOrderSide.BUY else self.max_base_budget,
         )
 
-    def _get_market_depth_order_amounts(
-        self, orders: list[order_book_distribution.BookOrderData], reference_price: decimal.Decimal
-    ) -> list[decimal.Decimal]:
-        return [
-            order.get_base_amount()
-            for order in orders
-            if abs(trading_constants.ONE_HUNDRED - (
-                order.price * trading_constants.ONE_HUNDRED / reference_price
-            )) <= self.target_cumulated_volume_percent
-        ]
+    def _get_target_cumulated_volume_percent(self) -> decimal.Decimal:
+        return self.target_cumulated_volume_percent
 
     def _get_ideal_total_volume_to_use(
         self, side: trading_enums.TradeOrderSide, reference_price: decimal.Decimal,
@@ -0,0 +1,81 @@
+#  Drakkar-Software OctoBot-Tentacles
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Vectorized and decimal.Decimal order book distribution benchmarks, using pytest-benchmark.
+Distributions of less than order_book_distribution.VECTORIZED_MIN_ORDERS_COUNT orders always use decimal.Decimal.
+Not collected by default, run them from the OctoBot folder:
+pytest tentacles/Trading/Mode/simple_market_making_trading_mode/tests/benchmark_advanced_order_book_distribution.py
+
+Save a baseline with --benchmark-save=<name> and detect regressions against it with
+--benchmark-compare=<name> --benchmark-compare-fail=mean:10%
+"""
+import decimal
+import pytest
+
+import octobot_trading.enums as trading_enums
+import tentacles.Trading.Mode.simple_market_making_trading_mode.advanced_order_book_distribution as \
+    advanced_order_book_distribution
+import tentacles.Trading.Mode.simple_market_making_trading_mode.tests.test_advanced_order_book_distribution as \
+    test_advanced_order_book_distribution
+
+ORDERS_COUNTS = (5, 20, 50, 200, 1000)
+MIN_SPREAD = decimal.Decimal("0.005")
+MAX_SPREAD = decimal.Decimal("0.2")
+PRICE = decimal.Decimal("50000.12")
+DAILY_BASE_VOLUME = decimal.Decimal("10.1111111111111111111111111")
+DAILY_QUOTE_VOLUME = decimal.Decimal("450000.22222222222222222222222")
+
+
+def _create_distribution(orders_count: int, vectorized: bool):
+    return advanced_order_book_distribution.AdvancedOrderBookDistribution(
+        orders_count, orders_count, MIN_SPREAD, MAX_SPREAD,
+        test_advanced_order_book_distribution.TARGET_CUMULATED_VOLUME_PERCENT,
+        test_advanced_order_book_distribution.DAILY_TRADING_VOLUME_PERCENT,
+        test_advanced_order_book_distribution.PRICE_DISTRIBUTION,
+        test_advanced_order_book_distribution.FUNDS_DISTRIBUTION,
+        vectorized=vectorized
+    )
+
+
+def _compute_distribution(distribution):
+    distribution.compute_distribution(
+        PRICE, DAILY_BASE_VOLUME, DAILY_QUOTE_VOLUME, test_advanced_order_book_distribution.SYMBOL_MARKET
+    )
+
+
+@pytest.mark.parametrize("vectorized", (False, True))
+@pytest.mark.parametrize("orders_count", ORDERS_COUNTS)
+def test_compute_distribution(benchmark, orders_count, vectorized):
+    distribution = _create_distribution(orders_count, vectorized)
+    benchmark(_compute_distribution, distribution)
+
+
+@pytest.mark.parametrize("vectorized", (False, True))
+@pytest.mark.parametrize("orders_count", ORDERS_COUNTS)
+def test_get_shape_distance_from(benchmark, orders_count, vectorized):
+    distribution = _create_distribution(orders_count, vectorized)
+    _compute_distribution(distribution)
+    orders = distribution.bids + distribution.asks
+    available_quote = distribution.get_ideal_total_volume(
+        trading_enums.TradeOrderSide.BUY, PRICE, DAILY_BASE_VOLUME, DAILY_QUOTE_VOLUME,
+    )
+    available_base = distribution.get_ideal_total_volume(
+        trading_enums.TradeOrderSide.SELL, PRICE, DAILY_BASE_VOLUME, DAILY_QUOTE_VOLUME,
+    )
+    benchmark(
+        distribution.get_shape_distance_from,
+        orders, available_base, available_quote, PRICE, DAILY_BASE_VOLUME, DAILY_QUOTE_VOLUME, "benchmark"
+    )
@@ -555,3 +555,40 @@ def test_validate_config(distribution):
     distribution.min_spread = decimal.Decimal(50)
     with pytest.raises(ValueError):
         distribution.validate_config()
+
+
+def test_vectorized_and_decimal_distributions_are_equal():
+    price = decimal.Decimal("50000.12")
+    daily_base_volume = decimal.Decimal("10.1111111111111111111111111")
+    daily_quote_volume = decimal.Decimal("450000.22222222222222222222222")
+    for budgets in (
+        (None, None, None, None),
+        (MAX_BASE_BUDGET, MAX_QUOTE_BUDGET, MIN_BASE_BUDGET, MIN_QUOTE_BUDGET)
+    ):
+        for funds_distribution in (
+            advanced_order_book_distribution.FundsDistribution.VALLEY,
+            advanced_order_book_distribution.FundsDistribution.FLAT,
+        ):
+            distributions = [
+                advanced_order_book_distribution.AdvancedOrderBookDistribution(
+                    25, 40, decimal.Decimal("0.01"), decimal.Decimal("0.15"),
+                    TARGET_CUMULATED_VOLUME_PERCENT, DAILY_TRADING_VOLUME_PERCENT,
+                    PRICE_DISTRIBUTION, funds_distribution, *budgets, vectorized=vectorized
+                ).compute_distribution(
+                    price, daily_base_volume, daily_quote_volume, SYMBOL_MARKET
+                )
+                for vectorized in (True, False)
+            ]
+            vectorized_distribution, decimal_distribution = distributions
+            assert vectorized_distribution.bids == decimal_distribution.bids
+            assert vectorized_distribution.asks == decimal_distribution.asks
+
+            orders = decimal_distribution.bids[2:] + decimal_distribution.asks[:-3]
+            distances = [
+                distribution.get_shape_distance_from(
+                    orders, decimal.Decimal("1"), decimal.Decimal("50000"),
+                    price, daily_base_volume, daily_quote_volume, "test"
+                )
+                for distribution in distributions
+            ]
+            assert distances[0] == pytest.approx(distances[1])
@@ -73,6 +73,9 @@ from octobot_tentacles_manager.api.updater import (
 )
 from octobot_tentacles_manager.api.loader import (
     load_tentacles,
+    load_deferred_tentacles,
+    get_deferred_tentacles,
+    get_tentacles_import_time_report,
     is_tentacles_architecture_valid,
     reload_tentacle_info,
     ensure_tentacle_info,
@@ -147,6 +150,9 @@ __all__ = [
     "update_all_tentacles",
     "update_tentacles",
     "load_tentacles",
+    "load_deferred_tentacles",
+    "get_deferred_tentacles",
+    "get_tentacles_import_time_report",
     "is_tentacles_architecture_valid",
     "reload_tentacle_info",
     "ensure_tentacle_info",
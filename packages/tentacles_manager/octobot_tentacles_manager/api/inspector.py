@@ -89,12 +89,14 @@ def check_tentacle_version(version, name, origin_package, verbose=True) -> bool:
     except Exception as e:
         if verbose:
             logger.error(f"Error when reading tentacle metadata: {e}")
-    return True
+    # lazy loaded tentacles are imported when looked up
+    return loaders.should_import_tentacle_module(name)
 
 
 def _load_tentacle_class(tentacle_name):
     # Lazy import of tentacles to let tentacles manager handle imports
     try:
+        loaders.ensure_tentacle_class_imported(tentacle_name)
         import octobot_evaluators.evaluators as evaluators
         import tentacles.Evaluator as tentacles_Evaluator
         if tentacle_class := tentacles_management.get_class_from_string(
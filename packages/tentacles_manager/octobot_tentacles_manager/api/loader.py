@@ -13,18 +13,78 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import typing
+
 import packaging.version as packaging_version
 
 import octobot_tentacles_manager.constants as constants
 import octobot_tentacles_manager.loaders as loaders
 import octobot_tentacles_manager.managers as managers
 import octobot_tentacles_manager.util as util
+import octobot_tentacles_manager.api.configurator as configurator
 
 
-def load_tentacles(verbose=True) -> bool:
+def load_tentacles(verbose=True, tentacles_setup_config=None) -> bool:
+    """
+    Import installed tentacles
+    :param verbose: when True, log import errors
+    :param tentacles_setup_config: when provided, lazy load tentacles: only import the tentacles activated in
+    this configuration (and their requirements) from constants.LAZY_LOADED_TENTACLE_TYPES. Other tentacles
+    are imported when looked up.
+    :return: True when tentacles are successfully imported
+    """
+    if tentacles_setup_config is not None:
+        loaders.ensure_tentacles_metadata(constants.TENTACLES_PATH)
+        loaders.set_lazy_loaded_tentacle_modules(
+            loaders.get_tentacle_module_names_from_classes(
+                configurator.get_activated_tentacles(tentacles_setup_config)
+            )
+        )
     return managers.TentaclesSetupManager.is_tentacles_arch_valid(verbose=verbose)
 
 
+def load_deferred_tentacles() -> None:
+    """
+    Import lazy loaded tentacles that have not been imported yet
+    """
+    loaders.import_deferred_tentacles()
+
+
+def get_deferred_tentacles() -> list:
+    return loaders.get_deferred_tentacle_module_names()
+
+
+async def get_tentacles_import_time_report(
+    tentacles_setup_config_path: typing.Optional[str] = None,
+    limit: int = constants.IMPORT_TIME_REPORT_DEFAULT_LIMIT
+) -> str:
+    """
+    Profile tentacles loading in a new python process, as python -X importtime would
+    :param tentacles_setup_config_path: when provided, profile lazy loading using this tentacles configuration
+    :param limit: max number of slowest modules to include in the report
+    :return: the import time report
+    """
+    loaders.ensure_tentacles_metadata(constants.TENTACLES_PATH)
+    load_kwargs = "verbose=False" if tentacles_setup_config_path is None else (
+        f"verbose=False, tentacles_setup_config=api.get_tentacles_setup_config({tentacles_setup_config_path!r})"
+    )
+    import_times, return_code = await util.profile_imports(
+        f"import octobot_tentacles_manager.api as api\n"
+        f"raise SystemExit(0 if api.load_tentacles({load_kwargs}) else 1)"
+    )
+    report = util.get_import_time_report(
+        import_times,
+        (
+            f"{constants.TENTACLES_PATH}.{tentacle.tentacle_type}.{tentacle.name}"
+            for tentacle in set(loaders.get_tentacle_classes().values())
+        ),
+        limit=limit
+    )
+    if return_code != 0:
+        report = f"{report}\nWarning: tentacles loading failed, this report is incomplete"
+    return report
+
+
 def is_tentacles_architecture_valid() -> bool:
     return managers.TentaclesSetupManager.is_tentacles_arch_valid(verbose=False, import_tentacles=False)
 
@@ -51,7 +51,11 @@ async def _handle_package_manager_command(starting_args,
         should_use_package_name_when_exporting = starting_args.export_with_package_name
         upload_tentacles_export_list = starting_args.upload_tentacles_export \
             if starting_args.upload_tentacles_export else []
-        if starting_args.creator:
+        if starting_args.import_time_report is not None:
+            print(await api.get_tentacles_import_time_report(
+                tentacles_setup_config_path=starting_args.import_time_report or None
+            ))
+        elif starting_args.creator:
             error_count = api.start_tentacle_creator({}, starting_args.creator)
         elif starting_args.repair:
             error_count = await api.repair_installation(bot_path=target_dir)
@@ -254,6 +258,12 @@ def register_tentacles_manager_arguments(tentacles_parser) -> None:
     tentacles_parser.add_argument("-m", "--metadata-file", help="The metadata file to use when exporting the package.")
     tentacles_parser.add_argument("-cy", "--cythonize", help="Option for the --pack command: cythonize and "
                                                              "compile the packed tentacles.", action='store_true')
+    tentacles_parser.add_argument("-itr", "--import-time-report",
+                                  help="Display the time spent importing each installed tentacle and the slowest "
+                                       "imported modules, as 'python -X importtime' would. Add the path to a "
+                                       "tentacles_config.json file to profile lazy tentacles loading using this "
+                                       "configuration.\nExample: -itr user/profiles/default/tentacles_config.json",
+                                  nargs="?", const="")
     tentacles_parser.add_argument("-q", "--quite", help="Only display errors in logs.", action='store_true')
     tentacles_parser.add_argument("tentacle_names", nargs="*")
 
@@ -235,6 +235,19 @@ TENTACLE_TYPES = [
     TENTACLES_TRADING_PATH
 ]
 
+# import time profiling
+IMPORT_TIME_REPORT_DEFAULT_LIMIT = 20
+
+# tentacles types that are only imported when activated or looked up when lazy loading is enabled
+LAZY_LOADED_TENTACLE_TYPES = [
+    TENTACLES_EVALUATOR_PATH,
+    path.join(TENTACLES_TRADING_PATH, TENTACLES_TRADING_MODE_PATH),
+    path.join(TENTACLES_SERVICES_PATH, TENTACLES_INTERFACES_PATH),
+    path.join(TENTACLES_SERVICES_PATH, TENTACLES_NOTIFIERS_PATH),
+    path.join(TENTACLES_SERVICES_PATH, TENTACLES_SERVICES_BASES_PATH),
+    path.join(TENTACLES_SERVICES_PATH, TENTACLES_SERVICES_FEEDS_PATH),
+]
+
 
 IGNORED_TENTACLES_NAMES_IN_TENTACLES_SETUP_CONFIG = [
     "Automation", # special case for the automation tentacle config: it's storing all automations config under the same name: Automation (it's not a normal tentacle class name)
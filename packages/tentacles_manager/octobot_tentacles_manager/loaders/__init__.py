@@ -29,6 +29,14 @@ from octobot_tentacles_manager.loaders.tentacle_loading import (
     get_tentacle,
     get_tentacle_class_from_name,
     set_tentacle_class_by_name,
+    set_lazy_loaded_tentacle_modules,
+    get_tentacle_modules_with_requirements,
+    get_tentacle_module_names_from_classes,
+    should_import_tentacle_module,
+    get_deferred_tentacle_module_names,
+    ensure_tentacle_class_imported,
+    import_deferred_tentacles,
+    import_tentacle_module,
 )
 
 __all__ = [
@@ -44,4 +52,12 @@ __all__ = [
     "get_tentacle",
     "get_tentacle_class_from_name",
     "set_tentacle_class_by_name",
+    "set_lazy_loaded_tentacle_modules",
+    "get_tentacle_modules_with_requirements",
+    "get_tentacle_module_names_from_classes",
+    "should_import_tentacle_module",
+    "get_deferred_tentacle_module_names",
+    "ensure_tentacle_class_imported",
+    "import_deferred_tentacles",
+    "import_tentacle_module",
 ]
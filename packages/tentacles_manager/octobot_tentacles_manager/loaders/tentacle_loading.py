@@ -13,27 +13,43 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import functools
+import importlib
 import os.path as path
+import sys
 import typing
 
+import octobot_commons.logging as logging
+import octobot_commons.tentacles_management as tentacles_management
+
 import octobot_tentacles_manager.constants as constants
 import octobot_tentacles_manager.models as models
 import octobot_tentacles_manager.util as util
 
 # tentacle_data_by_tentacle_class is used to cache tentacles metadata
 _tentacle_by_tentacle_class = None
+_tentacle_by_module_name = {}
 _tentacle_class_by_class_name = {}
 _tentacle_documentation_by_class_name = {}
+# when set, tentacles from LAZY_LOADED_TENTACLE_TYPES are only imported with their tentacle type package
+# when their module is in this set, other ones are deferred until they are looked up
+_lazy_loading_allowed_modules: typing.Optional[set] = None
+_deferred_tentacle_by_module_name = {}
+LOGGER_NAME = "TentacleLoader"
 
 
 def reload_tentacle_by_tentacle_class(tentacles_path=constants.TENTACLES_PATH):
-    global _tentacle_by_tentacle_class
+    global _tentacle_by_tentacle_class, _tentacle_by_module_name
     loaded_tentacles = util.load_tentacle_with_metadata(tentacles_path)
     _tentacle_by_tentacle_class = {
         klass: tentacle
         for tentacle in loaded_tentacles
         for klass in tentacle.tentacle_class_names
     }
+    _tentacle_by_module_name = {
+        tentacle.name: tentacle
+        for tentacle in loaded_tentacles
+    }
 
 
 def get_tentacle_classes() -> dict:
@@ -109,3 +125,129 @@ def get_tentacle_class_from_name(tentacle_class_name):
 
 def set_tentacle_class_by_name(tentacle_class_name, tentacle_class):
     _tentacle_class_by_class_name[tentacle_class_name] = tentacle_class
+
+
+def set_lazy_loaded_tentacle_modules(tentacle_module_names: typing.Optional[typing.Iterable[str]]) -> None:
+    """
+    Enable lazy loading of tentacles from LAZY_LOADED_TENTACLE_TYPES
+    :param tentacle_module_names: names of the tentacle modules to import with their tentacle type package,
+    their required tentacles are also imported. None to disable lazy loading
+    """
+    global _lazy_loading_allowed_modules
+    _lazy_loading_allowed_modules = None if tentacle_module_names is None \
+        else get_tentacle_modules_with_requirements(tentacle_module_names)
+    # deferred tentacles are imported when their classes are looked up by name
+    tentacles_management.set_missing_class_importer(
+        None if tentacle_module_names is None else ensure_tentacle_class_imported
+    )
+
+
+def get_tentacle_modules_with_requirements(tentacle_module_names: typing.Iterable[str]) -> set:
+    module_names = set()
+    to_check_module_names = list(tentacle_module_names)
+    while to_check_module_names:
+        module_name = to_check_module_names.pop()
+        if module_name in module_names:
+            continue
+        module_names.add(module_name)
+        if (tentacle := _tentacle_by_module_name.get(module_name)) is not None and tentacle.tentacles_requirements:
+            to_check_module_names.extend(
+                requirement_name for requirement_name, _ in tentacle.extract_tentacle_requirements()
+            )
+    return module_names
+
+
+def get_tentacle_module_names_from_classes(tentacle_class_names: typing.Iterable[str]) -> set:
+    return set(
+        _tentacle_by_tentacle_class[tentacle_class_name].name
+        for tentacle_class_name in tentacle_class_names
+        if tentacle_class_name in _tentacle_by_tentacle_class
+    )
+
+
+def should_import_tentacle_module(tentacle_module_name: str) -> bool:
+    """
+    Called when importing tentacle type packages: defer the import of tentacle modules that are not required
+    when lazy loading is enabled. Deferred modules are imported when accessed from their tentacle type package.
+    """
+    if _lazy_loading_allowed_modules is None or tentacle_module_name in _lazy_loading_allowed_modules:
+        return True
+    tentacle = _tentacle_by_module_name.get(tentacle_module_name)
+    if tentacle is None or not _is_lazy_loaded_tentacle_type(tentacle.tentacle_type):
+        return True
+    _deferred_tentacle_by_module_name[tentacle_module_name] = tentacle
+    _install_deferred_import_hook(_get_tentacle_type_package_name(tentacle))
+    return False
+
+
+def get_deferred_tentacle_module_names() -> list:
+    return list(_deferred_tentacle_by_module_name)
+
+
+def ensure_tentacle_class_imported(tentacle_class_name: str) -> bool:
+    """
+    :return: True when the given tentacle class was deferred and has been imported
+    """
+    if _tentacle_by_tentacle_class and (tentacle := _tentacle_by_tentacle_class.get(tentacle_class_name)) \
+            and tentacle.name in _deferred_tentacle_by_module_name:
+        import_tentacle_module(tentacle)
+        return True
+    return False
+
+
+def import_deferred_tentacles() -> None:
+    for tentacle in list(_deferred_tentacle_by_module_name.values()):
+        import_tentacle_module(tentacle)
+
+
+def import_tentacle_module(tentacle: models.Tentacle):
+    """
+    Import a deferred tentacle module and expose its content in its tentacle type package,
+    as the "from .tentacle_module import *" line of tentacle type packages would
+    """
+    _deferred_tentacle_by_module_name.pop(tentacle.name, None)
+    package_name = _get_tentacle_type_package_name(tentacle)
+    module = importlib.import_module(f"{package_name}.{tentacle.name}")
+    package = sys.modules[package_name]
+    for attribute in getattr(
+        module, "__all__", [attribute for attribute in vars(module) if not attribute.startswith("_")]
+    ):
+        setattr(package, attribute, getattr(module, attribute))
+    logging.get_logger(LOGGER_NAME).debug(f"Imported lazy loaded {tentacle.name} tentacle")
+    return module
+
+
+def _import_deferred_attribute(package_name: str, attribute: str):
+    if not attribute.startswith("__"):
+        deferred_tentacles = [
+            tentacle
+            for tentacle in _deferred_tentacle_by_module_name.values()
+            if _get_tentacle_type_package_name(tentacle) == package_name
+        ]
+        # first try the tentacle declaring this attribute, import every deferred tentacle of this package otherwise
+        for tentacle in sorted(
+            deferred_tentacles,
+            key=lambda t: not (attribute == t.name or attribute in t.tentacle_class_names)
+        ):
+            import_tentacle_module(tentacle)
+            if attribute in vars(sys.modules[package_name]):
+                return getattr(sys.modules[package_name], attribute)
+    raise AttributeError(f"module '{package_name}' has no attribute '{attribute}'")
+
+
+def _install_deferred_import_hook(package_name: str) -> None:
+    # module level __getattr__ is called when an attribute is not found in the module
+    if (package := sys.modules.get(package_name)) is not None and "__getattr__" not in vars(package):
+        package.__getattr__ = functools.partial(_import_deferred_attribute, package_name)
+
+
+def _get_tentacle_type_package_name(tentacle: models.Tentacle) -> str:
+    return f"{constants.TENTACLES_PATH}.{tentacle.tentacle_type}"
+
+
+def _is_lazy_loaded_tentacle_type(tentacle_type: models.TentacleType) -> bool:
+    tentacle_type_path = tentacle_type.to_path()
+    return any(
+        tentacle_type_path == lazy_loaded_type or tentacle_type_path.startswith(f"{lazy_loaded_type}{path.sep}")
+        for lazy_loaded_type in constants.LAZY_LOADED_TENTACLE_TYPES
+    )
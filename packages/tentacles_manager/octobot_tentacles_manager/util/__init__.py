@@ -21,6 +21,7 @@ from octobot_tentacles_manager.util import tentacle_cleaner
 from octobot_tentacles_manager.util import file_util
 from octobot_tentacles_manager.util import hashing
 from octobot_tentacles_manager.util import signature_verification
+from octobot_tentacles_manager.util import import_profiling
 
 from octobot_tentacles_manager.util.os_util import (
     get_os_str,
@@ -57,6 +58,12 @@ from octobot_tentacles_manager.util.tentacle_cleaner import (
     remove_dir_or_file_from_path,
     remove_dir_or_file,
 )
+from octobot_tentacles_manager.util.import_profiling import (
+    ImportTime,
+    parse_import_times,
+    profile_imports,
+    get_import_time_report,
+)
 from octobot_tentacles_manager.util.hashing import (
     get_tentacles_code_hash,
     get_tentacles_config_hash,
@@ -98,4 +105,8 @@ __all__ = [
     "verify_package_signature",
     "verify_package",
     "sign_package_file",
+    "ImportTime",
+    "parse_import_times",
+    "profile_imports",
+    "get_import_time_report",
 ]
@@ -0,0 +1,109 @@
+#  Drakkar-Software OctoBot-Tentacles-Manager
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import sys
+import typing
+
+import octobot_tentacles_manager.constants as constants
+
+IMPORT_TIME_LINE_PREFIX = "import time:"
+IMPORT_TIME_DEPTH_INDENT = 2
+
+
+class ImportTime:
+    def __init__(self, module_name: str, self_time: int, cumulative_time: int, depth: int):
+        self.module_name: str = module_name
+        # times are in microseconds
+        self.self_time: int = self_time
+        self.cumulative_time: int = cumulative_time
+        self.depth: int = depth
+
+
+def parse_import_times(import_time_output: str) -> typing.List[ImportTime]:
+    """
+    Parse the output of python -X importtime
+    :param import_time_output: the stderr of the profiled python process
+    :return: the parsed ImportTime of each imported module, in import completion order
+    """
+    import_times = []
+    for line in import_time_output.splitlines():
+        if not line.startswith(IMPORT_TIME_LINE_PREFIX):
+            continue
+        try:
+            self_time, cumulative_time, module = line[len(IMPORT_TIME_LINE_PREFIX):].split("|")
+            # nested imports are indented by 2 spaces per level after the first space
+            depth = (len(module) - len(module.lstrip()) - 1) // IMPORT_TIME_DEPTH_INDENT
+            import_times.append(ImportTime(module.strip(), int(self_time), int(cumulative_time), depth))
+        except ValueError:
+            # header line
+            continue
+    return import_times
+
+
+async def profile_imports(python_code: str) -> typing.Tuple[typing.List[ImportTime], int]:
+    """
+    Run python_code in a new python process with -X importtime
+    :return: the import times and the process return code
+    """
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-X", "importtime", "-c", python_code,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE
+    )
+    _, stderr = await process.communicate()
+    return parse_import_times(stderr.decode(errors="replace")), process.returncode
+
+
+def get_import_time_report(
+    import_times: typing.List[ImportTime],
+    tentacle_package_names: typing.Iterable[str],
+    limit: int = constants.IMPORT_TIME_REPORT_DEFAULT_LIMIT
+) -> str:
+    """
+    :param import_times: the profiled import times
+    :param tentacle_package_names: full package names of the installed tentacles
+    :param limit: max number of slowest modules to include
+    :return: a text report of the total import time, of each imported tentacle import time and
+    of the slowest imported modules
+    """
+    tentacle_package_names = set(tentacle_package_names)
+    total_time = sum(import_time.cumulative_time for import_time in import_times if import_time.depth == 0)
+    tentacle_import_times = sorted(
+        (import_time for import_time in import_times if import_time.module_name in tentacle_package_names),
+        key=lambda import_time: import_time.cumulative_time,
+        reverse=True
+    )
+    slowest_import_times = sorted(
+        import_times, key=lambda import_time: import_time.self_time, reverse=True
+    )[:limit]
+    lines = [
+        f"Imported {len(import_times)} modules in {_format_time(total_time)}",
+        f"Imported tentacles: {len(tentacle_import_times)}/{len(tentacle_package_names)}",
+    ]
+    lines += [_format_line(import_time.cumulative_time, import_time.module_name)
+              for import_time in tentacle_import_times]
+    lines.append(f"Slowest {len(slowest_import_times)} modules (self time):")
+    lines += [_format_line(import_time.self_time, import_time.module_name)
+              for import_time in slowest_import_times]
+    return "\n".join(lines)
+
+
+def _format_line(time: int, module_name: str) -> str:
+    return f"{_format_time(time):>12} | {module_name}"
+
+
+def _format_time(time: int) -> str:
+    return f"{time / 1000:.1f} ms"
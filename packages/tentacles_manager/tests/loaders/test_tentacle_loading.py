@@ -13,10 +13,12 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import sys
 from os.path import isdir, isfile
 
 import aiohttp
 import pytest
+import octobot_commons.tentacles_management as tentacles_management
 from importlib import reload
 from os import path
 
@@ -56,6 +58,70 @@ async def test_with_reload_tentacle_by_tentacle_class_installed_tentacles():
     _cleanup()
 
 
+async def test_lazy_loading_installed_tentacles():
+    async with aiohttp.ClientSession() as session:
+        await install_all_tentacles(_tentacles_local_path(), aiohttp_session=session)
+    _unload_tentacles()
+    tentacle_loading.reload_tentacle_by_tentacle_class()
+    try:
+        tentacle_loading.set_lazy_loaded_tentacle_modules(
+            tentacle_loading.get_tentacle_module_names_from_classes(["DailyTradingMode"])
+        )
+        # requirements are imported with activated tentacles
+        assert tentacle_loading.get_tentacle_modules_with_requirements(["daily_trading_mode"]) == {
+            "daily_trading_mode", "mixed_strategies_evaluator", "instant_fluctuations_evaluator", "forum_evaluator",
+            "overall_state_analysis", "text_analysis", "reddit_service_feed", "reddit_service"
+        }
+        import tentacles
+        assert tentacle_loading.get_deferred_tentacle_module_names() == ["other_instant_fluctuations_evaluator"]
+        assert "OtherInstantFluctuationsEvaluator" not in vars(tentacles.Evaluator.RealTime)
+        assert "InstantFluctuationsEvaluator" in vars(tentacles.Evaluator.RealTime)
+        assert "DailyTradingMode" in vars(tentacles.Trading.Mode)
+
+        # deferred tentacles are imported when accessed
+        from tentacles.Evaluator.RealTime import SecondOtherInstantFluctuationsEvaluator
+        assert SecondOtherInstantFluctuationsEvaluator.__name__ == "SecondOtherInstantFluctuationsEvaluator"
+        assert "OtherInstantFluctuationsEvaluator" in vars(tentacles.Evaluator.RealTime)
+        assert tentacle_loading.get_deferred_tentacle_module_names() == []
+        with pytest.raises(AttributeError):
+            tentacles.Evaluator.RealTime.UnknownEvaluator
+    finally:
+        tentacle_loading.set_lazy_loaded_tentacle_modules(None)
+        _unload_tentacles()
+        _cleanup()
+
+
+async def test_lazy_loading_tentacle_class_lookup():
+    async with aiohttp.ClientSession() as session:
+        await install_all_tentacles(_tentacles_local_path(), aiohttp_session=session)
+    _unload_tentacles()
+    tentacle_loading.reload_tentacle_by_tentacle_class()
+    try:
+        tentacle_loading.set_lazy_loaded_tentacle_modules(
+            tentacle_loading.get_tentacle_module_names_from_classes(["DailyTradingMode"])
+        )
+        import tentacles
+        assert tentacle_loading.get_deferred_tentacle_module_names() == ["other_instant_fluctuations_evaluator"]
+        # deferred tentacles are imported when looked up by name
+        evaluator_class = tentacles_management.get_class_from_string(
+            "OtherInstantFluctuationsEvaluator", object, tentacles.Evaluator.RealTime
+        )
+        assert evaluator_class.__name__ == "OtherInstantFluctuationsEvaluator"
+        assert tentacle_loading.get_deferred_tentacle_module_names() == []
+        assert tentacles_management.get_class_from_string(
+            "UnknownEvaluator", object, tentacles.Evaluator.RealTime
+        ) is None
+    finally:
+        tentacle_loading.set_lazy_loaded_tentacle_modules(None)
+        _unload_tentacles()
+        _cleanup()
+
+
+def _unload_tentacles():
+    for module_name in [name for name in sys.modules if name == "tentacles" or name.startswith("tentacles.")]:
+        sys.modules.pop(module_name)
+
+
 def _tentacles_local_path():
     return path.join("tests", "static", "tentacles.zip")
 
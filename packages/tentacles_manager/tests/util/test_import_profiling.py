@@ -0,0 +1,62 @@
+#  Drakkar-Software OctoBot-Tentacles-Manager
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+import octobot_tentacles_manager.util.import_profiling as import_profiling
+
+IMPORT_TIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | io
+import time:      1500 |       1500 |       ccxt.base
+import time:       500 |       2000 |     tentacles.Trading.Mode.daily_trading_mode.daily_trading
+import time:       100 |       2100 |   tentacles.Trading.Mode.daily_trading_mode
+import time:        50 |       2150 | tentacles
+some other stderr line
+"""
+
+
+def test_parse_import_times():
+    import_times = import_profiling.parse_import_times(IMPORT_TIME_OUTPUT)
+    assert [import_time.module_name for import_time in import_times] == [
+        "_io", "io", "ccxt.base", "tentacles.Trading.Mode.daily_trading_mode.daily_trading",
+        "tentacles.Trading.Mode.daily_trading_mode", "tentacles"
+    ]
+    assert [import_time.depth for import_time in import_times] == [1, 0, 3, 2, 1, 0]
+    assert import_times[2].self_time == 1500
+    assert import_times[4].cumulative_time == 2100
+
+
+def test_get_import_time_report():
+    report = import_profiling.get_import_time_report(
+        import_profiling.parse_import_times(IMPORT_TIME_OUTPUT),
+        ["tentacles.Trading.Mode.daily_trading_mode", "tentacles.Evaluator.TA.momentum_evaluator"],
+        limit=2
+    )
+    assert report.splitlines() == [
+        "Imported 6 modules in 2.6 ms",
+        "Imported tentacles: 1/2",
+        "      2.1 ms | tentacles.Trading.Mode.daily_trading_mode",
+        "Slowest 2 modules (self time):",
+        "      1.5 ms | ccxt.base",
+        "      0.5 ms | tentacles.Trading.Mode.daily_trading_mode.daily_trading",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_profile_imports():
+    import_times, return_code = await import_profiling.profile_imports("import json")
+    assert return_code == 0
+    assert "json" in [import_time.module_name for import_time in import_times]
@@ -32,6 +32,7 @@ from octobot_trading.api.symbol_data import (
     get_symbol_candles_manager,
     get_symbol_historical_candles,
     create_preloaded_candles_manager,
+    create_preloaded_candles_manager_from_arrays,
     are_symbol_candles_initialized,
     get_candles_as_list,
     get_candle_as_list,
@@ -55,6 +56,8 @@ from octobot_trading.api.symbol_data import (
 from octobot_trading.api.trades import (
     get_trade_history,
     get_completed_pnl_history,
+    get_realised_pnl_by_symbol,
+    get_completed_trades_count_by_symbol,
     get_trade_pnl,
     is_executed_trade,
     is_trade_after_or_at,
@@ -256,6 +259,7 @@ __all__ = [
     "get_symbol_candles_manager",
     "get_symbol_historical_candles",
     "create_preloaded_candles_manager",
+    "create_preloaded_candles_manager_from_arrays",
     "are_symbol_candles_initialized",
     "get_candles_as_list",
     "get_candle_as_list",
@@ -277,6 +281,8 @@ __all__ = [
     "get_config_symbols",
     "get_trade_history",
     "get_completed_pnl_history",
+    "get_realised_pnl_by_symbol",
+    "get_completed_trades_count_by_symbol",
     "get_trade_pnl",
     "is_executed_trade",
     "is_trade_after_or_at",
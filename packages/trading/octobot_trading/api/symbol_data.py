@@ -45,6 +45,13 @@ async def create_preloaded_candles_manager(preloaded_candles):
     return candles_manager
 
 
+async def create_preloaded_candles_manager_from_arrays(preloaded_candle_arrays: dict):
+    candles_manager = exchange_data.PreloadedCandlesManager()
+    await candles_manager.initialize()
+    candles_manager.replace_all_candle_arrays(preloaded_candle_arrays)
+    return candles_manager
+
+
 def are_symbol_candles_initialized(exchange_manager, symbol, time_frame) -> bool:
     try:
         return get_symbol_candles_manager(
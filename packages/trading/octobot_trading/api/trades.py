@@ -39,6 +39,16 @@ def get_completed_pnl_history(exchange_manager, quote=None, symbol=None, since=N
     )
 
 
+def get_realised_pnl_by_symbol(exchange_manager, since=0) -> dict:
+    return exchange_manager.exchange_personal_data.trades_manager.get_realised_pnl_by_symbol(since=since)
+
+
+def get_completed_trades_count_by_symbol(exchange_manager, winning=None) -> dict:
+    return exchange_manager.exchange_personal_data.trades_manager.get_completed_trades_count_by_symbol(
+        winning=winning
+    )
+
+
 def get_trade_pnl(
     exchange_manager, trade_id: typing.Optional[str] = None, order_id: typing.Optional[str] = None
 ) -> typing.Optional[personal_data.TradePnl]:
@@ -104,6 +104,10 @@ USE_AUTHENTICATED_EXCHANGE_REQUESTS_ONLY_PROXY = os_util.parse_boolean_environme
 ENABLE_CCXT_VERBOSE = os_util.parse_boolean_environment_var("ENABLE_CCXT_VERBOSE", "False")
 ENABLE_CCXT_RATE_LIMIT = os_util.parse_boolean_environment_var("ENABLE_CCXT_RATE_LIMIT", "True")
 ENABLE_CCXT_REQUESTS_COUNTER = os_util.parse_boolean_environment_var("ENABLE_CCXT_REQUESTS_COUNTER", "False")
+# share HTTP connection pools between the ccxt clients of the same exchange
+USE_SHARED_EXCHANGE_HTTP_SESSIONS = os_util.parse_boolean_environment_var("USE_SHARED_EXCHANGE_HTTP_SESSIONS", "False")
+SHARED_EXCHANGE_HTTP_SESSIONS_CONNECTIONS_LIMIT = int(os.getenv("SHARED_EXCHANGE_HTTP_SESSIONS_CONNECTIONS_LIMIT", "100"))
+SHARED_EXCHANGE_HTTP_SESSIONS_KEEPALIVE_TIMEOUT = float(os.getenv("SHARED_EXCHANGE_HTTP_SESSIONS_KEEPALIVE_TIMEOUT", "30"))
 FETCH_MIN_EXCHANGE_MARKETS = os_util.parse_boolean_environment_var("FETCH_MIN_EXCHANGE_MARKETS", "False")
 CCXT_DEFAULT_CACHE_LIMIT = int(os.getenv("CCXT_DEFAULT_CACHE_LIMIT", "1000"))  # 1000: default ccxt value
 CCXT_TRADES_CACHE_LIMIT = int(os.getenv("CCXT_TRADES_CACHE_LIMIT", str(CCXT_DEFAULT_CACHE_LIMIT)))
@@ -112,7 +116,14 @@ CCXT_OHLCV_CACHE_LIMIT = int(os.getenv("CCXT_OHLCV_CACHE_LIMIT", str(CCXT_DEFAUL
 CCXT_WATCH_ORDER_BOOK_LIMIT = int(os.getenv("CCXT_WATCH_ORDER_BOOK_LIMIT", str(CCXT_DEFAULT_CACHE_LIMIT)))
 CCXT_TIMEOUT_ON_EXIT_MS = 100
 THROTTLED_WS_UPDATES = float(os.getenv("THROTTLED_WS_UPDATES", "0.1"))  # avoid spamming CPU
-MAX_CANDLES_IN_RAM = int(os.getenv("MAX_CANDLES_IN_RAM", "3000"))    # max candles per CandlesManager
+# when supported by the exchange, watch tickers and candles of many symbols using a single websocket feed
+MULTIPLEX_WS_SYMBOLS_FEEDS = os_util.parse_boolean_environment_var("MULTIPLEX_WS_SYMBOLS_FEEDS", "True")
+# max candles to fetch from REST when filling websocket candles gaps
+WS_CANDLES_RESYNC_MAX_CANDLES = int(os.getenv("WS_CANDLES_RESYNC_MAX_CANDLES", "500"))
+# max candles per CandlesManager when tentacles are not requiring a candles count
+MAX_CANDLES_IN_RAM = int(os.getenv("MAX_CANDLES_IN_RAM", "3000"))
+# initial candles capacity of a CandlesManager, grown up to its max candles count when required
+INITIAL_CANDLES_CAPACITY_IN_RAM = int(os.getenv("INITIAL_CANDLES_CAPACITY_IN_RAM", "100"))
 STORAGE_ORIGIN_VALUE = "origin_value"
 DISPLAY_TIME_FRAME = commons_enums.TimeFrames.ONE_HOUR
 DEFAULT_SUBACCOUNT_ID = "default_subaccount_id"
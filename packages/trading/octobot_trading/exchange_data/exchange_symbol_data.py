@@ -89,7 +89,7 @@ class ExchangeSymbolData:
             )
             if symbol_candles is not None:
                 return symbol_candles
-        # If set, use exchange required_historical_candles_count as it is asked in configuration
+        # keep the candles count required by activated tentacles, MAX_CANDLES_IN_RAM is used when not set
         symbol_candles = candles_manager.CandlesManager(
             max_candles_count=self.exchange_manager.exchange_config.required_historical_candles_count
         )
@@ -15,7 +15,6 @@
 #  License along with this library.
 import numpy as np
 
-import octobot_commons.data_util as data_util
 import octobot_commons.enums as enums
 import octobot_commons.logging as logging
 
@@ -24,16 +23,29 @@ import octobot_trading.constants as constants
 
 
 class CandlesManager(util.Initializable):
+    # used when no candles count is required
     MAX_CANDLES_COUNT = constants.MAX_CANDLES_IN_RAM
+    # initially fetched candles should always fit
+    MIN_CANDLES_COUNT = constants.DEFAULT_CANDLE_HISTORY_SIZE
+    INITIAL_CANDLES_CAPACITY = constants.INITIAL_CANDLES_CAPACITY_IN_RAM
+    CANDLES_ROWS_COUNT = 6
+    # price index of each row of the candles buffer
+    BUFFER_PRICE_INDEXES = (
+        enums.PriceIndexes.IND_PRICE_CLOSE.value,
+        enums.PriceIndexes.IND_PRICE_OPEN.value,
+        enums.PriceIndexes.IND_PRICE_HIGH.value,
+        enums.PriceIndexes.IND_PRICE_LOW.value,
+        enums.PriceIndexes.IND_PRICE_TIME.value,
+        enums.PriceIndexes.IND_PRICE_VOL.value,
+    )
+    BUFFER_TIME_ROW = 4
 
     def __init__(self, max_candles_count=None):
         super().__init__()
         self.logger: logging.BotLogger = logging.get_logger(self.__class__.__name__)
 
         self.candles_initialized: bool = False
-        self.max_candles_count: int = max_candles_count \
-            if max_candles_count and max_candles_count > self.__class__.MAX_CANDLES_COUNT \
-            else self.__class__.MAX_CANDLES_COUNT
+        self.max_candles_count: int = self.get_max_candles_count(max_candles_count)
 
         self.close_candles_index: int = 0
         self.open_candles_index: int = 0
@@ -47,14 +59,26 @@ class CandlesManager(util.Initializable):
         self.low_candles: np.ndarray = None # type: ignore
         self.time_candles: np.ndarray = None # type: ignore
         self.volume_candles: np.ndarray = None # type: ignore
+        # candle arrays are rows of this buffer, it is grown up to max_candles_count as candles are added
+        self._candles_buffer: np.ndarray = None # type: ignore
 
         self.reached_max: bool = False
         self._reset_candles()
 
+    @classmethod
+    def get_max_candles_count(cls, required_candles_count) -> int:
+        """
+        :param required_candles_count: the candles count required by tentacles, ignored when not positive
+        :return: the maximum count of candles to keep in RAM
+        """
+        if required_candles_count is None or required_candles_count <= 0:
+            return cls.MAX_CANDLES_COUNT
+        return max(required_candles_count, cls.MIN_CANDLES_COUNT)
+
     async def initialize_impl(self):
         self._reset_candles()
 
-    def _reset_candles(self):
+    def _reset_candles(self, capacity=None):
         self.candles_initialized = False
         self.reached_max = False
 
@@ -65,12 +89,28 @@ class CandlesManager(util.Initializable):
         self.time_candles_index = 0
         self.volume_candles_index = 0
 
-        self.close_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.open_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.high_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.low_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.time_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.volume_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
+        self._set_candles_buffer(np.full(
+            (self.CANDLES_ROWS_COUNT, self._get_capacity(capacity or self.INITIAL_CANDLES_CAPACITY)),
+            fill_value=np.nan, dtype=np.float64
+        ))
+
+    def _get_capacity(self, required_capacity):
+        return max(1, min(required_capacity, self.max_candles_count))
+
+    def _set_candles_buffer(self, candles_buffer):
+        self._candles_buffer = candles_buffer
+        (
+            self.close_candles, self.open_candles, self.high_candles,
+            self.low_candles, self.time_candles, self.volume_candles
+        ) = candles_buffer
+
+    def _grow_candles_buffer(self):
+        current_capacity = self._candles_buffer.shape[1]
+        candles_buffer = np.full(
+            (self.CANDLES_ROWS_COUNT, self._get_capacity(current_capacity * 2)), fill_value=np.nan, dtype=np.float64
+        )
+        candles_buffer[:, :current_capacity] = self._candles_buffer
+        self._set_candles_buffer(candles_buffer)
 
     # getters
     def get_symbol_candles_count(self):
@@ -123,7 +163,11 @@ class CandlesManager(util.Initializable):
         return candles
 
     def replace_all_candles(self, all_candles_data):
-        self._reset_candles()
+        # reserve space for the given candles and the next one
+        self._reset_candles(
+            capacity=len(all_candles_data) + 1
+            if all_candles_data and isinstance(all_candles_data[-1], list) else None
+        )
         self._set_all_candles(all_candles_data)
         self.candles_initialized = True
 
@@ -143,10 +187,28 @@ class CandlesManager(util.Initializable):
 
     def add_old_and_new_candles(self, candles_data):
         """
-        Same as add_new_candle but also checks if old candles are missing
+        Same as add_new_candle but also checks if old candles are missing.
+        Missing candles older than the latest candle are merged at their place in time.
         :param candles_data: new candles data
         :return:
         """
+        last_candle_time = self._get_last_candle_time()
+        missing_older_candles = [
+            candle
+            for candle in candles_data
+            if candle[enums.PriceIndexes.IND_PRICE_TIME.value] < last_candle_time
+            and candle[enums.PriceIndexes.IND_PRICE_TIME.value] not in self.time_candles
+        ]
+        if missing_older_candles:
+            self._merge_older_candles(missing_older_candles)
+            # only newer candles are left to add
+            candles_data = [
+                candle
+                for candle in candles_data
+                if candle[enums.PriceIndexes.IND_PRICE_TIME.value] > last_candle_time
+            ]
+            if not candles_data:
+                return
         # check old candles
         for old_candle in candles_data[:-1]:
             if old_candle[enums.PriceIndexes.IND_PRICE_TIME.value] not in self.time_candles:
@@ -176,6 +238,43 @@ class CandlesManager(util.Initializable):
                 self.logger.error(f"Fail to add new candle {new_candle_data} : {e}")
 
     # private
+    def _get_last_candle_time(self):
+        time_candles = self.get_symbol_time_candles(1)
+        return time_candles[-1] if len(time_candles) else -np.inf
+
+    def _merge_older_candles(self, older_candles):
+        candles_count = self.max_candles_count if self.reached_max else self.time_candles_index
+        merged_candles = np.concatenate(
+            (
+                self._candles_buffer[:, :candles_count],
+                np.array(
+                    [
+                        [candle[price_index] for price_index in self.BUFFER_PRICE_INDEXES]
+                        for candle in older_candles
+                    ],
+                    dtype=np.float64
+                ).T
+            ),
+            axis=1
+        )
+        # keep candles sorted by time, drop the oldest ones when exceeding max_candles_count
+        merged_candles = merged_candles[
+            :, np.argsort(merged_candles[self.BUFFER_TIME_ROW], kind="stable")
+        ][:, -self.max_candles_count:]
+        merged_candles_count = merged_candles.shape[1]
+        candles_initialized = self.candles_initialized
+        self._reset_candles(capacity=merged_candles_count + 1)
+        self.candles_initialized = candles_initialized
+        self._candles_buffer[:, :merged_candles_count] = merged_candles
+        self.reached_max = merged_candles_count >= self.max_candles_count
+        candles_index = merged_candles_count - 1 if self.reached_max else merged_candles_count
+        self.close_candles_index = candles_index
+        self.open_candles_index = candles_index
+        self.high_candles_index = candles_index
+        self.low_candles_index = candles_index
+        self.time_candles_index = candles_index
+        self.volume_candles_index = candles_index
+
     def _set_all_candles(self, new_candles_data):
         if isinstance(new_candles_data[-1], list):
             for candle_data in new_candles_data:
@@ -184,12 +283,9 @@ class CandlesManager(util.Initializable):
             self.add_new_candle(new_candles_data)
 
     def _change_current_candle(self):
-        self.close_candles = data_util.shift_value_array(self.close_candles, -1, np.nan, np.float64)
-        self.open_candles = data_util.shift_value_array(self.open_candles, -1, np.nan, np.float64)
-        self.high_candles = data_util.shift_value_array(self.high_candles, -1, np.nan, np.float64)
-        self.low_candles = data_util.shift_value_array(self.low_candles, -1, np.nan, np.float64)
-        self.volume_candles = data_util.shift_value_array(self.volume_candles, -1, np.nan, np.float64)
-        self.time_candles = data_util.shift_value_array(self.time_candles, -1, np.nan, np.float64)
+        # shift every candle array at once, in place
+        self._candles_buffer[:, :-1] = self._candles_buffer[:, 1:]
+        self._candles_buffer[:, -1] = np.nan
 
     def _should_add_new_candle(self, new_open_time):
         return new_open_time not in self.time_candles
@@ -206,6 +302,8 @@ class CandlesManager(util.Initializable):
             self.low_candles_index += 1
             self.time_candles_index += 1
             self.volume_candles_index += 1
+            if self.time_candles_index >= len(self.time_candles):
+                self._grow_candles_buffer()
         else:
             self.reached_max = True
 
@@ -69,7 +69,7 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
                     elif self.require_last_init_candles_pairs_push:
                         # triggered on first iteration to initialize large candles that might be pushed much later
                         # otherwise but are required to complete TA evaluation
-                        if time_frame.value in self.last_candles_by_pair_by_time_frame[pair]:
+                        if time_frame.value in self.last_candles_by_pair_by_time_frame.get(pair, {}):
                             await self.push(time_frame,
                                             pair,
                                             [self.last_candles_by_pair_by_time_frame[pair][time_frame.value][-1]],
@@ -124,6 +124,20 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
             return True
         return False
 
+    async def modify(self, added_pairs=None, removed_pairs=None):
+        # traded and watched pairs can be updated during backtesting
+        previous_pairs = self.traded_pairs
+        removed_pairs = removed_pairs or []
+        self.traded_pairs = [pair for pair in self._get_traded_pairs() if pair not in removed_pairs]
+        if not self.is_initialized:
+            # added pairs history will be loaded on start
+            return
+        for pair in self.traded_pairs:
+            if pair not in previous_pairs:
+                for time_frame in self.traded_time_frame:
+                    # load candles up to the current backtesting time: next candles will be pushed on time updates
+                    await self._load_historical_candles(time_frame, pair, self.last_timestamp_pushed)
+
     async def pause(self):
         await util.pause_time_consumer(self)
 
@@ -134,26 +148,40 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
         await util.resume_time_consumer(self, self.handle_timestamp)
 
     def _get_traded_pairs(self):
-        return api.get_available_symbols(self.exchange_data_importer)
+        # only read data file pairs that are traded or watched: a data file can contain many other pairs
+        exchange_config = self.channel.exchange_manager.exchange_config
+        required_pairs = set(exchange_config.traded_symbol_pairs).union(
+            exchange_config.watched_pairs, exchange_config.additional_traded_pairs
+        )
+        return [
+            pair
+            for pair in api.get_available_symbols(self.exchange_data_importer)
+            if pair in required_pairs
+        ]
 
     def _get_time_frames(self, *_):
         return self.channel.exchange_manager.exchange.get_time_frames(self.exchange_data_importer)
 
     async def _initialize_candles(self, time_frame, pair, should_retry):
+        # only load candles starting from the star time of the backtesting
+        if await self._load_historical_candles(time_frame, pair, self.initial_timestamp):
+            self.require_last_init_candles_pairs_push = True
+        # self.initial_timestamp - 1 to re-select this candle and push it when init step will be over
+        self.last_timestamp_pushed = self.initial_timestamp - 1
+
+    async def _load_historical_candles(self, time_frame, pair, timestamp) -> bool:
         # fetch history
         ohlcv_data = None
         try:
-            # only load candles starting from the star time of the backtesting
             ohlcv_data: list = await self.exchange_data_importer.get_ohlcv_from_timestamps(
                 exchange_name=self.exchange_name,
                 symbol=pair,
                 time_frame=time_frame,
                 limit=self.HISTORICAL_OHLCV_LIMIT,
-                inferior_timestamp=self.initial_timestamp,
-                superior_timestamp=self.initial_timestamp)
+                inferior_timestamp=timestamp,
+                superior_timestamp=timestamp)
             candles_len = len(ohlcv_data)
-            self.logger.info(f"Loaded pre-backtesting starting timestamp historical "
-                             f"candles for: {pair} in {time_frame}: {candles_len} "
+            self.logger.info(f"Loaded historical candles until {timestamp} for: {pair} in {time_frame}: {candles_len} "
                              f"candle{'s' if candles_len > 1 else ''}")
         except Exception as e:
             self.logger.exception(e, True, f"Error while fetching historical candles: {e}")
@@ -168,6 +196,5 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
                                        partial=False,
                                        upsert=False)
             self.last_candles_by_pair_by_time_frame[pair][time_frame.value] = ohlcv_data[-1]
-            self.require_last_init_candles_pairs_push = True
-        # self.initial_timestamp - 1 to re-select this candle and push it when init step will be over
-        self.last_timestamp_pushed = self.initial_timestamp - 1
+            return True
+        return False
@@ -52,6 +52,20 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         self.time_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_TIME.value)
         self.volume_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_VOL.value)
 
+    def replace_all_candle_arrays(self, candle_arrays: dict):
+        """
+        Columnar version of replace_all_candles: candle arrays are used as is when already float64 arrays
+        :param candle_arrays: candles as a dict of arrays by PriceIndexes value
+        """
+        self._reset_candles()
+        self.close_candles = np.asarray(candle_arrays[enums.PriceIndexes.IND_PRICE_CLOSE.value], dtype=np.float64)
+        self.open_candles = np.asarray(candle_arrays[enums.PriceIndexes.IND_PRICE_OPEN.value], dtype=np.float64)
+        self.high_candles = np.asarray(candle_arrays[enums.PriceIndexes.IND_PRICE_HIGH.value], dtype=np.float64)
+        self.low_candles = np.asarray(candle_arrays[enums.PriceIndexes.IND_PRICE_LOW.value], dtype=np.float64)
+        self.time_candles = np.asarray(candle_arrays[enums.PriceIndexes.IND_PRICE_TIME.value], dtype=np.float64)
+        self.volume_candles = np.asarray(candle_arrays[enums.PriceIndexes.IND_PRICE_VOL.value], dtype=np.float64)
+        self.candles_initialized = True
+
     def _get_candle_values_array(self, candles, key):
         return np.array([candle[key] for candle in candles], dtype=np.float64)
 
@@ -100,7 +114,7 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
     def add_new_candle(self, new_candle_data):
         self.logger.error("add_new_candle should not be called")
 
-    def _reset_candles(self):
+    def _reset_candles(self, capacity=None):
         self.candles_initialized = False
 
         self.close_candles_index = 0
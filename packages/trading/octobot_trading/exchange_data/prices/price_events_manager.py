@@ -17,6 +17,8 @@ import asyncio
 import decimal
 import typing
 
+import sortedcontainers
+
 import octobot_commons.logging as logging
 from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
 
@@ -25,19 +27,32 @@ class PriceEventsManager:
     """
     Manage price events for a specific price and timestamp
     Mainly used for updating Order status
+    Events are indexed by price to only visit the events triggered by a price
     """
 
     """
     The price event index from a price event tuple
     """
     PRICE_EVENT_INDEX = 2
+    """
+    The price index from a price event tuple
+    """
+    PRICE_INDEX = 0
     PRICE_KEY = "price"
     TIME_KEY = "time"
     MAX_LAST_RECENT_PRICES = 50
 
     def __init__(self):
         self.logger: logging.BotLogger = logging.get_logger(self.__class__.__name__)
-        self.events: list[tuple[decimal.Decimal, int, asyncio.Event, bool]] = []
+        # events waiting for a price above or equal to their price, sorted by price
+        self._trigger_above_events: sortedcontainers.SortedKeyList = sortedcontainers.SortedKeyList(
+            key=_get_event_price
+        )
+        # events waiting for a price below or equal to their price, sorted by price
+        self._trigger_below_events: sortedcontainers.SortedKeyList = sortedcontainers.SortedKeyList(
+            key=_get_event_price
+        )
+        self._price_event_by_event: dict[asyncio.Event, tuple[decimal.Decimal, int, asyncio.Event, bool]] = {}
         self._last_recent_prices: list[dict[str, typing.Union[decimal.Decimal, int]]] = []
 
     def stop(self):
@@ -48,7 +63,16 @@ class PriceEventsManager:
         Reset price events
         """
         self.clear_recent_prices()
-        self.events.clear()
+        self._trigger_above_events.clear()
+        self._trigger_below_events.clear()
+        self._price_event_by_event.clear()
+
+    @property
+    def events(self) -> list[tuple[decimal.Decimal, int, asyncio.Event, bool]]:
+        """
+        :return: the waiting price events
+        """
+        return [*self._trigger_above_events, *self._trigger_below_events]
 
     def get_min_and_max_prices(self) -> (float, float):
         if len(self._last_recent_prices) < 2:
@@ -115,7 +139,8 @@ class PriceEventsManager:
             price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX].set()
         else:
             # this event will be set when conditions are met
-            self.events.append(price_event_tuple)
+            self._price_event_by_event[price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]] = price_event_tuple
+            self._get_events_list(trigger_above).add(price_event_tuple)
         return price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]
 
     def _is_triggered_by_last_recent_prices(self, price, timestamp, trigger_above):
@@ -156,9 +181,11 @@ class PriceEventsManager:
         Remove the event from events list
         :param event_to_remove: the event to remove
         """
-        for price_event_data in self.events:
-            if event_to_remove in price_event_data:
-                return self.events.remove(price_event_data)
+        if (price_event_data := self._price_event_by_event.pop(event_to_remove, None)) is not None:
+            self._get_events_list(price_event_data[-1]).remove(price_event_data)
+
+    def _get_events_list(self, trigger_above):
+        return self._trigger_above_events if trigger_above else self._trigger_below_events
 
     def _check_events(self, price, timestamp):
         """
@@ -169,15 +196,20 @@ class PriceEventsManager:
         """
         return [
             event
-            for event_price, event_timestamp, event, trigger_above in self.events
-            if event_timestamp <= timestamp and
-            (
-                (trigger_above and event_price <= price) or
-                (not trigger_above and event_price >= price)
+            for _, event_timestamp, event, _ in (
+                # trigger above events with a price lower or equal to price
+                *self._trigger_above_events.irange_key(max_key=price),
+                # trigger below events with a price higher or equal to price
+                *self._trigger_below_events.irange_key(min_key=price),
             )
+            if event_timestamp <= timestamp
         ]
 
 
+def _get_event_price(price_event_tuple):
+    return price_event_tuple[PriceEventsManager.PRICE_INDEX]
+
+
 def _new_price_event(price, timestamp, trigger_above):
     """
     Create a new price event item
@@ -79,7 +79,7 @@ class TickerUpdater(ticker_channel.TickerProducer):
             try:
                 pairs = self._get_pairs_to_update()
                 if self.enable_short_refresh_time:
-                    self.logger.debug(f"Triggering ticker update for {len(pairs)} pairs: {pairs}")
+                    self.logger.debug("Triggering ticker update for %s pairs: %s", len(pairs), pairs)
                 for pair in pairs:
                     await self._fetch_ticker(pair)
 
@@ -109,12 +109,12 @@ class TickerUpdater(ticker_channel.TickerProducer):
                 if self._is_valid(ticker):
                     await self.push(pair, ticker)
                 else:
-                    self.logger.debug(f"Ignored incomplete ticker: {ticker}")
+                    self.logger.debug("Ignored incomplete ticker: %s", ticker)
             else:
-                self.logger.debug(f"Skipping {pair} ticker update request: an update is already processing")
+                self.logger.debug("Skipping %s ticker update request: an update is already processing", pair)
 
     async def trigger_ticker_update(self, symbol: str):
-        self.logger.debug(f"Triggered ticker update for {symbol}")
+        self.logger.debug("Triggered ticker update for %s", symbol)
         await self.fetch_and_push_pair(symbol)
 
     async def fetch_all_tickers(self, symbols: typing.Optional[list[str]]) -> dict[str, dict]:
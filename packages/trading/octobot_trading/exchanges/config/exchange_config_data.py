@@ -188,6 +188,9 @@ class ExchangeConfig(util.Initializable):
     ):
         # All channels with a modify() method should be added here
         watch_only_channels_to_notify = [trading_constants.TICKER_CHANNEL]
+        if self.exchange_manager.is_backtesting:
+            # backtesting watched pairs candles are read from data files by the OHLCV updater
+            watch_only_channels_to_notify.append(trading_constants.OHLCV_CHANNEL)
         traded_channels_to_notify_when_no_websocket = exchange_channel.get_to_notify_on_traded_symbols_update_channels(
             self.exchange_manager.id
         )
@@ -42,6 +42,7 @@ import octobot_trading.errors as errors
 import octobot_trading.exchanges.connectors.ccxt.constants as ccxt_constants
 import octobot_trading.exchanges.connectors.ccxt.enums as ccxt_enums
 import octobot_trading.exchanges.connectors.ccxt.ccxt_clients_cache as ccxt_clients_cache
+import octobot_trading.exchanges.connectors.ccxt.ccxt_shared_sessions as ccxt_shared_sessions
 import octobot_trading.exchanges.config.exchange_proxy_config as exchange_proxy_config
 import octobot_trading.exchanges.config.exchange_credentials_data as exchange_credentials_data
 import octobot_trading.exchanges.util.exchange_util as exchange_util
@@ -115,6 +116,7 @@ def create_client(
 
 async def close_client(client):
     await client.close()
+    await ccxt_shared_sessions.close_unused_sessions()
 
 
 def get_unauthenticated_exchange(
@@ -134,11 +136,15 @@ def instantiate_exchange(
 ) -> async_ccxt.Exchange:
     client = exchange_class(config)
     _use_proxy_if_necessary(client, proxy_config)
+    uses_socks_proxy = proxy_config.socks_proxy or proxy_config.socks_proxy_callback
     if constants.ENABLE_CCXT_REQUESTS_COUNTER and allow_request_counter:
-        if proxy_config.socks_proxy or proxy_config.socks_proxy_callback:
+        if uses_socks_proxy:
             _get_logger().error("socks proxy and request counter can't yet be used together.")
         else:
             _use_request_counter(identifier, client, proxy_config)
+    elif constants.USE_SHARED_EXCHANGE_HTTP_SESSIONS and not uses_socks_proxy:
+        # socks proxies use their own sessions
+        _use_shared_session(client)
     return client
 
 
@@ -464,6 +470,24 @@ async def _close_previous_session_and_connector(session, connector):
         await session.close()
 
 
+def _use_shared_session(ccxt_client: async_ccxt.Exchange):
+    """
+    Replaces the given exchange async session by the one shared with other clients of this exchange
+    WARNING: should only be called right after creating the exchange and on the same async loop as
+    the one the exchange will be using
+    """
+    try:
+        # create ssl context and other required elements without creating the client's own session
+        ccxt_client.own_session = False
+        ccxt_client.open()
+    except RuntimeError as err:
+        # no running loop: the client will create its own session
+        ccxt_client.own_session = True
+        _get_logger().debug(f"Can't use shared session for {ccxt_client.id}: {err}")
+        return
+    ccxt_shared_sessions.use_shared_session(ccxt_client)
+
+
 def _use_request_counter(
     identifier: str, ccxt_client: async_ccxt.Exchange, proxy_config: exchange_proxy_config.ExchangeProxyConfig
 ):
@@ -0,0 +1,83 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import weakref
+
+import aiohttp
+import ccxt.async_support as async_ccxt
+
+import octobot_trading.constants as constants
+
+
+class _SharedSession:
+    def __init__(self, session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop):
+        self.session: aiohttp.ClientSession = session
+        self.loop: asyncio.AbstractEventLoop = loop
+        self.clients: weakref.WeakSet = weakref.WeakSet()
+
+    def is_used(self) -> bool:
+        # closed clients reset their session
+        return any(client.session is self.session for client in self.clients)
+
+
+# HTTP sessions by exchange and session settings, shared between ccxt clients.
+# Each client keeps its own rate limiter.
+_SHARED_SESSIONS: dict[tuple, _SharedSession] = {}
+
+
+def use_shared_session(client: async_ccxt.Exchange) -> None:
+    """
+    Makes the given client use the HTTP session shared by clients of the same exchange and session settings.
+    The client asyncio_loop and ssl_context have to be set.
+    """
+    key = _get_session_key(client)
+    shared_session = _SHARED_SESSIONS.get(key)
+    if shared_session is None or shared_session.loop is not client.asyncio_loop or shared_session.session.closed:
+        shared_session = _SHARED_SESSIONS[key] = _SharedSession(_create_session(client), client.asyncio_loop)
+    shared_session.clients.add(client)
+    # a session which is not owned by the client is not closed by the client
+    client.own_session = False
+    client.session = shared_session.session
+
+
+async def close_unused_sessions() -> None:
+    """
+    Closes the shared sessions that are not used by any open client anymore
+    """
+    loop = asyncio.get_running_loop()
+    for key, shared_session in list(_SHARED_SESSIONS.items()):
+        if shared_session.is_used():
+            continue
+        if shared_session.loop.is_closed():
+            # can't close a session of a closed loop
+            _SHARED_SESSIONS.pop(key)
+        elif shared_session.loop is loop:
+            _SHARED_SESSIONS.pop(key)
+            await shared_session.session.close()
+
+
+def _get_session_key(client: async_ccxt.Exchange) -> tuple:
+    return client.id, client.aiohttp_trust_env, client.verify, client.cafile, id(client.asyncio_loop)
+
+
+def _create_session(client: async_ccxt.Exchange) -> aiohttp.ClientSession:
+    # same as in ccxt.async_support.exchange.py#open(), using shared connections settings
+    connector = aiohttp.TCPConnector(
+        ssl=client.ssl_context, loop=client.asyncio_loop, enable_cleanup_closed=True,
+        limit=constants.SHARED_EXCHANGE_HTTP_SESSIONS_CONNECTIONS_LIMIT,
+        keepalive_timeout=constants.SHARED_EXCHANGE_HTTP_SESSIONS_KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(loop=client.asyncio_loop, connector=connector, trust_env=client.aiohttp_trust_env)
@@ -104,6 +104,13 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
         trading_enums.WebsocketFeeds.TRADE,
         trading_enums.WebsocketFeeds.POSITION,
     ]
+    # feeds that can be watched for many symbols using a single subscription, used when supported by the exchange
+    MULTI_SYMBOLS_FEED_GENERATORS = {
+        Feeds.TICKER: "watchTickers",
+        Feeds.CANDLE: "watchOHLCVForSymbols",
+        Feeds.KLINE: "watchOHLCVForSymbols",
+    }
+    USE_MULTI_SYMBOLS_FEEDS = trading_constants.MULTIPLEX_WS_SYMBOLS_FEEDS
     EXCHANGE_CONSTRUCTOR_KWARGS = {}
     SHORT_RECONNECT_DELAY = 0.5
     LONG_RECONNECT_DELAY = 5
@@ -121,6 +128,7 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
         self.watched_pairs: list[str] = []
         self.min_timeframe: typing.Optional[commons_enums.TimeFrames] = None
         self._previous_open_candles: dict[str, dict[str, dict]] = {}
+        self._last_pushed_closed_candle_times: dict[str, dict[str, float]] = {}
         self._subsequent_unordered_candles_count: dict[
             str, dict[str, tuple[int, float]]
         ] = {}  # dict values: tuple(candle_count, candle_time)
@@ -159,6 +167,10 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
         )
         self.client: ccxt.Exchange = None  # type: ignore # ccxt.pro exchange: a ccxt.async_support exchange with websocket capabilities
         self.feed_tasks: dict[str, asyncio.Task] = {}
+        # symbols already watched by multi symbols feeds, by feed generator and time frame
+        self._multi_symbols_feeds_symbols: dict[str, set[str]] = {}
+        # (time_frame, symbol) of candle feeds that reconnected and might have missed candles
+        self._candles_to_resync: set[tuple[str, str]] = set()
         self._last_close_time: float = 0
         self._last_message_time: float = 0
         self.throttled_ws_updates: float = trading_constants.THROTTLED_WS_UPDATES
@@ -550,6 +562,40 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
             Feeds.CANCEL_ORDER: self._get_generator("watchCancelOrder"),
         }
 
+    def _get_multi_symbols_feed_generator(self, feed):
+        if not self.USE_MULTI_SYMBOLS_FEEDS or feed not in self.MULTI_SYMBOLS_FEED_GENERATORS:
+            return Feeds.UNSUPPORTED
+        return self._get_generator(self.MULTI_SYMBOLS_FEED_GENERATORS[feed])
+
+    def _get_multi_symbols_callback_by_feed(self):
+        return {
+            Feeds.TICKER: self.tickers,
+            Feeds.CANDLE: self.candles,
+            Feeds.KLINE: self.candles,
+        }
+
+    @staticmethod
+    def _is_multi_symbols_feed(g_kwargs) -> bool:
+        return "symbols" in g_kwargs or "symbolsAndTimeframes" in g_kwargs
+
+    def _get_feed_watch_func(self, feed, g_kwargs):
+        if self._is_multi_symbols_feed(g_kwargs):
+            return self._get_multi_symbols_feed_generator(feed)
+        return self._get_feed_generator_by_feed()[feed]
+
+    @staticmethod
+    def _get_feed_symbols_and_time_frames(g_kwargs) -> list[tuple[str, typing.Optional[str]]]:
+        if "symbolsAndTimeframes" in g_kwargs:
+            return [
+                (symbol, time_frame)
+                for symbol, time_frame in g_kwargs["symbolsAndTimeframes"]
+            ]
+        if "symbols" in g_kwargs:
+            return [(symbol, g_kwargs.get("timeframe")) for symbol in g_kwargs["symbols"]]
+        if "symbol" in g_kwargs:
+            return [(g_kwargs["symbol"], g_kwargs.get("timeframe"))]
+        return []
+
     def _get_generator(self, method_name):
         return (
             getattr(self.client, method_name)
@@ -631,10 +677,19 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
             kwargs["limit"] = limit
         if params is not None:
             kwargs["params"] = params
-        if symbols is not None:
+        multi_symbols_feed_generator = (
+            Feeds.UNSUPPORTED if symbols is None else self._get_multi_symbols_feed_generator(feed)
+        )
+        if multi_symbols_feed_generator is not Feeds.UNSUPPORTED:
+            # one task for every symbols: all symbols are watched using the same subscription
+            added_subscriptions = self._subscribe_multi_symbols_feed(
+                feed, multi_symbols_feed_generator, symbols, kwargs
+            )
+            has_added_feed = bool(added_subscriptions)
+        elif symbols is not None:
             for symbol in symbols:
                 kwargs["symbol"] = symbol
-                # one task per symbol: ccxt_pro is not handling multi symbol generators
+                # one task per symbol: the exchange is not handling multi symbol generators
                 if self._create_task_if_necessary(
                     feed, feed_callback, feed_generator, **kwargs
                 ):
@@ -660,6 +715,29 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                 f"No new feed to subscribe to on {feed.value} (inputs: {symbols_str}{time_frame_str})"
             )
 
+    def _subscribe_multi_symbols_feed(self, feed, feed_generator, symbols, kwargs) -> list[str]:
+        """
+        Subscribe a feed watching every given symbol that is not already watched by a multi symbols feed
+        :return: the newly watched symbols
+        """
+        time_frame = kwargs.pop("timeframe", None)
+        subscribed_symbols = self._multi_symbols_feeds_symbols.setdefault(
+            f"{feed_generator.__name__}{time_frame}", set()
+        )
+        new_symbols = [symbol for symbol in symbols if symbol not in subscribed_symbols]
+        if not new_symbols:
+            return []
+        if time_frame is None:
+            kwargs["symbols"] = new_symbols
+        else:
+            kwargs["symbolsAndTimeframes"] = [[symbol, time_frame] for symbol in new_symbols]
+        if self._create_task_if_necessary(
+            feed, self._get_multi_symbols_callback_by_feed()[feed], feed_generator, **kwargs
+        ):
+            subscribed_symbols.update(new_symbols)
+            return new_symbols
+        return []
+
     async def _feed_task(self, feed, callback, watch_func, *g_args, **g_kwargs):
         if not await self._wait_for_initialization(feed, *g_args, **g_kwargs):
             self.logger.error(
@@ -683,6 +761,12 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                 self._last_message_time = time.time()
                 if subsequent_disconnections > 0:
                     self.logger.debug(f"Reconnected to {ws_des}")
+                    if feed in self.CANDLE_TIME_FILTERED_CHANNELS:
+                        # candles might have been missed while disconnected
+                        self._candles_to_resync.update(
+                            (time_frame, symbol)
+                            for symbol, time_frame in self._get_feed_symbols_and_time_frames(g_kwargs)
+                        )
                 subsequent_disconnections = 0
                 already_got_closed_by_user_error = False
                 if update_data:
@@ -732,7 +816,7 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                 await asyncio.sleep(reconnect_delay)
                 self.logger.debug(f"Reconnecting to {ws_des}")
                 # self.client might have changed
-                watch_func = self._get_feed_generator_by_feed()[feed]
+                watch_func = self._get_feed_watch_func(feed, g_kwargs)
                 subsequent_disconnections += (
                     1  # wait for a longer time before the next reconnect
                 )
@@ -749,7 +833,7 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                 already_got_feed_stopping_error = True
                 await asyncio.sleep(self.LONG_RECONNECT_DELAY)  # avoid spamming
                 # self.client might have changed
-                watch_func = self._get_feed_generator_by_feed()[feed]
+                watch_func = self._get_feed_watch_func(feed, g_kwargs)
             except ccxt.NotSupported as err:
                 self.logger.exception(
                     err,
@@ -796,7 +880,7 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                     1  # wait for a longer time before the next reconnect
                 )
                 # self.client might have changed
-                watch_func = self._get_feed_generator_by_feed()[feed]
+                watch_func = self._get_feed_watch_func(feed, g_kwargs)
 
     def _create_task_if_necessary(self, feed, feed_callback, feed_generator, **kwargs):
         identifier = self._get_feed_identifier(feed_generator, kwargs)
@@ -811,16 +895,18 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
         return False
 
     async def _wait_for_initialization(self, feed, *g_args, **g_kwargs):
-        if (
-            not self.is_feed_requiring_init(feed)
-            or g_kwargs["symbol"] not in self.filtered_pairs
-        ):
+        symbols_and_time_frames = [
+            (symbol, time_frame)
+            for symbol, time_frame in self._get_feed_symbols_and_time_frames(g_kwargs)
             # no need to wait for pairs not in self.filtered_pairs
+            if symbol in self.filtered_pairs
+        ]
+        if not self.is_feed_requiring_init(feed) or not symbols_and_time_frames:
             return True
         is_initialized_func = None
         if feed is Feeds.CANDLE:
 
-            def candle_is_initialized_func():
+            def candle_is_initialized_func(symbol, time_frame):
                 if self.exchange_manager is None:
                     # Should only happen in tests / unusual environments. Or there is a real issue.
                     self.logger.error(
@@ -830,9 +916,9 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                 try:
                     return (
                         self.exchange_manager.exchange_symbols_data.get_exchange_symbol_data(
-                            g_kwargs["symbol"], allow_creation=False
+                            symbol, allow_creation=False
                         )
-                        .symbol_candles[commons_enums.TimeFrames(g_kwargs["timeframe"])]
+                        .symbol_candles[commons_enums.TimeFrames(time_frame)]
                         .candles_initialized
                     )
                 except KeyError:
@@ -841,7 +927,14 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
             is_initialized_func = candle_is_initialized_func
         if is_initialized_func is None:
             return True
-        if is_initialized_func():
+
+        def are_all_initialized():
+            return all(
+                is_initialized_func(symbol, time_frame)
+                for symbol, time_frame in symbols_and_time_frames
+            )
+
+        if are_all_initialized():
             return True
         self.logger.debug(
             f"Waiting for initialization before starting {feed.value} feed with {g_kwargs}"
@@ -851,7 +944,7 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
             not self.should_stop and time.time() - t0 < self.FEED_INITIALIZATION_TIMEOUT
         ):
             # add timeout
-            if is_initialized_func():
+            if are_all_initialized():
                 self.logger.debug(
                     f"Starting {feed.value} feed with {g_kwargs}: initialization complete"
                 )
@@ -860,7 +953,28 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
             await asyncio.sleep(
                 0.1 if time.time() - t0 < self.FEED_INITIALIZATION_TIMEOUT / 10 else 1
             )
-        return is_initialized_func()
+        if are_all_initialized():
+            return True
+        if "symbolsAndTimeframes" in g_kwargs:
+            # don't prevent initialized symbols from being watched: only exclude the uninitialized ones
+            uninitialized = [
+                [symbol, time_frame]
+                for symbol, time_frame in symbols_and_time_frames
+                if not is_initialized_func(symbol, time_frame)
+            ]
+            watched = [
+                symbol_and_time_frame
+                for symbol_and_time_frame in g_kwargs["symbolsAndTimeframes"]
+                if symbol_and_time_frame not in uninitialized
+            ]
+            if watched:
+                self.logger.error(
+                    f"Excluding {uninitialized} from {feed.value} feed: missing required initialization data"
+                )
+                # update the list in place: it is also used by the calling feed task
+                g_kwargs["symbolsAndTimeframes"][:] = watched
+                return True
+        return False
 
     def _get_feed_identifier(self, feed_generator, kwargs):
         # since is not part of the identifier as it depends on the start time
@@ -1015,6 +1129,15 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
             adapted,
         )
 
+    async def tickers(self, tickers: dict, symbols=None, **kwargs):
+        """
+        :param tickers: the ccxt tickers dict by symbol
+        :param symbols: the feed symbols
+        :param kwargs: the feed kwargs
+        """
+        for symbol, ticker in tickers.items():
+            await self.ticker(ticker, symbol=symbol, **kwargs)
+
     async def recent_trades(self, trades: list, symbol=None, **kwargs):
         """
         :param trades: the ccxt ticker list
@@ -1134,13 +1257,22 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                             # go to next candle in loop
                             continue
                 if is_previous_candle_closed:
-                    # OHLCV_CHANNEL only takes closed candles
-                    await self.push_to_channel(
-                        trading_constants.OHLCV_CHANNEL,
-                        time_frame,
-                        symbol,
-                        previous_candle,
-                    )
+                    if self._should_resync_candles(
+                        timeframe, symbol, time_frame, previous_candle_time, current_candle_time
+                    ):
+                        # previous candle might be outdated or followed by missing candles: fetch them
+                        self._schedule_candles_resync(
+                            time_frame, symbol, previous_candle, current_candle_time
+                        )
+                    else:
+                        # OHLCV_CHANNEL only takes closed candles
+                        self._register_last_pushed_closed_candle_time(timeframe, symbol, previous_candle_time)
+                        await self.push_to_channel(
+                            trading_constants.OHLCV_CHANNEL,
+                            time_frame,
+                            symbol,
+                            previous_candle,
+                        )
                 self._register_previous_open_candle(timeframe, symbol, candle)
             await self.push_to_channel(
                 trading_constants.KLINE_CHANNEL, time_frame, symbol, kline
@@ -1169,6 +1301,16 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
             }
             await self.push_to_channel(trading_constants.TICKER_CHANNEL, symbol, ticker)
 
+    async def candles(self, candles_by_symbol: dict, symbolsAndTimeframes=None, **kwargs):
+        """
+        :param candles_by_symbol: the ccxt ohlcv lists by time frame by symbol
+        :param symbolsAndTimeframes: the feed symbols and time frames
+        :param kwargs: the feed kwargs
+        """
+        for symbol, candles_by_time_frame in candles_by_symbol.items():
+            for timeframe, candles in candles_by_time_frame.items():
+                await self.candle(candles, symbol=symbol, timeframe=timeframe, **kwargs)
+
     async def funding(self, funding: dict, symbol=None, **kwargs):
         """
         Unsupported, feed list https://docs.ccxt.com/en/latest/ccxt.pro.manual.html?rtd_search=fetchLedger#prerequisites
@@ -1263,6 +1405,88 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
         # TODO update this when supported (ccxt is supporting it). Use watchLedger ?
         raise NotImplementedError("transaction callback is not implemented")
 
+    def _should_resync_candles(
+        self, time_frame, symbol, parsed_timeframe, previous_candle_time, current_candle_time
+    ) -> bool:
+        if (time_frame, symbol) in self._candles_to_resync:
+            self._candles_to_resync.discard((time_frame, symbol))
+            return True
+        # candles are missing between the previous and the current candle
+        return (
+            current_candle_time - previous_candle_time
+            > commons_enums.TimeFramesMinutes[parsed_timeframe] * commons_constants.MINUTE_TO_SECONDS
+        )
+
+    def _schedule_candles_resync(
+        self, time_frame, symbol, previous_candle, current_candle_time
+    ):
+        # REST requests are performed from the bot main loop
+        return asyncio.run_coroutine_threadsafe(
+            self._resync_candles(time_frame, symbol, previous_candle, current_candle_time),
+            self.bot_mainloop,
+        )
+
+    async def _resync_candles(
+        self, time_frame, symbol, previous_candle, current_candle_time
+    ):
+        """
+        Push the closed candles from previous_candle to current_candle_time (excluded) fetched from REST.
+        Pushes previous_candle as is when REST candles can't be fetched.
+        """
+        previous_candle_time = previous_candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value]
+        time_frame_seconds = commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+        since = max(
+            previous_candle_time,
+            current_candle_time - trading_constants.WS_CANDLES_RESYNC_MAX_CANDLES * time_frame_seconds,
+        )
+        closed_candles = []
+        try:
+            candles = await self.exchange_manager.exchange.get_symbol_prices(
+                symbol,
+                time_frame,
+                # + 1 to include the current candle when available
+                limit=int((current_candle_time - since) / time_frame_seconds) + 1,
+                since=int(since * commons_constants.MSECONDS_TO_SECONDS),
+            )
+            closed_candles = [
+                candle
+                for candle in candles or []
+                if since <= candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] < current_candle_time
+            ]
+            self.logger.debug(
+                f"Fetched {len(closed_candles)} {symbol} {time_frame.value} candles to resync websocket candles"
+            )
+        except Exception as err:
+            self.logger.warning(
+                f"Failed to fetch {symbol} {time_frame.value} candles to resync websocket candles: {err} "
+                f"({err.__class__.__name__})"
+            )
+        if not closed_candles:
+            closed_candles = [previous_candle]
+        # websocket candles might have been pushed while fetching: don't overwrite them, only merge the
+        # resynced candles that are older or newer than the last pushed candle
+        last_pushed_candle_time = self._get_last_pushed_closed_candle_time(time_frame.value, symbol)
+        closed_candles = [
+            candle
+            for candle in closed_candles
+            if candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] != last_pushed_candle_time
+        ]
+        if not closed_candles:
+            self.logger.debug(
+                f"Ignored {symbol} {time_frame.value} resynced candles: they have already been pushed"
+            )
+            return
+        last_resynced_candle_time = closed_candles[-1][commons_enums.PriceIndexes.IND_PRICE_TIME.value]
+        if last_resynced_candle_time > last_pushed_candle_time:
+            self._register_last_pushed_closed_candle_time(time_frame.value, symbol, last_resynced_candle_time)
+        await self.push_to_channel(
+            trading_constants.OHLCV_CHANNEL,
+            time_frame,
+            symbol,
+            closed_candles,
+            partial=True,
+        )
+
     def _register_previous_open_candle(self, time_frame, symbol, candle):
         try:
             self._previous_open_candles[time_frame][symbol] = candle
@@ -1277,6 +1501,20 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
         except KeyError:
             return None
 
+    def _register_last_pushed_closed_candle_time(self, time_frame, symbol, candle_time):
+        try:
+            self._last_pushed_closed_candle_times[time_frame][symbol] = candle_time
+        except KeyError:
+            if time_frame not in self._last_pushed_closed_candle_times:
+                self._last_pushed_closed_candle_times[time_frame] = {}
+            self._last_pushed_closed_candle_times[time_frame][symbol] = candle_time
+
+    def _get_last_pushed_closed_candle_time(self, time_frame, symbol):
+        try:
+            return self._last_pushed_closed_candle_times[time_frame][symbol]
+        except KeyError:
+            return 0
+
     def _register_subsequent_unordered_candle(
         self, time_frame, symbol, parsed_timeframe, current_candle_time
     ):
@@ -418,7 +418,10 @@ class Trader(util.Initializable):
             )
             if created_order is None:
                 return None
-            self.logger.debug(f"Successfully created order on {self.exchange_manager.exchange_name}: {logging.get_private_minimized_message_if_necessary(created_order)}")
+            self.logger.debug(
+                "Successfully created order on %s: %s",
+                self.exchange_manager.exchange_name, logging.PrivateMinimizedMessage(created_order)
+            )
 
             # get real order from exchange
             updated_order = order_factory.create_order_instance_from_raw(
@@ -638,10 +641,14 @@ class Trader(util.Initializable):
             is_order_refreshing = order.is_refreshing()
             if order_status is enums.OrderStatus.CANCELED:
                 order.status = enums.OrderStatus.CANCELED
-                self.logger.debug(f"Successfully cancelled order {logging.get_private_minimized_message_if_necessary(order)}")
+                self.logger.debug(
+                    "Successfully cancelled order %s", logging.PrivateMinimizedMessage(order)
+                )
             elif order_status is enums.OrderStatus.PENDING_CANCEL:
                 order.status = enums.OrderStatus.PENDING_CANCEL
-                self.logger.debug(f"Order cancel in progress for {logging.get_private_minimized_message_if_necessary(order)}")
+                self.logger.debug(
+                    "Order cancel in progress for %s", logging.PrivateMinimizedMessage(order)
+                )
         else:
             order.status = enums.OrderStatus.CANCELED
 
@@ -17,6 +17,8 @@ import dataclasses
 import typing
 import decimal
 
+import numpy
+
 import octobot_commons.dataclasses
 import octobot_commons.enums as common_enums
 import octobot_trading.exchanges.util.symbol_details as symbol_details_import
@@ -90,6 +92,32 @@ class MarketDetails(octobot_commons.dataclasses.FlexibleDataclass, octobot_commo
         ohlcv[common_enums.PriceIndexes.IND_PRICE_VOL.value] = self.volume[index]
         return ohlcv
 
+    def get_candle_arrays(self) -> dict[int, numpy.ndarray]:
+        return {
+            common_enums.PriceIndexes.IND_PRICE_TIME.value: numpy.array(self.time, dtype=numpy.float64),
+            common_enums.PriceIndexes.IND_PRICE_OPEN.value: numpy.array(self.open, dtype=numpy.float64),
+            common_enums.PriceIndexes.IND_PRICE_HIGH.value: numpy.array(self.high, dtype=numpy.float64),
+            common_enums.PriceIndexes.IND_PRICE_LOW.value: numpy.array(self.low, dtype=numpy.float64),
+            common_enums.PriceIndexes.IND_PRICE_CLOSE.value: numpy.array(self.close, dtype=numpy.float64),
+            common_enums.PriceIndexes.IND_PRICE_VOL.value: numpy.array(self.volume, dtype=numpy.float64),
+        }
+
+    @staticmethod
+    def from_candle_arrays(
+        symbol: str, time_frame: str, candle_arrays: dict[int, numpy.ndarray], close_price_only: bool = False
+    ) -> "MarketDetails":
+        # tolist() converts each column at once, without going through each candle
+        return MarketDetails(
+            symbol=symbol,
+            time_frame=time_frame,
+            close=candle_arrays[common_enums.PriceIndexes.IND_PRICE_CLOSE.value].tolist(),
+            open=[] if close_price_only else candle_arrays[common_enums.PriceIndexes.IND_PRICE_OPEN.value].tolist(),
+            high=[] if close_price_only else candle_arrays[common_enums.PriceIndexes.IND_PRICE_HIGH.value].tolist(),
+            low=[] if close_price_only else candle_arrays[common_enums.PriceIndexes.IND_PRICE_LOW.value].tolist(),
+            volume=[] if close_price_only else candle_arrays[common_enums.PriceIndexes.IND_PRICE_VOL.value].tolist(),
+            time=candle_arrays[common_enums.PriceIndexes.IND_PRICE_TIME.value].tolist(),
+        )
+
     @staticmethod
     def from_ohlcvs(symbol: str, time_frame: str, ohlcvs: list[dict]) -> "MarketDetails":
         return MarketDetails(
@@ -138,7 +138,9 @@ class AbstractTradingModeConsumer(modes_channel.ModeChannelConsumer):
         Will retry once on failure
         :return: list of orders to create
         """
-        self.logger.debug(f"Entering create_order_if_possible for {symbol} on {self.exchange_manager.exchange_name}")
+        self.logger.debug(
+            "Entering create_order_if_possible for %s on %s", symbol, self.exchange_manager.exchange_name
+        )
         try:
             async with self.trading_mode.remote_signal_publisher(symbol), \
                   self.exchange_manager.exchange_personal_data.portfolio_manager.portfolio.lock:
@@ -174,7 +176,7 @@ class AbstractTradingModeConsumer(modes_channel.ModeChannelConsumer):
                              f"not enough available funds")
             return []
         finally:
-            self.logger.debug(f"Exiting create_order_if_possible for {symbol}")
+            self.logger.debug("Exiting create_order_if_possible for %s", symbol)
 
     # Can be overwritten
     async def can_create_order(self, symbol, state):
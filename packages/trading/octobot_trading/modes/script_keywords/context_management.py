@@ -83,6 +83,21 @@ def get_full_context(trading_mode, matrix_id, cryptocurrency, symbol, time_frame
     return context
 
 
+def refresh_full_context(context, matrix_id, cryptocurrency, trigger_source, trigger_cache_timestamp,
+                         candle, kline, init_call=False):
+    """
+    Updates a context created by get_full_context with the given trigger values to reuse it in a new script call
+    """
+    context.matrix_id = matrix_id
+    context.cryptocurrency = cryptocurrency
+    context.trigger_cache_timestamp = trigger_cache_timestamp
+    context.trigger_source = trigger_source
+    context.trigger_value = candle or kline
+    context.enable_trading = not init_call
+    context.reset_script_call_state()
+    return context
+
+
 class Context(databases.CacheClient):
     def __init__(
         self,
@@ -171,6 +186,22 @@ class Context(databases.CacheClient):
         self.optimization_campaign_name = optimization_campaign_name
         self.signal_builder = None
 
+    def reset_script_call_state(self):
+        """
+        Resets the values that can be updated during a script call
+        """
+        self.allow_artificial_orders = False
+        self.plot_orders = False
+        self.just_created_orders = []
+        self.signal_builder = None
+        self.top_level_tentacle = self.tentacle
+        self.is_nested_tentacle = False
+        self.nested_depth = 0
+        self.nested_config_names = []
+        self.config_name = self.cache_manager.DEFAULT_CONFIG_IDENTIFIER
+        self.tentacles_requirements = tentacles_manager_models.TentacleRequirementsTree(self.tentacle, self.config_name)
+        self.parent_tentacles_requirements = None
+
     def get_signal_builder(self) -> "trading_signals.TradingSignalBundleBuilder":
         if self.signal_builder is None:
             self.signal_builder = trading_signals.TradingSignalBundleBuilder(
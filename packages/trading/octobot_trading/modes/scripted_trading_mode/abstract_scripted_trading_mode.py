@@ -13,6 +13,8 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import asyncio
+import copy
 import time
 import importlib
 
@@ -113,6 +115,7 @@ class AbstractScriptedTradingMode(abstract_trading_mode.AbstractTradingMode):
                                                                             self.symbol)
         symbol_db.set_initialized_flags(False)
         for producer in self.producers:
+            producer.clear_contexts()
             for time_frame, call_args in producer.last_call_by_timeframe.items():
                 run_db = databases.RunDatabasesProvider.instance().get_run_db(self.bot_id)
                 await producer.init_user_inputs(False)
@@ -157,10 +160,17 @@ class AbstractScriptedTradingMode(abstract_trading_mode.AbstractTradingMode):
 
 
 class AbstractScriptedTradingModeProducer(modes_channel.AbstractTradingModeProducer):
+    FLUSH_BATCH_DURATION = 5    # in live, flush script caches and databases at most once every FLUSH_BATCH_DURATION
 
     def __init__(self, channel, config, trading_mode, exchange_manager):
         super().__init__(channel, config, trading_mode, exchange_manager)
         self.last_call_by_timeframe = {}
+        # contexts of calls on the same symbol and time frame are copied from the same context to avoid
+        # its databases and caches lookups. Concurrent calls don't share the same context
+        self.contexts_by_symbol_and_time_frame = {}
+        self._to_flush_caches = set()
+        self._flush_task = None
+        self._is_flushing = False
 
     async def start(self) -> None:
         await super().start()
@@ -168,6 +178,21 @@ class AbstractScriptedTradingModeProducer(modes_channel.AbstractTradingModeProdu
         if not self.exchange_manager.is_backtesting:
             await self._schedule_initialization_call()
 
+    async def stop(self) -> None:
+        if self._flush_task is not None and not self._flush_task.done():
+            if self._is_flushing:
+                # don't interrupt the current flush: its databases would not be flushed
+                await self._flush_task
+            else:
+                self._flush_task.cancel()
+            # write pending updates
+            await self._flush_script_databases()
+        self.clear_contexts()
+        await super().stop()
+
+    def clear_contexts(self):
+        self.contexts_by_symbol_and_time_frame = {}
+
     async def _schedule_initialization_call(self):
         # initialization call is a special call that does not trigger trades and allows the script
         # to be run at least once in order to initialize its configuration
@@ -255,9 +280,9 @@ class AbstractScriptedTradingModeProducer(modes_channel.AbstractTradingModeProdu
     async def call_script(self, matrix_id: str, cryptocurrency: str, symbol: str, time_frame: str,
                           trigger_source: str, trigger_cache_timestamp: float,
                           candle: dict = None, kline: dict = None, init_call: bool = False):
-        context = context_management.get_full_context(
-            self.trading_mode, matrix_id, cryptocurrency, symbol, time_frame,
-            trigger_source, trigger_cache_timestamp, candle, kline, init_call=init_call
+        context = self._get_context(
+            matrix_id, cryptocurrency, symbol, time_frame,
+            trigger_source, trigger_cache_timestamp, candle, kline, init_call
         )
         self.last_call_by_timeframe[time_frame] = \
             (matrix_id, cryptocurrency, symbol, time_frame, trigger_source, trigger_cache_timestamp, candle, kline, init_call)
@@ -280,27 +305,66 @@ class AbstractScriptedTradingModeProducer(modes_channel.AbstractTradingModeProdu
         finally:
             if not self.exchange_manager.is_backtesting:
                 if context.has_cache(context.symbol, context.time_frame):
-                    await context.get_cache().flush()
-                for symbol in self.exchange_manager.exchange_config.traded_symbol_pairs:
-                    await databases.RunDatabasesProvider.instance().get_symbol_db(
-                        self.exchange_manager.bot_id,
-                        self.exchange_manager.exchange_name,
-                        symbol
-                    ).flush()
+                    self._to_flush_caches.add(context.get_cache())
+                self._schedule_batched_flush()
             run_data_writer.set_initialized_flags(initialized)
             databases.RunDatabasesProvider.instance().get_symbol_db(self.exchange_manager.bot_id,
                                                                   self.exchange_name, symbol)\
                 .set_initialized_flags(initialized, (time_frame,))
 
+    def _get_context(self, matrix_id, cryptocurrency, symbol, time_frame, trigger_source, trigger_cache_timestamp,
+                     candle, kline, init_call):
+        try:
+            base_context = self.contexts_by_symbol_and_time_frame[(symbol, time_frame)]
+        except KeyError:
+            base_context = context_management.get_full_context(
+                self.trading_mode, matrix_id, cryptocurrency, symbol, time_frame,
+                trigger_source, trigger_cache_timestamp, candle, kline, init_call=init_call
+            )
+            self.contexts_by_symbol_and_time_frame[(symbol, time_frame)] = base_context
+        # each call uses its own context: calls on the same symbol and time frame can run concurrently
+        return context_management.refresh_full_context(
+            copy.copy(base_context), matrix_id, cryptocurrency,
+            trigger_source, trigger_cache_timestamp, candle, kline, init_call=init_call
+        )
+
+    def _schedule_batched_flush(self):
+        # don't postpone an already scheduled flush to make sure updates are regularly written
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._waiting_flush())
+
+    async def _waiting_flush(self):
+        await asyncio.sleep(self.FLUSH_BATCH_DURATION)
+        await self._flush_script_databases()
+
+    async def _flush_script_databases(self):
+        self._is_flushing = True
+        try:
+            await self._flush_databases()
+        finally:
+            self._is_flushing = False
+
+    async def _flush_databases(self):
+        caches, self._to_flush_caches = self._to_flush_caches, set()
+        symbol_databases = [
+            databases.RunDatabasesProvider.instance().get_symbol_db(
+                self.exchange_manager.bot_id,
+                self.exchange_manager.exchange_name,
+                symbol
+            )
+            for symbol in self.exchange_manager.exchange_config.traded_symbol_pairs
+        ]
+        for database in (*caches, *symbol_databases, *self.all_databases().values()):
+            if database:
+                try:
+                    await database.flush()
+                except Exception as err:
+                    self.logger.exception(err, True, f"Error when flushing database: {err}")
+
     async def _pre_script_call(self, context):
         await basic_keywords.set_leverage(context, await basic_keywords.user_select_leverage(context))
 
     async def post_trigger(self):
         if not self.exchange_manager.is_backtesting:
-            # update db after each run only in live mode
-            for database in self.all_databases().values():
-                if database:
-                    try:
-                        await database.flush()
-                    except Exception as err:
-                        self.logger.exception(err, True, f"Error when flushing database: {err}")
+            # update db after runs only in live mode
+            self._schedule_batched_flush()
@@ -93,6 +93,9 @@ from octobot_trading.personal_data.orders import (
     BaseTrigger,
     PriceTrigger,
     OrdersUpdater,
+    MarketRules,
+    get_market_rules,
+    clear_market_rules_cache,
     get_minimal_order_amount,
     get_minimal_order_cost,
     decimal_adapt_price,
@@ -237,6 +240,7 @@ from octobot_trading.personal_data.trades import (
     TradesUpdater,
     Trade,
     TradePnl,
+    TradesArchive,
     compute_win_rate,
     aggregate_trades_by_exchange_order_id,
     get_real_or_estimated_trade_fee,
@@ -371,6 +375,9 @@ __all__ = [
     "BaseTrigger",
     "PriceTrigger",
     "OrdersUpdater",
+    "MarketRules",
+    "get_market_rules",
+    "clear_market_rules_cache",
     "get_minimal_order_amount",
     "get_minimal_order_cost",
     "decimal_adapt_price",
@@ -485,6 +492,7 @@ __all__ = [
     "TradesUpdater",
     "Trade",
     "TradePnl",
+    "TradesArchive",
     "compute_win_rate",
     "aggregate_trades_by_exchange_order_id",
     "get_real_or_estimated_trade_fee",
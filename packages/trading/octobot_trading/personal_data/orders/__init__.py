@@ -160,6 +160,12 @@ from octobot_trading.personal_data.orders.orders_storage_operations import (
     create_orders_storage_related_elements,
     create_missing_virtual_orders_from_storage_order_groups,
 )
+from octobot_trading.personal_data.orders import market_rules
+from octobot_trading.personal_data.orders.market_rules import (
+    MarketRules,
+    get_market_rules,
+    clear_market_rules_cache,
+)
 from octobot_trading.personal_data.orders.decimal_order_adapter import (
     get_minimal_order_amount,
     get_minimal_order_cost,
@@ -255,6 +261,9 @@ __all__ = [
     "BaseTrigger",
     "PriceTrigger",
     "OrdersUpdater",
+    "MarketRules",
+    "get_market_rules",
+    "clear_market_rules_cache",
     "get_minimal_order_amount",
     "get_minimal_order_cost",
     "decimal_adapt_price",
@@ -143,7 +143,9 @@ class OrdersProducer(exchanges_channel.ExchangeChannelProducer):
         Called when open order init failed due to a portfolio sync issue, will now complete their init
         """
         for order in orders:
-            self.logger.debug(f"Completing order init for order: {logging.get_private_minimized_message_if_necessary(order)}")
+            self.logger.debug(
+                "Completing order init for order: %s", logging.PrivateMinimizedMessage(order)
+            )
             await self.channel.exchange_manager.exchange_personal_data.on_order_refresh_success(order, False, False)
             await self.send(
                 self.channel.exchange_manager.exchange.get_pair_cryptocurrency(order.symbol),
@@ -23,6 +23,7 @@ import octobot_trading.constants as constants
 import octobot_trading.errors as errors
 import octobot_trading.enums as enums
 import octobot_trading.personal_data as personal_data
+import octobot_trading.personal_data.orders.market_rules as market_rules
 from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
 
 DECIMAL_SCIENTIFIC_NOTATION_EXP = "E-"
@@ -64,21 +65,28 @@ def get_minimal_order_cost(symbol_market, default_price=None) -> float:
 
 
 def decimal_adapt_price(symbol_market, price, truncate=True):
-    maximal_price_digits = symbol_market[Ecmsc.PRECISION.value].get(
-        Ecmsc.PRECISION_PRICE.value, constants.CURRENCY_DEFAULT_MAX_PRICE_DIGITS
-    )
-    if maximal_price_digits is None:
+    symbol_market_rules = _get_market_rules_with_precision(symbol_market)
+    if symbol_market_rules.price_digits is None:
         return price
-    return decimal_trunc_with_n_decimal_digits(price, maximal_price_digits, truncate)
+    return decimal_trunc_with_n_decimal_digits(
+        price, symbol_market_rules.price_digits, truncate, quantum=symbol_market_rules.price_quantum
+    )
 
 
 def decimal_adapt_quantity(symbol_market, quantity, truncate=True):
-    maximal_volume_digits = symbol_market[Ecmsc.PRECISION.value].get(
-        Ecmsc.PRECISION_AMOUNT.value, 0
-    )
-    if maximal_volume_digits is None:
+    symbol_market_rules = _get_market_rules_with_precision(symbol_market)
+    if symbol_market_rules.amount_digits is None:
         return quantity
-    return decimal_trunc_with_n_decimal_digits(quantity, maximal_volume_digits, truncate)
+    return decimal_trunc_with_n_decimal_digits(
+        quantity, symbol_market_rules.amount_digits, truncate, quantum=symbol_market_rules.amount_quantum
+    )
+
+
+def _get_market_rules_with_precision(symbol_market) -> market_rules.MarketRules:
+    symbol_market_rules = market_rules.get_market_rules(symbol_market)
+    if not symbol_market_rules.has_precision:
+        raise KeyError(Ecmsc.PRECISION.value)
+    return symbol_market_rules
 
 
 def _has_more_than_x_digits(value, digits):
@@ -90,13 +98,14 @@ def _has_more_than_x_digits(value, digits):
     return False
 
 
-def decimal_trunc_with_n_decimal_digits(value, digits, truncate=True):  # TODO migrate to commons
+def decimal_trunc_with_n_decimal_digits(value, digits, truncate=True, quantum=None):  # TODO migrate to commons
     try:
         # decimal.Decimal can add unnecessary complexity in numbers, only use it when necessary
         if _has_more_than_x_digits(value, digits):
             if digits > constants.ZERO:
-                return value.quantize(decimal.Decimal(f".{'0' * int(digits)}"),
-                                      rounding=decimal.ROUND_DOWN if truncate else decimal.ROUND_UP)
+                if quantum is None:
+                    quantum = decimal.Decimal(f".{'0' * int(digits)}")
+                return value.quantize(quantum, rounding=decimal.ROUND_DOWN if truncate else decimal.ROUND_UP)
             else:
                 return value // constants.ONE
         return value
@@ -235,23 +244,19 @@ def decimal_check_and_adapt_order_details_if_necessary(quantity, price, symbol_m
     if quantity.is_nan() or price.is_nan() or price == constants.ZERO:
         return []
 
-    symbol_market_limits = symbol_market[Ecmsc.LIMITS.value]
-
-    limit_amount = symbol_market_limits[Ecmsc.LIMITS_AMOUNT.value]
-    limit_cost = symbol_market_limits[Ecmsc.LIMITS_COST.value]
-    limit_price = symbol_market_limits[Ecmsc.LIMITS_PRICE.value]
+    symbol_market_rules = market_rules.get_market_rules(symbol_market)
+    if not symbol_market_rules.has_limits:
+        raise KeyError(Ecmsc.LIMITS.value)
 
     # adapt digits if necessary
     valid_quantity = decimal_adapt_quantity(symbol_market, quantity, truncate)
     valid_price = decimal_adapt_price(symbol_market, price, truncate)
 
     # case 1: try with data directly from exchange
-    if personal_data.is_valid(limit_amount, Ecmsc.LIMITS_AMOUNT_MIN.value, zero_valid=True):
-        min_quantity = decimal.Decimal(str(limit_amount.get(Ecmsc.LIMITS_AMOUNT_MIN.value, math.nan)))
-        max_quantity = None
+    if symbol_market_rules.min_quantity is not None:
+        min_quantity = symbol_market_rules.min_quantity
         # not all symbol data have a max quantity
-        if personal_data.is_valid(limit_amount, Ecmsc.LIMITS_AMOUNT_MAX.value, zero_valid=False):
-            max_quantity = decimal.Decimal(str(limit_amount.get(Ecmsc.LIMITS_AMOUNT_MAX.value, math.nan)))
+        max_quantity = symbol_market_rules.max_quantity
 
         total_order_price = valid_quantity * valid_price
 
@@ -260,12 +265,10 @@ def decimal_check_and_adapt_order_details_if_necessary(quantity, price, symbol_m
             return []
 
         # case 1.1: use only quantity and cost
-        if personal_data.is_valid(limit_cost, Ecmsc.LIMITS_COST_MIN.value, zero_valid=True):
-            min_cost = decimal.Decimal(str(limit_cost.get(Ecmsc.LIMITS_COST_MIN.value, math.nan)))
-            max_cost = None
+        if symbol_market_rules.min_cost is not None:
+            min_cost = symbol_market_rules.min_cost
             # not all symbol data have a max cost
-            if personal_data.is_valid(limit_cost, Ecmsc.LIMITS_COST_MAX.value, zero_valid=False):
-                max_cost = decimal.Decimal(str(limit_cost.get(Ecmsc.LIMITS_COST_MAX.value, math.nan)))
+            max_cost = symbol_market_rules.max_cost
 
             # check total_order_price not < min_cost
             if not personal_data.check_cost(float(total_order_price), min_cost):
@@ -284,12 +287,10 @@ def decimal_check_and_adapt_order_details_if_necessary(quantity, price, symbol_m
 
         # case 1.2: use only quantity and price (if available)
         else:
-            if personal_data.is_valid(limit_price, Ecmsc.LIMITS_PRICE_MIN.value, zero_valid=True):
-                min_price = decimal.Decimal(str(limit_price.get(Ecmsc.LIMITS_PRICE_MIN.value, math.nan)))
-                max_price = None
+            if symbol_market_rules.min_price is not None:
+                min_price = symbol_market_rules.min_price
                 # not all symbol data have a max price
-                if personal_data.is_valid(limit_price, Ecmsc.LIMITS_PRICE_MAX.value, zero_valid=False):
-                    max_price = decimal.Decimal(str(limit_price.get(Ecmsc.LIMITS_PRICE_MAX.value, math.nan)))
+                max_price = symbol_market_rules.max_price
 
                 if (max_price is not None and (valid_price > max_price)) or valid_price < min_price:
                     # invalid order
@@ -0,0 +1,122 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import typing
+
+import octobot_trading.constants as constants
+import octobot_trading.personal_data as personal_data
+from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
+
+MAX_CACHED_MARKET_RULES = 5000
+# market rules by market status symbol, precision and limits values
+_MARKET_RULES_BY_KEY: dict[tuple, "MarketRules"] = {}
+
+
+class MarketRules:
+    """
+    Order rules of a market status, parsed once: precision digits and their quantum, valid min and max limits.
+    Missing limits are None
+    """
+
+    def __init__(self, symbol_market: dict):
+        precision = symbol_market.get(Ecmsc.PRECISION.value)
+        self.has_precision: bool = precision is not None
+        self.amount_digits = None
+        self.price_digits = None
+        if self.has_precision:
+            self.amount_digits = precision.get(Ecmsc.PRECISION_AMOUNT.value, 0)
+            self.price_digits = precision.get(
+                Ecmsc.PRECISION_PRICE.value, constants.CURRENCY_DEFAULT_MAX_PRICE_DIGITS
+            )
+        self.amount_quantum: typing.Optional[decimal.Decimal] = _get_quantum(self.amount_digits)
+        self.price_quantum: typing.Optional[decimal.Decimal] = _get_quantum(self.price_digits)
+
+        limits = symbol_market.get(Ecmsc.LIMITS.value) or {}
+        self.has_limits: bool = all(
+            key in limits
+            for key in (Ecmsc.LIMITS_AMOUNT.value, Ecmsc.LIMITS_COST.value, Ecmsc.LIMITS_PRICE.value)
+        )
+        limit_amount = limits.get(Ecmsc.LIMITS_AMOUNT.value) or {}
+        limit_cost = limits.get(Ecmsc.LIMITS_COST.value) or {}
+        limit_price = limits.get(Ecmsc.LIMITS_PRICE.value) or {}
+        self.min_quantity: typing.Optional[decimal.Decimal] = _get_limit(
+            limit_amount, Ecmsc.LIMITS_AMOUNT_MIN.value, True
+        )
+        self.max_quantity: typing.Optional[decimal.Decimal] = _get_limit(
+            limit_amount, Ecmsc.LIMITS_AMOUNT_MAX.value, False
+        )
+        self.min_cost: typing.Optional[decimal.Decimal] = _get_limit(limit_cost, Ecmsc.LIMITS_COST_MIN.value, True)
+        self.max_cost: typing.Optional[decimal.Decimal] = _get_limit(limit_cost, Ecmsc.LIMITS_COST_MAX.value, False)
+        self.min_price: typing.Optional[decimal.Decimal] = _get_limit(limit_price, Ecmsc.LIMITS_PRICE_MIN.value, True)
+        self.max_price: typing.Optional[decimal.Decimal] = _get_limit(
+            limit_price, Ecmsc.LIMITS_PRICE_MAX.value, False
+        )
+
+
+def get_market_rules(symbol_market: dict) -> MarketRules:
+    """
+    :return: the MarketRules of the given market status, computed once per market status symbol,
+    precision and limits values
+    """
+    market_rules_key = get_market_rules_key(symbol_market)
+    try:
+        return _MARKET_RULES_BY_KEY[market_rules_key]
+    except KeyError:
+        pass
+    except TypeError:
+        # unhashable precision or limits values: can't be cached
+        return MarketRules(symbol_market)
+    if len(_MARKET_RULES_BY_KEY) >= MAX_CACHED_MARKET_RULES:
+        clear_market_rules_cache()
+    market_rules = MarketRules(symbol_market)
+    _MARKET_RULES_BY_KEY[market_rules_key] = market_rules
+    return market_rules
+
+
+def get_market_rules_key(symbol_market: dict) -> tuple:
+    """
+    :return: an identifier of the given market status symbol, precision and limits values,
+    updated when any of those values is updated
+    """
+    precision = symbol_market.get(Ecmsc.PRECISION.value)
+    limits = symbol_market.get(Ecmsc.LIMITS.value)
+    return (
+        symbol_market.get(Ecmsc.SYMBOL.value),
+        None if precision is None else tuple(precision.items()),
+        None if not limits else tuple(
+            (key, tuple(limit.items()) if isinstance(limit, dict) else limit)
+            for key, limit in limits.items()
+        ),
+    )
+
+
+def clear_market_rules_cache():
+    _MARKET_RULES_BY_KEY.clear()
+
+
+def _get_quantum(digits) -> typing.Optional[decimal.Decimal]:
+    if digits is None or digits <= constants.ZERO:
+        return None
+    try:
+        return decimal.Decimal(f".{'0' * int(digits)}")
+    except (ValueError, decimal.InvalidOperation):
+        return None
+
+
+def _get_limit(limit: dict, key: str, zero_valid: bool) -> typing.Optional[decimal.Decimal]:
+    if personal_data.is_valid(limit, key, zero_valid=zero_valid):
+        return decimal.Decimal(str(limit[key]))
+    return None
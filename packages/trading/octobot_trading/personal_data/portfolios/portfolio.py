@@ -85,13 +85,19 @@ class Portfolio:
             self.portfolio = {
                 currency: self._parse_raw_currency_asset(currency=currency, raw_currency_balance=balance[currency])
                 for currency in balance}
-            self.logger.debug(f"Portfolio updated | {constants.CURRENT_PORTFOLIO_STRING} {logging.get_private_placeholder_if_necessary(self)}")
+            self.logger.debug(
+                "Portfolio updated | %s %s",
+                constants.CURRENT_PORTFOLIO_STRING, logging.get_private_placeholder_if_necessary(self)
+            )
             return True
         if any(
                 self._update_raw_currency_asset(currency=currency, raw_currency_balance=balance[currency])
                 for currency in balance
         ):
-            self.logger.debug(f"Portfolio partially updated | {constants.CURRENT_PORTFOLIO_STRING} {logging.get_private_placeholder_if_necessary(self)}")
+            self.logger.debug(
+                "Portfolio partially updated | %s %s",
+                constants.CURRENT_PORTFOLIO_STRING, logging.get_private_placeholder_if_necessary(self)
+            )
             return True
         return False
 
@@ -296,8 +302,12 @@ class Portfolio:
             currency_portfolio_num = -order.filled_quantity
             market_portfolio_num = order.filled_quantity * order.filled_price - order.get_total_fees(order.market)
 
-        self.logger.debug(f"Portfolio updated from order | {order.currency} {logging.get_private_placeholder_if_necessary(currency_portfolio_num)} | {order.market} "
-                          f"{market_portfolio_num} | {constants.CURRENT_PORTFOLIO_STRING} {logging.get_private_placeholder_if_necessary(self.portfolio)}")
+        self.logger.debug(
+            "Portfolio updated from order | %s %s | %s %s | %s %s",
+            order.currency, logging.get_private_placeholder_if_necessary(currency_portfolio_num),
+            order.market, market_portfolio_num,
+            constants.CURRENT_PORTFOLIO_STRING, logging.get_private_placeholder_if_necessary(self.portfolio)
+        )
 
     def log_portfolio_update_from_withdrawal(self, amount, currency):
         """
@@ -305,8 +315,11 @@ class Portfolio:
         :param amount: withdraw quantity
         :param currency: withdraw currency
         """
-        self.logger.debug(f"Portfolio updated from withdraw | {currency} -{logging.get_private_placeholder_if_necessary(amount)}"
-                          f" | {constants.CURRENT_PORTFOLIO_STRING} {logging.get_private_placeholder_if_necessary(self.portfolio)}")
+        self.logger.debug(
+            "Portfolio updated from withdraw | %s -%s | %s %s",
+            currency, logging.get_private_placeholder_if_necessary(amount),
+            constants.CURRENT_PORTFOLIO_STRING, logging.get_private_placeholder_if_necessary(self.portfolio)
+        )
 
     def log_portfolio_update_from_deposit(self, amount, currency):
         """
@@ -314,8 +327,11 @@ class Portfolio:
         :param amount: deposit quantity
         :param currency: deposit currency
         """
-        self.logger.debug(f"Portfolio updated from deposit | {currency} {logging.get_private_placeholder_if_necessary(amount)}"
-                          f" | {constants.CURRENT_PORTFOLIO_STRING} {logging.get_private_placeholder_if_necessary(self.portfolio)}")
+        self.logger.debug(
+            "Portfolio updated from deposit | %s %s | %s %s",
+            currency, logging.get_private_placeholder_if_necessary(amount),
+            constants.CURRENT_PORTFOLIO_STRING, logging.get_private_placeholder_if_necessary(self.portfolio)
+        )
 
 def _should_reduce_available_assets_on_fill(order):
     """
@@ -18,6 +18,7 @@ from octobot_trading.personal_data.trades import trades_manager
 from octobot_trading.personal_data.trades import trade_factory
 from octobot_trading.personal_data.trades import channel
 from octobot_trading.personal_data.trades import trade
+from octobot_trading.personal_data.trades import trades_archive
 
 from octobot_trading.personal_data.trades.trades_manager import (
     TradesManager,
@@ -39,6 +40,9 @@ from octobot_trading.personal_data.trades.trade import (
 from octobot_trading.personal_data.trades.trade_pnl import (
     TradePnl,
 )
+from octobot_trading.personal_data.trades.trades_archive import (
+    TradesArchive,
+)
 from octobot_trading.personal_data.trades.trades_util import (
     compute_win_rate,
     aggregate_trades_by_exchange_order_id,
@@ -62,6 +66,7 @@ __all__ = [
     "TradesUpdater",
     "Trade",
     "TradePnl",
+    "TradesArchive",
     "compute_win_rate",
     "aggregate_trades_by_exchange_order_id",
     "get_real_or_estimated_trade_fee",
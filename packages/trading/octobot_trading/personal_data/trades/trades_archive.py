@@ -0,0 +1,235 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+import decimal
+import typing
+
+import numpy
+
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+import octobot_trading.errors as errors
+
+NO_VALUE_ID = -1
+BUY_SIDE = 1
+SELL_SIDE = -1
+
+
+class TradesArchive:
+    """
+    Columnar storage of the oldest trades removed from the TradesManager.
+    Only keeps what is required by trades history and statistics, using a fraction of the memory of Trade
+    instances. Statistics are aggregated as decimals to remain exact.
+    Cancelled trades are not archived.
+    """
+
+    def __init__(self):
+        self.symbols: list[str] = []
+        self.currencies: list[str] = []
+        # trades columns
+        self.executed_times: numpy.ndarray = numpy.empty(0, dtype=numpy.float64)
+        self.symbol_ids: numpy.ndarray = numpy.empty(0, dtype=numpy.int32)
+        self.sides: numpy.ndarray = numpy.empty(0, dtype=numpy.int8)
+        self.executed_prices: numpy.ndarray = numpy.empty(0, dtype=numpy.float64)
+        self.executed_quantities: numpy.ndarray = numpy.empty(0, dtype=numpy.float64)
+        self.fee_costs: numpy.ndarray = numpy.empty(0, dtype=numpy.float64)
+        self.fee_currency_ids: numpy.ndarray = numpy.empty(0, dtype=numpy.int32)
+        # archived trades aggregates
+        self.trades_count_by_symbol: dict[str, int] = {}
+        self.paid_fees_by_currency: dict[str, decimal.Decimal] = {}
+        self.traded_volume_by_symbol: dict[str, decimal.Decimal] = {}
+        # filled trades count by (side, reduce_only, exchange_trade_type)
+        self.filled_trades_count: collections.Counter = collections.Counter()
+        # completed trades pnl columns, pnl values are kept as decimals to sum them without rounding errors
+        self.pnl_close_times: numpy.ndarray = numpy.empty(0, dtype=numpy.float64)
+        self.pnl_symbol_ids: numpy.ndarray = numpy.empty(0, dtype=numpy.int32)
+        self.pnl_values: list[decimal.Decimal] = []
+        self._symbol_ids: dict[str, int] = {}
+        self._currency_ids: dict[str, int] = {}
+
+    def __len__(self):
+        return len(self.executed_times)
+
+    def archive(self, trades: list, trades_pnl: list) -> None:
+        """
+        Appends the given trades and their completed trades pnl to the archive
+        """
+        archived_trades = [
+            trade
+            for trade in trades
+            if trade.status is not enums.OrderStatus.CANCELED
+        ]
+        for trade in archived_trades:
+            self.trades_count_by_symbol[trade.symbol] = self.trades_count_by_symbol.get(trade.symbol, 0) + 1
+            _add_to_total(
+                self.traded_volume_by_symbol, trade.symbol, trade.executed_price * trade.executed_quantity
+            )
+            if trade.fee is not None:
+                _add_to_total(
+                    self.paid_fees_by_currency,
+                    trade.fee[enums.FeePropertyColumns.CURRENCY.value],
+                    trade.fee[enums.FeePropertyColumns.COST.value]
+                )
+            if trade.status is enums.OrderStatus.FILLED:
+                self.filled_trades_count[(trade.side, trade.reduce_only, trade.exchange_trade_type)] += 1
+        self._archive_trades_columns(archived_trades)
+        self._archive_trades_pnl(trades_pnl)
+
+    def get_total_paid_fees(self) -> dict[str, decimal.Decimal]:
+        """
+        :return: the total paid fees of archived trades by currency
+        """
+        return dict(self.paid_fees_by_currency)
+
+    def get_trades_count_by_symbol(self) -> dict[str, int]:
+        """
+        :return: the count of archived trades by symbol
+        """
+        return dict(self.trades_count_by_symbol)
+
+    def get_traded_volume_by_symbol(self) -> dict[str, decimal.Decimal]:
+        """
+        :return: the total cost of archived trades by symbol, denominated in quote
+        """
+        return dict(self.traded_volume_by_symbol)
+
+    def get_filled_trades_count(
+        self,
+        side: typing.Optional[enums.TradeOrderSide] = None,
+        reduce_only: typing.Optional[bool] = None,
+        exchange_trade_types: typing.Optional[list] = None,
+    ) -> int:
+        """
+        :return: the count of archived filled trades matching the given side, reduce_only and trade types
+        """
+        return sum(
+            count
+            for (trade_side, trade_reduce_only, exchange_trade_type), count in self.filled_trades_count.items()
+            if (side is None or trade_side is side)
+            and (reduce_only is None or trade_reduce_only == reduce_only)
+            and (exchange_trade_types is None or exchange_trade_type in exchange_trade_types)
+        )
+
+    def get_realised_pnl_by_symbol(self, since: float = 0) -> dict[str, decimal.Decimal]:
+        """
+        :return: the total pnl of archived completed trades closed since the given time by symbol,
+        denominated in quote
+        """
+        totals = {}
+        for symbol_id, close_time, value in zip(
+            self.pnl_symbol_ids.tolist(), self.pnl_close_times.tolist(), self.pnl_values
+        ):
+            if close_time >= since:
+                _add_to_total(totals, self.symbols[symbol_id], value)
+        return totals
+
+    def get_completed_trades_count_by_symbol(self, winning: typing.Optional[bool] = None) -> dict[str, int]:
+        """
+        :param winning: when set, only count winning (True) or losing (False) completed trades
+        :return: the count of archived completed trades by symbol
+        """
+        return {
+            self.symbols[symbol_id]: count
+            for symbol_id, count in collections.Counter(
+                symbol_id
+                for symbol_id, value in zip(self.pnl_symbol_ids.tolist(), self.pnl_values)
+                if winning is None or (value > constants.ZERO) is winning
+            ).items()
+        }
+
+    def _archive_trades_columns(self, archived_trades: list):
+        self.executed_times = numpy.concatenate((
+            self.executed_times,
+            numpy.array([trade.executed_time for trade in archived_trades], dtype=numpy.float64)
+        ))
+        self.symbol_ids = numpy.concatenate((
+            self.symbol_ids,
+            numpy.array([self._get_symbol_id(trade.symbol) for trade in archived_trades], dtype=numpy.int32)
+        ))
+        self.sides = numpy.concatenate((
+            self.sides,
+            numpy.array(
+                [BUY_SIDE if trade.side is enums.TradeOrderSide.BUY else SELL_SIDE for trade in archived_trades],
+                dtype=numpy.int8
+            )
+        ))
+        self.executed_prices = numpy.concatenate((
+            self.executed_prices,
+            numpy.array([trade.executed_price for trade in archived_trades], dtype=numpy.float64)
+        ))
+        self.executed_quantities = numpy.concatenate((
+            self.executed_quantities,
+            numpy.array([trade.executed_quantity for trade in archived_trades], dtype=numpy.float64)
+        ))
+        self.fee_costs = numpy.concatenate((
+            self.fee_costs,
+            numpy.array(
+                [
+                    numpy.nan if trade.fee is None else trade.fee[enums.FeePropertyColumns.COST.value]
+                    for trade in archived_trades
+                ],
+                dtype=numpy.float64
+            )
+        ))
+        self.fee_currency_ids = numpy.concatenate((
+            self.fee_currency_ids,
+            numpy.array(
+                [
+                    NO_VALUE_ID if trade.fee is None
+                    else self._get_currency_id(trade.fee[enums.FeePropertyColumns.CURRENCY.value])
+                    for trade in archived_trades
+                ],
+                dtype=numpy.int32
+            )
+        ))
+
+    def _archive_trades_pnl(self, trades_pnl: list):
+        close_times = []
+        symbol_ids = []
+        for pnl in trades_pnl:
+            try:
+                value = pnl.get_profits()[0]
+                close_time = pnl.get_close_time()
+                symbol = pnl.entries[0].symbol
+            except (errors.IncompletePNLError, decimal.DecimalException, IndexError):
+                # ignore incomplete pnl
+                continue
+            self.pnl_values.append(value)
+            close_times.append(close_time)
+            symbol_ids.append(self._get_symbol_id(symbol))
+        self.pnl_close_times = numpy.concatenate((
+            self.pnl_close_times, numpy.array(close_times, dtype=numpy.float64)
+        ))
+        self.pnl_symbol_ids = numpy.concatenate((self.pnl_symbol_ids, numpy.array(symbol_ids, dtype=numpy.int32)))
+
+    def _get_symbol_id(self, symbol: str) -> int:
+        return _get_value_id(symbol, self.symbols, self._symbol_ids)
+
+    def _get_currency_id(self, currency: str) -> int:
+        return _get_value_id(currency, self.currencies, self._currency_ids)
+
+
+def _get_value_id(value: str, values: list, value_ids: dict) -> int:
+    try:
+        return value_ids[value]
+    except KeyError:
+        value_ids[value] = len(values)
+        values.append(value)
+        return value_ids[value]
+
+
+def _add_to_total(totals: dict, key: str, value: decimal.Decimal) -> None:
+    totals[key] = totals.get(key, constants.ZERO) + value
@@ -14,6 +14,8 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import collections
+import decimal
+import itertools
 import typing
 
 import octobot_commons.logging as logging
@@ -22,8 +24,10 @@ import octobot_commons.enums as commons_enums
 
 import octobot_trading.constants as constants
 import octobot_trading.enums as enums
+import octobot_trading.errors as errors
 import octobot_trading.personal_data as personal_data
 import octobot_trading.personal_data.trades.trade_pnl as trade_pnl
+import octobot_trading.personal_data.trades.trades_archive as trades_archive
 import octobot_trading.util as util
 
 if typing.TYPE_CHECKING:
@@ -40,6 +44,8 @@ class TradesManager(util.Initializable):
         self.trader = trader
         self.trades_initialized: bool = False
         self.trades: collections.OrderedDict[str, personal_data.Trade] = collections.OrderedDict()
+        # oldest trades removed from self.trades
+        self.archived_trades: trades_archive.TradesArchive = trades_archive.TradesArchive()
 
     async def initialize_impl(self):
         await self.reload_history(False)
@@ -94,8 +100,8 @@ class TradesManager(util.Initializable):
                 return True
         return False
 
-    def get_total_paid_fees(self):
-        total_fees = {}
+    def get_total_paid_fees(self, include_archived_trades=True):
+        total_fees = self.archived_trades.get_total_paid_fees() if include_archived_trades else {}
         for trade in self.trades.values():
             if trade.fee is not None:
                 fee_cost = trade.fee[enums.FeePropertyColumns.COST.value]
@@ -140,6 +146,35 @@ class TradesManager(util.Initializable):
             for entry_id, exit_trade in exits_by_entry_id.items()
         ]
 
+    def get_realised_pnl_by_symbol(self, since: float = 0) -> dict[str, decimal.Decimal]:
+        """
+        :return: the total pnl of completed trades closed since the given time by symbol, including archived trades
+        """
+        realised_pnl = self.archived_trades.get_realised_pnl_by_symbol(since=since)
+        for symbol, close_time, profit in self._get_completed_trades_profits():
+            if close_time >= since:
+                realised_pnl[symbol] = realised_pnl.get(symbol, constants.ZERO) + profit
+        return realised_pnl
+
+    def get_completed_trades_count_by_symbol(self, winning: typing.Optional[bool] = None) -> dict[str, int]:
+        """
+        :param winning: when set, only count winning (True) or losing (False) completed trades
+        :return: the count of completed trades by symbol, including archived trades
+        """
+        completed_trades_count = self.archived_trades.get_completed_trades_count_by_symbol(winning=winning)
+        for symbol, _, profit in self._get_completed_trades_profits():
+            if winning is None or (profit > constants.ZERO) is winning:
+                completed_trades_count[symbol] = completed_trades_count.get(symbol, 0) + 1
+        return completed_trades_count
+
+    def _get_completed_trades_profits(self):
+        for pnl in self.get_completed_trades_pnl():
+            try:
+                yield pnl.entries[0].symbol, pnl.get_close_time(), pnl.get_profits()[0]
+            except (errors.IncompletePNLError, decimal.DecimalException, IndexError):
+                # ignore incomplete pnl
+                continue
+
     def get_trade(self, trade_id: str):
         return self.trades[trade_id]
 
@@ -175,6 +210,7 @@ class TradesManager(util.Initializable):
     def _reset_trades(self):
         self.trades_initialized = False
         self.trades = collections.OrderedDict()
+        self.archived_trades = trades_archive.TradesArchive()
 
     async def _load_trades_history(self, reset):
         if self.trader.exchange_manager.is_backtesting:
@@ -223,8 +259,21 @@ class TradesManager(util.Initializable):
         popped = []
         for _ in range(nb_to_remove):
             popped.append(self.trades.popitem(last=False)[1])
+        # keep removed trades statistics: archive the pnl of removed entries using their currently known exits
+        # as they won't be associated to their entry anymore
+        popped_order_ids = set(trade.origin_order_id for trade in popped)
+        removed_entries_exits = [
+            trade
+            for trade in itertools.chain(popped, self.trades.values())
+            if trade.associated_entry_ids and not popped_order_ids.isdisjoint(trade.associated_entry_ids)
+        ]
+        self.archived_trades.archive(
+            popped,
+            self.get_completed_trades_pnl(trades_history=popped, selected_trades=removed_entries_exits)
+            if removed_entries_exits else []
+        )
         self.logger.info(
-            f"Cleared the {len(popped)} {self.trader.exchange_manager.exchange_name} oldest historical trades: "
+            f"Archived the {len(popped)} {self.trader.exchange_manager.exchange_name} oldest historical trades: "
             f"{dict(self._get_trades_count_by_symbols(trades=popped))}"
         )
 
@@ -59,8 +59,16 @@ def compute_win_rate(exchange_manager):
     lost_trades_count = constants.ZERO
     won_trades_count = constants.ZERO
     entries = constants.ZERO
+    trades_manager = exchange_manager.exchange_personal_data.trades_manager
     if exchange_manager.is_future:
-        for trade in exchange_manager.exchange_personal_data.trades_manager.trades.values():
+        # include archived trades
+        lost_trades_count += trades_manager.archived_trades.get_filled_trades_count(
+            reduce_only=True, exchange_trade_types=_LOSING_ORDER_TYPES
+        )
+        won_trades_count += trades_manager.archived_trades.get_filled_trades_count(reduce_only=True) \
+            - lost_trades_count
+        entries += trades_manager.archived_trades.get_filled_trades_count(reduce_only=False)
+        for trade in trades_manager.trades.values():
             if trade.status is trading_enums.OrderStatus.FILLED:
                 if trade.reduce_only:
                     if trade.exchange_trade_type in _LOSING_ORDER_TYPES:
@@ -87,7 +95,14 @@ def compute_win_rate(exchange_manager):
                     else:
                         lost_trades_count += constants.ONE
     else:
-        for trade in exchange_manager.exchange_personal_data.trades_manager.trades.values():
+        # include archived trades
+        lost_trades_count += trades_manager.archived_trades.get_filled_trades_count(
+            side=trading_enums.TradeOrderSide.SELL, exchange_trade_types=_LOSING_ORDER_TYPES
+        )
+        won_trades_count += trades_manager.archived_trades.get_filled_trades_count(
+            side=trading_enums.TradeOrderSide.SELL
+        ) - lost_trades_count
+        for trade in trades_manager.trades.values():
             if trade.status is trading_enums.OrderStatus.FILLED and trade.side is trading_enums.TradeOrderSide.SELL:
                 if trade.exchange_trade_type in _LOSING_ORDER_TYPES:
                     lost_trades_count += constants.ONE
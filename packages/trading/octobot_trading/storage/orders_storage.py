@@ -44,6 +44,7 @@ class OrdersStorage(abstract_storage.AbstractStorage):
     HISTORICAL_OPEN_ORDERS_TABLE = commons_enums.DBTables.HISTORICAL_ORDERS_UPDATES.value
     ENABLE_HISTORICAL_ORDER_UPDATES_STORAGE = constants.ENABLE_HISTORICAL_ORDERS_UPDATES_STORAGE
     IS_MULTI_EXCHANGE_STORAGE = True   # set True when this storage is updating data from all other exchanges as well
+    HISTORY_COMPACTION_DELTA_WRITES = 500   # fully rewrite open orders after this number of incremental writes
 
     def __init__(self, exchange_manager, use_live_consumer_in_backtesting=None, is_historical=None):
         super().__init__(
@@ -51,6 +52,10 @@ class OrdersStorage(abstract_storage.AbstractStorage):
             use_live_consumer_in_backtesting=use_live_consumer_in_backtesting, is_historical=is_historical
         )
         self.startup_orders = {}
+        # (uuid, relations) of each stored open order document by order id, None when stored documents are unknown
+        self._stored_orders = None
+        self._updated_order_ids = set()
+        self._delta_writes_count = 0
 
     def should_store_data(self):
         return (
@@ -73,21 +78,83 @@ class OrdersStorage(abstract_storage.AbstractStorage):
         await self.trigger_debounced_update_auth_data(False)
         # only store the current snapshot of open orders when order updates are received
         if self.should_store_data():
+            self._updated_order_ids.add(order[enums.ExchangeConstantsOrderColumns.ID.value])
             await self._update_history()
             if self.ENABLE_HISTORICAL_ORDER_UPDATES_STORAGE:
                 await self._add_historical_open_orders(order, update_type)
             await self.trigger_debounced_flush()
 
     @abstract_storage.AbstractStorage.hard_reset_and_retry_if_necessary
-    async def _update_history(self):
-        await self._get_db().replace_all(
+    async def _update_history(self, compact=False):
+        open_orders = {
+            order.order_id: order
+            for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders()
+        }
+        # reset stored documents to force a full rewrite next time if anything goes wrong
+        stored_orders, self._stored_orders = self._stored_orders, None
+        if (
+            compact or stored_orders is None
+            or self._delta_writes_count >= self.HISTORY_COMPACTION_DELTA_WRITES
+        ):
+            stored_orders = await self._replace_history(open_orders)
+        else:
+            await self._write_history_delta(open_orders, stored_orders)
+        self._stored_orders = stored_orders
+        self._updated_order_ids.clear()
+
+    async def _replace_history(self, open_orders: dict) -> dict:
+        uuids = await self._get_db().replace_all(
             self.HISTORY_TABLE,
             [
                 _format_order(order, self.exchange_manager)
-                for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders()
+                for order in open_orders.values()
             ],
             cache=False,
         )
+        self._delta_writes_count = 0
+        return {
+            order_id: (uuid, _get_order_relations(order))
+            for (order_id, order), uuid in zip(open_orders.items(), uuids)
+        }
+
+    async def _write_history_delta(self, open_orders: dict, stored_orders: dict):
+        """
+        Only writes new, updated and removed open orders, stored documents of other orders are left untouched.
+        Orders are also rewritten when elements stored in their document changed without updating them
+        (ex: a chained order is added) or when one of their chained orders is updated.
+        """
+        database = self._get_db()
+        updated_order_ids = set(self._updated_order_ids)
+        for order_id in self._updated_order_ids:
+            if (order := open_orders.get(order_id)) is not None and order.triggered_by is not None:
+                updated_order_ids.add(order.triggered_by.order_id)
+        for order_id in [
+            order_id
+            for order_id, (_, relations) in stored_orders.items()
+            if order_id not in open_orders
+            or order_id in updated_order_ids
+            or not _are_same_relations(relations, _get_order_relations(open_orders[order_id]))
+        ]:
+            await database.delete(self.HISTORY_TABLE, None, uuid=stored_orders.pop(order_id)[0])
+        to_store_order_ids = [
+            order_id
+            for order_id in open_orders
+            if order_id not in stored_orders
+        ]
+        if to_store_order_ids:
+            uuids = await database.log_many(
+                self.HISTORY_TABLE,
+                [
+                    _format_order(open_orders[order_id], self.exchange_manager)
+                    for order_id in to_store_order_ids
+                ],
+                cache=False,
+            )
+            stored_orders.update(
+                (order_id, (uuid, _get_order_relations(open_orders[order_id])))
+                for order_id, uuid in zip(to_store_order_ids, uuids)
+            )
+        self._delta_writes_count += 1
 
     async def _add_historical_open_orders(self, order_dict: dict, update_type: str):
         update_time = time.time()
@@ -115,9 +182,13 @@ class OrdersStorage(abstract_storage.AbstractStorage):
             await authenticator.update_orders(orders_by_exchange)
 
     async def _store_history(self):
-        await self._update_history()
+        await self._update_history(compact=True)
         await self._get_db().flush()
 
+    async def clear_history(self, flush=True):
+        await super().clear_history(flush=flush)
+        self._stored_orders = None
+
     def _get_db(self):
         return commons_databases.RunDatabasesProvider.instance().get_orders_db(
             self.exchange_manager.bot_id,
@@ -236,6 +307,24 @@ def _get_chained_orders(order, exchange_manager):
     ]
 
 
+def _get_order_relations(order) -> tuple:
+    # elements stored in the order document that can change without an update of this order
+    return (
+        order.order_group,
+        order.active_trigger,
+        order.trailing_profile,
+        order.cancel_policy,
+        *order.chained_orders,
+    )
+
+
+def _are_same_relations(relations, other_relations) -> bool:
+    return len(relations) == len(other_relations) and all(
+        relation is other_relation
+        for relation, other_relation in zip(relations, other_relations)
+    )
+
+
 def _format_order(order, exchange_manager):
     try:
         formatted = {
@@ -30,6 +30,14 @@ class TradesStorage(abstract_storage.AbstractStorage):
     LIVE_CHANNEL = channels_name.OctoBotTradingChannelsName.TRADES_CHANNEL.value
     HISTORY_TABLE = commons_enums.DBTables.TRADES.value
 
+    def __init__(self, exchange_manager, plot_settings, use_live_consumer_in_backtesting=None, is_historical=None):
+        super().__init__(
+            exchange_manager, plot_settings,
+            use_live_consumer_in_backtesting=use_live_consumer_in_backtesting, is_historical=is_historical
+        )
+        # uuid of the stored trades by trade id, None when stored trades are unknown
+        self._stored_trade_uuids = None
+
     @abstract_storage.AbstractStorage.hard_reset_and_retry_if_necessary
     async def _live_callback(
         self,
@@ -41,8 +49,7 @@ class TradesStorage(abstract_storage.AbstractStorage):
         old_trade: bool
     ):
         if trade[enums.ExchangeConstantsOrderColumns.STATUS.value] != enums.OrderStatus.CANCELED.value:
-            await self._get_db().log(
-                self.HISTORY_TABLE,
+            await self._upsert_trade(
                 _format_trade(
                     trade,
                     self.exchange_manager,
@@ -56,6 +63,23 @@ class TradesStorage(abstract_storage.AbstractStorage):
             self._to_update_auth_data_ids_buffer.add(trade[enums.ExchangeConstantsOrderColumns.ID.value])
             await self.trigger_debounced_update_auth_data(False)
 
+    async def _upsert_trade(self, formatted_trade: dict):
+        database = self._get_db()
+        # reset stored trades to reload them next time if anything goes wrong
+        stored_trade_uuids, self._stored_trade_uuids = self._stored_trade_uuids, None
+        if stored_trade_uuids is None:
+            stored_trade_uuids = {
+                document.get(commons_enums.DBRows.ID.value): database.get_uuid(document)
+                for document in await database.all(self.HISTORY_TABLE)
+            }
+        trade_id = formatted_trade[commons_enums.DBRows.ID.value]
+        if (uuid := stored_trade_uuids.get(trade_id)) is not None:
+            # only update the already stored trade instead of adding it again
+            await database.upsert(self.HISTORY_TABLE, formatted_trade, None, uuid=uuid)
+        else:
+            stored_trade_uuids[trade_id] = (await database.log_many(self.HISTORY_TABLE, [formatted_trade]))[0]
+        self._stored_trade_uuids = stored_trade_uuids
+
     async def _update_auth_data(self, reset):
         # skip trades history on simulated trading
         if self.exchange_manager.is_trader_simulated:
@@ -76,24 +100,30 @@ class TradesStorage(abstract_storage.AbstractStorage):
     @abstract_storage.AbstractStorage.hard_reset_and_retry_if_necessary
     async def _store_history(self):
         database = self._get_db()
-        await database.replace_all(
-            self.HISTORY_TABLE,
-            [
-                _format_trade(
-                    trade.to_dict(),
-                    self.exchange_manager,
-                    self.plot_settings.chart,
-                    self.plot_settings.x_multiplier,
-                    self.plot_settings.kind,
-                    self.plot_settings.mode
-                )
-                for trade in self.exchange_manager.exchange_personal_data.trades_manager.trades.values()
-                if trade.status is not enums.OrderStatus.CANCELED
-            ],
-            cache=False,
-        )
+        self._stored_trade_uuids = None
+        formatted_trades = [
+            _format_trade(
+                trade.to_dict(),
+                self.exchange_manager,
+                self.plot_settings.chart,
+                self.plot_settings.x_multiplier,
+                self.plot_settings.kind,
+                self.plot_settings.mode
+            )
+            for trade in self.exchange_manager.exchange_personal_data.trades_manager.trades.values()
+            if trade.status is not enums.OrderStatus.CANCELED
+        ]
+        uuids = await database.replace_all(self.HISTORY_TABLE, formatted_trades, cache=False)
+        self._stored_trade_uuids = {
+            formatted_trade[commons_enums.DBRows.ID.value]: uuid
+            for formatted_trade, uuid in zip(formatted_trades, uuids)
+        }
         await database.flush()
 
+    async def clear_history(self, flush=True):
+        await super().clear_history(flush=flush)
+        self._stored_trade_uuids = None
+
     def _get_trade_dict_with_usd_like_volume(self, trade) -> dict:
         trade_dict = trade.to_dict()
         parsed_symbol = commons_symbols.parse_symbol(trade.symbol)
@@ -0,0 +1,27 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Hot paths benchmarks, using pytest-benchmark on deterministic synthetic datasets at several scales.
+Not collected by default, run them from the OctoBot-Trading folder:
+pytest tests/benchmarks/benchmark_*.py --benchmark-storage=tests/benchmarks/.benchmarks
+
+Save a baseline with --benchmark-save=<name> and detect regressions against it with
+--benchmark-compare=<name> --benchmark-compare-fail=mean:10%
+"""
+CANDLES_COUNTS = (100, 1000, 10000)
+OPEN_ORDERS_COUNTS = (10, 100, 1000)
+ORDER_BOOK_DEPTHS = (10, 100, 1000)
+PAIRS_COUNTS = (1, 10, 100)
@@ -0,0 +1,63 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import itertools
+
+import pytest
+
+from octobot_trading.exchange_data.ohlcv.candles_manager import CandlesManager
+from tests.benchmarks import CANDLES_COUNTS
+
+TIME_FRAME_SECONDS = 60
+
+
+def _get_candle(index):
+    price = 1000 + index % 100
+    return [index * TIME_FRAME_SECONDS, price, price + 2, price - 2, price + 1, 10 + index % 7]
+
+
+def _gen_candles(start_index, size) -> list:
+    return [_get_candle(index) for index in range(start_index, start_index + size)]
+
+
+def _add_new_candles(candles_manager, candles):
+    for candle in candles:
+        candles_manager.add_new_candle(candle)
+
+
+@pytest.mark.parametrize("candles_count", CANDLES_COUNTS)
+def test_add_new_candles(benchmark, candles_count):
+    candles = _gen_candles(0, candles_count)
+    benchmark.pedantic(
+        _add_new_candles,
+        setup=lambda: ((CandlesManager(max_candles_count=candles_count), candles), {}),
+        rounds=20
+    )
+
+
+@pytest.mark.parametrize("candles_count", CANDLES_COUNTS)
+def test_add_new_candle_when_full(benchmark, candles_count):
+    candles_manager = CandlesManager(max_candles_count=candles_count)
+    _add_new_candles(candles_manager, _gen_candles(0, candles_manager.max_candles_count))
+    assert candles_manager.reached_max
+    new_candle_indexes = itertools.count(candles_manager.max_candles_count)
+    benchmark(lambda: candles_manager.add_new_candle(_get_candle(next(new_candle_indexes))))
+
+
+@pytest.mark.parametrize("candles_count", CANDLES_COUNTS)
+def test_get_symbol_prices(benchmark, candles_count):
+    candles_manager = CandlesManager(max_candles_count=candles_count)
+    _add_new_candles(candles_manager, _gen_candles(0, candles_count))
+    benchmark(candles_manager.get_symbol_prices)
@@ -0,0 +1,83 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import pytest
+
+from octobot_trading.exchange_data.order_book.order_book_manager import OrderBookManager
+from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC
+from octobot_trading.enums import TradeOrderSide
+from tests.benchmarks import ORDER_BOOK_DEPTHS
+
+MID_PRICE = decimal.Decimal(10000)
+PRICE_STEP = decimal.Decimal("0.1")
+ORDERS_PER_PRICE = 3
+
+
+def _price_size_lists(depth):
+    asks = [[float(MID_PRICE + index * PRICE_STEP), 1 + index % 5] for index in range(1, depth + 1)]
+    bids = [[float(MID_PRICE - index * PRICE_STEP), 1 + index % 5] for index in range(1, depth + 1)]
+    return asks, bids
+
+
+def _book_orders(depth, size):
+    # ORDERS_PER_PRICE orders on each of the depth price levels of each side
+    return [
+        {
+            ECOBIC.SIDE.value: side,
+            ECOBIC.SIZE.value: size,
+            ECOBIC.PRICE.value: MID_PRICE + index * PRICE_STEP * (1 if side == TradeOrderSide.SELL.value else -1),
+            ECOBIC.ORDER_ID.value: f"{side}-{index}-{order_index}",
+        }
+        for side in (TradeOrderSide.SELL.value, TradeOrderSide.BUY.value)
+        for index in range(1, depth + 1)
+        for order_index in range(ORDERS_PER_PRICE)
+    ]
+
+
+def _order_book_manager(depth):
+    order_book_manager = OrderBookManager()
+    order_book_manager.handle_book_adds(_book_orders(depth, decimal.Decimal(1)))
+    return order_book_manager
+
+
+@pytest.mark.parametrize("depth", ORDER_BOOK_DEPTHS)
+def test_handle_new_books(benchmark, depth):
+    order_book_manager = OrderBookManager()
+    asks, bids = _price_size_lists(depth)
+    benchmark(order_book_manager.handle_new_books, asks, bids, timestamp=1)
+    assert len(order_book_manager.asks) == len(order_book_manager.bids) == depth
+
+
+@pytest.mark.parametrize("depth", ORDER_BOOK_DEPTHS)
+def test_handle_book_updates(benchmark, depth):
+    order_book_manager = _order_book_manager(depth)
+    updates = _book_orders(depth, decimal.Decimal(2))
+    benchmark(order_book_manager.handle_book_updates, updates)
+    assert order_book_manager.get_ask()[1][0][ECOBIC.SIZE.value] == decimal.Decimal(2)
+
+
+@pytest.mark.parametrize("depth", ORDER_BOOK_DEPTHS)
+def test_handle_book_deletes_and_adds(benchmark, depth):
+    order_book_manager = _order_book_manager(depth)
+    orders = _book_orders(depth, decimal.Decimal(1))
+
+    def _delete_and_add_orders():
+        order_book_manager.handle_book_deletes(orders)
+        order_book_manager.handle_book_adds(orders)
+
+    benchmark(_delete_and_add_orders)
+    assert len(order_book_manager.asks) == len(order_book_manager.bids) == depth
@@ -0,0 +1,63 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import pytest
+
+import octobot_commons.constants as commons_constants
+from octobot_trading.enums import TraderOrderType, OrderStatus
+from octobot_trading.personal_data.orders import BuyLimitOrder, SellLimitOrder
+from tests.benchmarks import PAIRS_COUNTS
+from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+SYMBOL = "BTC/USDT"
+PRICE = decimal.Decimal(100)
+QUANTITY = decimal.Decimal("0.1")
+
+
+def _filled_order(trader, order_class, order_type):
+    order = order_class(trader)
+    order.update(
+        order_type=order_type, symbol=SYMBOL, status=OrderStatus.FILLED, current_price=PRICE,
+        quantity=QUANTITY, quantity_filled=QUANTITY, price=PRICE, filled_price=PRICE,
+    )
+    return order
+
+
+@pytest.mark.parametrize("pairs_count", PAIRS_COUNTS)
+async def test_update_portfolio_from_filled_order(benchmark, backtesting_trader, pairs_count):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio = exchange_manager.exchange_personal_data.portfolio_manager.portfolio
+    portfolio.update_portfolio_from_balance({
+        currency: {
+            commons_constants.PORTFOLIO_AVAILABLE: decimal.Decimal(1000),
+            commons_constants.PORTFOLIO_TOTAL: decimal.Decimal(1000),
+        }
+        for currency in ("BTC", "USDT", *(f"COIN{index}" for index in range(pairs_count)))
+    })
+    buy_order = _filled_order(trader, BuyLimitOrder, TraderOrderType.BUY_LIMIT)
+    sell_order = _filled_order(trader, SellLimitOrder, TraderOrderType.SELL_LIMIT)
+
+    def _update_portfolio_from_filled_orders():
+        # buy then sell to keep the portfolio content stable
+        portfolio.update_portfolio_from_filled_order(buy_order)
+        portfolio.update_portfolio_from_filled_order(sell_order)
+
+    benchmark(_update_portfolio_from_filled_orders)
@@ -0,0 +1,64 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import pytest
+
+from octobot_trading.exchange_data.prices.price_events_manager import PriceEventsManager
+from tests.benchmarks import OPEN_ORDERS_COUNTS
+
+MID_PRICE = decimal.Decimal(10000)
+PRICE_STEP = decimal.Decimal("0.5")
+
+
+def _price_events_manager(open_orders_count):
+    # half of the events are waiting for a price increase and half for a price decrease, around MID_PRICE
+    price_events_manager = PriceEventsManager()
+    for index in range(1, open_orders_count // 2 + 1):
+        price_events_manager.new_event(MID_PRICE + index * PRICE_STEP, 0, True)
+        price_events_manager.new_event(MID_PRICE - index * PRICE_STEP, 0, False)
+    return price_events_manager
+
+
+@pytest.mark.parametrize("open_orders_count", OPEN_ORDERS_COUNTS)
+def test_handle_price_without_triggered_events(benchmark, open_orders_count):
+    price_events_manager = _price_events_manager(open_orders_count)
+    benchmark(price_events_manager.handle_price, MID_PRICE, 1)
+    assert len(price_events_manager.events) == open_orders_count // 2 * 2
+
+
+@pytest.mark.parametrize("open_orders_count", OPEN_ORDERS_COUNTS)
+def test_handle_price_triggering_all_events(benchmark, open_orders_count):
+    # every event waiting for a price increase is triggered
+    benchmark.pedantic(
+        lambda price_events_manager: price_events_manager.handle_price(
+            MID_PRICE + open_orders_count * PRICE_STEP, 1
+        ),
+        setup=lambda: ((_price_events_manager(open_orders_count), ), {}),
+        rounds=50
+    )
+
+
+@pytest.mark.parametrize("open_orders_count", OPEN_ORDERS_COUNTS)
+def test_new_event(benchmark, open_orders_count):
+    price_events_manager = _price_events_manager(open_orders_count)
+    for index in range(PriceEventsManager.MAX_LAST_RECENT_PRICES):
+        price_events_manager.handle_price(MID_PRICE, index)
+
+    def _new_and_remove_event():
+        price_events_manager.remove_event(price_events_manager.new_event(MID_PRICE * 2, 0, True))
+
+    benchmark(_new_and_remove_event)
@@ -17,13 +17,14 @@ import numpy as np
 
 from octobot_commons.enums import PriceIndexes
 from octobot_trading.exchange_data.ohlcv.candles_manager import CandlesManager
+from octobot_trading.exchange_data.ohlcv.preloaded_candles_manager import PreloadedCandlesManager
 
 
 def test_constructor():
     candles_manager = CandlesManager()
     assert candles_manager.candles_initialized is False
     assert candles_manager.close_candles_index == 0
-    assert len(candles_manager.close_candles) == CandlesManager.MAX_CANDLES_COUNT
+    assert len(candles_manager.close_candles) == CandlesManager.INITIAL_CANDLES_CAPACITY
     assert all(np.isnan(value) for value in candles_manager.close_candles)
 
 
@@ -32,7 +33,7 @@ def test_add_new_candle():
     candle = _gen_candles(1)[0]
     candles_manager.add_new_candle(candle)
     assert candles_manager.close_candles_index == 1
-    assert len(candles_manager.close_candles) == CandlesManager.MAX_CANDLES_COUNT
+    assert len(candles_manager.close_candles) == CandlesManager.INITIAL_CANDLES_CAPACITY
     assert candles_manager.close_candles[0] == candle[PriceIndexes.IND_PRICE_CLOSE.value]
 
 
@@ -44,7 +45,7 @@ def test_add_old_and_new_candles():
     candles_manager.add_old_and_new_candles(single_candle)
     assert candles_manager.reached_max is False
     assert candles_manager.close_candles_index == 1
-    assert len(candles_manager.close_candles) == CandlesManager.MAX_CANDLES_COUNT
+    assert len(candles_manager.close_candles) == CandlesManager.INITIAL_CANDLES_CAPACITY
     assert candles_manager.close_candles[0] == single_candle[0][PriceIndexes.IND_PRICE_CLOSE.value]
 
     # with many candles including first one
@@ -52,11 +53,66 @@ def test_add_old_and_new_candles():
     candles_manager.add_old_and_new_candles(many_candles)
     assert candles_manager.reached_max is False
     assert candles_manager.close_candles_index == 10
-    assert len(candles_manager.close_candles) == CandlesManager.MAX_CANDLES_COUNT
+    assert len(candles_manager.close_candles) == CandlesManager.INITIAL_CANDLES_CAPACITY
     assert candles_manager.close_candles[0] == many_candles[0][PriceIndexes.IND_PRICE_CLOSE.value]
     assert candles_manager.close_candles[9] == many_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
 
 
+def test_add_old_and_new_candles_with_missing_older_candles():
+    candles_manager = CandlesManager()
+    candles = _gen_candles(10)
+    candles_manager.add_old_and_new_candles(candles[:3] + candles[7:])
+    assert candles_manager.close_candles_index == 6
+
+    # missing candles are merged at their place in time
+    candles_manager.add_old_and_new_candles(candles[2:7])
+    assert candles_manager.close_candles_index == 10
+    assert np.array_equal(
+        candles_manager.get_symbol_time_candles(),
+        np.array([candle[PriceIndexes.IND_PRICE_TIME.value] for candle in candles], dtype=np.float64)
+    )
+    assert np.array_equal(
+        candles_manager.get_symbol_close_candles(),
+        np.array([candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in candles], dtype=np.float64)
+    )
+
+    # oldest candles are dropped when exceeding max candles count
+    candles_manager = CandlesManager(max_candles_count=CandlesManager.MIN_CANDLES_COUNT)
+    candles = _gen_candles(candles_manager.max_candles_count + 2)
+    candles_manager.add_old_and_new_candles(candles[:1] + candles[3:])
+    assert candles_manager.reached_max is True
+    candles_manager.add_old_and_new_candles(candles[:3])
+    assert candles_manager.reached_max is True
+    assert candles_manager.close_candles_index == candles_manager.max_candles_count - 1
+    assert np.array_equal(
+        candles_manager.get_symbol_time_candles(),
+        np.array([candle[PriceIndexes.IND_PRICE_TIME.value] for candle in candles[2:]], dtype=np.float64)
+    )
+    candles_manager.add_new_candle(_get_candle(len(candles) + 1))
+    assert candles_manager.get_symbol_time_candles(1)[-1] == len(candles) + 1
+
+
+def test_candles_capacity_growth():
+    candles_manager = CandlesManager()
+    initial_capacity = CandlesManager.INITIAL_CANDLES_CAPACITY
+    candles = _gen_candles(initial_capacity + 1)
+    candles_manager.add_old_and_new_candles(candles[:initial_capacity])
+    assert candles_manager.reached_max is False
+    assert len(candles_manager.close_candles) == initial_capacity * 2
+    candles_manager.add_new_candle(candles[-1])
+    assert candles_manager.close_candles_index == initial_capacity + 1
+    assert np.array_equal(
+        candles_manager.get_symbol_time_candles(),
+        np.array([candle[PriceIndexes.IND_PRICE_TIME.value] for candle in candles], dtype=np.float64)
+    )
+    assert np.isnan(candles_manager.close_candles[initial_capacity + 1])
+
+    # capacity is reserved for every candle when replacing candles
+    candles_manager.replace_all_candles(_gen_candles(initial_capacity * 3))
+    assert len(candles_manager.close_candles) == initial_capacity * 3 + 1
+    assert candles_manager.get_symbol_candles_count() == initial_capacity * 3
+
+
 def test_replace_all_candles():
     candles_manager = CandlesManager()
     many_candles = _gen_candles(20)[10:]
@@ -69,6 +125,26 @@ def test_replace_all_candles():
     assert candles_manager.close_candles[9] == new_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
 
 
+def test_preloaded_replace_all_candle_arrays():
+    candles_manager = PreloadedCandlesManager()
+    candles = _gen_candles(10)
+    candle_arrays = {
+        price_index.value: np.array([candle[price_index.value] for candle in candles], dtype=np.float64)
+        for price_index in PriceIndexes
+    }
+    candles_manager.replace_all_candle_arrays(candle_arrays)
+    assert candles_manager.candles_initialized is True
+    # arrays are used as is
+    assert candles_manager.close_candles is candle_arrays[PriceIndexes.IND_PRICE_CLOSE.value]
+    assert candles_manager.get_preloaded_symbol_candles_count() == 10
+    other_candles_manager = PreloadedCandlesManager()
+    other_candles_manager.replace_all_candles(candles)
+    assert all(
+        np.array_equal(candles_manager.get_symbol_prices()[index], other_candles_manager.get_symbol_prices()[index])
+        for index in candle_arrays
+    )
+
+
 def test_get_symbol_prices():
     candles_manager = CandlesManager()
     candle = _gen_candles(1)[0]
@@ -155,6 +231,28 @@ def test_reach_max_candles_count_with_custom_candles_count():
                other_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value])
 
 
+def test_required_candles_count():
+    required_candles_count = CandlesManager.MIN_CANDLES_COUNT + 50
+    candles_manager = CandlesManager(max_candles_count=required_candles_count)
+    assert candles_manager.max_candles_count == required_candles_count
+    all_candles = _gen_candles(required_candles_count * 2)
+    candles_manager.add_old_and_new_candles(all_candles)
+    # only the required candles are kept in RAM
+    assert candles_manager.reached_max is True
+    assert len(candles_manager.close_candles) == required_candles_count
+    _test_data(candles_manager.get_symbol_close_candles(), required_candles_count,
+               all_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value])
+
+    # replaced candles are also limited
+    candles_manager.replace_all_candles(all_candles)
+    assert len(candles_manager.close_candles) == required_candles_count
+    _test_data(candles_manager.get_symbol_time_candles(), required_candles_count,
+               all_candles[-1][PriceIndexes.IND_PRICE_TIME.value])
+
+    # initially fetched candles always fit
+    assert CandlesManager(max_candles_count=10).max_candles_count == CandlesManager.MIN_CANDLES_COUNT
+
+
 def _test_data(candles_data, expected_len, expected_last_val):
     assert len(candles_data) == expected_len
     if expected_len > 0:
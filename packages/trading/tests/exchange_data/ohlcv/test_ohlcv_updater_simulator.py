@@ -0,0 +1,64 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+import octobot_commons.enums as commons_enums
+import octobot_trading.constants as constants
+import octobot_trading.exchange_channel as exchange_channel
+from octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater_simulator import OHLCVUpdaterSimulator
+
+from tests import event_loop
+from tests.exchanges import backtesting_config, backtesting_exchange_manager, fake_backtesting
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_traded_pairs(backtesting_exchange_manager):
+    exchange_config = backtesting_exchange_manager.exchange_config
+    exchange_config.traded_symbol_pairs = ["BTC/USDT"]
+    exchange_config.watched_pairs = ["BTC/USDT"]
+    exchange_config.additional_traded_pairs = []
+    importer = mock.Mock(
+        symbols=["BTC/USDT", "ETH/USDT", "ETH/BTC", "SOL/USDT"],
+        time_frames=[commons_enums.TimeFrames.ONE_HOUR]
+    )
+    updater = OHLCVUpdaterSimulator(
+        exchange_channel.get_chan(constants.OHLCV_CHANNEL, backtesting_exchange_manager.id), importer
+    )
+    # other data file pairs are not read
+    assert updater.traded_pairs == ["BTC/USDT"]
+
+    exchange_config.watched_pairs.append("ETH/BTC")
+    exchange_config.additional_traded_pairs.append("SOL/USDT")
+    exchange_config.additional_traded_pairs.append("XRP/USDT")
+    # traded pairs are not recomputed on time updates
+    assert updater.traded_pairs == ["BTC/USDT"]
+    with mock.patch.object(updater, "_load_historical_candles", mock.AsyncMock()) as _load_historical_candles_mock:
+        # not initialized: added pairs history will be loaded on start
+        await updater.modify(added_pairs=["ETH/BTC"])
+        assert updater.traded_pairs == ["BTC/USDT", "ETH/BTC", "SOL/USDT"]
+        _load_historical_candles_mock.assert_not_awaited()
+
+        updater.is_initialized = True
+        updater.traded_time_frame = [commons_enums.TimeFrames.ONE_HOUR]
+        updater.last_timestamp_pushed = 1000
+        exchange_config.watched_pairs.append("ETH/USDT")
+        await updater.modify(added_pairs=["ETH/USDT"], removed_pairs=["SOL/USDT"])
+        assert updater.traded_pairs == ["BTC/USDT", "ETH/USDT", "ETH/BTC"]
+        # added pairs history is loaded up to the current backtesting time
+        _load_historical_candles_mock.assert_awaited_once_with(commons_enums.TimeFrames.ONE_HOUR, "ETH/USDT", 1000)
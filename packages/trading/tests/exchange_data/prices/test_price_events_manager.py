@@ -31,7 +31,8 @@ pytestmark = pytest.mark.asyncio
 
 async def test_reset(price_events_manager):
     if not os.getenv('CYTHON_IGNORE'):
-        price_events_manager.events.append(None)
+        price_events_manager.new_event(decimal.Decimal("2"), 0.0, True)
+        price_events_manager.new_event(decimal.Decimal("2"), 0.0, False)
         assert price_events_manager.events
         price_events_manager.reset()
         assert not price_events_manager.events
@@ -171,3 +172,30 @@ async def test_remove_event(price_events_manager):
         price_events_manager.remove_event(event_2)
         assert event_2 not in price_events_manager.events
         assert len(price_events_manager.events) == 0
+
+
+async def test_handle_price_with_many_events(price_events_manager):
+    above_events = {
+        price: price_events_manager.new_event(decimal.Decimal(price), 10, True)
+        for price in range(100, 200)
+    }
+    below_events = {
+        price: price_events_manager.new_event(decimal.Decimal(price), 10, False)
+        for price in range(1, 100)
+    }
+    # same price, later timestamp
+    late_event = price_events_manager.new_event(decimal.Decimal(150), 20, True)
+    assert len(price_events_manager.events) == 200
+    price_events_manager.handle_price(decimal.Decimal(150), 15)
+    assert all(above_events[price].is_set() is (price <= 150) for price in above_events)
+    assert not any(event.is_set() for event in below_events.values())
+    assert not late_event.is_set()
+    assert len(price_events_manager.events) == 149
+    price_events_manager.handle_price(decimal.Decimal("89.5"), 15)
+    assert all(below_events[price].is_set() is (price >= 90) for price in below_events)
+    assert len(price_events_manager.events) == 139
+    price_events_manager.handle_price(decimal.Decimal(150), 20)
+    assert late_event.is_set()
+    price_events_manager.remove_event(above_events[199])
+    price_events_manager.remove_event(below_events[1])
+    assert len(price_events_manager.events) == 136
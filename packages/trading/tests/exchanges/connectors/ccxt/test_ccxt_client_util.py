@@ -23,6 +23,7 @@ import octobot_commons.aiohttp_util as aiohttp_util
 
 import octobot_trading.exchanges as exchanges
 import octobot_trading.exchanges.connectors.ccxt.ccxt_client_util as ccxt_client_util
+import octobot_trading.exchanges.connectors.ccxt.ccxt_shared_sessions as ccxt_shared_sessions
 import octobot_trading.constants as constants
 
 
@@ -167,6 +168,48 @@ async def test_request_counter():
         _request_mock.reset_mock()
 
 
+@pytest.mark.asyncio
+async def test_shared_sessions():
+    proxy_config = exchanges.ExchangeProxyConfig()
+    with mock.patch.object(aiohttp.ClientSession, "_request", mock.AsyncMock()) as _request_mock:
+        # disabled
+        async with _exchange_with_proxy_config(proxy_config) as exchange_1, \
+                _exchange_with_proxy_config(proxy_config) as exchange_2:
+            assert exchange_1.own_session is exchange_2.own_session is True
+            assert ccxt_shared_sessions._SHARED_SESSIONS == {}
+
+        with mock.patch.object(constants, "USE_SHARED_EXCHANGE_HTTP_SESSIONS", True):
+            exchange_1 = ccxt_client_util.instantiate_exchange(ccxt.kraken, {"enableRateLimit": False}, "test", proxy_config)
+            exchange_2 = ccxt_client_util.instantiate_exchange(ccxt.kraken, {"enableRateLimit": False}, "test", proxy_config)
+            other_exchange = ccxt_client_util.instantiate_exchange(ccxt.binance, {"enableRateLimit": False}, "test", proxy_config)
+            for exchange in (exchange_1, exchange_2, other_exchange):
+                exchange.timeout_on_exit = 0    # avoid waiting for the exchange to close
+            assert exchange_1.session is exchange_2.session
+            assert other_exchange.session is not exchange_1.session
+            assert exchange_1.own_session is exchange_2.own_session is other_exchange.own_session is False
+            assert len(ccxt_shared_sessions._SHARED_SESSIONS) == 2
+            # requests are sent from the shared session
+            await exchange_1.load_markets()
+            assert _request_mock.call_count > 0
+            shared_session = exchange_1.session
+
+            # session is kept while used by a client
+            await ccxt_client_util.close_client(exchange_1)
+            assert exchange_1.session is None
+            assert not shared_session.closed
+            await ccxt_client_util.close_client(exchange_2)
+            assert shared_session.closed
+            assert len(ccxt_shared_sessions._SHARED_SESSIONS) == 1
+            await ccxt_client_util.close_client(other_exchange)
+            assert ccxt_shared_sessions._SHARED_SESSIONS == {}
+
+            # request counter session can't be shared
+            with mock.patch.object(constants, "ENABLE_CCXT_REQUESTS_COUNTER", True):
+                async with _exchange_with_proxy_config(proxy_config, allow_request_counter=True) as exchange:
+                    assert isinstance(exchange.session, aiohttp_util.CounterClientSession)
+                    assert ccxt_shared_sessions._SHARED_SESSIONS == {}
+
+
 @contextlib.asynccontextmanager
 async def _exchange_with_proxy_config(proxy_config: exchanges.ExchangeProxyConfig, allow_request_counter=False):
     exchange = None
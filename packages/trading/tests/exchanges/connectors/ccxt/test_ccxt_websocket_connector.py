@@ -0,0 +1,222 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+import octobot_commons.enums as commons_enums
+import octobot_trading.constants as trading_constants
+import octobot_trading.enums as enums
+import octobot_trading.exchanges as exchanges
+
+from tests.exchanges import exchange_manager, DEFAULT_EXCHANGE_NAME
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+HOUR = 3600
+START = 1699999200
+
+
+class WebsocketConnector(exchanges.CCXTWebsocketConnector):
+    EXCHANGE_FEEDS = {
+        enums.WebsocketFeeds.CANDLE: True,
+        enums.WebsocketFeeds.TICKER: True,
+    }
+
+    @classmethod
+    def get_name(cls):
+        return DEFAULT_EXCHANGE_NAME
+
+
+@pytest.fixture
+def websocket_connector(exchange_manager):
+    connector = WebsocketConnector(exchange_manager.config, exchange_manager)
+    connector._start_time_millis = 0
+    connector.filtered_pairs = ["BTC/USDT", "ETH/USDT"]
+    yield connector
+
+
+def _ccxt_candle(hours, close):
+    return [(START + hours * HOUR) * 1000, close, close, close, close, 10]
+
+
+async def test_subscribe_feed_multi_symbols(websocket_connector):
+    with mock.patch.object(
+        websocket_connector, "_create_task_if_necessary", mock.Mock(return_value=True)
+    ) as _create_task_if_necessary_mock:
+        websocket_connector._subscribe_feed(enums.WebsocketFeeds.TICKER, symbols=["BTC/USDT", "ETH/USDT"])
+        _create_task_if_necessary_mock.assert_called_once()
+        assert _create_task_if_necessary_mock.call_args[0][2].__name__ == "watch_tickers"
+        assert _create_task_if_necessary_mock.call_args[1]["symbols"] == ["BTC/USDT", "ETH/USDT"]
+        _create_task_if_necessary_mock.reset_mock()
+
+        # only new symbols are subscribed
+        websocket_connector._subscribe_feed(enums.WebsocketFeeds.TICKER, symbols=["BTC/USDT", "SOL/USDT"])
+        _create_task_if_necessary_mock.assert_called_once()
+        assert _create_task_if_necessary_mock.call_args[1]["symbols"] == ["SOL/USDT"]
+        _create_task_if_necessary_mock.reset_mock()
+        websocket_connector._subscribe_feed(enums.WebsocketFeeds.TICKER, symbols=["BTC/USDT"])
+        _create_task_if_necessary_mock.assert_not_called()
+
+        websocket_connector._subscribe_feed(
+            enums.WebsocketFeeds.CANDLE, symbols=["BTC/USDT", "ETH/USDT"], time_frame="1h"
+        )
+        _create_task_if_necessary_mock.assert_called_once()
+        assert _create_task_if_necessary_mock.call_args[0][2].__name__ == "watch_ohlcv_for_symbols"
+        kwargs = _create_task_if_necessary_mock.call_args[1]
+        assert kwargs["symbolsAndTimeframes"] == [["BTC/USDT", "1h"], ["ETH/USDT", "1h"]]
+        assert "timeframe" not in kwargs
+        _create_task_if_necessary_mock.reset_mock()
+
+        # another time frame is another feed
+        websocket_connector._subscribe_feed(enums.WebsocketFeeds.CANDLE, symbols=["BTC/USDT"], time_frame="4h")
+        assert _create_task_if_necessary_mock.call_args[1]["symbolsAndTimeframes"] == [["BTC/USDT", "4h"]]
+
+
+async def test_subscribe_feed_single_symbol(websocket_connector):
+    with mock.patch.object(
+        websocket_connector, "_create_task_if_necessary", mock.Mock(return_value=True)
+    ) as _create_task_if_necessary_mock, mock.patch.object(websocket_connector, "USE_MULTI_SYMBOLS_FEEDS", False):
+        websocket_connector._subscribe_feed(enums.WebsocketFeeds.TICKER, symbols=["BTC/USDT", "ETH/USDT"])
+        assert _create_task_if_necessary_mock.call_count == 2
+        assert [call[1]["symbol"] for call in _create_task_if_necessary_mock.call_args_list] == \
+               ["BTC/USDT", "ETH/USDT"]
+        assert _create_task_if_necessary_mock.call_args[0][2].__name__ == "watch_ticker"
+
+
+async def test_tickers_and_candles_callbacks(websocket_connector):
+    with mock.patch.object(websocket_connector, "ticker", mock.AsyncMock()) as ticker_mock, \
+            mock.patch.object(websocket_connector, "candle", mock.AsyncMock()) as candle_mock:
+        await websocket_connector.tickers({"BTC/USDT": {"last": 1}, "ETH/USDT": {"last": 2}}, symbols=["BTC/USDT"])
+        assert ticker_mock.call_args_list == [
+            mock.call({"last": 1}, symbol="BTC/USDT"),
+            mock.call({"last": 2}, symbol="ETH/USDT"),
+        ]
+        await websocket_connector.candles(
+            {"BTC/USDT": {"1h": [[1]], "4h": [[2]]}},
+            symbolsAndTimeframes=[["BTC/USDT", "1h"], ["BTC/USDT", "4h"]],
+            since=0
+        )
+        assert candle_mock.call_args_list == [
+            mock.call([[1]], symbol="BTC/USDT", timeframe="1h", since=0),
+            mock.call([[2]], symbol="BTC/USDT", timeframe="4h", since=0),
+        ]
+
+
+async def test_wait_for_initialization_multi_symbols(websocket_connector):
+    symbols_and_time_frames = [["BTC/USDT", "1h"], ["ETH/USDT", "1h"], ["SOL/USDT", "1h"]]
+    with mock.patch.object(websocket_connector, "FEED_INITIALIZATION_TIMEOUT", 0):
+        # SOL/USDT is not in filtered pairs: it does not require initialization
+        assert await websocket_connector._wait_for_initialization(
+            enums.WebsocketFeeds.CANDLE, symbolsAndTimeframes=symbols_and_time_frames
+        ) is True
+        assert symbols_and_time_frames == [["SOL/USDT", "1h"]]
+        assert await websocket_connector._wait_for_initialization(
+            enums.WebsocketFeeds.CANDLE, symbol="BTC/USDT", timeframe="1h"
+        ) is False
+        assert await websocket_connector._wait_for_initialization(
+            enums.WebsocketFeeds.TICKER, symbols=["BTC/USDT"]
+        ) is True
+
+
+async def test_candle_resync_on_missing_candles(websocket_connector):
+    with mock.patch.object(websocket_connector, "push_to_channel", mock.AsyncMock()) as push_to_channel_mock, \
+            mock.patch.object(websocket_connector, "_schedule_candles_resync", mock.Mock()) as resync_mock:
+        await websocket_connector.candle(
+            [_ccxt_candle(1, 1), _ccxt_candle(2, 2)], symbol="BTC/USDT", timeframe="1h"
+        )
+        # first candle is closed: pushed as is
+        assert [call[0][0] for call in push_to_channel_mock.call_args_list] == \
+               [trading_constants.OHLCV_CHANNEL, trading_constants.KLINE_CHANNEL]
+        assert websocket_connector._get_last_pushed_closed_candle_time("1h", "BTC/USDT") == START + HOUR
+        resync_mock.assert_not_called()
+        push_to_channel_mock.reset_mock()
+
+        # 2 missing candles
+        await websocket_connector.candle([_ccxt_candle(5, 5)], symbol="BTC/USDT", timeframe="1h")
+        assert [call[0][0] for call in push_to_channel_mock.call_args_list] == [trading_constants.KLINE_CHANNEL]
+        resync_mock.assert_called_once()
+        time_frame, symbol, previous_candle, current_candle_time = resync_mock.call_args[0]
+        assert time_frame is commons_enums.TimeFrames.ONE_HOUR
+        assert symbol == "BTC/USDT"
+        assert previous_candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] == START + 2 * HOUR
+        assert current_candle_time == START + 5 * HOUR
+        push_to_channel_mock.reset_mock()
+        resync_mock.reset_mock()
+
+        # reconnected feed
+        websocket_connector._candles_to_resync.add(("1h", "BTC/USDT"))
+        await websocket_connector.candle([_ccxt_candle(6, 6)], symbol="BTC/USDT", timeframe="1h")
+        resync_mock.assert_called_once()
+        assert websocket_connector._candles_to_resync == set()
+        resync_mock.reset_mock()
+        await websocket_connector.candle([_ccxt_candle(7, 7)], symbol="BTC/USDT", timeframe="1h")
+        resync_mock.assert_not_called()
+
+
+async def test_resync_candles(websocket_connector):
+    time_frame = commons_enums.TimeFrames.ONE_HOUR
+    previous_candle = [START + 2 * HOUR, 2, 2, 2, 2, 10]
+    fetched_candles = [[START + hour * HOUR, hour, hour, hour, hour, 10] for hour in range(2, 6)]
+    exchange = websocket_connector.exchange_manager.exchange
+    with mock.patch.object(websocket_connector, "push_to_channel", mock.AsyncMock()) as push_to_channel_mock, \
+            mock.patch.object(
+                exchange, "get_symbol_prices", mock.AsyncMock(return_value=fetched_candles)
+            ) as get_symbol_prices_mock:
+        await websocket_connector._resync_candles(time_frame, "BTC/USDT", previous_candle, START + 5 * HOUR)
+        get_symbol_prices_mock.assert_awaited_once_with(
+            "BTC/USDT", time_frame, limit=4, since=(START + 2 * HOUR) * 1000
+        )
+        push_to_channel_mock.assert_awaited_once_with(
+            trading_constants.OHLCV_CHANNEL, time_frame, "BTC/USDT", fetched_candles[:-1], partial=True
+        )
+        assert websocket_connector._get_last_pushed_closed_candle_time("1h", "BTC/USDT") == START + 4 * HOUR
+        push_to_channel_mock.reset_mock()
+
+        # websocket candles have been pushed while fetching: don't push them again
+        websocket_connector._register_last_pushed_closed_candle_time("1h", "BTC/USDT", START + 2 * HOUR)
+        await websocket_connector._resync_candles(time_frame, "BTC/USDT", previous_candle, START + 5 * HOUR)
+        push_to_channel_mock.assert_awaited_once_with(
+            trading_constants.OHLCV_CHANNEL, time_frame, "BTC/USDT", fetched_candles[1:-1], partial=True
+        )
+        assert websocket_connector._get_last_pushed_closed_candle_time("1h", "BTC/USDT") == START + 4 * HOUR
+        push_to_channel_mock.reset_mock()
+        websocket_connector._register_last_pushed_closed_candle_time("1h", "BTC/USDT", START + 3 * HOUR)
+        await websocket_connector._resync_candles(time_frame, "BTC/USDT", previous_candle, START + 5 * HOUR)
+        push_to_channel_mock.assert_awaited_once_with(
+            trading_constants.OHLCV_CHANNEL, time_frame, "BTC/USDT", [fetched_candles[0], fetched_candles[2]],
+            partial=True
+        )
+        assert websocket_connector._get_last_pushed_closed_candle_time("1h", "BTC/USDT") == START + 4 * HOUR
+        push_to_channel_mock.reset_mock()
+
+        # newer websocket candles have been pushed while fetching: still merge older resynced candles
+        websocket_connector._register_last_pushed_closed_candle_time("1h", "BTC/USDT", START + 5 * HOUR)
+        await websocket_connector._resync_candles(time_frame, "BTC/USDT", previous_candle, START + 5 * HOUR)
+        push_to_channel_mock.assert_awaited_once_with(
+            trading_constants.OHLCV_CHANNEL, time_frame, "BTC/USDT", fetched_candles[:-1], partial=True
+        )
+        # last pushed candle time is not moved back
+        assert websocket_connector._get_last_pushed_closed_candle_time("1h", "BTC/USDT") == START + 5 * HOUR
+        push_to_channel_mock.reset_mock()
+
+        # REST error: push websocket candle
+        websocket_connector._last_pushed_closed_candle_times.clear()
+        get_symbol_prices_mock.side_effect = ConnectionError
+        await websocket_connector._resync_candles(time_frame, "BTC/USDT", previous_candle, START + 5 * HOUR)
+        push_to_channel_mock.assert_awaited_once_with(
+            trading_constants.OHLCV_CHANNEL, time_frame, "BTC/USDT", [previous_candle], partial=True
+        )
@@ -0,0 +1,52 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+
+import octobot_commons.enums as commons_enums
+import octobot_trading.modes.script_keywords as script_keywords
+
+
+def test_refresh_full_context():
+    trading_mode = mock.Mock(exchange_manager=mock.Mock(is_backtesting=True, bot_id=None), symbol="BTC/USDT")
+    context = script_keywords.get_full_context(
+        trading_mode, "matrix", "Bitcoin", None, "1h", commons_enums.TriggerSource.OHLCV.value, 1,
+        [1, 2], None, init_call=True
+    )
+    assert context.symbol == "BTC/USDT"
+    assert context.enable_trading is False
+    context.allow_artificial_orders = True
+    context.just_created_orders.append("order")
+    context.config_name = "nested"
+    tentacles_requirements = context.tentacles_requirements
+
+    assert script_keywords.refresh_full_context(
+        context, "matrix_2", "Ethereum", commons_enums.TriggerSource.KLINE.value, 2, None, [3, 4]
+    ) is context
+    assert context.matrix_id == "matrix_2"
+    assert context.cryptocurrency == "Ethereum"
+    assert context.trigger_source == commons_enums.TriggerSource.KLINE.value
+    assert context.trigger_cache_timestamp == 2
+    assert context.trigger_value == [3, 4]
+    assert context.enable_trading is True
+    # values updated during the previous script call are reset
+    assert context.allow_artificial_orders is False
+    assert context.just_created_orders == []
+    assert context.config_name == context.cache_manager.DEFAULT_CONFIG_IDENTIFIER
+    assert context.tentacles_requirements is not tentacles_requirements
+    # trigger independent values are kept
+    assert context.symbol == "BTC/USDT"
+    assert context.time_frame == "1h"
+    assert context.exchange_manager is trading_mode.exchange_manager
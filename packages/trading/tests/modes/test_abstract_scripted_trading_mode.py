@@ -0,0 +1,130 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import contextlib
+import pytest
+import mock
+
+import octobot_commons.databases as databases
+import octobot_trading.modes.scripted_trading_mode.abstract_scripted_trading_mode as abstract_scripted_trading_mode
+import octobot_trading.modes.script_keywords.context_management as context_management
+
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def producer(simulated_exchange_manager):
+    producer = abstract_scripted_trading_mode.AbstractScriptedTradingModeProducer(
+        mock.Mock(), {}, mock.Mock(), simulated_exchange_manager
+    )
+    producer.FLUSH_BATCH_DURATION = 0.05
+    return producer
+
+
+@contextlib.contextmanager
+def _patched_databases(producer):
+    with mock.patch.object(databases.RunDatabasesProvider, "instance",
+                           mock.Mock(return_value=mock.Mock(get_symbol_db=mock.Mock(return_value=None)))), \
+         mock.patch.object(producer, "all_databases", mock.Mock(return_value={})):
+        yield
+
+
+def _cache():
+    return mock.Mock(flush=mock.AsyncMock())
+
+
+async def test_schedule_batched_flush(producer):
+    cache_1 = _cache()
+    cache_2 = _cache()
+    with _patched_databases(producer):
+        producer._to_flush_caches.add(cache_1)
+        producer._schedule_batched_flush()
+        flush_task = producer._flush_task
+        producer._to_flush_caches.add(cache_2)
+        producer._schedule_batched_flush()
+        # flushes are batched in the same task
+        assert producer._flush_task is flush_task
+        cache_1.flush.assert_not_called()
+        await flush_task
+        cache_1.flush.assert_awaited_once()
+        cache_2.flush.assert_awaited_once()
+        assert producer._to_flush_caches == set()
+        assert producer._is_flushing is False
+
+
+async def test_stop_flushes_pending_caches(producer):
+    cache = _cache()
+    with _patched_databases(producer):
+        producer._to_flush_caches.add(cache)
+        producer._schedule_batched_flush()
+        flush_task = producer._flush_task
+        await producer.stop()
+        await asyncio.sleep(0)
+        # waiting flush is cancelled but pending caches are flushed
+        assert flush_task.cancelled()
+        cache.flush.assert_awaited_once()
+
+
+async def test_stop_waits_for_in_progress_flush(producer):
+    flush_started = asyncio.Event()
+    release_flush = asyncio.Event()
+
+    async def _slow_flush():
+        flush_started.set()
+        await release_flush.wait()
+
+    flushing_cache = mock.Mock(flush=mock.AsyncMock(side_effect=_slow_flush))
+    new_cache = _cache()
+    with _patched_databases(producer):
+        producer._to_flush_caches.add(flushing_cache)
+        producer._schedule_batched_flush()
+        flush_task = producer._flush_task
+        await flush_started.wait()
+        assert producer._is_flushing is True
+        producer._to_flush_caches.add(new_cache)
+        stop_task = asyncio.create_task(producer.stop())
+        await asyncio.sleep(0)
+        release_flush.set()
+        await stop_task
+        # in progress flush is not interrupted
+        assert not flush_task.cancelled()
+        flushing_cache.flush.assert_awaited_once()
+        new_cache.flush.assert_awaited_once()
+        assert producer._to_flush_caches == set()
+
+
+async def test_get_context(producer):
+    base_context = mock.Mock()
+    with mock.patch.object(context_management, "get_full_context", mock.Mock(return_value=base_context)) \
+         as get_full_context_mock, \
+         mock.patch.object(context_management, "refresh_full_context",
+                           mock.Mock(side_effect=lambda context, *_, **__: context)) as refresh_full_context_mock:
+        context_1 = producer._get_context("matrix_id", "BTC", "BTC/USDT", "1h", "ohlcv", 1, None, None, False)
+        get_full_context_mock.assert_called_once()
+        refresh_full_context_mock.assert_called_once()
+        context_2 = producer._get_context("matrix_id", "BTC", "BTC/USDT", "1h", "ohlcv", 2, None, None, False)
+        # base context is reused but each call gets its own context
+        get_full_context_mock.assert_called_once()
+        assert refresh_full_context_mock.call_count == 2
+        assert producer.contexts_by_symbol_and_time_frame == {("BTC/USDT", "1h"): base_context}
+        assert context_1 is not base_context
+        assert context_2 is not base_context
+        assert context_1 is not context_2
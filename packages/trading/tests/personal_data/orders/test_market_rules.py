@@ -0,0 +1,117 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import copy
+import decimal
+import math
+import mock
+import pytest
+
+from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
+import octobot_trading.constants as constants
+import octobot_trading.personal_data as personal_data
+import octobot_trading.personal_data.orders.market_rules as market_rules
+
+
+@pytest.fixture
+def symbol_market():
+    personal_data.clear_market_rules_cache()
+    yield {
+        Ecmsc.PRECISION.value: {
+            Ecmsc.PRECISION_PRICE.value: 2,
+        },
+        Ecmsc.LIMITS.value: {
+            Ecmsc.LIMITS_AMOUNT.value: {
+                Ecmsc.LIMITS_AMOUNT_MIN.value: 0.001,
+                Ecmsc.LIMITS_AMOUNT_MAX.value: 0,
+            },
+            Ecmsc.LIMITS_COST.value: {
+                Ecmsc.LIMITS_COST_MIN.value: 0,
+                Ecmsc.LIMITS_COST_MAX.value: math.nan,
+            },
+            Ecmsc.LIMITS_PRICE.value: {
+                Ecmsc.LIMITS_PRICE_MIN.value: None,
+            },
+        },
+    }
+    personal_data.clear_market_rules_cache()
+
+
+def test_market_rules(symbol_market):
+    rules = personal_data.MarketRules(symbol_market)
+    assert rules.has_precision is True
+    assert rules.price_digits == 2
+    assert rules.price_quantum.as_tuple().exponent == -2
+    # default amount digits
+    assert rules.amount_digits == 0
+    assert rules.amount_quantum is None
+    assert rules.has_limits is True
+    assert rules.min_quantity == decimal.Decimal("0.001")
+    # 0 is only a valid min value
+    assert rules.max_quantity is None
+    assert rules.min_cost == constants.ZERO
+    assert rules.max_cost is None
+    assert rules.min_price is None
+    assert rules.max_price is None
+
+    rules = personal_data.MarketRules({})
+    assert rules.has_precision is False
+    assert rules.has_limits is False
+    assert rules.min_quantity is None
+
+
+def test_get_market_rules(symbol_market):
+    with mock.patch.object(market_rules, "MarketRules", mock.Mock(side_effect=market_rules.MarketRules)) \
+            as market_rules_mock:
+        rules = personal_data.get_market_rules(symbol_market)
+        assert personal_data.get_market_rules(symbol_market) is rules
+        personal_data.decimal_adapt_price(symbol_market, decimal.Decimal("1.234"))
+        personal_data.decimal_check_and_adapt_order_details_if_necessary(
+            decimal.Decimal("1"), decimal.Decimal("1.234"), symbol_market
+        )
+        market_rules_mock.assert_called_once_with(symbol_market)
+        # equal but not the same market status
+        assert personal_data.get_market_rules(copy.deepcopy(symbol_market)) is rules
+        market_rules_mock.assert_called_once()
+        # market status updated in place
+        symbol_market[Ecmsc.PRECISION.value][Ecmsc.PRECISION_PRICE.value] = 3
+        updated_rules = personal_data.get_market_rules(symbol_market)
+        assert updated_rules is not rules
+        assert updated_rules.price_digits == 3
+        symbol_market[Ecmsc.LIMITS.value][Ecmsc.LIMITS_AMOUNT.value][Ecmsc.LIMITS_AMOUNT_MIN.value] = 1
+        assert personal_data.get_market_rules(symbol_market).min_quantity == constants.ONE
+        # other symbol
+        assert personal_data.get_market_rules({**symbol_market, Ecmsc.SYMBOL.value: "BTC/USDT"}) \
+            is not personal_data.get_market_rules(symbol_market)
+        assert market_rules_mock.call_count == 4
+        personal_data.clear_market_rules_cache()
+        assert personal_data.get_market_rules(symbol_market) is not updated_rules
+
+
+def test_get_market_rules_with_unhashable_values(symbol_market):
+    symbol_market[Ecmsc.PRECISION.value][Ecmsc.PRECISION_PRICE.value] = [2]
+    with mock.patch.object(market_rules, "MarketRules", mock.Mock()) as market_rules_mock:
+        personal_data.get_market_rules(symbol_market)
+        personal_data.get_market_rules(symbol_market)
+        assert market_rules_mock.call_count == 2
+
+
+def test_missing_market_status_elements():
+    with pytest.raises(KeyError):
+        personal_data.decimal_adapt_price({}, decimal.Decimal("1.234"))
+    with pytest.raises(KeyError):
+        personal_data.decimal_check_and_adapt_order_details_if_necessary(
+            decimal.Decimal("1"), decimal.Decimal("1.234"), {Ecmsc.PRECISION.value: {}}
+        )
@@ -13,11 +13,13 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import decimal
+import mock
 import pytest
 
 from tests import event_loop
 from tests.exchanges import simulated_exchange_manager, simulated_trader
-from tests.personal_data.trades import create_trade
+from tests.personal_data.trades import create_trade, create_executed_trade
 
 import octobot_trading.personal_data as personal_data
 import octobot_trading.enums as enums
@@ -95,3 +97,80 @@ def test_get_completed_trades_pnl(trade_manager_and_trader):
     # does not depend on trades_manager trades
     trade_manager.trades.clear()
     assert len(trade_manager.get_completed_trades_pnl(trades)) == 3
+
+
+def test_archive_oldest_trades(trade_manager_and_trader):
+    trade_manager, trader = trade_manager_and_trader
+    for index in range(10):
+        is_exit = index % 2 == 1
+        trade = create_executed_trade(
+            trader, enums.TradeOrderSide.SELL if is_exit else enums.TradeOrderSide.BUY, index,
+            decimal.Decimal("1"), decimal.Decimal(str(110 if is_exit else 100)), "BTC/USDT",
+            {enums.FeePropertyColumns.COST.value: decimal.Decimal("0.1"),
+             enums.FeePropertyColumns.CURRENCY.value: "USDT"}
+        )
+        trade.trade_id = trade.origin_order_id = str(index)
+        trade.status = enums.OrderStatus.FILLED
+        if is_exit:
+            trade.associated_entry_ids = [str(index - 1)]
+        trade_manager.upsert_trade_instance(trade)
+    assert trade_manager.get_total_paid_fees() == {"USDT": decimal.Decimal("1.0")}
+    with mock.patch.object(trade_manager, "MAX_TRADES_COUNT", 10):
+        cancelled_trade = create_executed_trade(trader, enums.TradeOrderSide.BUY, 10, decimal.Decimal("1"),
+                                                decimal.Decimal("100"), "BTC/USDT", None)
+        cancelled_trade.trade_id = "10"
+        cancelled_trade.status = enums.OrderStatus.CANCELED
+        trader.exchange_manager.exchange_config.is_saving_cancelled_orders_as_trade = True
+        trade_manager.upsert_trade_instance(cancelled_trade)
+        # removed the oldest trade
+        assert list(trade_manager.trades) == [str(i) for i in range(1, 11)]
+        assert len(trade_manager.get_completed_trades_pnl()) == 4
+        # "0" entry is archived: its pnl is archived with its "1" exit
+        assert len(trade_manager.archived_trades) == 1
+        assert trade_manager.archived_trades.get_completed_trades_count_by_symbol() == {"BTC/USDT": 1}
+        assert trade_manager.get_total_paid_fees() == {"USDT": decimal.Decimal("1.0")}
+        assert trade_manager.get_total_paid_fees(include_archived_trades=False) == {"USDT": decimal.Decimal("0.9")}
+        # archived pnl is included
+        assert trade_manager.get_completed_trades_count_by_symbol() == {"BTC/USDT": 5}
+        assert trade_manager.get_completed_trades_count_by_symbol(winning=False) == {}
+        assert trade_manager.get_realised_pnl_by_symbol() == {"BTC/USDT": decimal.Decimal("49.0")}
+        assert trade_manager.get_realised_pnl_by_symbol(since=7) == {"BTC/USDT": decimal.Decimal("19.6")}
+
+    # archived exits are included in win rate
+    with mock.patch.object(trader.exchange_manager.exchange_personal_data, "trades_manager", trade_manager):
+        assert personal_data.compute_win_rate(trader.exchange_manager) == decimal.Decimal("1")
+        stop_loss_trade = create_executed_trade(trader, enums.TradeOrderSide.SELL, 11, decimal.Decimal("1"),
+                                                decimal.Decimal("90"), "BTC/USDT", None)
+        stop_loss_trade.status = enums.OrderStatus.FILLED
+        stop_loss_trade.exchange_trade_type = enums.TradeOrderType.STOP_LOSS
+        trade_manager.archived_trades.archive([stop_loss_trade], [])
+        assert personal_data.compute_win_rate(trader.exchange_manager) == decimal.Decimal(5) / decimal.Decimal(6)
+
+    archived_trades = personal_data.TradesArchive()
+    trades = list(trade_manager.trades.values())
+    archived_trades.archive(trades, trade_manager.get_completed_trades_pnl(trades_history=trades))
+    # cancelled trade is not archived
+    assert len(archived_trades) == 9
+    assert archived_trades.get_trades_count_by_symbol() == {"BTC/USDT": 9}
+    assert archived_trades.get_traded_volume_by_symbol() == {"BTC/USDT": decimal.Decimal("950.0")}
+    assert archived_trades.get_total_paid_fees() == {"USDT": decimal.Decimal("0.9")}
+    assert archived_trades.get_filled_trades_count(side=enums.TradeOrderSide.SELL) == 5
+    assert archived_trades.get_filled_trades_count(exchange_trade_types=[enums.TradeOrderType.STOP_LOSS]) == 0
+    # entry of trade "1" is not available anymore
+    assert archived_trades.get_completed_trades_count_by_symbol() == {"BTC/USDT": 4}
+    assert archived_trades.get_completed_trades_count_by_symbol(winning=False) == {}
+    assert archived_trades.get_realised_pnl_by_symbol() == {"BTC/USDT": decimal.Decimal("39.2")}
+    assert archived_trades.get_realised_pnl_by_symbol(since=7) == {"BTC/USDT": decimal.Decimal("19.6")}
+    # archived trades history columns
+    assert archived_trades.executed_times.tolist() == list(range(1, 10))
+    assert archived_trades.symbols == ["BTC/USDT"]
+    assert archived_trades.symbol_ids.tolist() == [0] * 9
+    assert archived_trades.sides.tolist() == [
+        personal_data.trades.trades_archive.SELL_SIDE if index % 2 else personal_data.trades.trades_archive.BUY_SIDE
+        for index in range(1, 10)
+    ]
+    assert archived_trades.executed_prices.tolist() == [110 if index % 2 else 100 for index in range(1, 10)]
+    assert archived_trades.executed_quantities.tolist() == [1] * 9
+    assert archived_trades.fee_costs.tolist() == [0.1] * 9
+    assert archived_trades.currencies == ["USDT"]
+    assert archived_trades.fee_currency_ids.tolist() == [0] * 9
@@ -14,9 +14,17 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import decimal
+import os
+import tempfile
+import mock
+import pytest
+import pytest_asyncio
+
+import octobot_commons.databases as commons_databases
 
 import octobot_trading.personal_data as personal_data
 import octobot_trading.enums as enums
+import octobot_trading.constants as constants
 import octobot_trading.storage.orders_storage as orders_storage
 
 
@@ -80,3 +88,167 @@ class TestRestoreOrderStorageOriginValue:
         origin_value = {}
         restored_origin_value = orders_storage.restore_order_storage_origin_value(origin_value)
         assert restored_origin_value == {}
+
+
+@pytest_asyncio.fixture
+async def orders_storage_with_db():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        database = commons_databases.DBWriterReader(os.path.join(temp_dir, "orders.json"))
+        exchange_manager = mock.Mock(is_trader_simulated=False, is_backtesting=False)
+        exchange_manager.exchange_personal_data.orders_manager.get_open_orders.return_value = []
+        storage = orders_storage.OrdersStorage(exchange_manager)
+        with mock.patch.object(storage, "_get_db", mock.Mock(return_value=database)), \
+                mock.patch.object(orders_storage, "_format_order", mock.Mock(side_effect=_format_order)), \
+                mock.patch.object(storage, "trigger_debounced_update_auth_data", mock.AsyncMock()), \
+                mock.patch.object(storage, "trigger_debounced_flush", mock.AsyncMock()):
+            yield storage, exchange_manager, database
+        await database.close()
+
+
+def _format_order(order, _):
+    formatted = {
+        constants.STORAGE_ORIGIN_VALUE: {
+            enums.ExchangeConstantsOrderColumns.ID.value: order.order_id,
+            enums.ExchangeConstantsOrderColumns.EXCHANGE_ID.value: f"exchange_{order.order_id}",
+            enums.ExchangeConstantsOrderColumns.PRICE.value: order.price,
+        }
+    }
+    if order.chained_orders:
+        formatted[enums.StoredOrdersAttr.CHAINED_ORDERS.value] = [
+            _format_order(chained_order, _)
+            for chained_order in order.chained_orders
+        ]
+    return formatted
+
+
+def _order(order_id, price):
+    return mock.Mock(
+        order_id=order_id, price=price, order_group=None, active_trigger=None, trailing_profile=None,
+        cancel_policy=None, chained_orders=[], triggered_by=None
+    )
+
+
+def _set_open_orders(exchange_manager, orders):
+    exchange_manager.exchange_personal_data.orders_manager.get_open_orders.return_value = orders
+
+
+async def _on_order_update(storage, order):
+    await storage._live_callback(
+        "binance", "1", "BTC", "BTC/USDT",
+        {enums.ExchangeConstantsOrderColumns.ID.value: order.order_id}, "update", True
+    )
+
+
+async def _get_stored_prices(database):
+    return sorted(
+        (
+            document[constants.STORAGE_ORIGIN_VALUE][enums.ExchangeConstantsOrderColumns.ID.value],
+            document[constants.STORAGE_ORIGIN_VALUE][enums.ExchangeConstantsOrderColumns.PRICE.value],
+        )
+        for document in await database.all(orders_storage.OrdersStorage.HISTORY_TABLE)
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_history_only_writes_changed_orders(orders_storage_with_db):
+    storage, exchange_manager, database = orders_storage_with_db
+    order_1, order_2, order_3 = (_order(str(i), i) for i in range(1, 4))
+    _set_open_orders(exchange_manager, [order_1, order_2])
+    await _on_order_update(storage, order_2)
+    # first write: every open order is stored
+    assert orders_storage._format_order.call_count == 2
+    assert await _get_stored_prices(database) == [("1", 1), ("2", 2)]
+
+    orders_storage._format_order.reset_mock()
+    order_2.price = 22
+    _set_open_orders(exchange_manager, [order_1, order_2, order_3])
+    await _on_order_update(storage, order_2)
+    # order_2 is updated and order_3 is new, order_1 is unchanged
+    assert [call.args[0] for call in orders_storage._format_order.call_args_list] == [order_2, order_3]
+    assert await _get_stored_prices(database) == [("1", 1), ("2", 22), ("3", 3)]
+
+    orders_storage._format_order.reset_mock()
+    _set_open_orders(exchange_manager, [order_3])
+    await _on_order_update(storage, order_1)
+    # closed orders are removed
+    orders_storage._format_order.assert_not_called()
+    assert await _get_stored_prices(database) == [("3", 3)]
+
+    # restart: startup orders are the stored open orders
+    await storage._load_startup_orders()
+    assert list(storage.startup_orders) == ["exchange_3"]
+    assert await storage.get_startup_order_details("exchange_3") == {
+        constants.STORAGE_ORIGIN_VALUE: {
+            enums.ExchangeConstantsOrderColumns.ID.value: "3",
+            enums.ExchangeConstantsOrderColumns.EXCHANGE_ID.value: "exchange_3",
+            enums.ExchangeConstantsOrderColumns.PRICE.value: decimal.Decimal("3"),
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_history_rewrites_orders_with_updated_relations(orders_storage_with_db):
+    storage, exchange_manager, database = orders_storage_with_db
+    order_1, order_2, order_3 = (_order(str(i), i) for i in range(1, 4))
+    _set_open_orders(exchange_manager, [order_1, order_2])
+    await _on_order_update(storage, order_1)
+
+    # chain an order to the already stored order_1 without any update of order_1
+    chained_order = _order("chained", 10)
+    order_1.chained_orders.append(chained_order)
+    orders_storage._format_order.reset_mock()
+    await _on_order_update(storage, order_2)
+    assert [call.args[0] for call in orders_storage._format_order.call_args_list] == [order_1, order_2]
+    stored_order_1 = [
+        document
+        for document in await database.all(orders_storage.OrdersStorage.HISTORY_TABLE)
+        if document[constants.STORAGE_ORIGIN_VALUE][enums.ExchangeConstantsOrderColumns.ID.value] == "1"
+    ][0]
+    assert stored_order_1[enums.StoredOrdersAttr.CHAINED_ORDERS.value] == [_format_order(chained_order, None)]
+
+    # an order triggered by an open order is updated: its triggering order document is rewritten
+    order_3.triggered_by = order_2
+    _set_open_orders(exchange_manager, [order_1, order_2, order_3])
+    orders_storage._format_order.reset_mock()
+    await _on_order_update(storage, order_3)
+    assert [call.args[0] for call in orders_storage._format_order.call_args_list] == [order_2, order_3]
+    assert await _get_stored_prices(database) == [("1", 1), ("2", 2), ("3", 3)]
+
+
+@pytest.mark.asyncio
+async def test_update_history_compaction(orders_storage_with_db):
+    storage, exchange_manager, database = orders_storage_with_db
+    order_1, order_2 = (_order(str(i), i) for i in range(1, 3))
+    _set_open_orders(exchange_manager, [order_1, order_2])
+    with mock.patch.object(storage, "HISTORY_COMPACTION_DELTA_WRITES", 2):
+        await _on_order_update(storage, order_1)
+        for _ in range(2):
+            orders_storage._format_order.reset_mock()
+            await _on_order_update(storage, order_1)
+            orders_storage._format_order.assert_called_once_with(order_1, exchange_manager)
+        orders_storage._format_order.reset_mock()
+        # compaction: every open order is rewritten
+        await _on_order_update(storage, order_1)
+        assert orders_storage._format_order.call_count == 2
+        assert await _get_stored_prices(database) == [("1", 1), ("2", 2)]
+
+        orders_storage._format_order.reset_mock()
+        # store_history always rewrites every open order
+        await storage.store_history()
+        assert orders_storage._format_order.call_count == 2
+        assert await _get_stored_prices(database) == [("1", 1), ("2", 2)]
+
+
+@pytest.mark.asyncio
+async def test_update_history_rewrites_all_orders_after_error(orders_storage_with_db):
+    storage, exchange_manager, database = orders_storage_with_db
+    order_1, order_2 = (_order(str(i), i) for i in range(1, 3))
+    _set_open_orders(exchange_manager, [order_1, order_2])
+    await _on_order_update(storage, order_1)
+    with mock.patch.object(database, "log_many", mock.AsyncMock(side_effect=IOError)):
+        with pytest.raises(IOError):
+            await _on_order_update(storage, order_1)
+    orders_storage._format_order.reset_mock()
+    await _on_order_update(storage, order_2)
+    assert orders_storage._format_order.call_count == 2
+    assert await _get_stored_prices(database) == [("1", 1), ("2", 2)]
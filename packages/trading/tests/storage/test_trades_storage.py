@@ -0,0 +1,99 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import tempfile
+import mock
+import pytest
+import pytest_asyncio
+
+import octobot_commons.databases as commons_databases
+import octobot_commons.display as commons_display
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.enums as enums
+import octobot_trading.storage.trades_storage as trades_storage
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def trades_storage_with_db():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        database = commons_databases.DBWriterReader(os.path.join(temp_dir, "trades.json"))
+        storage = trades_storage.TradesStorage(
+            mock.Mock(is_trader_simulated=True, is_backtesting=False), commons_display.PlotSettings()
+        )
+        with mock.patch.object(storage, "_get_db", mock.Mock(return_value=database)), \
+                mock.patch.object(trades_storage, "_format_trade", mock.Mock(side_effect=_format_trade)), \
+                mock.patch.object(storage, "trigger_debounced_update_auth_data", mock.AsyncMock()), \
+                mock.patch.object(storage, "trigger_debounced_flush", mock.AsyncMock()):
+            yield storage, database
+        await database.close()
+
+
+def _format_trade(trade_dict, *_):
+    return {
+        commons_enums.DBRows.ID.value: trade_dict[enums.ExchangeConstantsOrderColumns.ID.value],
+        "state": trade_dict[enums.ExchangeConstantsOrderColumns.STATUS.value],
+    }
+
+
+async def _on_trade(storage, trade_id, status):
+    await storage._live_callback(
+        "binance", "1", "BTC", "BTC/USDT",
+        {
+            enums.ExchangeConstantsOrderColumns.ID.value: trade_id,
+            enums.ExchangeConstantsOrderColumns.STATUS.value: status,
+        },
+        False
+    )
+
+
+async def test_live_callback_updates_stored_trades(trades_storage_with_db):
+    storage, database = trades_storage_with_db
+    await database.log(
+        trades_storage.TradesStorage.HISTORY_TABLE, {commons_enums.DBRows.ID.value: "0", "state": "closed"}
+    )
+    with mock.patch.object(database, "all", mock.AsyncMock(wraps=database.all)) as all_mock:
+        await _on_trade(storage, "1", enums.OrderStatus.OPEN.value)
+        await _on_trade(storage, "2", enums.OrderStatus.CANCELED.value)
+        await _on_trade(storage, "1", enums.OrderStatus.FILLED.value)
+        await _on_trade(storage, "0", enums.OrderStatus.FILLED.value)
+        # stored trades are only read once
+        all_mock.assert_awaited_once()
+    # already stored trades are updated instead of being added again
+    assert await database.all(trades_storage.TradesStorage.HISTORY_TABLE) == [
+        {commons_enums.DBRows.ID.value: "0", "state": enums.OrderStatus.FILLED.value},
+        {commons_enums.DBRows.ID.value: "1", "state": enums.OrderStatus.FILLED.value},
+    ]
+
+
+async def test_live_callback_updates_trades_after_store_history(trades_storage_with_db):
+    storage, database = trades_storage_with_db
+    trade = mock.Mock(status=enums.OrderStatus.OPEN)
+    trade.to_dict.return_value = {
+        enums.ExchangeConstantsOrderColumns.ID.value: "1",
+        enums.ExchangeConstantsOrderColumns.STATUS.value: enums.OrderStatus.OPEN.value,
+    }
+    storage.exchange_manager.exchange_personal_data.trades_manager.trades = {"1": trade}
+    await storage.store_history()
+    with mock.patch.object(database, "all", mock.AsyncMock(wraps=database.all)) as all_mock:
+        await _on_trade(storage, "1", enums.OrderStatus.FILLED.value)
+        all_mock.assert_not_awaited()
+    assert await database.all(trades_storage.TradesStorage.HISTORY_TABLE) == [
+        {commons_enums.DBRows.ID.value: "1", "state": enums.OrderStatus.FILLED.value},
+    ]
@@ -0,0 +1,24 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+"""
+Reference backtesting benchmarks, using pytest-benchmark.
+Not collected by default, run them from the OctoBot folder:
+pytest tests/benchmarks/benchmark_*.py --benchmark-storage=tests/benchmarks/.benchmarks
+
+Save a baseline with --benchmark-save=<name> and detect regressions against it with
+--benchmark-compare=<name> --benchmark-compare-fail=mean:10%
+Trading hot paths and async channels benchmarks are in the OctoBot-Trading and Async-Channel packages.
+"""
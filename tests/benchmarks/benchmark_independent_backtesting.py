@@ -0,0 +1,56 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+
+import pytest
+import tentacles
+
+import octobot_tentacles_manager.api as tentacles_manager_api
+from octobot.api.backtesting import stop_independent_backtesting
+from octobot.backtesting.abstract_backtesting_test import DATA_FILES
+from tests.test_utils.bot_management import run_independent_backtesting
+
+BACKTESTING_TIMEOUT = 120
+BENCHMARK_ROUNDS = 3
+
+
+@pytest.fixture
+def benchmark_loop():
+    tentacles_manager_api.reload_tentacle_info()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    loop.close()
+
+
+async def _run_and_stop_backtesting(data_files):
+    independent_backtesting = await run_independent_backtesting(
+        data_files, timeout=BACKTESTING_TIMEOUT, use_loggers=False
+    )
+    await stop_independent_backtesting(independent_backtesting)
+    await asyncio.wait_for(independent_backtesting.post_backtesting_task, BACKTESTING_TIMEOUT)
+
+
+@pytest.mark.parametrize("data_files", [
+    [DATA_FILES["ICX/BTC"]],
+    [DATA_FILES["ICX/BTC"], DATA_FILES["VEN/BTC"], DATA_FILES["XRB/BTC"]],
+    [DATA_FILES[symbol] for symbol in ("ICX/BTC", "VEN/BTC", "XRB/BTC", "NEO/BTC", "ONT/BTC", "XLM/BTC")],
+], ids=["one_pair", "three_pairs", "six_pairs"])
+def test_independent_backtesting(benchmark, benchmark_loop, data_files):
+    benchmark.pedantic(
+        lambda: benchmark_loop.run_until_complete(_run_and_stop_backtesting(data_files)),
+        rounds=BENCHMARK_ROUNDS
+    )
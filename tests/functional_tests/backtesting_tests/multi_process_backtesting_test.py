@@ -0,0 +1,229 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+import concurrent.futures
+import mock
+import pytest
+import tentacles
+
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as commons_enums
+import octobot_backtesting.data as backtesting_data
+import octobot_tentacles_manager.api as tentacles_manager_api
+import octobot_trading.api as trading_api
+import octobot.backtesting as backtesting
+import octobot.storage as storage
+from octobot_commons.tests.test_config import load_test_config
+from octobot.api.backtesting import create_multi_process_backtesting, run_multi_process_backtesting, \
+    get_independent_backtesting_report, stop_independent_backtesting
+from octobot.backtesting.abstract_backtesting_test import DATA_FILES
+from octobot.backtesting.multi_process_backtesting import merge_backtesting_reports
+from octobot.storage import merge_backtesting_runs_metadata
+from tests.test_utils.bot_management import run_independent_backtesting
+from tests.test_utils.config import load_test_tentacles_config
+
+
+@pytest.mark.asyncio
+async def test_multi_process_backtesting():
+    tentacles_manager_api.reload_tentacle_info()
+    data_files = [DATA_FILES["ICX/BTC"], DATA_FILES["VEN/BTC"]]
+    independent_backtesting = await run_independent_backtesting(data_files, timeout=40, use_loggers=False)
+    try:
+        expected_report = await get_independent_backtesting_report(independent_backtesting)
+    finally:
+        await stop_independent_backtesting(independent_backtesting)
+        await asyncio.wait_for(independent_backtesting.post_backtesting_task, 5)
+
+    multi_process_backtesting = create_multi_process_backtesting(
+        load_test_config(), load_test_tentacles_config(), data_files, "", join_backtesting_timeout=40
+    )
+    assert await multi_process_backtesting.get_backtesting_files_by_exchange() == {"binance": data_files}
+    report = await run_multi_process_backtesting(multi_process_backtesting)
+    assert multi_process_backtesting.backtesting_id is not None
+    assert list(multi_process_backtesting.reports_by_exchange) == ["binance"]
+    # same results as in a single process
+    assert report["bot_report"]["profitability"] == expected_report["bot_report"]["profitability"]
+    assert report["bot_report"]["end_portfolio"] == expected_report["bot_report"]["end_portfolio"]
+    assert report["symbol_report"] == expected_report["symbol_report"]
+    assert multi_process_backtesting.run_metadata[commons_enums.BacktestingMetadata.ID.value] == \
+        multi_process_backtesting.backtesting_id
+    assert multi_process_backtesting.run_metadata[commons_enums.DBRows.EXCHANGES.value] == ["binance"]
+
+
+@pytest.mark.asyncio
+async def test_multi_process_backtesting_on_multiple_exchanges():
+    data_files = ["binance_1.data", "kucoin_1.data", "social.data", "binance_2.data"]
+    exchange_by_data_file = {
+        "binance_1.data": "binance", "kucoin_1.data": "kucoin", "social.data": None, "binance_2.data": "binance"
+    }
+    runs_metadata = {
+        "binance": _run_metadata("binance", 10, 50, 4, {"BTC": {"total": 1}}, 100, 1000),
+        "kucoin": _run_metadata("kucoin", -2, 100, 2, {"BTC": {"total": 2}, "ETH": {"total": 3}}, 50, 2000),
+    }
+    processes_backtesting_files = []
+
+    def _run_backtesting_process(config, tentacles_setup_config, backtesting_files, backtesting_kwargs):
+        processes_backtesting_files.append(backtesting_files)
+        exchange = exchange_by_data_file[backtesting_files[0]]
+        assert config[commons_constants.CONFIG_BACKTESTING_ID] == 1
+        return _report(exchange), runs_metadata[exchange]
+
+    storage_mock = mock.Mock(
+        store_merged_backtesting_run_metadata=mock.AsyncMock(
+            side_effect=lambda metadata, _: merge_backtesting_runs_metadata(metadata)
+        ),
+        enforce_total_databases_max_size=mock.AsyncMock()
+    )
+    config = load_test_config()
+    config[commons_constants.CONFIG_BACKTESTING_ID] = 1
+    multi_process_backtesting = create_multi_process_backtesting(
+        config, load_test_tentacles_config(), data_files, ""
+    )
+    with mock.patch.object(backtesting_data, "get_file_description", mock.AsyncMock(
+        side_effect=lambda data_file: {"exchange": exchange_by_data_file[data_file]}
+    )), \
+            mock.patch.object(concurrent.futures, "ProcessPoolExecutor", concurrent.futures.ThreadPoolExecutor), \
+            mock.patch.object(backtesting.multi_process_backtesting, "run_backtesting_process",
+                              _run_backtesting_process), \
+            mock.patch.object(trading_api, "get_run_databases_identifier", mock.Mock()), \
+            mock.patch.object(storage, "store_merged_backtesting_run_metadata",
+                              storage_mock.store_merged_backtesting_run_metadata), \
+            mock.patch.object(storage, "enforce_total_databases_max_size",
+                              storage_mock.enforce_total_databases_max_size):
+        # one process by exchange, data files without exchange are used by every process
+        assert await multi_process_backtesting.get_backtesting_files_by_exchange() == {
+            "binance": ["binance_1.data", "binance_2.data", "social.data"],
+            "kucoin": ["kucoin_1.data", "social.data"],
+        }
+        report = await run_multi_process_backtesting(multi_process_backtesting)
+    assert sorted(processes_backtesting_files) == [
+        ["binance_1.data", "binance_2.data", "social.data"],
+        ["kucoin_1.data", "social.data"],
+    ]
+    assert list(multi_process_backtesting.reports_by_exchange) == ["binance", "kucoin"]
+    assert report == merge_backtesting_reports([_report("binance"), _report("kucoin")])
+    # processes metadata are merged and stored once
+    storage_mock.store_merged_backtesting_run_metadata.assert_awaited_once()
+    assert storage_mock.store_merged_backtesting_run_metadata.await_args[0][0] == \
+        [runs_metadata["binance"], runs_metadata["kucoin"]]
+    assert multi_process_backtesting.run_metadata == \
+        merge_backtesting_runs_metadata([runs_metadata["binance"], runs_metadata["kucoin"]])
+    assert multi_process_backtesting.run_metadata[commons_enums.DBRows.EXCHANGES.value] == ["binance", "kucoin"]
+    # max databases size is enforced once merged metadata are stored
+    assert [call[0] for call in storage_mock.mock_calls] == [
+        "store_merged_backtesting_run_metadata", "enforce_total_databases_max_size"
+    ]
+
+
+def test_merge_backtesting_reports():
+    assert merge_backtesting_reports([
+        {
+            "symbol_report": [{"BTC/USDT": 10}],
+            "bot_report": {
+                "profitability": {"binance": 1.5},
+                "reference_market": "USDT",
+                "trading_mode": "DailyTradingMode",
+            },
+            "chart_identifiers": [{"symbol": "BTC/USDT", "exchange_name": "binance"}],
+            "errors_count": 1
+        },
+        {
+            "symbol_report": [{"ETH/USDT": -5}],
+            "bot_report": {
+                "profitability": {"kucoin": -2},
+                "reference_market": "USDT",
+                "trading_mode": "DailyTradingMode",
+            },
+            "chart_identifiers": [{"symbol": "ETH/USDT", "exchange_name": "kucoin"}],
+            "errors_count": 2
+        },
+    ]) == {
+        "symbol_report": [{"BTC/USDT": 10}, {"ETH/USDT": -5}],
+        "bot_report": {
+            "profitability": {"binance": 1.5, "kucoin": -2},
+            "reference_market": "USDT",
+            "trading_mode": "DailyTradingMode",
+        },
+        "chart_identifiers": [
+            {"symbol": "BTC/USDT", "exchange_name": "binance"},
+            {"symbol": "ETH/USDT", "exchange_name": "kucoin"}
+        ],
+        "errors_count": 3
+    }
+
+
+def test_merge_backtesting_runs_metadata():
+    metadata = merge_backtesting_runs_metadata([
+        _run_metadata("binance", 10, 50, 4, {"BTC": {"total": 1}}, 100, 1000),
+        _run_metadata("kucoin", -2, 100, 2, {"BTC": {"total": 2}, "ETH": {"total": 3}}, 50, 2000),
+    ])
+    assert metadata[commons_enums.BacktestingMetadata.ID.value] == 1
+    assert metadata[commons_enums.DBRows.EXCHANGES.value] == ["binance", "kucoin"]
+    assert metadata[commons_enums.BacktestingMetadata.PERCENT_GAINS.value] == 4
+    assert metadata[commons_enums.BacktestingMetadata.WIN_RATE.value] == 75
+    assert metadata[commons_enums.BacktestingMetadata.ENTRIES.value] == 6
+    assert metadata[commons_enums.BacktestingMetadata.WINS.value] == 4
+    assert metadata[commons_enums.BacktestingMetadata.LOSES.value] == 2
+    assert metadata[commons_enums.BacktestingMetadata.END_PORTFOLIO.value] == \
+        str({"BTC": {"total": 3}, "ETH": {"total": 3}})
+    assert sorted(metadata[commons_enums.BacktestingMetadata.SYMBOLS.value]) == ["BTC/USDT", "ETH/USDT"]
+    assert metadata[commons_enums.BacktestingMetadata.MARKETS_PROFITABILITY.value] == \
+        {"binance BTC/USDT": "1%", "kucoin BTC/USDT": "1%"}
+    assert metadata[commons_enums.DBRows.START_TIME.value] == 50
+    assert metadata[commons_enums.DBRows.END_TIME.value] == 2000
+    assert metadata["additional"] == "binance"
+
+
+def _run_metadata(exchange, percent_gains, win_rate, entries, end_portfolio, start_time, end_time):
+    return {
+        commons_enums.BacktestingMetadata.ID.value: 1,
+        commons_enums.BacktestingMetadata.TIMESTAMP.value: start_time,
+        commons_enums.BacktestingMetadata.LEVERAGE.value: 0,
+        commons_enums.BacktestingMetadata.DURATION.value: 1,
+        commons_enums.BacktestingMetadata.BACKTESTING_FILES.value: [f"{exchange}.data"],
+        commons_enums.BacktestingMetadata.GAINS.value: percent_gains / 100,
+        commons_enums.BacktestingMetadata.PERCENT_GAINS.value: percent_gains,
+        commons_enums.BacktestingMetadata.MARKETS_PROFITABILITY.value: {f"{exchange} BTC/USDT": "1%"},
+        commons_enums.BacktestingMetadata.END_PORTFOLIO.value: str(end_portfolio),
+        commons_enums.BacktestingMetadata.START_PORTFOLIO.value: str({"USDT": {"total": 1000}}),
+        commons_enums.BacktestingMetadata.WIN_RATE.value: win_rate,
+        commons_enums.BacktestingMetadata.DRAW_DOWN.value: 0,
+        commons_enums.BacktestingMetadata.COEFFICIENT_OF_DETERMINATION_MAX_BALANCE.value: 0,
+        commons_enums.BacktestingMetadata.COEFFICIENT_OF_DETERMINATION_END_BALANCE.value: 0,
+        commons_enums.BacktestingMetadata.SYMBOLS.value: ["BTC/USDT", "ETH/USDT"],
+        commons_enums.BacktestingMetadata.TIME_FRAMES.value: ["1h"],
+        commons_enums.BacktestingMetadata.ENTRIES.value: entries,
+        commons_enums.BacktestingMetadata.WINS.value: round(win_rate * entries / 100),
+        commons_enums.BacktestingMetadata.LOSES.value: entries - round(win_rate * entries / 100),
+        commons_enums.BacktestingMetadata.TRADES.value: entries * 2,
+        commons_enums.DBRows.EXCHANGES.value: [exchange],
+        commons_enums.DBRows.START_TIME.value: start_time,
+        commons_enums.DBRows.END_TIME.value: end_time,
+        commons_enums.DBRows.FUTURE_CONTRACTS.value: {},
+        "additional": exchange,
+    }
+
+
+def _report(exchange):
+    return {
+        "symbol_report": [{f"{exchange} BTC/USDT": 10}],
+        "bot_report": {
+            "profitability": {exchange: 1.5},
+            "reference_market": "USDT",
+        },
+        "chart_identifiers": [{"symbol": "BTC/USDT", "exchange_name": exchange}],
+        "errors_count": 1
+    }
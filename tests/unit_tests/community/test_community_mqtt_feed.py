@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
 import pytest
 import pytest_asyncio
 import mock
@@ -40,6 +41,11 @@ def _build_message(value, identifier, version=constants.COMMUNITY_FEED_CURRENT_M
     }).encode()
 
 
+async def _join_callbacks_queues(feed):
+    await asyncio.gather(*(queue.join() for queue in feed._queue_by_callback.values()))
+
+
+
 @pytest_asyncio.fixture
 async def authenticator():
     community.IdentifiersProvider.use_production()
@@ -117,20 +123,26 @@ async def test_on_message(connected_community_feed):
     message = _build_message("hello", "1")
     # from topic
     await connected_community_feed._on_message(client, "other_topic", message, 1, {})
+    await _join_callbacks_queues(connected_community_feed)
     assert all(cb.assert_not_called() is None for cb in connected_community_feed.feed_callbacks["topic"])
 
     message = _build_message("hello", "2")
     # call callbacks
     await connected_community_feed._on_message(client, topic, message, 1, {})
+    await _join_callbacks_queues(connected_community_feed)
     assert all(
         cb.assert_called_once_with(json.loads(message)) is None
         for cb in connected_community_feed.feed_callbacks["topic"]
     )
+    # message is parsed once for every callback
+    assert connected_community_feed.feed_callbacks["topic"][0].call_args[0][0] \
+        is connected_community_feed.feed_callbacks["topic"][1].call_args[0][0]
 
     # already processed message
     connected_community_feed.feed_callbacks["topic"][0].reset_mock()
     connected_community_feed.feed_callbacks["topic"][1].reset_mock()
     await connected_community_feed._on_message(client, topic, message, 1, {})
+    await _join_callbacks_queues(connected_community_feed)
     assert all(cb.assert_not_called() is None for cb in connected_community_feed.feed_callbacks["topic"])
 
     for cb in connected_community_feed.feed_callbacks["topic"]:
@@ -140,5 +152,55 @@ async def test_on_message(connected_community_feed):
         message = _build_message("hello", "2", version)
         # version is not supported
         await connected_community_feed._on_message(client, topic, message, 1, {})
+        await _join_callbacks_queues(connected_community_feed)
         for cb in connected_community_feed.feed_callbacks["topic"]:
             cb.assert_not_called()
+
+
+async def test_on_message_with_slow_callback(connected_community_feed):
+    client = mock.Mock(client_id="1")
+    topic = "topic"
+    release_slow_callback = asyncio.Event()
+    slow_callback_values = []
+    fast_callback_values = []
+
+    async def _slow_callback(parsed_message):
+        await release_slow_callback.wait()
+        slow_callback_values.append(parsed_message[commons_enums.CommunityFeedAttrs.VALUE.value])
+
+    async def _fast_callback(parsed_message):
+        fast_callback_values.append(parsed_message[commons_enums.CommunityFeedAttrs.VALUE.value])
+
+    connected_community_feed.feed_callbacks["topic"] = [_slow_callback, _fast_callback]
+    for identifier in range(3):
+        await connected_community_feed._on_message(client, topic, _build_message(identifier, str(identifier)), 1, {})
+    await asyncio.wait_for(connected_community_feed._queue_by_callback[_fast_callback].join(), 1)
+    # fast callback is not delayed by the slow one
+    assert fast_callback_values == [0, 1, 2]
+    assert slow_callback_values == []
+    release_slow_callback.set()
+    await _join_callbacks_queues(connected_community_feed)
+    # messages are processed in order
+    assert slow_callback_values == [0, 1, 2]
+
+    # callbacks consumers are stopped with the feed
+    consumer_tasks = list(connected_community_feed._consumer_task_by_callback.values())
+    await connected_community_feed.stop()
+    await asyncio.sleep(0)
+    assert all(task.cancelled() for task in consumer_tasks)
+    assert connected_community_feed._queue_by_callback == {}
+
+
+async def test_should_process(connected_community_feed):
+    connected_community_feed.MAX_MESSAGE_ID_CACHE_SIZE = 3
+    for identifier in ("1", "2", "3"):
+        assert connected_community_feed._should_process({commons_enums.CommunityFeedAttrs.ID.value: identifier})
+    assert not connected_community_feed._should_process({commons_enums.CommunityFeedAttrs.ID.value: "1"})
+    assert connected_community_feed._should_process({commons_enums.CommunityFeedAttrs.ID.value: "4"})
+    # oldest message id is forgotten
+    assert list(connected_community_feed._processed_messages) == ["2", "3", "4"]
+    assert connected_community_feed._should_process({commons_enums.CommunityFeedAttrs.ID.value: "1"})
+    assert not connected_community_feed._should_process({commons_enums.CommunityFeedAttrs.ID.value: "4"})
+    # messages without id are always processed
+    assert connected_community_feed._should_process({})
+    assert connected_community_feed._should_process({})
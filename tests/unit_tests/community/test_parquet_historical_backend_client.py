@@ -0,0 +1,80 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import numpy
+import pytest
+
+import octobot_commons.enums as commons_enums
+import octobot.community as community
+import octobot.enums
+
+pytestmark = pytest.mark.asyncio
+
+EXCHANGE = "binance"
+TIME_FRAME = commons_enums.TimeFrames.ONE_HOUR
+COLUMN_NAMES = ["timestamp", "exchange_internal_name", "symbol", "time_frame", "open", "high", "low", "close", "volume"]
+TIME = commons_enums.PriceIndexes.IND_PRICE_TIME.value
+CLOSE = commons_enums.PriceIndexes.IND_PRICE_CLOSE.value
+
+
+def _rows(client, symbol, timestamps, time_frame=TIME_FRAME):
+    return [
+        [client.get_formatted_time(timestamp), EXCHANGE, symbol, time_frame.value, 1, 3, 0.5, index, 10]
+        for index, timestamp in enumerate(timestamps)
+    ]
+
+
+async def test_insert_and_fetch_candles(tmp_path):
+    async with community.history_backend_client(
+        octobot.enums.CommunityHistoricalBackendType.Parquet, directory=str(tmp_path)
+    ) as client:
+        assert await client.fetch_candles_history_range(EXCHANGE, "BTC/USDT", TIME_FRAME) == (0, 0)
+        # inserted in disorder and with a duplicate
+        await client.insert_candles_history(
+            _rows(client, "BTC/USDT", [1718787600, 1718784000, 1718791200])
+            + _rows(client, "ETH/USDT", [1718784000])
+            + _rows(client, "BTC/USDT", [1718784000], time_frame=commons_enums.TimeFrames.ONE_DAY),
+            COLUMN_NAMES
+        )
+        await client.insert_candles_history(_rows(client, "BTC/USDT", [1718784000]), COLUMN_NAMES)
+        assert await client.fetch_candles_history_range(EXCHANGE, "BTC/USDT", TIME_FRAME) == (1718784000, 1718791200)
+
+        candle_arrays = await client.fetch_candles_history_arrays(
+            EXCHANGE, "BTC/USDT", TIME_FRAME, 1718784000, 1718787600
+        )
+        assert candle_arrays[TIME].tolist() == [1718784000, 1718787600]
+        assert candle_arrays[CLOSE].tolist() == [1, 0]
+        assert all(array.dtype == numpy.float64 for array in candle_arrays.values())
+        assert await client.fetch_candles_history(EXCHANGE, "BTC/USDT", TIME_FRAME, 1718784000, 1718787600) == [
+            [1718784000, 1, 3, 0.5, 1, 10],
+            [1718787600, 1, 3, 0.5, 0, 10],
+        ]
+
+        candle_arrays_by_symbol_and_time_frame = await client.fetch_extended_candles_history_arrays(
+            EXCHANGE, ["BTC/USDT", "ETH/USDT", "SOL/USDT"], [TIME_FRAME, commons_enums.TimeFrames.ONE_DAY]
+        )
+        assert {
+            symbol: {
+                time_frame: candle_arrays[TIME].tolist()
+                for time_frame, candle_arrays in candle_arrays_by_time_frame.items()
+            }
+            for symbol, candle_arrays_by_time_frame in candle_arrays_by_symbol_and_time_frame.items()
+        } == {
+            "BTC/USDT": {"1h": [1718784000, 1718787600, 1718791200], "1d": [1718784000]},
+            "ETH/USDT": {"1h": [1718784000]},
+        }
+        assert await client.fetch_extended_candles_history(EXCHANGE, ["ETH/USDT"], [TIME_FRAME]) == [
+            ["1h", "ETH/USDT", 1718784000, 1, 3, 0.5, 0, 10],
+        ]